@@ -32,13 +32,11 @@ from app.auth import load_gemini_key
 from app.config import load_hive_dir
 from bees import Task, Bees
 from bees.protocols.events import (
+    AgentChanged,
     BroadcastReceived,
     CycleComplete,
     CycleStarted,
-    TaskAdded,
-    TaskDone,
     TaskEvent,
-    TaskStarted,
 )
 from bees.runners.gemini import GeminiRunner
 from bees.runners.live import LiveRunner
@@ -70,8 +68,12 @@ class Broadcaster:
             self._queues.remove(queue)
 
     async def broadcast(self, event: dict[str, Any]) -> None:
+        self.publish(event)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Synchronous ``broadcast``, for callbacks outside a coroutine."""
         for queue in list(self._queues):
-            await queue.put(event)
+            queue.put_nowait(event)
 
 
 broadcaster = Broadcaster()
@@ -83,10 +85,18 @@ bees: Bees | None = None
 # ---------------------------------------------------------------------------
 
 
-async def _on_task_added(event: TaskAdded) -> None:
-    """Broadcast a newly added agent."""
-    await broadcaster.broadcast({
-        "type": "agent:added",
+def _on_agent_changed(event: AgentChanged) -> None:
+    """Push each persisted agent change to SSE clients as a delta.
+
+    Covers every write to the store — scheduler transitions, replies,
+    retries, tag edits and out-of-process edits alike — so handlers
+    don't broadcast agent state themselves.
+    """
+    if event.kind == "deleted" or event.task is None:
+        broadcaster.publish({"type": "agent:removed", "id": event.agent_id})
+        return
+    broadcaster.publish({
+        "type": "agent:added" if event.kind == "created" else "agent:updated",
         "agent": _agent_to_dict(event.task),
     })
 
@@ -108,23 +118,6 @@ async def _on_task_event(event: TaskEvent) -> None:
     })
 
 
-async def _on_task_start(event: TaskStarted) -> None:
-    """Broadcast when an agent transitions to running."""
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(event.task),
-    })
-
-
-async def _on_task_done(event: TaskDone) -> None:
-    """Post-completion hook: broadcast updated agent state."""
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(event.task),
-    })
-
-
-
 async def _on_cycle_complete(event: CycleComplete) -> None:
     await broadcaster.broadcast({"type": "scheduler:stopped", "waves": event.total_cycles})
 
@@ -186,11 +179,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     }
     bees = Bees(hive_dir, runners)
 
-    bees.on(TaskAdded, _on_task_added)
+    bees.on(AgentChanged, _on_agent_changed)
     bees.on(CycleStarted, _on_cycle_start)
     bees.on(TaskEvent, _on_task_event)
-    bees.on(TaskStarted, _on_task_start)
-    bees.on(TaskDone, _on_task_done)
     bees.on(CycleComplete, _on_cycle_complete)
     bees.on(BroadcastReceived, _on_broadcast)
 
@@ -276,12 +267,6 @@ async def reply_to_agent(agent_id: str, req: ReplyRequest) -> dict[str, Any]:
         raise HTTPException(400, "Agent is not assigned to user")
 
     task = node.respond({"text": req.text})
-
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(task),
-    })
-
     return _agent_to_dict(task)
 
 
@@ -298,12 +283,6 @@ async def choose_for_agent(
         raise HTTPException(400, "Agent is not assigned to user")
 
     task = node.respond({"selectedIds": req.selectedIds})
-
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(task),
-    })
-
     return _agent_to_dict(task)
 
 
@@ -320,12 +299,6 @@ async def retry_agent(agent_id: str) -> dict[str, Any]:
         raise HTTPException(400, "Agent is not paused")
 
     node.retry()
-
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(node.task),
-    })
-
     return _agent_to_dict(node.task)
 
 
@@ -333,17 +306,11 @@ async def retry_agent(agent_id: str) -> dict[str, Any]:
 async def update_agent_tags(
     agent_id: str, req: UpdateTagsRequest
 ) -> dict[str, Any]:
-    """Update tags for an agent and broadcast."""
+    """Update tags for an agent (clients get the change over SSE)."""
     node = _get_node(agent_id)
 
     node.task.metadata.tags = req.tags
     node.save()
-
-    await broadcaster.broadcast({
-        "type": "agent:updated",
-        "agent": _agent_to_dict(node.task),
-    })
-
     return _agent_to_dict(node.task)
 
 
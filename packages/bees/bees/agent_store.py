@@ -9,25 +9,436 @@ Manages ``agents/{uuid}/`` directories, each containing a
 
 Designed to mirror the SQL-first entity model from Project Swarm:
 each directory is a row in the ``agents`` table.
+
+Reads are served from an in-memory index (by id, parent and status)
+that is shared by every ``AgentStore`` for the same hive in this
+process, and kept in sync write-through by ``create``/``save``/
+``save_metadata``/``delete``. Out-of-process edits are picked up by
+comparing the ``(mtime_ns, size)`` stamps of each agent's
+``metadata.json`` and ``objective.md`` — only changed agents are
+re-parsed, as in ``TaskFileStore``.
+
+Files are replaced atomically. With a ``WriteBehind``, metadata saves
+are coalesced and written in the background; the index (and so every
+in-process reader) sees them at once.
+
+Every change to the index — a write through any store instance, or an
+edit discovered while revalidating — is published as an
+``AgentChange`` to callbacks registered with ``subscribe``, so
+consumers (e.g. the server's SSE stream) can push deltas instead of
+re-querying the tree.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import os
+import shutil
+import time
 import uuid
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Literal
 
 from bees.agent import Agent, AgentMetadata, AgentStatus, RunnerType
+from bees.persistence import WriteBehind, atomic_write_text
+
+__all__ = ["AgentChange", "AgentStore"]
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILENAME = "metadata.json"
+OBJECTIVE_FILENAME = "objective.md"
+
+# File mtimes come from a coarse kernel clock, so two writes of the same
+# size inside one tick share a stamp. Files modified this recently are
+# re-read on the next revalidation instead of being trusted.
+_RACY_WINDOW_NS = 50_000_000
+
+# Saves into these statuses are written through even with a write-behind:
+# the agent is coming to rest, so nothing further will coalesce with them
+# and out-of-process readers should see the outcome right away.
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+AgentChangeKind = Literal["created", "updated", "deleted"]
+
+
+@dataclass(frozen=True)
+class AgentChange:
+    """One change to the agent index, delivered to subscribers."""
+
+    kind: AgentChangeKind
+    agent_id: str
+    agent: Agent | None
+    """A copy of the agent after the change; None when deleted."""
+
+    previous_status: AgentStatus | None = None
+    """Status before the change; None for newly created agents."""
+
+
+AgentChangeCallback = Callable[[AgentChange], None]
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy JSON-shaped containers so callers can't mutate the index."""
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    return value
+
+
+def _clone(agent: Agent) -> Agent:
+    """Copy of an indexed agent with its own metadata containers.
+
+    Callers mutate metadata in place (e.g. ``queued_updates.pop``), so
+    list and dict fields are copied too. Much cheaper than
+    ``copy.deepcopy`` on hot query paths.
+    """
+    metadata = object.__new__(AgentMetadata)
+    metadata.__dict__.update({
+        k: _copy_value(v) if isinstance(v, (list, dict)) else v
+        for k, v in agent.metadata.__dict__.items()
+    })
+    return Agent(
+        id=agent.id,
+        dir=agent.dir,
+        metadata=metadata,
+        objective=agent.objective,
+    )
+
+
+_Stamp = tuple[int, int, int, int]
+"""``(mtime_ns, size)`` of ``metadata.json`` then ``objective.md``.
+
+A missing objective is stamped ``(0, -1)``.
+"""
+
+
+class _AgentIndex:
+    """In-memory agent records for one hive, shared across stores."""
+
+    def __init__(self, agents_dir: Path) -> None:
+        self.agents_dir = agents_dir
+        self.loaded = False
+        self.records: dict[str, Agent] = {}
+        self.stamps: dict[str, _Stamp] = {}
+        self.racy: set[str] = set()
+        self.by_parent: dict[str | None, set[str]] = {}
+        self.by_status: dict[str, set[str]] = {}
+        self.subscribers: list[AgentChangeCallback] = []
+        # Write-behind queues of stores for this hive, so deleting an
+        # agent through any store drops its pending writes.
+        self.writers: weakref.WeakSet[WriteBehind] = weakref.WeakSet()
+
+    # -- Revalidation ------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Reconcile the index with the ``agents/`` directory."""
+        notify = self.loaded
+        seen: set[str] = set()
+        try:
+            entries = os.scandir(self.agents_dir)
+        except FileNotFoundError:
+            entries = None
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    stamp = self.stat(entry.name)
+                    if stamp is None:
+                        continue
+                    seen.add(entry.name)
+                    self.check(entry.name, stamp, notify=notify)
+        for agent_id in list(self.stamps.keys() - seen):
+            self.forget(agent_id, notify=notify)
+        self.loaded = True
+
+    def check(
+        self, agent_id: str, stamp: _Stamp | None, *, notify: bool = True,
+    ) -> None:
+        """Reload one agent if its stamp changed (or forget it if gone)."""
+        if any(writer.has(agent_id) for writer in self.writers):
+            # The index is ahead of the disk until the deferred write lands.
+            return
+        if stamp is None:
+            self.forget(agent_id, notify=notify)
+        elif self.stamps.get(agent_id) != stamp or agent_id in self.racy:
+            self.load(agent_id, stamp, notify=notify)
+
+    def stat(self, agent_id: str) -> _Stamp | None:
+        agent_dir = self.agents_dir / agent_id
+        try:
+            st = os.stat(agent_dir / METADATA_FILENAME)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        try:
+            ot = os.stat(agent_dir / OBJECTIVE_FILENAME)
+            objective = (ot.st_mtime_ns, ot.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            objective = (0, -1)
+        return (st.st_mtime_ns, st.st_size, *objective)
+
+    def load(self, agent_id: str, stamp: _Stamp, *, notify: bool) -> None:
+        """Parse an agent from disk into the index under ``stamp``.
+
+        Malformed metadata keeps its stamp (so it is not re-read until it
+        changes) but has no record.
+        """
+        self.set_stamp(agent_id, stamp)
+        agent_dir = self.agents_dir / agent_id
+        try:
+            data = json.loads(
+                (agent_dir / METADATA_FILENAME).read_text(encoding="utf-8")
+            )
+            metadata = AgentMetadata.from_dict(data)
+        except Exception:
+            self.drop(agent_id, notify=notify)
+            return
+        objective = self.read_objective(agent_id, stamp)
+        previous = self.records.get(agent_id)
+        if (
+            previous is not None
+            and previous.metadata == metadata
+            and previous.objective == objective
+        ):
+            return
+        agent = Agent(
+            id=agent_id, dir=agent_dir, metadata=metadata, objective=objective,
+        )
+        self.put(agent, notify=notify)
+
+    def read_objective(self, agent_id: str, stamp: _Stamp) -> str:
+        if stamp[3] < 0:
+            return ""
+        try:
+            return (self.agents_dir / agent_id / OBJECTIVE_FILENAME).read_text(
+                encoding="utf-8"
+            )
+        except OSError:
+            return ""
+
+    def set_stamp(self, agent_id: str, stamp: _Stamp) -> None:
+        self.stamps[agent_id] = stamp
+        now = time.time_ns()
+        if now - max(stamp[0], stamp[2]) < _RACY_WINDOW_NS:
+            self.racy.add(agent_id)
+        else:
+            self.racy.discard(agent_id)
+
+    # -- Records -----------------------------------------------------------
+
+    def put(self, agent: Agent, *, notify: bool = True) -> None:
+        """Index ``agent`` (already a private copy) and publish the change."""
+        previous = self.records.get(agent.id)
+        if previous is not None:
+            self.unindex(previous)
+        self.records[agent.id] = agent
+        self.by_parent.setdefault(agent.metadata.parent_id or None, set()).add(
+            agent.id
+        )
+        self.by_status.setdefault(agent.metadata.status, set()).add(agent.id)
+        if notify:
+            self.publish(AgentChange(
+                kind="created" if previous is None else "updated",
+                agent_id=agent.id,
+                agent=_clone(agent),
+                previous_status=(
+                    previous.metadata.status if previous is not None else None
+                ),
+            ))
+
+    def drop(self, agent_id: str, *, notify: bool = True) -> None:
+        """Remove an agent's record, keeping its stamp."""
+        previous = self.records.pop(agent_id, None)
+        if previous is None:
+            return
+        self.unindex(previous)
+        if notify:
+            self.publish(AgentChange(
+                kind="deleted",
+                agent_id=agent_id,
+                agent=None,
+                previous_status=previous.metadata.status,
+            ))
+
+    def forget(self, agent_id: str, *, notify: bool = True) -> None:
+        self.stamps.pop(agent_id, None)
+        self.racy.discard(agent_id)
+        self.drop(agent_id, notify=notify)
+
+    def unindex(self, agent: Agent) -> None:
+        for index, key in (
+            (self.by_parent, agent.metadata.parent_id or None),
+            (self.by_status, agent.metadata.status),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(agent.id)
+                if not ids:
+                    del index[key]
+
+    def collect(self, ids: set[str] | None) -> list[Agent]:
+        """Copies of the indexed agents, newest first.
+
+        Ties on ``created_at`` keep ID order, matching the directory
+        listing order the store used before indexing.
+        """
+        if not ids:
+            return []
+        agents = [_clone(self.records[i]) for i in sorted(ids)]
+        agents.sort(key=lambda a: a.metadata.created_at or "", reverse=True)
+        return agents
+
+    # -- Subscribers -------------------------------------------------------
+
+    def publish(self, change: AgentChange) -> None:
+        for callback in list(self.subscribers):
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Agent change subscriber failed")
+
+
+# One index per hive, alive while any store for that hive is.
+_indexes: weakref.WeakValueDictionary[Path, _AgentIndex] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _shared_index(agents_dir: Path) -> _AgentIndex:
+    key = agents_dir.resolve()
+    index = _indexes.get(key)
+    if index is None:
+        index = _AgentIndex(agents_dir)
+        _indexes[key] = index
+    return index
 
 
 class AgentStore:
-    """Encapsulates agent CRUD operations on ``agents/{uuid}/`` directories."""
+    """Encapsulates agent CRUD operations on ``agents/{uuid}/`` directories.
+
+    Args:
+        hive_dir: The hive root; agents live in ``hive_dir / "agents"``.
+        revalidate: When True (the default), every query re-stats the
+            agent files and re-reads the agents whose stamp changed. When
+            False, the index is trusted after the first load and the
+            owner must call ``invalidate`` for out-of-process edits.
+        write_behind: Defer eligible metadata writes to this queue (see
+            ``save_metadata``). The owner calls ``flush`` before exit.
+    """
 
-    def __init__(self, hive_dir: Path):
+    def __init__(
+        self,
+        hive_dir: Path,
+        *,
+        revalidate: bool = True,
+        write_behind: WriteBehind | None = None,
+    ):
         self.hive_dir = hive_dir
         self.agents_dir = hive_dir / "agents"
+        self._revalidate = revalidate
+        self._index = _shared_index(self.agents_dir)
+        self._write_behind = write_behind
+        self._objective_dirty: set[str] = set()
+        if write_behind is not None:
+            self._index.writers.add(write_behind)
+
+    # -- Index maintenance -------------------------------------------------
+
+    def refresh(self) -> None:
+        """Reconcile the index with the ``agents/`` directory.
+
+        Stats every agent's files and re-parses only those whose stamps
+        differ from the indexed ones. Agents that disappeared are
+        dropped. Changes found here are published to subscribers.
+        """
+        self._index.refresh()
+
+    def invalidate(self, agent_id: str | None = None) -> None:
+        """Re-read cached state from disk.
+
+        With an ``agent_id``, only that agent is reloaded (or forgotten,
+        if it no longer exists). Without one, every agent is re-read.
+        Agents whose contents did not change are not published.
+        """
+        index = self._index
+        if agent_id is None:
+            index.stamps.clear()
+            index.racy.clear()
+            index.refresh()
+            return
+        index.stamps.pop(agent_id, None)
+        index.check(agent_id, index.stat(agent_id))
+
+    def subscribe(self, callback: AgentChangeCallback) -> Callable[[], None]:
+        """Call ``callback`` with an ``AgentChange`` after every change.
+
+        Callbacks run synchronously on the thread that made the change
+        and are shared by every store for this hive. Returns a function
+        that unsubscribes.
+        """
+        subscribers = self._index.subscribers
+        subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in subscribers:
+                subscribers.remove(callback)
+
+        return unsubscribe
+
+    def flush(self) -> None:
+        """Write any deferred saves to disk now."""
+        if self._write_behind is not None:
+            self._write_behind.flush()
+
+    async def aflush(self, agent_id: str | None = None) -> None:
+        """Wait until deferred saves (of one agent, or all) are on disk.
+
+        The writes run off the event loop.
+        """
+        if self._write_behind is not None:
+            await self._write_behind.aflush(agent_id)
+
+    def _sync(self) -> None:
+        if self._revalidate or not self._index.loaded:
+            self._index.refresh()
+
+    def _stamp_written(self, agent: Agent, *, objective: bool) -> None:
+        """Index a copy of ``agent`` after writing it to disk.
+
+        When only the metadata was written, the indexed objective is kept
+        (or re-read, if ``objective.md`` changed behind the index) rather
+        than taken from ``agent``, which callers may have built without
+        one.
+        """
+        index = self._index
+        stamp = index.stat(agent.id)
+        copy = _clone(agent)
+        if stamp is not None:
+            if not objective:
+                previous = index.records.get(agent.id)
+                old = index.stamps.get(agent.id)
+                if (
+                    previous is not None
+                    and old is not None
+                    and old[2:] == stamp[2:]
+                    and agent.id not in index.racy
+                ):
+                    copy.objective = previous.objective
+                else:
+                    copy.objective = index.read_objective(agent.id, stamp)
+            index.set_stamp(agent.id, stamp)
+        index.put(copy)
+
+    # -- CRUD --------------------------------------------------------------
 
     def create(
         self,
@@ -48,9 +459,18 @@ class AgentStore:
         playbook_id: str | None = None,
         tasks: list[str] | None = None,
         tags: list[str] | None = None,
+        playbook_run_id: str | None = None,
+        context: str | None = None,
+        title: str | None = None,
+        assignee: str | None = None,
+        kind: str = "work",
+        objective: str | None = None,
     ) -> Agent:
         """Create a new agent directory with metadata.
 
+        When ``objective`` is given it is written to ``objective.md`` as
+        part of the same change.
+
         Returns the created Agent.
         """
         agent_id = str(uuid.uuid4())
@@ -77,78 +497,122 @@ class AgentStore:
             watch_events=watch_events,
             signal_type=signal_type,
             playbook_id=playbook_id,
+            playbook_run_id=playbook_run_id,
             tasks=tasks,
             tags=tags,
+            context=context,
+            title=title,
+            assignee=assignee,
+            kind=kind,
             created_at=datetime.now(timezone.utc).isoformat(),
         )
 
         agent = Agent(id=agent_id, dir=agent_dir, metadata=metadata)
+        if objective is not None:
+            agent.objective = objective
+            self._write_objective(agent)
         self._write_metadata(agent)
+        self._stamp_written(agent, objective=True)
         return agent
 
     def get(self, agent_id: str) -> Agent | None:
-        """Load an agent by ID. Returns None if not found or malformed."""
-        agent_dir = self.agents_dir / agent_id
-        if not agent_dir.exists():
-            return None
+        """Load an agent by ID. Returns None if not found or malformed.
 
-        metadata_path = agent_dir / "metadata.json"
-        if not metadata_path.exists():
-            return None
+        Only this agent's files are stat-ed; it is re-read if their
+        stamps changed since it was indexed.
+        """
+        index = self._index
+        if self._revalidate or agent_id not in index.stamps:
+            index.check(agent_id, index.stat(agent_id), notify=index.loaded)
+        agent = index.records.get(agent_id)
+        return _clone(agent) if agent is not None else None
 
-        try:
-            mdata = json.loads(metadata_path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
+    def query_all(self, status: AgentStatus | None = None) -> list[Agent]:
+        """List agents, optionally filtered by status."""
+        self._sync()
+        if status is None:
+            return self._index.collect(set(self._index.records))
+        return self._index.collect(self._index.by_status.get(status))
 
-        metadata = AgentMetadata.from_dict(mdata)
+    def get_children(self, parent_id: str | None = None) -> list[Agent]:
+        """Returns children of the given agent, or roots if parent_id is None."""
+        self._sync()
+        return self._index.collect(self._index.by_parent.get(parent_id or None))
 
-        # Load objective from disk — stored separately from metadata.
-        objective = ""
-        objective_path = agent_dir / "objective.md"
-        if objective_path.exists():
-            objective = objective_path.read_text(encoding="utf-8")
+    def save(self, agent: Agent) -> None:
+        """Persist the metadata and the objective."""
+        self._persist(agent, objective=True)
 
-        return Agent(
-            id=agent_id,
-            dir=agent_dir,
-            metadata=metadata,
-            objective=objective,
-        )
+    def save_metadata(self, agent: Agent) -> None:
+        """Persist only the metadata.
 
-    def query_all(self, status: AgentStatus | None = None) -> list[Agent]:
-        """List agents, optionally filtered by status."""
-        if not self.agents_dir.exists():
-            return []
+        With a write-behind, the save is deferred and coalesced with
+        later ones; the index sees it at once. A terminal status
+        (completed, failed, cancelled) skips the coalescing window and is
+        handed to the writer pool straight away. Use ``aflush`` to wait
+        for it to reach disk.
+        """
+        self._persist(agent, objective=False)
 
-        agents: list[Agent] = []
-        for agent_dir in sorted(self.agents_dir.iterdir()):
-            if not agent_dir.is_dir():
-                continue
-            agent = self.get(agent_dir.name)
-            if agent is None:
-                continue
-            if status is not None and agent.metadata.status != status:
-                continue
-            agents.append(agent)
+    def delete(self, agent_id: str) -> None:
+        """Remove an agent's directory (sessions, workspace, metadata)."""
+        for writer in list(self._index.writers):
+            writer.discard(agent_id)
+        agent_dir = self.agents_dir / agent_id
+        if agent_dir.exists():
+            shutil.rmtree(agent_dir)
+        self._index.forget(agent_id)
 
-        agents.sort(key=lambda a: a.metadata.created_at or "", reverse=True)
-        return agents
+    def _persist(self, agent: Agent, *, objective: bool) -> None:
+        index = self._index
+        previous = index.records.get(agent.id)
+        if self._write_behind is None or previous is None:
+            if objective:
+                self._write_objective(agent)
+            self._write_metadata(agent)
+            self._stamp_written(agent, objective=objective)
+            return
 
-    def get_children(self, parent_id: str | None = None) -> list[Agent]:
-        """Returns children of the given agent, or roots if parent_id is None."""
-        if parent_id is None:
-            return [a for a in self.query_all() if not a.metadata.parent_id]
-        return [a for a in self.query_all() if a.metadata.parent_id == parent_id]
+        copy = _clone(agent)
+        if objective:
+            self._objective_dirty.add(agent.id)
+        else:
+            copy.objective = previous.objective
+        index.put(copy)
+        self._write_behind.schedule(
+            agent.id,
+            lambda: self._write_deferred(agent.id),
+            now=agent.metadata.status in _TERMINAL_STATUSES,
+        )
 
-    def save_metadata(self, agent: Agent) -> None:
-        """Persist only the metadata."""
+    def _write_deferred(self, agent_id: str) -> None:
+        """Write the indexed state of an agent (runs on a writer thread).
+
+        Reads the record at write time, so coalesced saves land as one
+        write of the latest state.
+        """
+        index = self._index
+        agent = index.records.get(agent_id)
+        if agent is None:
+            return
+        if agent_id in self._objective_dirty:
+            self._objective_dirty.discard(agent_id)
+            self._write_objective(agent)
         self._write_metadata(agent)
+        stamp = index.stat(agent_id)
+        if stamp is not None:
+            index.set_stamp(agent_id, stamp)
 
     def _write_metadata(self, agent: Agent) -> None:
         """Write metadata.json to the agent's directory."""
         agent.dir.mkdir(parents=True, exist_ok=True)
-        (agent.dir / "metadata.json").write_text(
+        atomic_write_text(
+            agent.dir / METADATA_FILENAME,
             json.dumps(agent.metadata.to_dict(), indent=2, ensure_ascii=False)
-            + "\n"
+            + "\n",
         )
+
+    def _write_objective(self, agent: Agent) -> None:
+        """Write objective.md to the agent's directory."""
+        agent.dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(agent.dir / OBJECTIVE_FILENAME, agent.objective)
@@ -3,18 +3,32 @@
 
 from __future__ import annotations
 import asyncio
+import logging
 from collections import defaultdict
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Awaitable, Callable, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Iterable,
+    TypeVar,
+)
 
 from bees.agent import Agent
-from bees.protocols.events import SchedulerEvent
+from bees.agent_store import AgentChange
+from bees.config_registry import get_registry
+from bees.persistence import WriteBehind
+from bees.protocols.events import AgentChanged, SchedulerEvent
 from bees.unified_agent_store import UnifiedAgentStore
 from bees.agent_node import AgentNode
 from bees.scheduler import Scheduler
 
 T = TypeVar("T", bound=SchedulerEvent)
 
+logger = logging.getLogger(__name__)
+
 # Callback type for typed event listeners.
 EventCallback = Callable[..., Any]
 
@@ -31,8 +45,22 @@ class Bees:
         runners: dict[str, "SessionRunner"],
         *,
         root_override: str | None = None,
+        revalidate: bool = True,
     ):
-        self._store = UnifiedAgentStore(hive_dir)
+        # With revalidate=False the store trusts its indexes and the
+        # scheduler trusts the config registry's cache (see
+        # ``_config_scope``); the owner calls ``trigger`` whenever the hive
+        # changes on disk, and ``reload_config`` when its configuration
+        # does.
+        # Bookkeeping saves during busy waves are coalesced and written
+        # off the event loop; flushed on shutdown, after which saves are
+        # written synchronously again.
+        self._write_behind = WriteBehind()
+        self._store = UnifiedAgentStore(
+            hive_dir, revalidate=revalidate, write_behind=self._write_behind,
+        )
+        self._config = get_registry(hive_dir)
+        self._revalidate = revalidate
         self._observers: dict[type[SchedulerEvent], list[EventCallback]] = defaultdict(list)
         self._loop_task = None
 
@@ -40,6 +68,7 @@ class Bees:
             runners=runners, emit=self._emit, store=self._store,
             root_override=root_override,
         )
+        self._store.subscribe(self._on_agent_change)
 
     async def _emit(self, event: SchedulerEvent) -> None:
         """Dispatch a typed event to all registered observers."""
@@ -49,6 +78,32 @@ class Bees:
             if asyncio.iscoroutine(res):
                 await res
 
+    def _on_agent_change(self, change: AgentChange) -> None:
+        """Dispatch a store change as ``AgentChanged``.
+
+        Store notifications are synchronous, so coroutine observers are
+        scheduled on the running loop rather than awaited.
+        """
+        callbacks = self._observers.get(AgentChanged)
+        if not callbacks:
+            return
+        event = AgentChanged(
+            kind=change.kind,
+            agent_id=change.agent_id,
+            task=change.agent,
+            previous_status=change.previous_status,
+        )
+        for callback in list(callbacks):
+            res = callback(event)
+            if asyncio.iscoroutine(res):
+                try:
+                    asyncio.get_running_loop().create_task(res)
+                except RuntimeError:
+                    res.close()
+                    logger.warning(
+                        "Dropped async AgentChanged observer: no running loop"
+                    )
+
     def on(self, event_type: type[T], callback: Callable[[T], Any]) -> None:
         """Register a typed event listener.
 
@@ -78,6 +133,7 @@ class Bees:
             agent.metadata.paused_from = None
             self._store.save_metadata(agent)
             count += 1
+        self._scheduler.rescan_dependencies()
         return count
 
     def delete_task(self, task_id: str) -> list[str]:
@@ -100,22 +156,76 @@ class Bees:
 
         Counterpart to :meth:`listen` — one-shot vs. reactive.
         """
-        await self._scheduler.startup()
-        try:
-            return await self._scheduler.run_all_waves()
-        finally:
-            await self._scheduler.shutdown()
+        with self._config_scope():
+            await self._scheduler.startup()
+            try:
+                return await self._scheduler.run_all_waves()
+            finally:
+                await self._scheduler.shutdown()
+                await asyncio.to_thread(self._write_behind.close)
 
     async def listen(self):
-        """Starts the scheduler loop."""
-        await self._scheduler.startup()
-        self._loop_task = asyncio.create_task(self._scheduler.start_loop())
+        """Starts the scheduler loop.
+
+        The store is reconciled with the disk first: the hive may have
+        changed while no instance was watching it (e.g. across a restart).
+        """
+        self._store.refresh()
+        with self._config_scope():
+            await self._scheduler.startup()
+            # The task copies this context, so its cycles (and the tasks
+            # they start) share the scope.
+            self._loop_task = asyncio.create_task(
+                self._scheduler.start_loop(),
+            )
         self._scheduler.trigger()
 
-    def trigger(self):
-        """Wake the scheduler to re-evaluate available work."""
+    def _config_scope(self) -> ContextManager[None]:
+        """Trust the shared config registry while this instance runs.
+
+        Scoped to this instance's work rather than set on the registry,
+        which other callers for the same hive share.
+        """
+        if self._revalidate:
+            return nullcontext()
+        return self._config.trusted()
+
+    def trigger(
+        self, paths: Iterable[Path] = (), *, rescan: bool = False,
+    ):
+        """Wake the scheduler to re-evaluate available work.
+
+        ``paths`` are hive files changed outside the scheduler (e.g.
+        reported by ``awatch``); only the agents and task files they
+        belong to are re-read. The dependency index follows the changes
+        the store finds; pass ``rescan=True`` to rebuild it after changes
+        to the whole hive (e.g. mutations).
+        """
+        self._store.invalidate_paths(paths)
+        if rescan:
+            self._scheduler.rescan_dependencies()
         self._scheduler.trigger()
 
+    async def reload_config(self, paths: list[Path] | None = None) -> None:
+        """Pick up configuration changes without restarting.
+
+        Running tasks keep going.  The config registry drops whatever
+        ``paths`` (changed files) invalidate — ``None`` drops everything —
+        and skills are rescanned right away rather than by the next
+        session.  ``SYSTEM.yaml`` is then re-read, reconnecting only the
+        MCP servers whose config changed.
+        """
+        dropped = self._config.invalidate(paths)
+        if "skills" in dropped or paths is None:
+            await asyncio.to_thread(self._config.skills)
+        if dropped:
+            logger.info("Config reloaded: %s", ", ".join(dropped))
+
+        changed = await self._scheduler.reload_config()
+        if changed:
+            logger.info("Reconnected MCP servers: %s", ", ".join(changed))
+        self.trigger()
+
     async def shutdown(self):
         """Stops the scheduler loop and cleans up."""
         await self._scheduler.shutdown()
@@ -125,6 +235,7 @@ class Bees:
                 await self._loop_task
             except asyncio.CancelledError:
                 pass
+        await asyncio.to_thread(self._write_behind.close)
 
     @property
     def children(self) -> list[AgentNode]:
@@ -10,10 +10,10 @@ changes and drives the scheduler through filesystem events.
 
 Two conceptual watchers share a single ``watchfiles.awatch`` stream:
 
-- **Config watcher** (cold restart): changes to ``config/SYSTEM.yaml``,
-  ``config/TEMPLATES.yaml``, ``config/hooks/``, or ``skills/`` cause
-  the box to shut down the current ``Bees`` instance and restart with
-  fresh configuration.
+- **Config watcher** (hot reload): changes to ``config/SYSTEM.yaml``,
+  ``config/TEMPLATES.yaml``, ``config/hooks/``, or ``skills/`` are
+  applied to the running ``Bees`` instance — only changed MCP servers
+  are reconnected, skills are swapped in, and running tasks keep going.
 
 - **Task watcher** (hot trigger): changes under ``tickets/`` wake the
   scheduler to re-evaluate available work.
@@ -55,6 +55,7 @@ from bees.runners.live import LiveRunner
 from bees.runners.antigravity import AntigravityRunner
 from bees.runners.direct_model import DirectModelRunner
 from bees.agent import Agent
+from bees.persistence import TEMP_PREFIX
 from bees.trajectory_parser import convert_trajectory_to_json
 from opal_backend.local.backend_client_impl import HttpBackendClient
 
@@ -72,7 +73,7 @@ def classify_change(path: Path, hive_dir: Path) -> ChangeKind:
     """Classify a changed path relative to the hive directory.
 
     Returns:
-        ``"config"`` for configuration files that require a restart,
+        ``"config"`` for configuration files that require a reload,
         ``"task"`` for ticket changes that should trigger the scheduler,
         ``"mutation"`` for mutation files that need atomic processing,
         ``"ignore"`` for everything else (logs, temp files, etc.).
@@ -98,8 +99,11 @@ def classify_change(path: Path, hive_dir: Path) -> ChangeKind:
         return "config"
 
     # Mutation paths → process between shutdown and restart.
-    # Ignore result files (written by the box itself).
+    # Ignore result files, the journal, and the archive (all written by
+    # the box itself).
     if top == "mutations":
+        if len(parts) > 2:
+            return "ignore"
         if path.name.endswith(".result.json"):
             return "ignore"
         if path.name.startswith("."):
@@ -107,6 +111,9 @@ def classify_change(path: Path, hive_dir: Path) -> ChangeKind:
         return "mutation"
 
     # Entity paths → hot trigger.
+    # Temp files from atomic writes are followed by the rename itself.
+    if path.name.startswith(TEMP_PREFIX):
+        return "ignore"
     if top in ("agents", "tasks"):
         return "task"
 
@@ -167,15 +174,16 @@ async def run(
     """Run the box — outer restart loop + inner file-watch loop.
 
     This function runs indefinitely until cancelled or interrupted.
-    Config changes cause a restart (inner loop breaks, outer loop
-    re-creates ``Bees``). Task changes trigger the scheduler.
+    Config changes are reloaded into the running ``Bees`` instance.
+    Task changes trigger the scheduler.
 
     Mutations come in two flavors:
 
     - **Hot** (e.g., respond-to-task) — processed inline, then the
       scheduler is triggered.
     - **Cold** (e.g., reset) — processed in the quiescent gap between
-      shutdown and restart.
+      shutdown and restart (inner loop breaks, outer loop re-creates
+      ``Bees``).
     """
     logger.info("Box starting — watching %s", hive_dir)
 
@@ -196,7 +204,9 @@ async def run(
     }
 
     while True:
-        bees = Bees(hive_dir, runners)
+        # awatch below triggers on every agent/task change, so the store
+        # can trust its indexes between triggers.
+        bees = Bees(hive_dir, runners, revalidate=False)
 
         bees.on(TaskAdded, _on_task_added)
         bees.on(CycleStarted, _on_cycle_start)
@@ -208,13 +218,21 @@ async def run(
         await bees.listen()
         logger.info("Bees started — watching for changes")
 
+        # One manager per Bees instance, so the processed journal is
+        # read once rather than on every batch. The first batch scans the
+        # whole directory to catch mutations written while awatch was down.
+        manager = MutationManager(hive_dir, bees=bees)
+        full_scan = True
+
         restart = False
         cold_pending = False
         try:
             async for changes in awatch(hive_dir):
-                needs_restart = False
                 needs_trigger = False
-                needs_mutation = False
+                rescan = False
+                config_paths: list[Path] = []
+                entity_paths: list[Path] = []
+                mutation_paths: list[Path] = []
 
                 for _change_type, changed_path in changes:
                     path = Path(changed_path)
@@ -225,33 +243,43 @@ async def run(
 
                     kind = classify_change(path, hive_dir)
                     if kind == "config":
-                        needs_restart = True
+                        config_paths.append(path)
                     elif kind == "task":
+                        entity_paths.append(path)
                         needs_trigger = True
                     elif kind == "mutation":
-                        needs_mutation = True
+                        mutation_paths.append(path)
 
                 # Process mutations: hot mutations run inline,
-                # cold mutations signal a restart.
-                if needs_mutation:
-                    manager = MutationManager(hive_dir, bees=bees)
-                    outcome = await manager.process_inline()
+                # cold mutations signal a restart. Only the reported
+                # files are read — the rest of mutations/ is untouched.
+                if mutation_paths:
+                    outcome = await manager.process_inline(
+                        None if full_scan else mutation_paths,
+                    )
+                    full_scan = False
                     if outcome.hot_processed > 0:
                         needs_trigger = True
+                        rescan = True
                     if outcome.cold_pending:
                         logger.info("Cold mutation pending — shutting down")
                         cold_pending = True
                         restart = True
                         break
 
-                if needs_restart:
-                    logger.info("Config change detected — restarting")
-                    restart = True
-                    break
+                if config_paths:
+                    logger.info("Config change detected — reloading")
+                    try:
+                        await bees.reload_config(config_paths)
+                    except Exception:
+                        logger.exception(
+                            "Config reload failed — keeping the current "
+                            "configuration"
+                        )
 
                 if needs_trigger:
                     logger.debug("Task change detected — triggering scheduler")
-                    bees.trigger()
+                    bees.trigger(entity_paths, rescan=rescan)
 
         except asyncio.CancelledError:
             logger.info("Box cancelled — shutting down")
@@ -0,0 +1,431 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide cache of hive configuration.
+
+Skills, templates, hooks, and ``SYSTEM.yaml`` are consulted on almost
+every task start, signal, and completion. ``ConfigRegistry`` loads each
+once per hive and keys it by the stat signature (mtime and size) of the
+files it came from, so a lookup costs a few ``stat`` calls instead of a
+read and a parse.
+
+Like ``UnifiedAgentStore``, lookups have two modes:
+
+- revalidating (the default) — every lookup re-stats the source files
+  and reloads whatever changed.
+- trusting — lookups return the cached value; the owner (the box's
+  ``Bees``) calls :meth:`ConfigRegistry.invalidate` with the paths
+  ``awatch`` reports.
+
+The registry is shared by every caller in the process, so the mode is not
+a property of the registry: an owner that invalidates it runs its work
+inside :meth:`ConfigRegistry.trusted`, which trusts the cache only for
+code in that context (and the tasks and threads it starts). Everyone
+else keeps revalidating.
+
+Templates in agent workspaces are written by agents, not through
+``config/``, so they are always revalidated.
+
+Cached values are shared between callers, so they are handed out
+immutable: mappings as ``MappingProxyType``, lists as tuples.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+import yaml
+
+from bees.functions.skills import SkillInfo, scan_skills
+
+__all__ = [
+    "ConfigRegistry",
+    "SkillSet",
+    "freeze",
+    "get_registry",
+    "thaw",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Registries kept before the least recently created is dropped (eval runs
+# every case in its own hive copy).
+MAX_REGISTRIES = 64
+
+Signature = Any
+"""A hashable summary of the on-disk state a cached value came from."""
+
+# Registries whose cache the current context trusts (see ``trusted``).
+_trusted: ContextVar[frozenset[int]] = ContextVar(
+    "trusted_config_registries", default=frozenset(),
+)
+
+
+# ---------------------------------------------------------------------------
+# Freezing
+# ---------------------------------------------------------------------------
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply immutable view of parsed YAML or JSON data."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of data produced by :func:`freeze`."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Signatures
+# ---------------------------------------------------------------------------
+
+
+def _file_signature(path: Path) -> Signature:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _dir_signature(path: Path, suffixes: tuple[str, ...]) -> Signature:
+    """Signature of the matching files directly inside ``path``."""
+    try:
+        entries = list(os.scandir(path))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    signature = []
+    for entry in entries:
+        if entry.name.endswith(suffixes) and entry.is_file():
+            st = entry.stat()
+            signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(signature))
+
+
+def _tree_signature(path: Path) -> Signature:
+    """Signature of every file under ``path``."""
+    if not path.is_dir():
+        return None
+    signature = []
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            signature.append((root, name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(signature))
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SkillSet:
+    """A hive's skills, as scanned from ``skills/``.
+
+    - ``listing``: Formatted markdown for ``{{available_skills}}``.
+    - ``files``: ``{vfs_name: content}`` for every skill.
+    - ``skills``: Parsed ``SKILL.md`` metadata, in directory order.
+    - ``files_by_skill``: ``files`` split by skill directory name.
+    """
+
+    listing: str
+    files: Mapping[str, str]
+    skills: tuple[SkillInfo, ...]
+    files_by_skill: Mapping[str, Mapping[str, str]]
+
+
+@dataclass(frozen=True)
+class _Templates:
+    by_name: Mapping[str, Mapping[str, Any]]
+    files: Mapping[str, str]
+
+
+@dataclass
+class _Entry:
+    signature: Signature
+    value: Any
+
+
+class ConfigRegistry:
+    """Cached skills, templates, hooks, and system config for one hive.
+
+    Use :func:`get_registry` rather than constructing one directly, so
+    every caller in the process shares the same cache.
+
+    Args:
+        hive_dir: The hive root.
+        revalidate: Whether lookups outside a ``trusted`` context re-stat
+            the source files. Shared registries always do; pass False
+            only for a registry with a single owner.
+    """
+
+    def __init__(self, hive_dir: Path, *, revalidate: bool = True) -> None:
+        self.hive_dir = hive_dir
+        self._revalidate = revalidate
+        self._roots = (hive_dir, hive_dir.resolve())
+        self._config_dir = hive_dir / "config"
+        self._entries: dict[tuple[str, ...], _Entry] = {}
+
+    # -- Lookups -----------------------------------------------------------
+
+    def system_config(self) -> Mapping[str, Any]:
+        """``config/SYSTEM.yaml``, or an empty mapping if there is none."""
+        path = self._config_dir / "SYSTEM.yaml"
+        return self._get(
+            ("system",),
+            lambda: _file_signature(path),
+            lambda: freeze(_load_system_config(path)),
+        )
+
+    def templates(self) -> Mapping[str, Mapping[str, Any]]:
+        """Global templates from ``config/TEMPLATES.yaml``, by name."""
+        return self._global_templates().by_name
+
+    def template_files(self) -> Mapping[str, str]:
+        """Global templates rendered as ``{templates/{name}.yaml: text}``.
+
+        Seeded into every session's file system.
+        """
+        return self._global_templates().files
+
+    def workspace_templates(
+        self, workspace_dir: Path,
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Templates from ``{workspace_dir}/templates/*.yaml``, by name.
+
+        Always revalidated: agents write these directly.
+        """
+        templates_dir = workspace_dir / "templates"
+        key = ("workspace", str(workspace_dir))
+        entry = self._entries.get(key)
+        current = _dir_signature(templates_dir, (".yaml", ".yml"))
+        if entry is not None and entry.signature == current:
+            return entry.value
+        value = _load_workspace_templates(templates_dir)
+        self._entries[key] = _Entry(current, value)
+        return value
+
+    def hooks(self, name: str) -> ModuleType | None:
+        """The hooks module ``config/hooks/{name}.py``, if it exists."""
+        path = self._config_dir / "hooks" / f"{name}.py"
+        return self._get(
+            ("hooks", name),
+            lambda: _file_signature(path),
+            lambda: _load_hooks_module(name, path),
+        )
+
+    def skills(self) -> SkillSet:
+        """Every skill under ``skills/``."""
+        return self._get(
+            ("skills",),
+            lambda: _tree_signature(self.hive_dir / "skills"),
+            self._load_skills,
+        )
+
+    # -- Modes -------------------------------------------------------------
+
+    @contextmanager
+    def trusted(self) -> Iterator[None]:
+        """Trust the cache for lookups made in this context.
+
+        Applies to the current task and to tasks and threads started from
+        it. The caller takes on calling :meth:`invalidate` for changes.
+        """
+        token = _trusted.set(_trusted.get() | {id(self)})
+        try:
+            yield
+        finally:
+            _trusted.reset(token)
+
+    def revalidating(self) -> bool:
+        """Whether lookups in the current context re-stat source files."""
+        return self._revalidate and id(self) not in _trusted.get()
+
+    # -- Invalidation ------------------------------------------------------
+
+    def invalidate(self, paths: list[Path] | None = None) -> list[str]:
+        """Drop the entries that ``paths`` (changed files) were loaded from.
+
+        ``None`` drops everything.  Returns the kinds of entry dropped
+        (``"system"``, ``"templates"``, ``"hooks"``, ``"skills"``).
+        """
+        if paths is None:
+            kinds = sorted({key[0] for key in self._entries})
+            self._entries.clear()
+            return kinds
+
+        dropped: set[str] = set()
+        for path in paths:
+            parts = self._relative_parts(path)
+            if parts is None:
+                continue
+            if parts[:1] == ("skills",):
+                keys = [("skills",)]
+            elif parts == ("config", "SYSTEM.yaml"):
+                keys = [("system",)]
+            elif parts == ("config", "TEMPLATES.yaml"):
+                keys = [("templates",)]
+            elif parts[:2] == ("config", "hooks") and len(parts) == 3:
+                keys = [("hooks", Path(parts[2]).stem)]
+            else:
+                continue
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    dropped.add(key[0])
+        return sorted(dropped)
+
+    # -- Internals ---------------------------------------------------------
+
+    def _relative_parts(self, path: Path) -> tuple[str, ...] | None:
+        for root in self._roots:
+            try:
+                return path.relative_to(root).parts
+            except ValueError:
+                continue
+        return None
+
+    def _get(
+        self,
+        key: tuple[str, ...],
+        signature: Callable[[], Signature],
+        load: Callable[[], T],
+    ) -> T:
+        entry = self._entries.get(key)
+        if entry is not None and not self.revalidating():
+            return entry.value
+        current = signature()
+        if entry is not None and entry.signature == current:
+            return entry.value
+        value = load()
+        self._entries[key] = _Entry(current, value)
+        return value
+
+    def _global_templates(self) -> _Templates:
+        path = self._config_dir / "TEMPLATES.yaml"
+        return self._get(
+            ("templates",),
+            lambda: _file_signature(path),
+            lambda: _load_global_templates(path),
+        )
+
+    def _load_skills(self) -> SkillSet:
+        listing, files, skills = scan_skills(self.hive_dir)
+        by_skill: dict[str, dict[str, str]] = {}
+        for vfs_name, content in files.items():
+            # vfs names are ``skills/{dir_name}/...``.
+            dir_name = vfs_name.split("/", 2)[1]
+            by_skill.setdefault(dir_name, {})[vfs_name] = content
+        return SkillSet(
+            listing=listing,
+            files=MappingProxyType(files),
+            skills=tuple(skills),
+            files_by_skill=MappingProxyType({
+                name: MappingProxyType(f) for name, f in by_skill.items()
+            }),
+        )
+
+
+def _load_system_config(path: Path) -> dict[str, Any]:
+    from bees.playbook import load_system_config
+
+    return load_system_config(path.parent)
+
+
+def _load_global_templates(path: Path) -> _Templates:
+    from bees.playbook import _normalize_templates, _read_template_yaml
+
+    # TEMPLATES.yaml is parsed once for both views.  Seeded files keep
+    # their own rule: only the explicitly named entries of a list.
+    data = _read_template_yaml(path)
+    files: dict[str, str] = {}
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and item.get("name"):
+                files[f"templates/{item['name']}.yaml"] = yaml.dump(
+                    item, sort_keys=False, allow_unicode=True,
+                )
+    by_name = {
+        item["name"]: freeze(item)
+        for item in _normalize_templates(data, path) if item.get("name")
+    }
+    return _Templates(
+        by_name=MappingProxyType(by_name),
+        files=MappingProxyType(files),
+    )
+
+
+def _load_workspace_templates(
+    templates_dir: Path,
+) -> Mapping[str, Mapping[str, Any]]:
+    from bees.playbook import _normalize_templates, _read_template_yaml
+
+    by_name: dict[str, Mapping[str, Any]] = {}
+    if templates_dir.is_dir():
+        for child in sorted(templates_dir.iterdir()):
+            if child.is_file() and child.suffix in (".yaml", ".yml"):
+                data = _read_template_yaml(child)
+                for item in _normalize_templates(data, child):
+                    if item.get("name"):
+                        by_name[item["name"]] = freeze(item)
+    return MappingProxyType(by_name)
+
+
+def _load_hooks_module(name: str, path: Path) -> ModuleType | None:
+    if not path.exists():
+        return None
+
+    spec = importlib.util.spec_from_file_location(
+        f"template_hooks.{name}", path,
+    )
+    if spec is None or spec.loader is None:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registries
+# ---------------------------------------------------------------------------
+
+_REGISTRIES: dict[Path, ConfigRegistry] = {}
+
+# Memoized ``Path.resolve`` for the spellings callers pass in.
+_RESOLVED: dict[Path, Path] = {}
+
+
+def get_registry(hive_dir: Path) -> ConfigRegistry:
+    """Return the shared registry for ``hive_dir``, creating it if needed."""
+    key = _RESOLVED.get(hive_dir)
+    if key is None:
+        if len(_RESOLVED) >= MAX_REGISTRIES * 4:
+            _RESOLVED.clear()
+        key = _RESOLVED[hive_dir] = hive_dir.resolve()
+    registry = _REGISTRIES.get(key)
+    if registry is None:
+        if len(_REGISTRIES) >= MAX_REGISTRIES:
+            del _REGISTRIES[next(iter(_REGISTRIES))]
+        registry = _REGISTRIES[key] = ConfigRegistry(hive_dir)
+    return registry
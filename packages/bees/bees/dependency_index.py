@@ -0,0 +1,255 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Dependency index — event-driven promotion of ``blocked`` agents.
+
+A blocked agent lists the agents it waits on in ``metadata.depends_on``.
+Rather than re-checking every blocked agent's dependencies on every
+cycle, the index keeps:
+
+- a reverse map ``dep_id → {waiting agent ids}``, and
+- per blocked agent, the set of dependencies that are not yet
+  ``completed`` (its size is the unmet-dependency count).
+
+When an agent finishes, ``task_done`` touches only that agent's
+dependents: completions shrink their unmet sets (promoting to
+``available`` at zero) and failures propagate transitively through the
+reverse map.
+
+The index subscribes to the store's ``AgentChange`` notifications. A
+change to a blocked agent, or to any agent's status, that the index did
+not make itself marks that agent dirty, and the next ``sync`` re-checks
+only the dirty agents. Edits from other store instances in this process
+(e.g. mutations) and out-of-process edits the store picks up arrive the
+same way; bookkeeping saves (turns, context) are ignored.
+
+The index is rebuilt from disk with one pass over the store only when it
+is marked stale — on first use, and when the owner changes the whole
+hive at once (pause/resume all, mutations; see ``invalidate``).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+from bees.agent import Agent
+from bees.agent_store import AgentChange
+from bees.unified_agent_store import UnifiedAgentStore
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["DependencyIndex"]
+
+
+class DependencyIndex:
+    """Reverse-dependency index over the blocked agents in a store."""
+
+    def __init__(self, store: UnifiedAgentStore) -> None:
+        self._store = store
+        self._waiting: dict[str, set[str]] = {}
+        self._unmet: dict[str, set[str]] = {}
+        self._dirty: set[str] = set()
+        self._stale = True
+        # Set while the index saves its own promotions and failures.
+        self._applying = False
+        self._unsubscribe = store.subscribe(self._on_change)
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next ``sync`` rebuilds it."""
+        self._stale = True
+
+    def close(self) -> None:
+        """Stop following store changes."""
+        self._unsubscribe()
+
+    def waiting_on(self, dep_id: str) -> set[str]:
+        """IDs of blocked agents still waiting on ``dep_id``."""
+        return set(self._waiting.get(dep_id, ()))
+
+    def unmet(self, agent_id: str) -> set[str]:
+        """Dependencies of a tracked agent that have not completed yet."""
+        return set(self._unmet.get(agent_id, ()))
+
+    def sync(self) -> int:
+        """Bring the index up to date with the store.
+
+        If the index is stale, lists every agent once, promotes blocked
+        agents whose dependencies have all completed, and fails
+        (transitively) those with a failed dependency. Otherwise only the
+        agents changed since the last ``sync`` are re-checked.
+
+        Returns the number of agents promoted.
+        """
+        if not self._stale:
+            return self._sync_dirty()
+        self._stale = False
+        self._dirty.clear()
+        self._waiting.clear()
+        self._unmet.clear()
+
+        agents = self._store.query_all()
+        statuses = {a.id: a.metadata.status for a in agents}
+        promoted = 0
+        failed: list[str] = []
+
+        for agent in agents:
+            if agent.metadata.status != "blocked":
+                continue
+            outcome = self._track(agent, statuses.get)
+            if outcome == "failed":
+                failed.append(agent.id)
+            elif outcome == "promoted":
+                promoted += 1
+
+        for agent_id in failed:
+            self._fail_dependents(agent_id)
+
+        return promoted
+
+    def task_done(self, agent: Agent) -> int:
+        """Apply a finished agent's status to the agents waiting on it.
+
+        Only ``completed`` and ``failed`` affect dependents; any other
+        status (paused, cancelled, suspended) leaves them blocked.
+
+        Returns the number of agents promoted.
+        """
+        self._dirty.discard(agent.id)
+        status = agent.metadata.status
+        if status == "failed":
+            self._fail_dependents(agent.id)
+            return 0
+        if status != "completed":
+            return 0
+
+        promoted = 0
+        for waiter_id in self._waiting.pop(agent.id, set()):
+            unmet = self._unmet.get(waiter_id)
+            if unmet is None:
+                continue
+            unmet.discard(agent.id)
+            if unmet:
+                continue
+            del self._unmet[waiter_id]
+            waiter = self._store.get(waiter_id)
+            if waiter is not None and waiter.metadata.status == "blocked":
+                self._promote(waiter)
+                promoted += 1
+        return promoted
+
+    # -- internal ----------------------------------------------------------
+
+    def _on_change(self, change: AgentChange) -> None:
+        """Mark an agent dirty if the change can affect dependencies."""
+        if self._stale or self._applying:
+            return
+        agent = change.agent
+        if agent is None:
+            relevant = change.agent_id in self._unmet
+        else:
+            status = agent.metadata.status
+            relevant = (
+                status == "blocked" or status != change.previous_status
+            )
+        if relevant:
+            self._dirty.add(change.agent_id)
+
+    def _sync_dirty(self) -> int:
+        """Re-check the agents changed since the last ``sync``."""
+        dirty, self._dirty = self._dirty, set()
+        promoted = 0
+        for agent_id in dirty:
+            self._untrack(agent_id)
+            agent = self._store.get(agent_id)
+            if agent is None:
+                continue
+            status = agent.metadata.status
+            if status == "blocked":
+                outcome = self._track(agent, self._status_of)
+                if outcome == "failed":
+                    self._fail_dependents(agent_id)
+                elif outcome == "promoted":
+                    promoted += 1
+            else:
+                promoted += self.task_done(agent)
+        return promoted
+
+    def _status_of(self, agent_id: str) -> str | None:
+        agent = self._store.get(agent_id)
+        return agent.metadata.status if agent is not None else None
+
+    def _track(
+        self, agent: Agent, status_of: Callable[[str], str | None],
+    ) -> str | None:
+        """Index a blocked agent's unmet dependencies.
+
+        An agent with a failed dependency is failed (its dependents are
+        left to the caller) and one with none unmet is promoted; returns
+        ``"failed"`` or ``"promoted"`` in those cases.
+        """
+        deps = agent.metadata.depends_on or []
+        statuses = [status_of(dep_id) for dep_id in deps]
+        if "failed" in statuses:
+            self._fail(agent)
+            return "failed"
+        unmet = {
+            dep_id for dep_id, status in zip(deps, statuses)
+            if status != "completed"
+        }
+        if not unmet:
+            self._promote(agent)
+            return "promoted"
+        self._unmet[agent.id] = unmet
+        for dep_id in unmet:
+            self._waiting.setdefault(dep_id, set()).add(agent.id)
+        return None
+
+    def _untrack(self, agent_id: str) -> None:
+        """Stop tracking an agent as a waiter."""
+        for dep_id in self._unmet.pop(agent_id, set()):
+            waiters = self._waiting.get(dep_id)
+            if waiters is not None:
+                waiters.discard(agent_id)
+                if not waiters:
+                    del self._waiting[dep_id]
+
+    def _save(self, agent: Agent) -> None:
+        self._applying = True
+        try:
+            self._store.save_metadata(agent)
+        finally:
+            self._applying = False
+
+    def _promote(self, agent: Agent) -> None:
+        agent.metadata.status = "available"
+        self._save(agent)
+        logger.debug("Promoted blocked agent %s", agent.id[:8])
+
+    def _fail(self, agent: Agent) -> None:
+        agent.metadata.status = "failed"
+        agent.metadata.error = "Dependency failed"
+        self._save(agent)
+        logger.debug("Failed blocked agent %s (dependency failed)", agent.id[:8])
+
+    def _fail_dependents(self, dep_id: str) -> None:
+        """Fail every blocked agent that transitively waits on ``dep_id``."""
+        pending = [dep_id]
+        while pending:
+            current = pending.pop()
+            for waiter_id in self._waiting.pop(current, set()):
+                unmet = self._unmet.pop(waiter_id, None)
+                if unmet is None:
+                    continue
+                for other in unmet - {current}:
+                    waiters = self._waiting.get(other)
+                    if waiters is not None:
+                        waiters.discard(waiter_id)
+                        if not waiters:
+                            del self._waiting[other]
+                waiter = self._store.get(waiter_id)
+                if waiter is None or waiter.metadata.status != "blocked":
+                    continue
+                self._fail(waiter)
+                pending.append(waiter_id)
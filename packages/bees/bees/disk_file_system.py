@@ -10,16 +10,28 @@ no ``/mnt/`` prefix.
 
 This replaces the in-memory ``AgentFileSystem`` + bidirectional sync
 hacks that previously bridged the virtual FS with the bash sandbox.
+
+By default the async read methods (``get``, ``get_many``, ``read_text``,
+``list_files``) do their disk I/O inline, blocking the event loop for as
+long as a read takes. Passing an ``io_executor`` (typically
+``shared_io_executor()``) switches them to async I/O mode: blocking work
+runs on that bounded thread pool and ``get_many`` reads its files in
+parallel.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import logging
 import mimetypes
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from bees.protocols.filesystem import (
     FileDescriptor,
@@ -29,8 +41,9 @@ from bees.protocols.filesystem import (
     DEFAULT_MIME_TYPE,
     KNOWN_TYPES,
 )
+from bees.workspace_snapshots import BlobStore, ManifestEntry, WorkspaceManifest
 
-__all__ = ["DiskFileSystem"]
+__all__ = ["DiskFileSystem", "shared_io_executor"]
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +51,36 @@ _BINARY_SNIFF_BYTES = 8 * 1024  # scan first 8 KB for null bytes
 _SKIP_DIRS = {"node_modules", "__pycache__"}
 _MNT_PREFIX = "/mnt/"
 
+# Files modified this recently are re-hashed on the next manifest scan
+# even if size and mtime match: a same-size rewrite within the
+# filesystem's timestamp granularity would otherwise go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Bounds concurrent blocking reads across every workspace in the process.
+_IO_WORKERS = 8
+
+_T = TypeVar("_T")
+
+_io_executor: ThreadPoolExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def shared_io_executor() -> Executor:
+    """Return the process-wide thread pool for workspace reads."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                _IO_WORKERS, thread_name_prefix="bees-fs-io",
+            )
+        return _io_executor
+
 
 def _is_binary(path: Path) -> bool:
     """Return True if the file looks like non-text binary data."""
     try:
-        chunk = path.read_bytes()[:_BINARY_SNIFF_BYTES]
+        with path.open("rb") as f:
+            chunk = f.read(_BINARY_SNIFF_BYTES)
         return b"\x00" in chunk
     except OSError:
         return False
@@ -68,14 +106,23 @@ class DiskFileSystem:
     Virtual namespaces (system files) use the same getter pattern as
     ``AgentFileSystem``.  Routes are held in memory (transient per
     session).
+
+    Args:
+        work_dir: Directory backing the workspace; created if missing.
+        io_executor: When given, async reads run their blocking disk
+            work on this executor instead of the event loop thread.
     """
 
-    def __init__(self, work_dir: Path) -> None:
+    def __init__(
+        self, work_dir: Path, *, io_executor: Executor | None = None,
+    ) -> None:
         self._work_dir = work_dir
+        self._io_executor = io_executor
         self._work_dir.mkdir(parents=True, exist_ok=True)
         self._system_files: dict[str, SystemFileGetter] = {}
         self._routes: dict[str, str] = {"": "", "/": "/"}
         self._file_count = 0
+        self._manifest_cache: dict[str, ManifestEntry] = {}
         self._logger = logging.getLogger(__name__)
 
     # ---- Public API ----
@@ -155,28 +202,23 @@ class DiskFileSystem:
         if normalized in self._system_files:
             return self._get_system_file(normalized)
 
-        disk_path = self._work_dir / normalized
-        if not disk_path.is_file():
-            return {"$error": f'file "{path}" not found'}
-
-        if _is_binary(disk_path):
-            mime_type, _ = mimetypes.guess_type(disk_path.name)
-            mime_type = mime_type or "application/octet-stream"
-            raw = disk_path.read_bytes()
-            data = base64.b64encode(raw).decode("ascii")
-            return [{"inlineData": {"data": data, "mimeType": mime_type}}]
-
-        content = disk_path.read_text(encoding="utf-8", errors="replace")
-        return [{"text": content}]
+        return await self._offload(self._read_parts, path, normalized)
 
     async def get_many(
         self, paths: list[str],
     ) -> list[dict[str, Any]] | dict[str, str]:
-        """Get data parts for multiple file paths."""
+        """Get data parts for multiple file paths.
+
+        In async I/O mode the files are read in parallel; results keep
+        the order of ``paths`` either way.
+        """
+        if self._io_executor is not None:
+            results = await asyncio.gather(*(self.get(p) for p in paths))
+        else:
+            results = [await self.get(p) for p in paths]
         errors: list[str] = []
         parts: list[dict[str, Any]] = []
-        for path in paths:
-            result = await self.get(path)
+        for result in results:
             if isinstance(result, dict):
                 if "$error" in result:
                     errors.append(result["$error"])
@@ -188,19 +230,9 @@ class DiskFileSystem:
 
     async def list_files(self) -> str:
         """List all files as newline-separated paths."""
-        all_paths: list[str] = []
-
-        # Walk disk files.
-        for disk_path in self._work_dir.rglob("*"):
-            if not disk_path.is_file():
-                continue
-            rel = disk_path.relative_to(self._work_dir)
-            if any(
-                part.startswith(".") or part in _SKIP_DIRS
-                for part in rel.parts
-            ):
-                continue
-            all_paths.append(str(rel))
+        all_paths = await self._offload(
+            lambda: [path for path, _ in self._walk_files()]
+        )
 
         # Include system file paths.
         all_paths.extend(self._system_files.keys())
@@ -289,17 +321,7 @@ class DiskFileSystem:
         """
         result: dict[str, FileDescriptor] = {}
 
-        for disk_path in self._work_dir.rglob("*"):
-            if not disk_path.is_file():
-                continue
-            rel = disk_path.relative_to(self._work_dir)
-            if any(
-                part.startswith(".") or part in _SKIP_DIRS
-                for part in rel.parts
-            ):
-                continue
-            path = str(rel)
-
+        for path, disk_path in self._walk_files():
             if _is_binary(disk_path):
                 mime_type, _ = mimetypes.guess_type(disk_path.name)
                 mime_type = mime_type or "application/octet-stream"
@@ -341,6 +363,57 @@ class DiskFileSystem:
             file_count=len(files),
         )
 
+    def manifest(self, blobs: BlobStore | None = None) -> WorkspaceManifest:
+        """Capture a content-hashed manifest of the workspace.
+
+        Unlike ``snapshot``, file contents are not held in memory: each
+        file is described by its size, mtime and SHA-256. Hashes are
+        cached between calls, so only files whose size or mtime changed
+        are re-read. When ``blobs`` is given, the contents of every file
+        in the manifest are guaranteed to be present in it.
+        """
+        racy_cutoff = time.time_ns() - _RACY_WINDOW_NS
+        files: dict[str, ManifestEntry] = {}
+        cache: dict[str, ManifestEntry] = {}
+
+        for path, disk_path in self._walk_files():
+            try:
+                st = disk_path.stat()
+            except OSError:
+                continue
+            entry = self._manifest_cache.get(path)
+            if (
+                entry is None
+                or entry.size != st.st_size
+                or entry.mtime_ns != st.st_mtime_ns
+                or (blobs is not None and not blobs.has(entry.sha256))
+            ):
+                try:
+                    raw = disk_path.read_bytes()
+                except OSError:
+                    continue
+                entry = self._manifest_entry(disk_path, raw, st.st_mtime_ns)
+                if blobs is not None:
+                    blobs.put(entry.sha256, raw)
+            files[path] = entry
+            if entry.mtime_ns < racy_cutoff:
+                cache[path] = entry
+
+        self._manifest_cache = cache
+        return WorkspaceManifest(
+            files=files,
+            routes=dict(self._routes),
+            file_count=self._file_count,
+        )
+
+    def seed_manifest(self, entries: dict[str, ManifestEntry]) -> None:
+        """Prime the manifest hash cache, e.g. from a persisted manifest.
+
+        Lets a resumed session skip re-hashing files that have not
+        changed since their entry was recorded.
+        """
+        self._manifest_cache.update(entries)
+
     def hydrate_from_snapshot(self, snapshot: FileSystemSnapshot, clear_untracked: bool = True) -> None:
         """Hydrate the disk workspace from a snapshot.
 
@@ -382,6 +455,67 @@ class DiskFileSystem:
 
     # ---- Private helpers ----
 
+    async def _offload(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run blocking ``fn`` on the I/O executor, or inline without one."""
+        if self._io_executor is None:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, fn, *args)
+
+    def _read_parts(
+        self, path: str, normalized: str,
+    ) -> list[dict[str, Any]] | dict[str, str]:
+        """Read a workspace file from disk as data parts (blocking)."""
+        disk_path = self._work_dir / normalized
+        if not disk_path.is_file():
+            return {"$error": f'file "{path}" not found'}
+
+        if _is_binary(disk_path):
+            mime_type, _ = mimetypes.guess_type(disk_path.name)
+            mime_type = mime_type or "application/octet-stream"
+            raw = disk_path.read_bytes()
+            data = base64.b64encode(raw).decode("ascii")
+            return [{"inlineData": {"data": data, "mimeType": mime_type}}]
+
+        content = disk_path.read_text(encoding="utf-8", errors="replace")
+        return [{"text": content}]
+
+    def _walk_files(self) -> Iterator[tuple[str, Path]]:
+        """Yield ``(relative_path, disk_path)`` for visible workspace files.
+
+        Skips hidden files and directories and ``_SKIP_DIRS``.
+        """
+        for disk_path in self._work_dir.rglob("*"):
+            if not disk_path.is_file():
+                continue
+            rel = disk_path.relative_to(self._work_dir)
+            if any(
+                part.startswith(".") or part in _SKIP_DIRS
+                for part in rel.parts
+            ):
+                continue
+            yield str(rel), disk_path
+
+    @staticmethod
+    def _manifest_entry(
+        disk_path: Path, raw: bytes, mtime_ns: int,
+    ) -> ManifestEntry:
+        """Describe file contents the same way ``files`` would."""
+        mime_type, _ = mimetypes.guess_type(disk_path.name)
+        if b"\x00" in raw[:_BINARY_SNIFF_BYTES]:
+            kind = "inlineData"
+            mime_type = mime_type or "application/octet-stream"
+        else:
+            kind = "text"
+            mime_type = mime_type or DEFAULT_MIME_TYPE
+        return ManifestEntry(
+            sha256=hashlib.sha256(raw).hexdigest(),
+            size=len(raw),
+            mtime_ns=mtime_ns,
+            mime_type=mime_type,
+            type=kind,
+        )
+
     def _resolve_write(self, name: str) -> tuple[str, str]:
         """Resolve a name to a (relative_path, mime_type) tuple.
 
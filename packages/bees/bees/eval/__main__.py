@@ -8,8 +8,8 @@ Usage::
     # Single hive:
     python -m bees.eval run path/to/hive
 
-    # Batch (eval set):
-    python -m bees.eval run-set path/to/eval_set --output results/
+    # Batch (eval set), four cases at a time:
+    python -m bees.eval run-set path/to/eval_set --output results/ --jobs 4
 
     # Via npm:
     npm run eval -- run path/to/hive
@@ -94,6 +94,26 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override the root template from SYSTEM.yaml.",
     )
+    set_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of cases to run concurrently (default: 1).",
+    )
+    set_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Result cache directory (default: <output>/.eval-cache).",
+    )
+    set_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse cached results for unchanged hives. The cache doesn't "
+            "track changes to the bees code itself."
+        ),
+    )
 
     return parser
 
@@ -123,12 +143,20 @@ async def _run_single(
 
 async def _run_set(
     eval_set_dir: Path, output_dir: Path, key: str,
-    *, root_task: str | None = None,
+    *,
+    root_task: str | None = None,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    use_cache: bool = False,
 ) -> None:
     from bees.eval.batch import run_set
 
     results = await run_set(
-        eval_set_dir, output_dir, key, root_task=root_task,
+        eval_set_dir, output_dir, key,
+        root_task=root_task,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
     )
 
     if not results:
@@ -186,7 +214,13 @@ def main() -> None:
             sys.exit(1)
 
         output_dir = args.output.resolve()
-        asyncio.run(_run_set(eval_set_dir, output_dir, key, root_task=args.root))
+        asyncio.run(_run_set(
+            eval_set_dir, output_dir, key,
+            root_task=args.root,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir.resolve() if args.cache_dir else None,
+            use_cache=args.cache,
+        ))
 
 
 if __name__ == "__main__":
@@ -22,19 +22,41 @@ Each child directory that contains ``config/SYSTEM.yaml`` is treated as
 a hive (eval case).  The ``eval/`` subdirectory holds eval-specific
 configuration — currently ``persona.md`` (used in Phase 2 for the
 simulated user).
+
+Cases run concurrently up to ``jobs`` at a time, each in its own output
+directory with its own ``Bees`` instance and runners.  With
+``use_cache``, results are cached under a hash of the case's hive, the
+run configuration, and the runners it ran with (``case_key``); a case
+whose key is unchanged since its last successful run is not run again.
+The key does not cover the code under evaluation (or the model's
+nondeterminism), so caching is opt-in: it suits re-running a set
+against the same code, e.g. after an interrupted run.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
 import sys
+import time
 from pathlib import Path
+from typing import Any, Callable
 
-from bees.eval.runner import CaseResult, run_case
+from bees.eval.runner import CaseResult, TaskSummary, run_case
+from bees.runners.live import DEFAULT_MODEL as LIVE_MODEL
+from opal_backend.loop import AGENT_MODEL
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["run_set"]
+__all__ = ["case_key", "run_set", "runners_fingerprint"]
+
+# Bump to invalidate every cached result (e.g. when CaseResult changes).
+CACHE_VERSION = 2
+
+CACHE_DIRNAME = ".eval-cache"
 
 
 def _discover_cases(eval_set_dir: Path) -> list[tuple[str, Path]]:
@@ -57,7 +79,91 @@ def _discover_cases(eval_set_dir: Path) -> list[tuple[str, Path]]:
     return cases
 
 
-def _print_summary(results: list[CaseResult]) -> None:
+def runners_fingerprint(
+    runners_factory: Callable[[], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Describe the runners a case runs with, for ``case_key``.
+
+    The real model runners are identified by the default models they
+    fall back to when a template doesn't name one; a ``runners_factory``
+    by its qualified name, so its results never stand in for the real
+    runners' (or another factory's).
+    """
+    if runners_factory is None:
+        return {"generate": AGENT_MODEL, "live": LIVE_MODEL}
+    return {
+        "factory": f"{runners_factory.__module__}."
+        f"{runners_factory.__qualname__}",
+    }
+
+
+def case_key(
+    hive_dir: Path,
+    *,
+    root_task: str | None = None,
+    runners: dict[str, Any] | None = None,
+) -> str:
+    """Hash a case's hive and run configuration into a cache key.
+
+    Covers the relative path and contents of every file in the hive, so
+    any edit — config, templates, skills, ``eval/`` — changes the key.
+    ``runners`` is the ``runners_fingerprint`` of the runners the case
+    runs with; it defaults to the real model runners'.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "version": CACHE_VERSION,
+        "root_task": root_task,
+        "runners": runners or runners_fingerprint(),
+    }, sort_keys=True).encode())
+    for path in sorted(p for p in hive_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(hive_dir).as_posix().encode() + b"\0")
+        with path.open("rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+
+def _load_cached(cache_dir: Path, key: str, case_name: str) -> CaseResult | None:
+    """Return the cached result for ``key``, if any."""
+    path = cache_dir / f"{key}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        tasks = [TaskSummary(**t) for t in data.pop("tasks", [])]
+        result = CaseResult(**data, tasks=tasks)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError, TypeError) as exc:
+        logger.warning("Ignoring unreadable cached result %s: %s", path, exc)
+        return None
+    result.case_name = case_name
+    result.cached = True
+    return result
+
+
+def _store_cached(cache_dir: Path, key: str, result: CaseResult) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data = dataclasses.asdict(result)
+    data.pop("cached")
+    path = cache_dir / f"{key}.json"
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _print_progress(done: int, total: int, result: CaseResult) -> None:
+    """Print one line per finished case to stderr."""
+    width = len(str(total))
+    print(
+        f"[{done:>{width}}/{total}] {result.case_name}: {result.status} "
+        f"in {result.duration_s:.1f}s"
+        + (" (cached)" if result.cached else ""),
+        file=sys.stderr,
+    )
+
+
+def _print_summary(
+    results: list[CaseResult], wall_s: float | None = None,
+) -> None:
     """Print a per-case status table to stderr."""
     if not results:
         print("No cases to report.", file=sys.stderr)
@@ -81,7 +187,8 @@ def _print_summary(results: list[CaseResult]) -> None:
         duration_str = f"{r.duration_s:.1f}s"
         print(
             f"{r.case_name:<{name_width}}  {r.status:<12}  "
-            f"{r.task_count:>5}  {duration_str:>10}",
+            f"{r.task_count:>5}  {duration_str:>10}"
+            + ("  (cached)" if r.cached else ""),
             file=sys.stderr,
         )
 
@@ -101,7 +208,15 @@ def _print_summary(results: list[CaseResult]) -> None:
         f"{total_tasks:>5}  {total_duration:>9.1f}s",
         file=sys.stderr,
     )
-    print(f"{separator}\n", file=sys.stderr)
+    print(separator, file=sys.stderr)
+    if wall_s is not None:
+        cached = sum(r.cached for r in results)
+        print(
+            f"Wall time {wall_s:.1f}s, {cached} of {len(results)} "
+            f"case(s) from cache",
+            file=sys.stderr,
+        )
+    print(file=sys.stderr)
 
 
 async def run_set(
@@ -110,20 +225,36 @@ async def run_set(
     gemini_key: str,
     *,
     root_task: str | None = None,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    use_cache: bool = False,
+    runners_factory: Callable[[], dict[str, Any]] | None = None,
 ) -> list[CaseResult]:
     """Run all eval cases in a set directory.
 
-    Cases are run sequentially.  Each case's hive is copied to
-    ``output_dir/{case_name}/`` before running.
+    Up to ``jobs`` cases run at once.  Each case's hive is copied to
+    ``output_dir/{case_name}/`` before running.  Progress is printed as
+    each case finishes.
 
     Args:
         eval_set_dir: Directory containing eval cases.
         output_dir: Root output directory for results.
         gemini_key: Gemini API key for model calls.
         root_task: Override the root template from SYSTEM.yaml.
+        jobs: How many cases to run concurrently.
+        cache_dir: Where cached results live.  Defaults to
+            ``output_dir/.eval-cache``.
+        use_cache: Reuse cached results for unchanged cases and cache
+            new ones.  Failed cases are never cached.  Off by default:
+            the key doesn't change when the code under evaluation does.
+        runners_factory: Builds the session runners for each case,
+            instead of the real model runners (e.g. fake runners for
+            offline runs and benchmarks).  Results are cached apart
+            from the real runners', keyed by the factory's qualified
+            name.
 
     Returns:
-        A list of ``CaseResult`` objects, one per case.
+        A list of ``CaseResult`` objects, one per case, in case order.
     """
     cases = _discover_cases(eval_set_dir)
 
@@ -140,18 +271,41 @@ async def run_set(
     )
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    results: list[CaseResult] = []
-
-    for case_name, hive_dir in cases:
-        case_output = output_dir / case_name
-        result = await run_case(
-            hive_dir,
-            case_output,
-            gemini_key,
-            case_name=case_name,
-            root_task=root_task,
-        )
-        results.append(result)
-
-    _print_summary(results)
+    if cache_dir is None:
+        cache_dir = output_dir / CACHE_DIRNAME
+    runners = runners_fingerprint(runners_factory)
+    semaphore = asyncio.Semaphore(max(1, jobs))
+    done = 0
+    start = time.monotonic()
+
+    async def _run(case_name: str, hive_dir: Path) -> CaseResult:
+        nonlocal done
+        key = None
+        result = None
+        if use_cache:
+            key = await asyncio.to_thread(
+                case_key, hive_dir, root_task=root_task, runners=runners,
+            )
+            result = _load_cached(cache_dir, key, case_name)
+        if result is None:
+            async with semaphore:
+                result = await run_case(
+                    hive_dir,
+                    output_dir / case_name,
+                    gemini_key,
+                    case_name=case_name,
+                    root_task=root_task,
+                    runners=runners_factory() if runners_factory else None,
+                )
+            if key is not None and result.status != "failed":
+                _store_cached(cache_dir, key, result)
+        done += 1
+        _print_progress(done, len(cases), result)
+        return result
+
+    results = list(await asyncio.gather(
+        *(_run(case_name, hive_dir) for case_name, hive_dir in cases),
+    ))
+
+    _print_summary(results, time.monotonic() - start)
     return results
@@ -66,6 +66,7 @@ class CaseResult:
     summaries: list[dict] = field(default_factory=list)
     tasks: list[TaskSummary] = field(default_factory=list)
     error: str | None = None
+    cached: bool = False  # Reused from the batch result cache.
 
 
 def _derive_status(tasks: list[TaskSummary]) -> str:
@@ -159,6 +160,7 @@ async def run_case(
     *,
     case_name: str | None = None,
     root_task: str | None = None,
+    runners: dict[str, Any] | None = None,
 ) -> CaseResult:
     """Run a single eval case.
 
@@ -173,19 +175,24 @@ async def run_case(
         case_name: Human-readable name for this case (defaults to
             the hive directory name).
         root_task: Override the root template from SYSTEM.yaml.
+        runners: Session runners to use instead of the real model
+            runners (e.g. a fake runner for offline runs).
     """
     name = case_name or hive_dir.name
 
-    # Copy the hive to the output directory.
+    # Copy the hive to the output directory.  Off the event loop, since
+    # other cases may be running alongside.
     work_dir = output_dir / "hive"
     if work_dir.exists():
-        shutil.rmtree(work_dir)
-    shutil.copytree(hive_dir, work_dir)
+        await asyncio.to_thread(shutil.rmtree, work_dir)
+    await asyncio.to_thread(shutil.copytree, hive_dir, work_dir)
     (work_dir / ".readonly").touch()
 
     logger.info("Running case '%s': %s → %s", name, hive_dir, work_dir)
 
-    runners, http_client = _create_runners(gemini_key)
+    http_client: httpx.AsyncClient | None = None
+    if runners is None:
+        runners, http_client = _create_runners(gemini_key)
     start = time.monotonic()
 
     try:
@@ -343,7 +350,8 @@ async def run_case(
             error=str(exc),
         )
     finally:
-        await http_client.aclose()
+        if http_client is not None:
+            await http_client.aclose()
 
     duration = time.monotonic() - start
 
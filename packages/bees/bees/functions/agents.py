@@ -192,9 +192,7 @@ def _make_handlers(
                         blocks.append(sandbox_block)
                     full_objective = f"{objective}\n\n" + "\n\n".join(blocks)
                     existing.objective = full_objective
-                    objective_path = existing.dir / "objective.md"
-                    objective_path.write_text(full_objective)
-                    scheduler.store.save_metadata(existing)
+                    scheduler.store.save(existing)
 
                 if status_cb:
                     status_cb(None, None)
@@ -838,12 +838,18 @@ class MCPRegistry:
         registry = MCPRegistry()
         await registry.discover_all(configs)   # at startup (brief connect)
         factories = registry.get_factories()   # per session
+        await registry.update(new_configs)     # on config change
         await registry.disconnect_all()        # at shutdown
     """
 
     def __init__(self) -> None:
         self._connections: list[MCPConnection] = []
         self._factories: list[FunctionGroupFactory] = []
+        # The config each server was last discovered with, by name.
+        self._configs: dict[str, dict[str, Any]] = {}
+        # Connections replaced by ``update`` that running sessions may
+        # still hold (and lazily reconnect); closed again at shutdown.
+        self._retired: list[MCPConnection] = []
 
     async def discover_all(
         self,
@@ -865,15 +871,8 @@ class MCPRegistry:
         self._validate_configs(configs, hive_dir=hive_dir)
 
         for config in configs:
-            name = config["name"]
-            conn = MCPConnection(
-                name=name,
-                description=config.get("description", ""),
-                config=config,
-                hive_dir=hive_dir,
-            )
-            await conn.discover_tools()
-            if conn.tools:
+            conn = await self._discover(config, hive_dir=hive_dir)
+            if conn is not None:
                 self._connections.append(conn)
                 self._factories.append(_mcp_function_group_factory(conn))
 
@@ -887,6 +886,85 @@ class MCPRegistry:
         """Alias for ``discover_all()`` (backward compatibility)."""
         await self.discover_all(configs, hive_dir=hive_dir)
 
+    async def update(
+        self,
+        configs: list[dict[str, Any]],
+        *,
+        hive_dir: Path | None = None,
+    ) -> list[str]:
+        """Apply a new set of server configs, touching only what changed.
+
+        Servers whose config is unchanged keep their connection and
+        discovered tools.  Removed and changed servers are disconnected;
+        added and changed ones are discovered.  Sessions that already
+        hold a replaced server's tools keep using them until they end.
+
+        Raises ``ValueError`` (leaving the registry as it was) if the
+        new configs are invalid.
+
+        Returns the names of the servers that were added, removed, or
+        changed.
+        """
+        self._validate_configs(configs, hive_dir=hive_dir)
+
+        new_configs = {config["name"]: config for config in configs}
+        changed = sorted(
+            name for name in self._configs.keys() | new_configs.keys()
+            if self._configs.get(name) != new_configs.get(name)
+        )
+        if not changed:
+            return []
+
+        by_name = {conn.name: conn for conn in self._connections}
+        for name in changed:
+            self._configs.pop(name, None)
+            conn = by_name.pop(name, None)
+            if conn is None:
+                continue
+            self._retired.append(conn)
+            try:
+                await conn.disconnect()
+            except BaseException as exc:
+                logger.warning(
+                    "MCP server '%s' disconnect error: %s", conn.name, exc,
+                )
+
+        for name in changed:
+            if name not in new_configs:
+                continue
+            conn = await self._discover(new_configs[name], hive_dir=hive_dir)
+            if conn is not None:
+                by_name[name] = conn
+
+        # Swap both lists at once so ``get_factories`` never sees a
+        # partial update.
+        self._connections = [
+            by_name[name] for name in new_configs if name in by_name
+        ]
+        self._factories = [
+            _mcp_function_group_factory(conn) for conn in self._connections
+        ]
+        logger.info("MCP servers reloaded: %s", ", ".join(changed))
+        return changed
+
+    async def _discover(
+        self,
+        config: dict[str, Any],
+        *,
+        hive_dir: Path | None = None,
+    ) -> MCPConnection | None:
+        """Discover one server's tools; ``None`` if it has none."""
+        name = config["name"]
+        self._configs[name] = config
+        conn = MCPConnection(
+            name=name,
+            description=config.get("description", ""),
+            config=config,
+            hive_dir=hive_dir,
+        )
+        await conn.discover_tools()
+        return conn if conn.tools else None
+
     def _validate_configs(
         self,
         configs: list[dict[str, Any]],
@@ -947,7 +1025,7 @@ class MCPRegistry:
         logger.info(
             "Disconnecting from %d MCP server(s)", len(self._connections),
         )
-        for conn in self._connections:
+        for conn in [*self._connections, *self._retired]:
             try:
                 await conn.disconnect()
             except BaseException as exc:
@@ -956,4 +1034,6 @@ class MCPRegistry:
                 )
         self._connections.clear()
         self._factories.clear()
+        self._configs.clear()
+        self._retired.clear()
 
@@ -38,7 +38,7 @@ _FRONTMATTER_RE = re.compile(
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkillInfo:
     """Parsed metadata from a SKILL.md frontmatter."""
 
@@ -48,7 +48,7 @@ class SkillInfo:
     vfs_path: str
     content: str
     dir_name: str
-    allowed_tools: list[str]
+    allowed_tools: tuple[str, ...]
 
 
 def _parse_frontmatter(text: str) -> dict[str, Any]:
@@ -122,7 +122,7 @@ def scan_skills(
             vfs_path=vfs_path,
             content=content,
             dir_name=dir_name,
-            allowed_tools=allowed_tools,
+            allowed_tools=tuple(allowed_tools),
         )
         skills.append(skill)
 
@@ -9,6 +9,13 @@ Each mutation is a JSON file (``{uuid}.json``) with a ``type`` field.
 After processing, the box writes a result file (``{uuid}.result.json``)
 with a ``status`` field (``"ok"`` or ``"error"``).
 
+The queue is journaled: every mutation that gets a result is appended to
+``mutations/.processed``, so scans skip completed mutations without
+touching their files. Once enough completed mutations accumulate, all
+but the most recent are compacted into ``mutations/archive/{date}/`` and
+the journal is rewritten, keeping ``mutations/`` (and every scan of it)
+small no matter how long the hive has been running.
+
 Two processing modes:
 
 - **Cold** mutations (e.g., ``reset``) require quiescence — the box
@@ -42,6 +49,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -63,6 +71,20 @@ logger = logging.getLogger("bees.mutations")
 # Mutations that require shutdown → process → restart.
 COLD_MUTATIONS = frozenset({"reset"})
 
+# Append-only journal of mutation files that already have a result.
+PROCESSED_JOURNAL = ".processed"
+
+# Subdirectory of ``mutations/`` that compaction moves completed
+# mutations (and their results) into.
+ARCHIVE_DIRNAME = "archive"
+
+# Compaction runs once this many completed mutations sit in
+# ``mutations/``...
+COMPACT_THRESHOLD = 256
+
+# ...and leaves the most recently completed ones in place.
+RETAIN_COMPLETED = 64
+
 
 # ---------------------------------------------------------------------------
 # Types
@@ -110,11 +132,25 @@ class MutationManager:
     runtime access (e.g., cancelling asyncio tasks).  When no ``Bees``
     instance is available (startup processing), handlers fall back to
     direct filesystem operations via ``TaskStore``.
+
+    The processed journal is loaded on first use and kept in memory, so
+    a long-lived manager only reads it once.
     """
 
-    def __init__(self, hive_dir: Path, bees: Bees | None = None):
+    def __init__(
+        self,
+        hive_dir: Path,
+        bees: Bees | None = None,
+        *,
+        compact_threshold: int = COMPACT_THRESHOLD,
+        retain_completed: int = RETAIN_COMPLETED,
+    ):
         self._hive_dir = hive_dir
         self._bees = bees
+        self._compact_threshold = compact_threshold
+        self._retain_completed = retain_completed
+        # Journaled mutation filenames, in completion order.
+        self._processed: dict[str, None] | None = None
 
     # -- Sentinel lifecycle ------------------------------------------------
 
@@ -157,6 +193,7 @@ class MutationManager:
         """
         pending = self._scan_pending()
         if not pending:
+            self._compact()
             return False
 
         for mutation in pending:
@@ -166,17 +203,24 @@ class MutationManager:
             )
             await self._dispatch(mutation)
 
+        self._compact()
         return True
 
-    async def process_inline(self) -> MutationOutcome:
+    async def process_inline(
+        self, paths: list[Path] | None = None,
+    ) -> MutationOutcome:
         """Process hot mutations inline while the scheduler is running.
 
         Cold mutations are not processed — they're flagged in the outcome
         so the caller can initiate a shutdown/restart cycle.
 
+        Args:
+            paths: The mutation files reported as changed.  Only these
+                are considered; ``None`` scans the whole directory.
+
         Returns a ``MutationOutcome`` indicating what happened.
         """
-        pending = self._scan_pending()
+        pending = self._scan_pending(paths)
         outcome = MutationOutcome()
 
         for mutation in pending:
@@ -194,6 +238,7 @@ class MutationManager:
                 if result.get("created"):
                     outcome.created_tasks.update(result["created"])
 
+        self._compact()
         return outcome
 
     async def process_cold(self) -> bool:
@@ -216,30 +261,57 @@ class MutationManager:
             await self._dispatch(mutation)
             processed = True
 
+        self._compact()
         return processed
 
     # -- Scanning ----------------------------------------------------------
 
-    def _scan_pending(self) -> list[PendingMutation]:
-        """Find mutation files without a matching result file.
+    def _scan_pending(
+        self, paths: list[Path] | None = None,
+    ) -> list[PendingMutation]:
+        """Find mutation files that haven't been processed yet.
+
+        A mutation is processed once it is in the journal or has a
+        result file; the latter is backfilled into the journal so the
+        check is only paid once (e.g. for hives that predate it).
+
+        Args:
+            paths: Restrict the scan to these files.  ``None`` lists the
+                whole directory.
 
         Returns mutations sorted by filename (effectively by creation
         time if UUIDs are used, though ordering is best-effort).
         """
-        mutations_dir = self._hive_dir / "mutations"
+        mutations_dir = self._mutations_dir
         if not mutations_dir.exists():
             return []
 
+        if paths is None:
+            with os.scandir(mutations_dir) as entries:
+                names = sorted(
+                    entry.name for entry in entries if entry.is_file()
+                )
+        else:
+            names = sorted({
+                path.name for path in paths
+                if (mutations_dir / path.name).is_file()
+            })
+
+        processed = self._load_processed()
         pending: list[PendingMutation] = []
+        backfill: list[str] = []
 
-        for path in sorted(mutations_dir.glob("*.json")):
-            # Skip result files.
-            if path.stem.endswith(".result"):
+        for name in names:
+            # Skip non-mutations, result files, and anything processed.
+            if not name.endswith(".json") or name.startswith("."):
+                continue
+            if name.endswith(".result.json") or name in processed:
                 continue
 
-            # Skip if already processed.
-            result_path = path.with_suffix("").with_suffix(".result.json")
+            path = mutations_dir / name
+            result_path = path.with_suffix(".result.json")
             if result_path.exists():
+                backfill.append(name)
                 continue
 
             try:
@@ -252,16 +324,86 @@ class MutationManager:
                 logger.warning(
                     "Skipping malformed mutation %s: missing 'type'", path.name,
                 )
-                self._write_result(
-                    result_path,
+                self._record_result(
+                    path,
                     {"status": "error", "error": "Malformed mutation: missing 'type'"},
                 )
                 continue
 
             pending.append(PendingMutation(path=path, data=data))
 
+        if backfill:
+            self._journal(backfill)
+
         return pending
 
+    # -- Journal and compaction --------------------------------------------
+
+    @property
+    def _journal_path(self) -> Path:
+        return self._mutations_dir / PROCESSED_JOURNAL
+
+    def _load_processed(self) -> dict[str, None]:
+        """Return the journaled mutation filenames, loading them once."""
+        if self._processed is None:
+            try:
+                lines = self._journal_path.read_text().splitlines()
+            except FileNotFoundError:
+                lines = []
+            # A crash mid-append can leave a torn last line; it names no
+            # real file, so it is harmless to keep.
+            self._processed = dict.fromkeys(line for line in lines if line)
+        return self._processed
+
+    def _journal(self, names: list[str]) -> None:
+        """Append mutation filenames to the processed journal."""
+        processed = self._load_processed()
+        self._mutations_dir.mkdir(parents=True, exist_ok=True)
+        with self._journal_path.open("a") as f:
+            f.write("".join(f"{name}\n" for name in names))
+        processed.update(dict.fromkeys(names))
+
+    def _record_result(self, path: Path, result: dict[str, Any]) -> None:
+        """Write the result for the mutation at ``path`` and journal it."""
+        self._write_result(path.with_suffix(".result.json"), result)
+        self._journal([path.name])
+
+    def _compact(self) -> None:
+        """Archive completed mutations once too many have accumulated.
+
+        Moves all but the ``retain_completed`` most recently completed
+        mutations and their results into ``archive/{date}/``, then
+        rewrites the journal to list only what is left.
+        """
+        processed = self._load_processed()
+        if len(processed) <= self._compact_threshold:
+            return
+
+        names = list(processed)
+        cutoff = len(names) - self._retain_completed
+        archived, retained = names[:cutoff], names[cutoff:]
+
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        archive_dir = self._mutations_dir / ARCHIVE_DIRNAME / day
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        for name in archived:
+            stem = name.removesuffix(".json")
+            for filename in (name, f"{stem}.result.json"):
+                try:
+                    os.replace(
+                        self._mutations_dir / filename, archive_dir / filename,
+                    )
+                except FileNotFoundError:
+                    pass
+
+        tmp = self._journal_path.with_name(f"{PROCESSED_JOURNAL}.tmp")
+        tmp.write_text("".join(f"{name}\n" for name in retained))
+        os.replace(tmp, self._journal_path)
+        self._processed = dict.fromkeys(retained)
+        logger.info(
+            "Archived %d completed mutations to %s", len(archived), archive_dir,
+        )
+
     # -- Dispatch ----------------------------------------------------------
 
     async def _dispatch(self, mutation: PendingMutation) -> dict[str, Any] | None:
@@ -293,8 +435,8 @@ class MutationManager:
                 case "rollback-to-turn":
                     extra = await self._handle_rollback_to_turn(mutation)
                 case _:
-                    self._write_result(
-                        mutation.result_path,
+                    self._record_result(
+                        mutation.path,
                         {
                             "status": "error",
                             "error": f"Unknown mutation type: {mutation.mutation_type}",
@@ -303,14 +445,14 @@ class MutationManager:
                     return None
 
             result = {"status": "ok", **extra}
-            self._write_result(mutation.result_path, result)
+            self._record_result(mutation.path, result)
             logger.info("Mutation complete: %s", mutation.mutation_type)
             return result
 
         except Exception as exc:
             logger.exception("Mutation failed: %s", mutation.mutation_type)
-            self._write_result(
-                mutation.result_path,
+            self._record_result(
+                mutation.path,
                 {"status": "error", "error": str(exc)},
             )
             return None
@@ -343,6 +485,9 @@ class MutationManager:
 
             logger.info("Cleared %s/", subdir_name)
 
+        # The journal and archive went with the rest of mutations/.
+        self._processed = None
+
     def _handle_respond(self, mutation: PendingMutation) -> None:
         """Write response and flip assignee atomically.
 
@@ -595,6 +740,7 @@ class MutationManager:
         from opal_backend.sessions.file_store import FileBasedSessionStore
         from opal_backend.interaction_store import InteractionState
         from bees.disk_file_system import DiskFileSystem
+        from bees.workspace_snapshots import BlobStore, WorkspaceSnapshotLog
         from opal_backend.chat_log_manager import derive_chat_log
 
         task_id = mutation.data.get("task_id")
@@ -644,13 +790,17 @@ class MutationManager:
         target_checkpoint = checkpoints[turn_index]
         context_length = target_checkpoint["context_length"]
 
-        # Find the nearest non-null file system snapshot by walking backward from turn_index
-        fs_snapshot = None
-        for idx in range(turn_index, -1, -1):
-            cp = checkpoints[idx]
-            if cp.get("file_system") is not None:
-                fs_snapshot = cp["file_system"]
-                break
+        # Rebuild the workspace from manifest diffs when the session has
+        # them; otherwise find the nearest non-null file system snapshot by
+        # walking backward from turn_index.
+        snapshot_log = WorkspaceSnapshotLog(sdir, BlobStore(agent.dir / "blobs"))
+        fs_snapshot = snapshot_log.materialize(turn_index)
+        if fs_snapshot is None:
+            for idx in range(turn_index, -1, -1):
+                cp = checkpoints[idx]
+                if cp.get("file_system") is not None:
+                    fs_snapshot = cp["file_system"]
+                    break
 
         # 3. Generate a new session UUID. Create its directory under tickets/{id}/sessions/.
         import uuid as uuid_lib
@@ -681,16 +831,16 @@ class MutationManager:
         await session_store.save_interaction(new_session_id, new_state)
         await session_store.set_resume_id(new_session_id, "fork-resume-id")
 
-        # Also copy turns.json up to turn_index
-        turns_file = sdir / "turns.json"
-        if turns_file.exists():
-            try:
-                turns_data = json.loads(turns_file.read_text(encoding="utf-8"))
-                new_turns = turns_data[:turn_index]
-                new_turns_file = new_sdir / "turns.json"
-                new_turns_file.write_text(json.dumps(new_turns, ensure_ascii=False, indent=2), encoding="utf-8")
-            except Exception as e:
-                logger.warning("Failed to copy turns.json on fork: %s", e)
+        # Also copy the turn checkpoints up to turn_index
+        for cp in checkpoints[:turn_index]:
+            await session_store.record_turn_boundary(
+                session_id=new_session_id,
+                turn_index=cp["turn"],
+                context_length=cp["context_length"],
+                file_system=cp["file_system"],
+                token_metadata=cp["token_metadata"],
+            )
+        snapshot_log.copy_to(new_sdir, before_turn=turn_index)
 
         # Also copy and slice events.jsonl up to turn_index
         events_file = sdir / "events.jsonl"
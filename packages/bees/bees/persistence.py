@@ -0,0 +1,202 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Atomic file writes and write-behind persistence for hive state.
+
+- ``atomic_write_text`` replaces a file via a temp file in the same
+  directory and ``os.replace``, so a crash mid-write leaves either the
+  old contents or the new ones — never a truncated file.
+- ``WriteBehind`` coalesces writes per key within a short window and runs
+  them on a thread pool, off the event loop. Only the latest write
+  scheduled for a key runs; writes for the same key never overlap and
+  land in order. ``schedule(..., now=True)`` skips the window and hands
+  the write to the pool at once; ``aflush`` awaits pending writes from
+  the event loop without blocking it. ``flush`` writes pending entries
+  in the calling thread and is called on shutdown (and at interpreter
+  exit).
+
+``AgentStore`` uses both: saves are deferred, and a terminal status is
+handed to the pool straight away (see ``AgentStore.save_metadata``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+__all__ = ["WriteBehind", "atomic_write_text"]
+
+logger = logging.getLogger(__name__)
+
+TEMP_PREFIX = ".tmp-"
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temp file and rename."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class WriteBehind:
+    """Debounced, coalescing background writer.
+
+    Args:
+        delay: Seconds a write may wait for newer writes to the same key.
+            The window starts at the first pending write, so a key that is
+            saved continuously is still written at least this often.
+        max_workers: Size of the writer thread pool.
+    """
+
+    def __init__(self, *, delay: float = 0.05, max_workers: int = 4) -> None:
+        self._delay = delay
+        self._cond = threading.Condition()
+        self._pending: dict[str, tuple[float, Callable[[], None]]] = {}
+        self._inflight: set[str] = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="bees-write-behind",
+        )
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.writes = 0
+        self.coalesced = 0
+        atexit.register(self.close)
+
+    def schedule(
+        self, key: str, write: Callable[[], None], *, now: bool = False,
+    ) -> None:
+        """Run ``write`` for ``key`` after the window, replacing any pending one.
+
+        With ``now``, the write is handed to the pool without waiting out
+        the window. After ``close``, writes run immediately in the calling
+        thread.
+        """
+        with self._cond:
+            if not self._closed:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    self.coalesced += 1
+                    deadline = pending[0]
+                else:
+                    deadline = time.monotonic() + self._delay
+                if now:
+                    deadline = time.monotonic()
+                self._pending[key] = (deadline, write)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._dispatch,
+                        name="bees-write-behind-timer",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                self._cond.notify_all()
+                return
+        self._run(key, write)
+
+    def flush(self, key: str | None = None) -> None:
+        """Write pending entries now, in the calling thread.
+
+        Waits for in-flight writes of the same keys first, so everything
+        scheduled before the call is on disk when it returns.
+        """
+        with self._cond:
+            keys = (
+                [key] if key is not None
+                else list(self._pending.keys() | self._inflight)
+            )
+        for k in keys:
+            with self._cond:
+                while k in self._inflight:
+                    self._cond.wait()
+                pending = self._pending.pop(k, None)
+                if pending is None:
+                    continue
+                self._inflight.add(k)
+            self._run(k, pending[1])
+
+    async def aflush(self, key: str | None = None) -> None:
+        """``flush`` on a worker thread, so the event loop keeps running."""
+        await asyncio.to_thread(self.flush, key)
+
+    def discard(self, key: str) -> None:
+        """Drop a pending write for ``key`` and wait out an in-flight one."""
+        with self._cond:
+            self._pending.pop(key, None)
+            while key in self._inflight:
+                self._cond.wait()
+
+    def has(self, key: str) -> bool:
+        """True while a write for ``key`` is pending or in flight."""
+        with self._cond:
+            return key in self._pending or key in self._inflight
+
+    def pending(self) -> int:
+        """Number of keys with a write waiting to run."""
+        with self._cond:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush everything and stop the background threads."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.close)
+
+    # -- internal ----------------------------------------------------------
+
+    def _run(self, key: str, write: Callable[[], None]) -> None:
+        try:
+            write()
+        except Exception:
+            logger.exception("Write-behind for %s failed", key)
+        finally:
+            with self._cond:
+                self._inflight.discard(key)
+                self.writes += 1
+                self._cond.notify_all()
+
+    def _dispatch(self) -> None:
+        """Timer thread: hand due writes to the pool."""
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                next_deadline: float | None = None
+                for key, (deadline, write) in list(self._pending.items()):
+                    if key in self._inflight:
+                        # Ordered after the running write; retried when
+                        # it finishes and notifies.
+                        continue
+                    if deadline > now:
+                        if next_deadline is None or deadline < next_deadline:
+                            next_deadline = deadline
+                        continue
+                    del self._pending[key]
+                    self._inflight.add(key)
+                    try:
+                        self._executor.submit(self._run, key, write)
+                    except RuntimeError:
+                        # Interpreter shutdown: the pool no longer accepts
+                        # work. Leave it for the exit-time flush.
+                        self._inflight.discard(key)
+                        self._pending[key] = (deadline, write)
+                        return
+                timeout = None if next_deadline is None else next_deadline - now
+                self._cond.wait(timeout)
@@ -13,17 +13,17 @@ declares ``autostart``, child tasks are stamped automatically.
 
 from __future__ import annotations
 
-import importlib.util
 import logging
 import uuid
 from pathlib import Path
 from types import ModuleType
-from typing import Any
+from typing import Any, Mapping
 
 import yaml
 
 from bees.agent import Agent
 from bees.config import HIVE_DIR
+from bees.config_registry import get_registry, thaw
 from bees.subagent_scope import SubagentScope
 
 logger = logging.getLogger(__name__)
@@ -53,95 +53,80 @@ def _load_templates(config_dir: Path) -> list[dict[str, Any]]:
     return data
 
 
-def load_all_templates(config_dir: Path, workspace_dir: Path | None = None) -> list[dict[str, Any]]:
-    """Load and merge all templates from global and local sources."""
-    templates: dict[str, dict[str, Any]] = {}
+def _read_template_yaml(path: Path) -> Any:
+    """Parse a template file, or return ``None`` if it's missing or bad."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.warning("Failed to load template from %s: %s", path, e)
+        return None
 
-    def _load_file(path: Path) -> list[dict[str, Any]]:
-        if not path.exists():
-            return []
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if isinstance(data, dict):
-                if "name" not in data:
-                    data["name"] = path.stem
-                return [data]
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    if isinstance(item, dict) and "name" not in item:
-                        item["name"] = f"{path.stem}_{i}"
-                return [item for item in data if isinstance(item, dict)]
-            else:
-                logger.warning("Template file %s must be a list or dictionary; got %s", path, type(data).__name__)
-        except Exception as e:
-            logger.warning("Failed to load template from %s: %s", path, e)
-        return []
 
-    def _scan_dir(templates_dir: Path) -> list[dict[str, Any]]:
-        items = []
-        if not templates_dir.is_dir():
-            return []
-        for child in sorted(templates_dir.iterdir()):
-            if child.is_file() and child.suffix in (".yaml", ".yml"):
-                items.extend(_load_file(child))
-        return items
-
-    # 1. Global Legacy
-    global_legacy = config_dir / "TEMPLATES.yaml"
-    if global_legacy.exists():
-        for item in _load_file(global_legacy):
-            t_name = item.get("name")
-            if t_name:
-                templates[t_name] = item
-
-    # 2. Local Workspace templates
+def _normalize_templates(data: Any, path: Path) -> list[dict[str, Any]]:
+    """Turn a parsed template file into template dicts with names.
+
+    A file holds one template (a mapping, named after the file if it has
+    no ``name``) or a list of them (unnamed ones become ``{stem}_{i}``).
+    """
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        if "name" not in data:
+            data["name"] = path.stem
+        return [data]
+    if isinstance(data, list):
+        for i, item in enumerate(data):
+            if isinstance(item, dict) and "name" not in item:
+                item["name"] = f"{path.stem}_{i}"
+        return [item for item in data if isinstance(item, dict)]
+    logger.warning("Template file %s must be a list or dictionary; got %s", path, type(data).__name__)
+    return []
+
+
+def _merged_templates(
+    config_dir: Path, workspace_dir: Path | None,
+) -> dict[str, Mapping[str, Any]]:
+    """Global templates overlaid with workspace ones, frozen, by name."""
+    registry = get_registry(config_dir.parent)
+    templates = dict(registry.templates())
     if workspace_dir:
-        local_dir = workspace_dir / "templates"
-        if local_dir.is_dir():
-            for item in _scan_dir(local_dir):
-                t_name = item.get("name")
-                if t_name:
-                    templates[t_name] = item
+        templates.update(registry.workspace_templates(workspace_dir))
+    return templates
 
 
+def load_all_templates(config_dir: Path, workspace_dir: Path | None = None) -> list[dict[str, Any]]:
+    """Load and merge all templates from global and local sources.
 
-    return list(templates.values())
+    Parsed templates are cached in the hive's ``ConfigRegistry``; each
+    call returns fresh copies the caller may modify.
+    """
+    return [thaw(t) for t in _merged_templates(config_dir, workspace_dir).values()]
 
 
 def list_playbooks(config_dir: Path, workspace_dir: Path | None = None) -> list[str]:
     """Return the names of all available templates."""
-    return [t["name"] for t in load_all_templates(config_dir, workspace_dir) if "name" in t]
+    return list(_merged_templates(config_dir, workspace_dir))
 
 
 def load_playbook(name: str, config_dir: Path, workspace_dir: Path | None = None) -> dict[str, Any]:
     """Load a template by name."""
-    for t in load_all_templates(config_dir, workspace_dir):
-        if t.get("name") == name:
-            return t
-    raise FileNotFoundError(f"Template not found: {name}")
-
-
+    template = _merged_templates(config_dir, workspace_dir).get(name)
+    if template is None:
+        raise FileNotFoundError(f"Template not found: {name}")
+    return thaw(template)
 
 
 def _load_hooks(name: str, hooks_dir: Path) -> ModuleType | None:
-    """Import a template's hooks module if it exists.
+    """Return a template's hooks module if it exists.
 
-    Looks for ``hive/config/hooks/{name}.py``.
+    Looks for ``hive/config/hooks/{name}.py``.  The module is imported
+    once and cached in the hive's ``ConfigRegistry`` until the file
+    changes.
     """
-    hooks_path = hooks_dir / f"{name}.py"
-    if not hooks_path.exists():
-        return None
-
-    spec = importlib.util.spec_from_file_location(
-        f"template_hooks.{name}", hooks_path,
-    )
-    if spec is None or spec.loader is None:
-        return None
-
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return get_registry(hooks_dir.parent.parent).hooks(name)
 
 
 # ---------------------------------------------------------------------------
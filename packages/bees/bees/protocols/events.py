@@ -22,6 +22,7 @@ from typing import Any, Awaitable, Callable, TypeVar
 from bees.agent import Agent
 
 __all__ = [
+    "AgentChanged",
     "BroadcastReceived",
     "CycleComplete",
     "CycleStarted",
@@ -129,6 +130,27 @@ class BroadcastReceived(SchedulerEvent):
     source_task_id: str = ""
 
 
+@dataclass
+class AgentChanged(SchedulerEvent):
+    """An agent was created, updated or deleted in the hive's store.
+
+    Bridges the store's change notifications (``AgentStore.subscribe``)
+    into the typed event pipeline. Unlike the lifecycle events above, it
+    fires for every persisted change, whoever made it — use it to push
+    deltas to clients instead of re-querying the tree.
+    """
+
+    type: str = field(init=False, default="agent_changed")
+    kind: str = ""
+    """``'created'``, ``'updated'`` or ``'deleted'``."""
+
+    agent_id: str = ""
+    task: Agent | None = None
+    """The agent after the change; None when deleted."""
+
+    previous_status: str | None = None
+
+
 # ---------------------------------------------------------------------------
 # Emitter type
 # ---------------------------------------------------------------------------
@@ -68,6 +68,8 @@ class FunctionDefinition:
     response_json_schema: dict[str, Any] | None = None
     icon: str | None = None
     title: str | None = None
+    concurrency_class: str | None = None
+    timeout_s: float | None = None
 
 
 @dataclass
@@ -193,6 +195,8 @@ def assemble_function_group(
     name: str | None = None,
     instruction_override: str | None = None,
     preconditions: dict[str, PreconditionHandler] | None = None,
+    concurrency_classes: dict[str, str] | None = None,
+    timeouts: dict[str, float] | None = None,
 ) -> FunctionGroup:
     """Build a FunctionGroup from loaded declarations and a handler map.
 
@@ -208,11 +212,17 @@ def assemble_function_group(
         instruction_override: Replaces the loaded instruction when the
             instruction template needs runtime interpolation.
         preconditions: Optional map of function name to precondition handler.
+        concurrency_classes: Optional map of function name to concurrency
+            class.
+        timeouts: Optional map of function name to handler timeout in
+            seconds.
     """
     metadata_by_name: dict[str, dict[str, Any]] = {
         entry["name"]: entry for entry in loaded.metadata
     }
     preconds = preconditions or {}
+    classes = concurrency_classes or {}
+    timeout_by_name = timeouts or {}
 
     definitions: list[tuple[str, FunctionDefinition]] = []
     declarations: list[FunctionDeclaration] = []
@@ -233,6 +243,8 @@ def assemble_function_group(
             response_json_schema=decl.get("responseJsonSchema"),
             icon=meta.get("icon"),
             title=meta.get("title"),
+            concurrency_class=classes.get(fname),
+            timeout_s=timeout_by_name.get(fname),
         )
         definitions.append((fname, func_def))
         declarations.append(decl)
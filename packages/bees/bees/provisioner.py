@@ -22,7 +22,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
-from bees.disk_file_system import DiskFileSystem
+from bees.disk_file_system import DiskFileSystem, shared_io_executor
 from bees.functions.chat import get_chat_function_group_factory
 from bees.functions.events import get_events_function_group_factory
 from bees.functions.live import get_live_function_group
@@ -33,6 +33,7 @@ from bees.functions.system import get_system_function_group_factory
 from bees.functions.agents import get_agents_function_group_factory
 
 from bees.protocols.session import SessionConfiguration
+from bees.config_registry import get_registry
 from bees.skill_filter import filter_skills, merge_function_filter
 from bees.subagent_scope import SubagentScope
 
@@ -106,7 +107,7 @@ def provision_session(
         ticket_dir / "filesystem" if ticket_dir
         else Path(tempfile.mkdtemp(prefix="bees-fs-"))
     )
-    disk_fs = DiskFileSystem(work_dir)
+    disk_fs = DiskFileSystem(work_dir, io_executor=shared_io_executor())
 
     # 4. Seed initial files (skills and templates) directly to disk.
     if seed_files:
@@ -114,14 +115,9 @@ def provision_session(
             disk_fs.write(name, content)
 
         try:
-            import yaml
-            from bees.playbook import _load_templates
-            global_templates = _load_templates(hive_dir / "config")
-            for t in global_templates:
-                t_name = t.get("name")
-                if t_name:
-                    t_content = yaml.dump(t, sort_keys=False, allow_unicode=True)
-                    disk_fs.write(f"templates/{t_name}.yaml", t_content)
+            template_files = get_registry(hive_dir).template_files()
+            for name, content in template_files.items():
+                disk_fs.write(name, content)
         except Exception as exc:
             import logging
             logging.getLogger(__name__).warning("Failed to seed templates into workspace: %s", exc)
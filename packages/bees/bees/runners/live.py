@@ -10,6 +10,13 @@ the Gemini Live API is established and owned by the browser (hivetool).
 
 The :class:`LiveStream` blocks until the browser signals completion
 by writing ``live_result.json`` to the task directory.
+
+The browser and this process talk through files: events arrive in
+``live_events/``, tool calls in ``tool_dispatch/``.  Both readers wake
+on filesystem notifications (``watchfiles``) rather than polling, so a
+tool call is picked up within milliseconds and idle sessions cost
+nothing.  Polling every ``poll_interval`` remains as the fallback when
+the watcher cannot start (e.g. the inotify watch limit is reached).
 """
 
 from __future__ import annotations
@@ -22,7 +29,9 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from watchfiles import Change, awatch
 
 from bees.protocols.functions import (
     FunctionGroup,
@@ -54,6 +63,14 @@ LIVE_API_ENDPOINT = (
 
 DEFAULT_MODEL = "models/gemini-3.1-flash-live-preview"
 
+# With notifications on, rescan the directory this often anyway, in case
+# an event was missed.
+RESCAN_INTERVAL = 5.0
+
+# The browser creates a file before it writes it, so a notified file can
+# be briefly empty.  Give up on an unreadable file after this many tries.
+MAX_READ_ATTEMPTS = 3
+
 
 # ---------------------------------------------------------------------------
 # Live SessionHooks — provides a working controller for live sessions
@@ -399,6 +416,167 @@ def _write_bundle(bundle: SessionBundle, ticket_dir: Path) -> Path:
     return bundle_path
 
 
+# ---------------------------------------------------------------------------
+# _DirectoryWatch — change notifications with a polling fallback
+# ---------------------------------------------------------------------------
+
+
+class _DirectoryWatch:
+    """Wakes a reader when files in some directories change.
+
+    ``wait()`` returns the changed paths, or ``None`` when the reader
+    should rescan everything: in polling mode (``notify=False`` or the
+    watcher failed), after ``RESCAN_INTERVAL`` without changes, and
+    whenever the shared watcher has restarted, since changes made while
+    it was down went unseen.
+    """
+
+    def __init__(
+        self,
+        paths: list[Path],
+        *,
+        poll_interval: float,
+        notify: bool = True,
+    ) -> None:
+        self.paths = paths
+        self._poll_interval = poll_interval
+        self._notify = notify
+        self._changed: set[Path] = set()
+        self._rescan = True
+        self._wakeup = asyncio.Event()
+        self._notifier: _DirectoryNotifier | None = None
+
+    def start(self) -> None:
+        """Start watching (no-op when notifications are off)."""
+        if self._notify and self._notifier is None:
+            self._notifier = _get_notifier()
+            self._notifier.add(self)
+
+    def notify(self, changed: set[Path] | None) -> None:
+        """Record changes (``None``: unknown, rescan) and wake the reader."""
+        if changed is None:
+            self._rescan = True
+        else:
+            self._changed.update(changed)
+        self._wakeup.set()
+
+    def fail(self) -> None:
+        """Fall back to polling."""
+        self._notifier = None
+        self.notify(None)
+
+    async def wait(self) -> set[Path] | None:
+        """Wait for changes; ``None`` means rescan everything."""
+        if self._notifier is None:
+            await asyncio.sleep(self._poll_interval)
+            return None
+        if not (self._rescan or self._changed):
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), RESCAN_INTERVAL)
+            except TimeoutError:
+                return None
+        self._wakeup.clear()
+        if self._rescan:
+            self._rescan = False
+            self._changed.clear()
+            return None
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._notifier is not None:
+            self._notifier.remove(self)
+            self._notifier = None
+
+
+class _DirectoryNotifier:
+    """One ``watchfiles.awatch`` for every ``_DirectoryWatch`` in the process.
+
+    ``awatch`` holds a worker thread while it runs and the thread pool is
+    bounded, so a watcher per live session would stall once there are a
+    few dozen.  Instead the single watcher covers all watched
+    directories and restarts whenever that set changes.
+    """
+
+    def __init__(self) -> None:
+        # Resolved directory → watches, each with its own spelling of it.
+        self._watches: dict[Path, dict[_DirectoryWatch, Path]] = {}
+        self._stop: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, watch: _DirectoryWatch) -> None:
+        for path in watch.paths:
+            self._watches.setdefault(path.resolve(), {})[watch] = path
+        self._restart()
+
+    def remove(self, watch: _DirectoryWatch) -> None:
+        for path in watch.paths:
+            watches = self._watches.get(path.resolve())
+            if watches is not None:
+                watches.pop(watch, None)
+                if not watches:
+                    del self._watches[path.resolve()]
+        self._restart()
+
+    def _restart(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        if self._watches and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._watches:
+            stop = self._stop = asyncio.Event()
+            paths = [path for path in self._watches if path.is_dir()]
+            watches = {w for ws in self._watches.values() for w in ws}
+            # Changes made while restarting went unseen.
+            for watch in watches:
+                watch.notify(None)
+            try:
+                async for changes in awatch(
+                    *paths,
+                    stop_event=stop,
+                    debounce=100,
+                    step=5,
+                    recursive=False,
+                ):
+                    self._route(changes)
+            except Exception as exc:
+                logger.warning(
+                    "Cannot watch live session directories, polling "
+                    "instead: %s", exc,
+                )
+                for watch in watches:
+                    watch.fail()
+                    self.remove(watch)
+
+    def _route(self, changes: set[tuple[Change, str]]) -> None:
+        by_watch: dict[_DirectoryWatch, set[Path]] = {}
+        for change, name in changes:
+            if change == Change.deleted:
+                continue
+            path = Path(name)
+            for watch, parent in self._watches.get(path.parent, {}).items():
+                by_watch.setdefault(watch, set()).add(parent / path.name)
+        for watch, changed in by_watch.items():
+            watch.notify(changed)
+
+
+_notifier: _DirectoryNotifier | None = None
+_notifier_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_notifier() -> _DirectoryNotifier:
+    """Return the notifier for the running event loop."""
+    global _notifier, _notifier_loop
+    loop = asyncio.get_running_loop()
+    if _notifier is None or _notifier_loop is not loop:
+        _notifier = _DirectoryNotifier()
+        _notifier_loop = loop
+    return _notifier
+
+
 # ---------------------------------------------------------------------------
 # ToolDispatchWatcher — filesystem-mediated tool execution
 # ---------------------------------------------------------------------------
@@ -412,8 +590,11 @@ class ToolDispatchWatcher:
     handler, executes it, and writes ``{call_id}.result.json`` for the
     browser to relay back over the WebSocket.
 
-    Uses sleep-based polling (consistent with ``LiveStream``).  Runs as
-    a background ``asyncio.Task`` cancelled when the session ends.
+    Wakes on change notifications for the directory and looks only at
+    the files that changed; the result file marks a call as done.
+    With ``notify=False`` (or if the watcher fails) it polls every
+    ``poll_interval``.  Runs as a background ``asyncio.Task`` cancelled
+    when the session ends.
     """
 
     def __init__(
@@ -421,47 +602,67 @@ class ToolDispatchWatcher:
         dispatch_dir: Path,
         handler_map: dict[str, FunctionHandler],
         poll_interval: float = 0.3,
+        *,
+        notify: bool = True,
     ) -> None:
         self._dispatch_dir = dispatch_dir
         self._handler_map = handler_map
         self._poll_interval = poll_interval
-        self._processed: set[str] = set()
+        self._notify = notify
+        # call_id → failed reads, for call files not yet fully written.
+        self._read_failures: dict[str, int] = {}
 
     async def run(self) -> None:
-        """Poll for call files and dispatch handlers until cancelled."""
+        """Dispatch handlers for new call files until cancelled."""
         self._dispatch_dir.mkdir(parents=True, exist_ok=True)
+        watch = _DirectoryWatch(
+            [self._dispatch_dir],
+            poll_interval=self._poll_interval,
+            notify=self._notify,
+        )
+        watch.start()
         logger.info(
             "ToolDispatchWatcher started — watching %s", self._dispatch_dir,
         )
 
         try:
+            changed: set[Path] | None = None
             while True:
-                await self._scan_once()
-                await asyncio.sleep(self._poll_interval)
+                await self._scan_once(
+                    None if changed is None else (p.name for p in changed),
+                )
+                changed = await watch.wait()
         except asyncio.CancelledError:
             logger.info("ToolDispatchWatcher stopped")
             raise
+        finally:
+            watch.close()
+
+    async def _scan_once(self, names: Iterable[str] | None = None) -> None:
+        """Dispatch unprocessed call files.
 
-    async def _scan_once(self) -> None:
-        """Scan for unprocessed call files and dispatch them."""
+        Looks at ``names`` in the dispatch directory, or at every file
+        when ``names`` is ``None``.
+        """
         if not self._dispatch_dir.exists():
             return
 
-        for path in sorted(self._dispatch_dir.iterdir()):
-            # Skip result files and already-processed calls.
+        if names is None:
+            paths = sorted(self._dispatch_dir.iterdir())
+        else:
+            paths = [self._dispatch_dir / name for name in sorted(names)]
+
+        for path in paths:
+            # Skip result files and non-call files.
             if path.name.endswith(".result.json"):
                 continue
             if not path.name.endswith(".json"):
                 continue
 
+            # Skip calls that already have a result.
             call_id = path.stem
-            if call_id in self._processed:
-                continue
-
-            # Skip if result already exists.
             result_path = self._dispatch_dir / f"{call_id}.result.json"
-            if result_path.exists():
-                self._processed.add(call_id)
+            if result_path.exists() or not path.exists():
                 continue
 
             await self._dispatch(call_id, path, result_path)
@@ -470,14 +671,19 @@ class ToolDispatchWatcher:
         self, call_id: str, call_path: Path, result_path: Path,
     ) -> None:
         """Read a call file, execute the handler, write the result."""
-        self._processed.add(call_id)
-
         try:
             call_data = json.loads(call_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError) as exc:
+            failures = self._read_failures.get(call_id, 0) + 1
+            if failures < MAX_READ_ATTEMPTS:
+                # Probably still being written; retry on the next change.
+                self._read_failures[call_id] = failures
+                return
+            self._read_failures.pop(call_id, None)
             logger.error("Failed to read call file %s: %s", call_path, exc)
             self._write_error_result(result_path, call_id, str(exc))
             return
+        self._read_failures.pop(call_id, None)
 
         # Wire format: {"functionCall": {"id": ..., "name": ..., "args": ...}}
         fc = call_data.get("functionCall", {})
@@ -551,9 +757,11 @@ class LiveStream:
     """Session stream that reads live events from the filesystem.
 
     The browser writes structured event files to ``live_events/``
-    in the ticket directory.  This stream polls for new files,
-    translates each event into ``EvalCollector``-compatible event
-    dicts, and yields them to ``drain_session``.
+    in the ticket directory.  This stream waits for new files (change
+    notifications, or polling every ``poll_interval`` with
+    ``notify=False`` or when the watcher fails), translates each event
+    into ``EvalCollector``-compatible event dicts, and yields them to
+    ``drain_session``.
 
     Falls back to ``live_result.json`` for crash recovery (if the
     browser dies without writing a ``sessionEnd`` event).
@@ -569,6 +777,7 @@ class LiveStream:
         setup: dict[str, Any] | None = None,
         poll_interval: float = 0.5,
         watcher_task: asyncio.Task[None] | None = None,
+        notify: bool = True,
     ) -> None:
         self._ticket_dir = ticket_dir
         self._poll_interval = poll_interval
@@ -576,8 +785,20 @@ class LiveStream:
         self._watcher_task = watcher_task
         self._events_dir = ticket_dir / LIVE_EVENTS_DIR
 
+        # Watches the events and the ticket directory (for the fallback
+        # result file).  Started on the first read.
+        self._watch = _DirectoryWatch(
+            [self._events_dir, ticket_dir],
+            poll_interval=poll_interval,
+            notify=notify and self._events_dir.is_dir(),
+        )
+        self._watch_started = False
+
         # Read cursor: last processed sequence number.
         self._cursor = -1
+        # Failed reads of the event file after the cursor, which may
+        # still be being written.
+        self._read_failures = 0
 
         # Queue of translated events ready to yield.
         self._pending: list[dict[str, Any]] = []
@@ -613,11 +834,21 @@ class LiveStream:
             return self._pending.pop(0)
 
         if self._done:
+            self._watch.close()
             raise StopAsyncIteration
 
-        # Poll for new events or fallback result.
+        if not self._watch_started:
+            self._watch_started = True
+            self._watch.start()
+
+        # Wait for new events or fallback result.
+        changed: set[Path] | None = None
         while not self._pending and not self._done:
-            self._scan_events()
+            self._scan_events(
+                None if changed is None else (
+                    p.name for p in changed if p.parent == self._events_dir
+                ),
+            )
             if self._pending:
                 return self._pending.pop(0)
 
@@ -637,20 +868,30 @@ class LiveStream:
                 if self._pending:
                     return self._pending.pop(0)
 
-            await asyncio.sleep(self._poll_interval)
+            changed = await self._watch.wait()
 
         if self._pending:
             return self._pending.pop(0)
 
+        self._watch.close()
         raise StopAsyncIteration
 
-    def _scan_events(self) -> None:
-        """Scan ``live_events/`` for new event files past the cursor."""
+    def _scan_events(self, names: Iterable[str] | None = None) -> None:
+        """Read new event files past the cursor.
+
+        Looks at ``names`` in ``live_events/``, or at every file when
+        ``names`` is ``None`` or an earlier read needs retrying.
+        """
         if not self._events_dir.exists():
             return
 
+        if names is None or self._read_failures:
+            paths: Iterable[Path] = self._events_dir.iterdir()
+        else:
+            paths = (self._events_dir / name for name in names)
+
         candidates: list[tuple[int, Path]] = []
-        for path in self._events_dir.iterdir():
+        for path in paths:
             if not path.name.endswith(".json"):
                 continue
             try:
@@ -665,12 +906,20 @@ class LiveStream:
 
         # Process in sequence order.
         for seq, path in sorted(candidates):
-            self._cursor = seq
             try:
                 data = json.loads(path.read_text(encoding="utf-8"))
             except (json.JSONDecodeError, OSError) as exc:
+                self._read_failures += 1
+                if self._read_failures < MAX_READ_ATTEMPTS:
+                    # Probably still being written; retry from here on
+                    # the next change.
+                    return
                 logger.warning("Failed to read live event %s: %s", path, exc)
+                self._read_failures = 0
+                self._cursor = seq
                 continue
+            self._read_failures = 0
+            self._cursor = seq
             self._translate_event(data)
 
     def _translate_event(self, data: dict[str, Any]) -> None:
@@ -866,6 +1115,7 @@ class LiveStream:
 
     def _cancel_watcher(self) -> None:
         """Cancel the tool dispatch watcher if running."""
+        self._watch.close()
         if self._watcher_task and not self._watcher_task.done():
             self._watcher_task.cancel()
 
@@ -15,8 +15,10 @@ A **Cycle** is a single wave of dependency-aware task execution. The
 system operates by repeatedly evaluating task dependencies and firing all
 unblocked work simultaneously:
 
-1. **Promote**: The scheduler checks all ``blocked`` tasks. If their
-   dependencies are resolved (``completed``), it promotes them to ``available``.
+1. **Promote**: ``blocked`` tasks whose dependencies are resolved
+   (``completed``) are promoted to ``available``. This is event-driven:
+   a ``DependencyIndex`` maps each dependency to the tasks waiting on it,
+   so a finishing task only touches its own dependents.
 2. **Collect**: It gathers all runnable work:
    - New ``available`` tasks.
    - ``suspended`` tasks that have been responded to by a user and are
@@ -46,7 +48,9 @@ from typing import Any, Awaitable, Callable
 from bees.agent import Agent
 
 from bees.coordination import route_coordination_task
-from bees.playbook import run_task_done_hooks, load_system_config, run_playbook
+from bees.dependency_index import DependencyIndex
+from bees.config_registry import get_registry, thaw
+from bees.playbook import run_task_done_hooks, run_playbook
 from bees.protocols.events import (
     CycleComplete,
     CycleStarted,
@@ -83,40 +87,17 @@ async def _noop_emit(event: Any) -> None:
 def promote_blocked_tasks(store: UnifiedAgentStore) -> int:
     """Check blocked tasks and promote those whose deps are met.
 
+    One-shot sweep for callers without a long-lived ``Scheduler``: builds
+    a fresh ``DependencyIndex`` (a single pass over the store) and
+    applies it. Tasks with a failed dependency are failed transitively.
+
     Returns the number of tasks promoted.
     """
-    blocked = store.query_all(status="blocked")
-    promoted = 0
-
-    for agent in blocked:
-        deps = agent.metadata.depends_on or []
-        all_met = True
-        any_failed = False
-
-        for dep_id in deps:
-            dep = store.get(dep_id)
-            if dep is None:
-                all_met = False
-                continue
-            if dep.metadata.status == "completed":
-                continue
-            if dep.metadata.status == "failed":
-                any_failed = True
-                break
-            all_met = False
-
-        if any_failed:
-            agent.metadata.status = "failed"
-            agent.metadata.error = "Dependency failed"
-            store.save_metadata(agent)
-            continue
-
-        if all_met:
-            agent.metadata.status = "available"
-            store.save_metadata(agent)
-            promoted += 1
-
-    return promoted
+    index = DependencyIndex(store)
+    try:
+        return index.sync()
+    finally:
+        index.close()
 
 
 # ---------------------------------------------------------------------------
@@ -155,6 +136,7 @@ class Scheduler:
         self._active_streams: dict[str, SessionStream] = {}
         self._deleted_tasks: set[str] = set()
         self._mcp_registry: MCPRegistry | None = None
+        self._dependencies = DependencyIndex(self.store)
 
         self._task_runner = TaskRunner(
             runners=runners,
@@ -176,13 +158,23 @@ class Scheduler:
         """Wake the scheduler loop."""
         self._trigger.set()
 
+    def rescan_dependencies(self) -> None:
+        """Rebuild the dependency index on the next cycle.
+
+        Call this when the whole hive changed at once (mutations,
+        pause/resume). Changes to individual agents — task completions,
+        or edits the store picks up — keep the index current on their
+        own.
+        """
+        self._dependencies.invalidate()
+
     async def startup(self) -> Agent | None:
         """Recover stuck tasks, boot root template if needed."""
         agents = await self.recover_stuck_tasks()
 
         # Connect to MCP servers declared in SYSTEM.yaml.
-        config = load_system_config(self.store.hive_dir / "config")
-        mcp_configs = config.get("mcp", [])
+        config = get_registry(self.store.hive_dir).system_config()
+        mcp_configs = thaw(config.get("mcp", ()))
         if mcp_configs:
             self._mcp_registry = MCPRegistry()
             await self._mcp_registry.connect_all(
@@ -195,8 +187,31 @@ class Scheduler:
 
         return root_agent
 
+    async def reload_config(self) -> list[str]:
+        """Apply a changed ``SYSTEM.yaml`` without interrupting running tasks.
+
+        Reconnects only the MCP servers whose config changed, then boots
+        the root template if it isn't running — the parts of
+        :meth:`startup` that depend on configuration.
+
+        Returns the names of the MCP servers that were reconnected.
+        """
+        config = get_registry(self.store.hive_dir).system_config()
+        mcp_configs = thaw(config.get("mcp", ()))
+        changed: list[str] = []
+        if mcp_configs and self._mcp_registry is None:
+            self._mcp_registry = MCPRegistry()
+        if self._mcp_registry is not None:
+            changed = await self._mcp_registry.update(
+                mcp_configs, hive_dir=self.store.hive_dir,
+            )
+
+        await self._boot_root_template(self.store.query_all())
+        return changed
+
     async def shutdown(self) -> None:
         """Clean up MCP connections and other resources."""
+        self._dependencies.close()
         if self._mcp_registry:
             await self._mcp_registry.disconnect_all()
             self._mcp_registry = None
@@ -210,7 +225,7 @@ class Scheduler:
 
     async def _boot_root_template(self, agents: list[Agent]) -> Agent | None:
         """Boot the root template if it isn't already running."""
-        config = load_system_config(self.store.hive_dir / "config")
+        config = get_registry(self.store.hive_dir).system_config()
         root = self._root_override or config.get("root")
         if not root:
             return None
@@ -326,6 +341,7 @@ class Scheduler:
         # Cancel all in-flight asyncio tasks.
         for task_id, async_task in list(self._active_tasks.items()):
             async_task.cancel()
+        self._dependencies.invalidate()
 
         # Flip all non-terminal tasks to paused.
         NON_TERMINAL = ("available", "blocked", "running", "suspended")
@@ -361,6 +377,7 @@ class Scheduler:
         agent.metadata.paused_from = agent.metadata.status
         agent.metadata.status = "paused"
         self.store.save_metadata(agent)
+        self._dependencies.invalidate()
         return True
 
     def deliver_to_task(
@@ -586,7 +603,7 @@ class Scheduler:
         cycle = 0
 
         while True:
-            promote_blocked_tasks(self.store)
+            self._dependencies.sync()
 
             all_available = self.store.query_all(status="available")
 
@@ -600,6 +617,7 @@ class Scheduler:
                     a, self.store, self._running_tasks,
                     self._emit,
                 )
+                self._dependencies.task_done(a)
 
             items = [
                 a for a in all_available
@@ -669,6 +687,7 @@ class Scheduler:
             for item in all_items_in_cycle:
                 updated = self.store.get(item.id) or item
                 run_task_done_hooks(updated)
+                self._dependencies.task_done(updated)
 
                 parent_id = updated.metadata.parent_id
                 if parent_id and updated.metadata.status in (
@@ -725,6 +744,7 @@ class Scheduler:
 
             updated = self.store.get(agent.id) or agent
             run_task_done_hooks(updated)
+            self._dependencies.task_done(updated)
             self._notify_task_done(agent.id)
 
             parent_id = updated.metadata.parent_id
@@ -762,7 +782,7 @@ class Scheduler:
         cycle = 0
 
         while True:
-            promote_blocked_tasks(self.store)
+            self._dependencies.sync()
 
             all_available = self.store.query_all(status="available")
 
@@ -776,6 +796,7 @@ class Scheduler:
                     a, self.store, self._running_tasks,
                     self._emit,
                 )
+                self._dependencies.task_done(a)
 
             items = [
                 a for a in all_available
@@ -811,6 +832,13 @@ class Scheduler:
                 async_task = asyncio.create_task(self._wrap_execution(item, coro))
                 self._active_tasks[item.id] = async_task
 
-            await asyncio.sleep(1)
+            # Re-check after a second, or as soon as something triggers
+            # the scheduler (a new task, a config reload) — a trigger
+            # while cycles run would otherwise be dropped by start_loop.
+            try:
+                await asyncio.wait_for(self._trigger.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+            self._trigger.clear()
 
         await self._emit(CycleComplete(total_cycles=cycle))
@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Any, Callable
 
 from bees.protocols.session import PAUSE_TYPES, SUSPEND_TYPES, SessionResult
+from bees.workspace_snapshots import BlobStore, WorkspaceSnapshotLog
 
 CHAT_LOG_FILENAME = "chat_log.json"
 
@@ -406,14 +407,26 @@ async def drain_session(
     start_turn_index = len(existing_checkpoints)
     current_turn_index = start_turn_index - 1
 
+    # Disk-backed workspaces are checkpointed as manifest diffs with
+    # contents in the agent's blob store; anything else falls back to
+    # full snapshots compared turn over turn.
+    snapshot_log: WorkspaceSnapshotLog | None = None
+    if config.ticket_dir and hasattr(config.file_system, "manifest"):
+        snapshot_log = WorkspaceSnapshotLog(
+            config.ticket_dir / "sessions" / session_id,
+            BlobStore(config.ticket_dir / "blobs"),
+        )
+        if hasattr(config.file_system, "seed_manifest"):
+            config.file_system.seed_manifest(snapshot_log.current())
+
     last_fs_snapshot = None
-    if start_turn_index > 0:
-        for cp in reversed(existing_checkpoints):
-            if cp.get("file_system") is not None:
-                last_fs_snapshot = cp["file_system"]
-                break
-    else:
-        if hasattr(config.file_system, "snapshot"):
+    if snapshot_log is None:
+        if start_turn_index > 0:
+            for cp in reversed(existing_checkpoints):
+                if cp.get("file_system") is not None:
+                    last_fs_snapshot = cp["file_system"]
+                    break
+        elif hasattr(config.file_system, "snapshot"):
             last_fs_snapshot = config.file_system.snapshot
 
     try:
@@ -434,7 +447,9 @@ async def drain_session(
                 current_turn_index += 1
 
                 fs_snap = None
-                if hasattr(config.file_system, "snapshot"):
+                if snapshot_log is not None:
+                    snapshot_log.record(current_turn_index, config.file_system)
+                elif hasattr(config.file_system, "snapshot"):
                     current_snap = config.file_system.snapshot
                     if current_turn_index == 0 or _fs_changed(current_snap, last_fs_snapshot):
                         fs_snap = current_snap
@@ -10,32 +10,26 @@ Resolves which skills are active for a session and merges their
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Mapping
 
-from bees.functions.skills import scan_skills
+from bees.config_registry import get_registry
 
 __all__ = ["filter_skills", "merge_function_filter"]
 
-_SKILLS_CACHE: dict = {}
-
-
-def _get_skills(hive_dir: Path):
-    if hive_dir not in _SKILLS_CACHE:
-        _SKILLS_CACHE[hive_dir] = scan_skills(hive_dir)
-    return _SKILLS_CACHE[hive_dir]
-
 
 def filter_skills(
     allowed_skills: list[str] | None, hive_dir: Path
-) -> tuple[str, dict[str, str], list[str]]:
+) -> tuple[str, Mapping[str, str], list[str]]:
     """Filter skills based on allowed_skills and return listing, files, and tool globs.
 
     Returns:
         A ``(listing, files, skill_tools)`` tuple:
         - ``listing``: Formatted markdown for ``{{available_skills}}``.
-        - ``files``: Dict of ``{vfs_name: content}`` for seeding.
+        - ``files``: ``{vfs_name: content}`` for seeding (read-only).
         - ``skill_tools``: Merged ``allowed-tools`` from all selected skills.
     """
-    _, skills_files, skills_list = _get_skills(hive_dir)
+    skill_set = get_registry(hive_dir).skills()
+    skills_list = skill_set.skills
 
     skills_to_use = allowed_skills if allowed_skills is not None else []
 
@@ -53,10 +47,13 @@ def filter_skills(
         skill_tools.extend(s.allowed_tools)
     session_listing = "\n".join(lines)
 
-    session_files = {}
-    for k, v in skills_files.items():
-        if any(f"skills/{s.dir_name}/" in k for s in filtered_skills):
-            session_files[k] = v
+    # The file contents are shared with the registry, not copied.
+    if filtered_skills is skills_list:
+        session_files = skill_set.files
+    else:
+        session_files = {}
+        for s in filtered_skills:
+            session_files.update(skill_set.files_by_skill.get(s.dir_name, {}))
 
     return session_listing, session_files, skill_tools
 
@@ -10,17 +10,27 @@ objective, status, assignee, and outcome. No sessions, no workspace.
 
 This is distinct from the existing ``TaskStore`` (in ``task_store.py``)
 which manages the fused ``tickets/{uuid}/`` directories.
+
+Reads are served from an in-memory index (by id, assignee, creator and
+status) that is loaded once and kept in sync by ``create``/``save``/
+``delete``. Out-of-process edits (hivetool, mutations running through a
+separate store instance) are picked up by comparing each file's
+``(mtime_ns, size)`` stamp — only changed files are re-parsed. Callers
+that get change notifications from elsewhere (e.g. ``awatch``) can turn
+stamp checks off and call ``invalidate`` instead.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+from bees.persistence import atomic_write_text
 
 TaskStatus = Literal[
     "available", "queued", "in_progress", "completed", "failed", "cancelled"
@@ -82,12 +92,184 @@ class TaskRecord:
         )
 
 
+def _copy_value(value: Any) -> Any:
+    """Copy JSON-shaped containers so callers can't mutate the index."""
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    return value
+
+
+def _clone(task: TaskRecord) -> TaskRecord:
+    """Copy of an indexed record, so callers can't mutate the index.
+
+    List and dict fields (``tags``, ``depends_on``, ``outcome_content``)
+    are copied too. Much cheaper than ``copy.deepcopy`` on hot query
+    paths.
+    """
+    clone = object.__new__(TaskRecord)
+    clone.__dict__.update({
+        k: _copy_value(v) if isinstance(v, (list, dict)) else v
+        for k, v in task.__dict__.items()
+    })
+    return clone
+
+
+_Stamp = tuple[int, int]
+"""``(mtime_ns, size)`` of a task file when it was last indexed."""
+
+
 class TaskFileStore:
-    """CRUD for lightweight task JSON files under ``tasks/``."""
+    """CRUD for lightweight task JSON files under ``tasks/``.
+
+    Args:
+        hive_dir: The hive root; tasks live in ``hive_dir / "tasks"``.
+        revalidate: When True (the default), every query re-stats the
+            task files and re-reads the ones whose stamp changed. When
+            False, the index is trusted after the first load and the
+            owner must call ``invalidate`` for out-of-process edits.
+    """
 
-    def __init__(self, hive_dir: Path):
+    def __init__(self, hive_dir: Path, *, revalidate: bool = True):
         self.hive_dir = hive_dir
         self.tasks_dir = hive_dir / "tasks"
+        self._revalidate = revalidate
+        self._loaded = False
+        self._records: dict[str, TaskRecord] = {}
+        self._stamps: dict[str, _Stamp] = {}
+        self._by_assignee: dict[str, set[str]] = {}
+        self._by_creator: dict[str, set[str]] = {}
+        self._by_status: dict[str, set[str]] = {}
+
+    # -- Index maintenance -------------------------------------------------
+
+    def refresh(self) -> None:
+        """Reconcile the index with the ``tasks/`` directory.
+
+        Stats every task file and re-parses only those whose
+        ``(mtime_ns, size)`` stamp differs from the indexed one. Files
+        that disappeared are dropped from the index.
+        """
+        seen: set[str] = set()
+        try:
+            entries = os.scandir(self.tasks_dir)
+        except FileNotFoundError:
+            entries = None
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    task_id = entry.name[: -len(".json")]
+                    seen.add(task_id)
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    if self._stamps.get(task_id) != stamp:
+                        self._load_file(task_id, stamp)
+        for task_id in list(self._stamps.keys() - seen):
+            self._forget(task_id)
+        self._loaded = True
+
+    def invalidate(self, task_id: str | None = None) -> None:
+        """Drop cached state so it is re-read from disk.
+
+        With a ``task_id``, only that file is reloaded (or forgotten, if
+        it no longer exists). Without one, the next query performs a full
+        reload.
+        """
+        if task_id is None:
+            for index in (
+                self._records,
+                self._stamps,
+                self._by_assignee,
+                self._by_creator,
+                self._by_status,
+            ):
+                index.clear()
+            self._loaded = False
+            return
+        self._stamps.pop(task_id, None)
+        stamp = self._stat(task_id)
+        if stamp is None:
+            self._forget(task_id)
+        else:
+            self._load_file(task_id, stamp)
+
+    def _sync(self) -> None:
+        if self._revalidate or not self._loaded:
+            self.refresh()
+
+    def _stat(self, task_id: str) -> _Stamp | None:
+        try:
+            st = (self.tasks_dir / f"{task_id}.json").stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load_file(self, task_id: str, stamp: _Stamp) -> None:
+        """Parse a task file into the index under the given stamp.
+
+        Malformed files keep their stamp (so they are not re-read until
+        they change) but have no record.
+        """
+        self._unindex(task_id)
+        self._stamps[task_id] = stamp
+        task_path = self.tasks_dir / f"{task_id}.json"
+        try:
+            data = json.loads(task_path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        self._index(task_id, TaskRecord.from_dict(data))
+
+    def _index(self, task_id: str, task: TaskRecord) -> None:
+        """Index a record under its file name (normally equal to its ID)."""
+        self._records[task_id] = task
+        if task.assignee:
+            self._by_assignee.setdefault(task.assignee, set()).add(task_id)
+        if task.created_by:
+            self._by_creator.setdefault(task.created_by, set()).add(task_id)
+        self._by_status.setdefault(task.status, set()).add(task_id)
+
+    def _unindex(self, task_id: str) -> None:
+        task = self._records.pop(task_id, None)
+        if task is None:
+            return
+        for index, key in (
+            (self._by_assignee, task.assignee),
+            (self._by_creator, task.created_by),
+            (self._by_status, task.status),
+        ):
+            if key is None:
+                continue
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(task_id)
+                if not ids:
+                    del index[key]
+
+    def _forget(self, task_id: str) -> None:
+        self._unindex(task_id)
+        self._stamps.pop(task_id, None)
+
+    def _collect(self, ids: set[str] | None) -> list[TaskRecord]:
+        """Copies of the indexed records, newest first.
+
+        Ties on ``created_at`` keep ID order, matching the on-disk
+        listing order the store used before indexing.
+        """
+        if not ids:
+            return []
+        tasks = [_clone(self._records[i]) for i in sorted(ids)]
+        tasks.sort(key=lambda t: t.created_at or "", reverse=True)
+        return tasks
+
+    # -- CRUD --------------------------------------------------------------
 
     def create(
         self,
@@ -124,41 +306,52 @@ class TaskFileStore:
         return task
 
     def get(self, task_id: str) -> TaskRecord | None:
-        """Load a task by ID. Returns None if not found or malformed."""
-        task_path = self.tasks_dir / f"{task_id}.json"
-        if not task_path.exists():
-            return None
-
-        try:
-            data = json.loads(task_path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
+        """Load a task by ID. Returns None if not found or malformed.
 
-        return TaskRecord.from_dict(data)
+        Only this task's file is stat-ed; it is re-read if its stamp
+        changed since it was indexed.
+        """
+        if self._revalidate or task_id not in self._stamps:
+            stamp = self._stat(task_id)
+            if stamp is None:
+                self._forget(task_id)
+                return None
+            if self._stamps.get(task_id) != stamp:
+                self._load_file(task_id, stamp)
+        task = self._records.get(task_id)
+        return _clone(task) if task is not None else None
 
     def query_all(self, status: TaskStatus | None = None) -> list[TaskRecord]:
         """List all tasks, optionally filtered by status."""
-        if not self.tasks_dir.exists():
-            return []
-
-        tasks: list[TaskRecord] = []
-        for task_file in sorted(self.tasks_dir.iterdir()):
-            if not task_file.is_file() or not task_file.suffix == ".json":
-                continue
-            task_id = task_file.stem
-            task = self.get(task_id)
-            if task is None:
-                continue
-            if status is not None and task.status != status:
-                continue
-            tasks.append(task)
-
-        tasks.sort(key=lambda t: t.created_at or "", reverse=True)
-        return tasks
+        self._sync()
+        if status is None:
+            return self._collect(set(self._records))
+        return self._collect(self._by_status.get(status))
 
     def query_by_assignee(self, agent_id: str) -> list[TaskRecord]:
         """Return all tasks assigned to the given agent."""
-        return [t for t in self.query_all() if t.assignee == agent_id]
+        self._sync()
+        return self._collect(self._by_assignee.get(agent_id))
+
+    def query_by_creator(self, agent_id: str) -> list[TaskRecord]:
+        """Return all tasks created by the given agent."""
+        self._sync()
+        return self._collect(self._by_creator.get(agent_id))
+
+    def group_by_assignee(
+        self, agent_ids: list[str]
+    ) -> dict[str, list[TaskRecord]]:
+        """Tasks for each of the given agents, with a single revalidation.
+
+        Equivalent to calling ``query_by_assignee`` per agent, but the
+        directory is only reconciled once — use this when attaching tasks
+        to a whole list of agents.
+        """
+        self._sync()
+        return {
+            agent_id: self._collect(self._by_assignee.get(agent_id))
+            for agent_id in agent_ids
+        }
 
     def dequeue_next(self, agent_id: str) -> TaskRecord | None:
         """Dequeue the oldest queued task for an agent.
@@ -208,9 +401,15 @@ class TaskFileStore:
         """Persist a task to disk as a JSON file."""
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
         task_path = self.tasks_dir / f"{task.id}.json"
-        task_path.write_text(
-            json.dumps(task.to_dict(), indent=2, ensure_ascii=False) + "\n"
+        atomic_write_text(
+            task_path,
+            json.dumps(task.to_dict(), indent=2, ensure_ascii=False) + "\n",
         )
+        self._unindex(task.id)
+        self._index(task.id, _clone(task))
+        stamp = self._stat(task.id)
+        if stamp is not None:
+            self._stamps[task.id] = stamp
 
     def delete(self, task_id: str) -> bool:
         """Remove a task file by ID.
@@ -218,6 +417,7 @@ class TaskFileStore:
         Returns True if the file existed and was removed.
         """
         task_path = self.tasks_dir / f"{task_id}.json"
+        self._forget(task_id)
         if task_path.exists():
             task_path.unlink()
             return True
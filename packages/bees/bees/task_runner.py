@@ -151,6 +151,7 @@ class TaskRunner:
             agent.metadata.completed_at = datetime.now(timezone.utc).isoformat()
             agent.metadata.error = str(exc)
             self._store.save_metadata(agent)
+            await self._store.aflush(agent.id)
             print(f"  [{label}] ❌ {exc}", file=sys.stderr)
             return SessionResult(
                 session_id="",
@@ -164,6 +165,7 @@ class TaskRunner:
         self._handle_suspend(agent, result)
         self._handle_pause(agent, result)
         self._store.save_metadata(agent)
+        await self._store.aflush(agent.id)
         return result
 
     async def resume_task(
@@ -395,6 +397,7 @@ class TaskRunner:
             agent.metadata.completed_at = datetime.now(timezone.utc).isoformat()
             agent.metadata.error = str(exc)
             self._store.save_metadata(agent)
+            await self._store.aflush(agent.id)
             print(f"  [{label}] ❌ {exc}", file=sys.stderr)
             return SessionResult(
                 session_id="",
@@ -420,6 +423,7 @@ class TaskRunner:
                 (sdir / stale_file).unlink(missing_ok=True)
 
         self._store.save_metadata(agent)
+        await self._store.aflush(agent.id)
         return result
 
     # -- internal ----------------------------------------------------------
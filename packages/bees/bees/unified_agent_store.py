@@ -9,7 +9,9 @@ All CRUD operations go through the swarm layout:
 ``TaskFileStore`` for lightweight task records under ``tasks/``.
 
 This store is the single internal access point for the scheduler,
-task runner, and all mutation handlers.
+task runner, and all mutation handlers. Agent reads come from the
+hive-wide index in ``AgentStore``; ``subscribe`` exposes its change
+notifications.
 """
 
 from __future__ import annotations
@@ -18,22 +20,45 @@ import json
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from bees.agent import Agent, AgentMetadata, AgentStatus, has_system_functions
-from bees.agent_store import AgentStore
+from bees.agent_store import (
+    METADATA_FILENAME,
+    OBJECTIVE_FILENAME,
+    AgentChange,
+    AgentStore,
+)
+from bees.persistence import WriteBehind
 from bees.task_file_store import TaskFileStore, TaskRecord
 
 __all__ = ["UnifiedAgentStore"]
 
 
 class UnifiedAgentStore:
-    """Agent-typed CRUD over the swarm filesystem layout."""
-
-    def __init__(self, hive_dir: Path):
+    """Agent-typed CRUD over the swarm filesystem layout.
+
+    Args:
+        hive_dir: The hive root.
+        revalidate: Passed to ``AgentStore`` and ``TaskFileStore``. Owners
+            that watch the hive for changes (e.g. the box) pass False and
+            call ``invalidate_paths`` with the files that changed, so
+            reads stop re-stating every agent and task file.
+        write_behind: Passed to ``AgentStore`` to defer bookkeeping saves.
+    """
+
+    def __init__(
+        self,
+        hive_dir: Path,
+        *,
+        revalidate: bool = True,
+        write_behind: WriteBehind | None = None,
+    ):
         self._hive_dir = hive_dir
-        self._agent_store = AgentStore(hive_dir)
-        self._task_file_store = TaskFileStore(hive_dir)
+        self._agent_store = AgentStore(
+            hive_dir, revalidate=revalidate, write_behind=write_behind,
+        )
+        self._task_file_store = TaskFileStore(hive_dir, revalidate=revalidate)
 
     # -- Delegate properties -----------------------------------------------
 
@@ -56,16 +81,68 @@ class UnifiedAgentStore:
         Callers handle recursion into children and log cleanup — this
         method only deletes the single agent's own data.
         """
-        import shutil
-
         # Remove the agent directory (sessions, workspace, metadata).
-        agent_dir = self.entity_dir(agent_id)
-        if agent_dir.exists():
-            shutil.rmtree(agent_dir)
+        self._agent_store.delete(agent_id)
 
         # Remove task records assigned to this agent.
         self._task_file_store.delete_by_assignee(agent_id)
 
+    def refresh(self) -> None:
+        """Reconcile the agent and task indexes with the disk."""
+        self._agent_store.refresh()
+        self._task_file_store.refresh()
+
+    def invalidate_paths(self, paths: Iterable[Path]) -> None:
+        """Re-read the agents and task files that ``paths`` belong to.
+
+        ``paths`` are files under the hive reported as changed (e.g. by
+        ``awatch``). An agent is re-read when its directory, metadata or
+        objective changed; a task when its JSON file did. Other paths
+        (sessions, workspaces) are ignored.
+        """
+        agent_ids: set[str] = set()
+        task_ids: set[str] = set()
+        for path in paths:
+            try:
+                parts = path.relative_to(self._hive_dir).parts
+            except ValueError:
+                continue
+            if len(parts) < 2:
+                continue
+            if parts[0] == "agents" and (
+                len(parts) == 2
+                or parts[2] in (METADATA_FILENAME, OBJECTIVE_FILENAME)
+            ):
+                agent_ids.add(parts[1])
+            elif (
+                parts[0] == "tasks"
+                and len(parts) == 2
+                and parts[1].endswith(".json")
+            ):
+                task_ids.add(parts[1][: -len(".json")])
+        for agent_id in agent_ids:
+            self._agent_store.invalidate(agent_id)
+        for task_id in task_ids:
+            self._task_file_store.invalidate(task_id)
+
+    def flush(self) -> None:
+        """Write any deferred agent saves to disk now."""
+        self._agent_store.flush()
+
+    async def aflush(self, agent_id: str | None = None) -> None:
+        """Wait for deferred agent saves without blocking the event loop."""
+        await self._agent_store.aflush(agent_id)
+
+    def subscribe(
+        self, callback: Callable[[AgentChange], None],
+    ) -> Callable[[], None]:
+        """Register for agent change notifications.
+
+        See ``AgentStore.subscribe``. Returns a function that
+        unsubscribes.
+        """
+        return self._agent_store.subscribe(callback)
+
     # -- Read operations ---------------------------------------------------
 
     def get(self, agent_id: str) -> Agent | None:
@@ -78,27 +155,32 @@ class UnifiedAgentStore:
     def query_all(self, status: AgentStatus | None = None) -> list[Agent]:
         """List agents, optionally filtered by status."""
         agents = self._agent_store.query_all(status=status)
-        for agent in agents:
-            agent.tasks = self._task_file_store.query_by_assignee(agent.id)
+        self._attach_tasks(agents)
         return agents
 
     def get_children(self, parent_id: str | None = None) -> list[Agent]:
         """Children of an agent, or root agents if parent_id is None."""
         agents = self._agent_store.get_children(parent_id)
-        for agent in agents:
-            agent.tasks = self._task_file_store.query_by_assignee(agent.id)
+        self._attach_tasks(agents)
         return agents
 
+    def _attach_tasks(self, agents: list[Agent]) -> None:
+        """Attach task records to a batch of agents in one index pass."""
+        tasks = self._task_file_store.group_by_assignee(
+            [agent.id for agent in agents]
+        )
+        for agent in agents:
+            agent.tasks = tasks[agent.id]
+
     # -- Write operations --------------------------------------------------
 
     def save(self, agent: Agent) -> None:
-        """Persist agent to disk."""
-        self._agent_store.save_metadata(agent)
-        # Also write objective.md into the agent dir for backward compat
-        # with code that reads objective from the filesystem.
-        objective_path = agent.dir / "objective.md"
-        objective_path.parent.mkdir(parents=True, exist_ok=True)
-        objective_path.write_text(agent.objective)
+        """Persist agent to disk.
+
+        Writes ``objective.md`` alongside the metadata, for backward
+        compat with code that reads the objective from the filesystem.
+        """
+        self._agent_store.save(agent)
 
     def save_metadata(self, agent: Agent) -> None:
         """Persist only the metadata.
@@ -146,28 +228,16 @@ class UnifiedAgentStore:
             playbook_id=kwargs.get("playbook_id"),
             tasks=kwargs.get("tasks"),
             tags=kwargs.get("tags"),
+            # Bridge fields carried from kwargs.
+            playbook_run_id=kwargs.get("playbook_run_id") or None,
+            context=kwargs.get("context") or None,
+            title=kwargs.get("title") or None,
+            assignee=kwargs.get("assignee") or None,
+            kind=kwargs.get("kind") or "work",
+            # Written to the agent directory for backward compat.
+            objective=objective,
         )
 
-        # Bridge fields carried from kwargs.
-        if kwargs.get("playbook_run_id"):
-            agent.metadata.playbook_run_id = kwargs["playbook_run_id"]
-        if kwargs.get("context"):
-            agent.metadata.context = kwargs["context"]
-        if kwargs.get("title"):
-            agent.metadata.title = kwargs["title"]
-        if kwargs.get("assignee"):
-            agent.metadata.assignee = kwargs["assignee"]
-        if kwargs.get("kind"):
-            agent.metadata.kind = kwargs["kind"]
-        self._agent_store.save_metadata(agent)
-
-        # Write objective to the agent directory for backward compat.
-        objective_path = agent.dir / "objective.md"
-        objective_path.write_text(objective)
-
-        # Set transient objective on the Agent object.
-        agent.objective = objective
-
         # Create lightweight task record.
         task = self._task_file_store.create(
             objective=objective,
@@ -330,13 +400,10 @@ class UnifiedAgentStore:
         if options:
             agent.metadata.options = options
 
-        # Write new objective.
+        # Write new objective and updated metadata.
         agent.objective = objective
-        objective_path = agent.dir / "objective.md"
-        objective_path.write_text(objective)
-
-        # Save updated metadata.
-        self.save_metadata(agent)
+        self._agent_store.save(agent)
+        self._sync_task_record(agent)
 
         # Create new task record for the new assignment.
         return self._task_file_store.create(
@@ -372,9 +439,7 @@ class UnifiedAgentStore:
 
     def has_pending_tasks(self, agent_id: str) -> bool:
         """Check if an agent has any pending child tasks."""
-        pending_tasks = [
-            t for t in self._task_file_store.query_all()
-            if t.created_by == agent_id
-            and t.status not in ("completed", "failed", "cancelled")
-        ]
-        return len(pending_tasks) > 0
+        return any(
+            t.status not in ("completed", "failed", "cancelled")
+            for t in self._task_file_store.query_by_creator(agent_id)
+        )
@@ -0,0 +1,283 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Incremental, content-addressed workspace snapshots for turn checkpoints.
+
+Capturing a full ``FileSystemSnapshot`` on every turn reads (and
+base64-encodes) every file in the workspace. Instead, a turn checkpoint
+records a **manifest** — ``path → (size, mtime_ns, sha256, mime type)`` —
+and the file bytes live once in a content-addressed ``BlobStore``:
+
+- ``DiskFileSystem.manifest`` re-hashes only files whose size or mtime
+  changed since the previous scan.
+- ``WorkspaceSnapshotLog`` appends one JSON line per turn that changed the
+  workspace, holding only the manifest diff (added/changed entries and
+  removed paths).
+- ``WorkspaceSnapshotLog.materialize`` replays the diffs up to a turn and
+  rebuilds a regular ``FileSystemSnapshot`` from the blobs, for rollback.
+
+On-disk layout (per agent)::
+
+    {ticket_dir}/blobs/{sha[:2]}/{sha}              file contents, written once
+    {ticket_dir}/sessions/{session}/fs_manifest.jsonl  per-turn manifest diffs
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from bees.protocols.filesystem import FileDescriptor, FileSystemSnapshot
+
+__all__ = [
+    "BlobStore",
+    "ManifestEntry",
+    "WorkspaceManifest",
+    "WorkspaceSnapshotLog",
+]
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_LOG_FILENAME = "fs_manifest.jsonl"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One workspace file as recorded in a manifest."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+    mime_type: str
+    type: str  # "text" or "inlineData"
+
+    def same_content(self, other: ManifestEntry) -> bool:
+        """True if both entries describe the same file contents."""
+        return (
+            self.sha256 == other.sha256
+            and self.mime_type == other.mime_type
+            and self.type == other.type
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ManifestEntry:
+        return cls(
+            sha256=data["sha256"],
+            size=data.get("size", 0),
+            mtime_ns=data.get("mtime_ns", 0),
+            mime_type=data.get("mime_type", "application/octet-stream"),
+            type=data.get("type", "inlineData"),
+        )
+
+
+@dataclass
+class WorkspaceManifest:
+    """Manifest counterpart of ``FileSystemSnapshot``: hashes, not contents."""
+
+    files: dict[str, ManifestEntry]
+    routes: dict[str, str]
+    file_count: int
+
+
+class BlobStore:
+    """Content-addressed blob storage: each distinct content is stored once."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    def has(self, sha256: str) -> bool:
+        return self.path(sha256).is_file()
+
+    def put(self, sha256: str, data: bytes) -> None:
+        """Store ``data`` under its hash. No-op if already present.
+
+        Writes via a temp file and rename so a crash never leaves a
+        truncated blob under a valid hash.
+        """
+        target = self.path(sha256)
+        if target.is_file():
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def get(self, sha256: str) -> bytes:
+        return self.path(sha256).read_bytes()
+
+
+class WorkspaceSnapshotLog:
+    """Append-only log of per-turn workspace manifest diffs for one session."""
+
+    def __init__(self, session_dir: Path, blobs: BlobStore) -> None:
+        self._path = session_dir / MANIFEST_LOG_FILENAME
+        self._blobs = blobs
+        self._state: dict[str, ManifestEntry] | None = None
+        self._routes: dict[str, str] | None = None
+        self._file_count: int | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def exists(self) -> bool:
+        return self._path.is_file()
+
+    def current(self) -> dict[str, ManifestEntry]:
+        """Manifest as of the last recorded turn (empty if none)."""
+        self._ensure_loaded()
+        assert self._state is not None
+        return dict(self._state)
+
+    def record(self, turn: int, file_system: Any) -> bool:
+        """Record the workspace for ``turn`` if it changed.
+
+        ``file_system`` must provide ``manifest(blobs)`` returning a
+        ``WorkspaceManifest`` (see ``DiskFileSystem``); it stores any new
+        contents in this log's ``BlobStore``. Returns True if a diff line
+        was written.
+        """
+        self._ensure_loaded()
+        assert self._state is not None
+        snapshot: WorkspaceManifest = file_system.manifest(self._blobs)
+        manifest = snapshot.files
+        routes = dict(snapshot.routes)
+        file_count = snapshot.file_count
+
+        changed = {
+            path: entry
+            for path, entry in manifest.items()
+            if path not in self._state
+            or not self._state[path].same_content(entry)
+        }
+        removed = sorted(self._state.keys() - manifest.keys())
+        first = not self.exists()
+        if (
+            not first
+            and not changed
+            and not removed
+            and routes == self._routes
+            and file_count == self._file_count
+        ):
+            self._state = manifest
+            return False
+
+        record = {
+            "turn": turn,
+            "files": {path: asdict(e) for path, e in changed.items()},
+            "removed": removed,
+            "routes": routes,
+            "file_count": file_count,
+            "total_files": len(manifest),
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._state = manifest
+        self._routes = routes
+        self._file_count = file_count
+        return True
+
+    def materialize(self, turn: int) -> FileSystemSnapshot | None:
+        """Rebuild the full snapshot as of ``turn`` from diffs and blobs.
+
+        Returns None if no record at or before ``turn`` exists.
+        """
+        replayed = self._replay(max_turn=turn)
+        if replayed is None:
+            return None
+        state, routes, file_count = replayed
+        files: dict[str, FileDescriptor] = {}
+        for path, entry in state.items():
+            try:
+                raw = self._blobs.get(entry.sha256)
+            except OSError:
+                logger.warning("Missing blob %s for %s", entry.sha256, path)
+                continue
+            if entry.type == "inlineData":
+                data = base64.b64encode(raw).decode("ascii")
+            else:
+                data = raw.decode("utf-8", errors="replace")
+            files[path] = FileDescriptor(
+                data=data, mime_type=entry.mime_type, type=entry.type,
+            )
+        return FileSystemSnapshot(
+            files=files, routes=routes, file_count=file_count,
+        )
+
+    def copy_to(self, session_dir: Path, *, before_turn: int) -> None:
+        """Copy the records for turns before ``before_turn`` to another session.
+
+        Blobs are shared through the agent's ``BlobStore`` and are not
+        copied.
+        """
+        if not self.exists():
+            return
+        kept: list[str] = []
+        for line in self._path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            if json.loads(line).get("turn", 0) < before_turn:
+                kept.append(line)
+        if kept:
+            target = session_dir / MANIFEST_LOG_FILENAME
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("\n".join(kept) + "\n", encoding="utf-8")
+
+    # -- internal ----------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._state is not None:
+            return
+        replayed = self._replay(max_turn=None)
+        if replayed is None:
+            self._state, self._routes, self._file_count = {}, None, None
+        else:
+            self._state, self._routes, self._file_count = replayed
+
+    def _replay(
+        self, *, max_turn: int | None,
+    ) -> tuple[dict[str, ManifestEntry], dict[str, str], int] | None:
+        if not self.exists():
+            return None
+        state: dict[str, ManifestEntry] = {}
+        routes: dict[str, str] = {}
+        file_count = 0
+        seen = False
+        with open(self._path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append.
+                    logger.warning("Skipping malformed line in %s", self._path)
+                    continue
+                if max_turn is not None and record["turn"] > max_turn:
+                    break
+                seen = True
+                for path in record.get("removed", []):
+                    state.pop(path, None)
+                for path, data in record.get("files", {}).items():
+                    state[path] = ManifestEntry.from_dict(data)
+                routes = record.get("routes", routes)
+                file_count = record.get("file_count", file_count)
+        if not seen:
+            return None
+        return state, routes, file_count
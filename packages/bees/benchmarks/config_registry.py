@@ -0,0 +1,138 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-task configuration cost: reading from disk vs the config registry.
+
+Builds a hive with ``--skills`` skills of ``--files`` files each,
+``--templates`` templates, and a hooks module per template, then times
+the configuration work one task start does: filter the skills, render
+the templates seeded into the session, load its template, and import
+its hooks.
+
+- **uncached** — what every task start used to do: pick the skill files
+  out of a (never invalidated) skill scan, parse ``TEMPLATES.yaml``
+  twice and re-dump every template, and exec the hooks.
+- **revalidate** — the registry re-statting its source files per lookup
+  (the default, e.g. for the CLI and eval).
+- **trusted** — the registry trusting its cache, as under the box, which
+  invalidates it from ``awatch`` events.
+
+Usage::
+
+    python -m benchmarks.config_registry --skills 30 --templates 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import yaml
+
+from bees.config_registry import _load_hooks_module, get_registry
+from bees.functions.skills import scan_skills
+from bees.playbook import _load_templates, load_playbook
+from bees.skill_filter import filter_skills
+
+
+def _populate(hive: Path, args: argparse.Namespace) -> None:
+    for i in range(args.skills):
+        skill_dir = hive / "skills" / f"skill-{i:03d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{i}\ntitle: Skill {i}\n"
+            f"description: Does thing {i}.\nallowed-tools: [system.*]\n---\n"
+            + "Instructions.\n" * 50
+        )
+        for j in range(args.files - 1):
+            (skill_dir / f"ref-{j}.md").write_text("Reference text.\n" * 100)
+
+    config_dir = hive / "config"
+    (config_dir / "hooks").mkdir(parents=True)
+    templates = []
+    for i in range(args.templates):
+        templates.append({
+            "name": f"template-{i}",
+            "title": f"Template {i}",
+            "objective": "Do the work.\n" * 20,
+            "skills": ["*"],
+            "functions": ["system.*", "sandbox.*"],
+        })
+        (config_dir / "hooks" / f"template-{i}.py").write_text(
+            "def on_task_done(agent):\n    pass\n"
+        )
+    (config_dir / "TEMPLATES.yaml").write_text(yaml.dump(templates))
+
+
+_SKILLS_CACHE: dict[Path, tuple] = {}
+
+
+def _uncached(hive: Path, name: str) -> None:
+    if hive not in _SKILLS_CACHE:
+        _SKILLS_CACHE[hive] = scan_skills(hive)
+    _, files, skills = _SKILLS_CACHE[hive]
+    {
+        k: v for k, v in files.items()
+        if any(f"skills/{s.dir_name}/" in k for s in skills)
+    }
+    for t in _load_templates(hive / "config"):
+        yaml.dump(t, sort_keys=False, allow_unicode=True)
+    next(t for t in _load_templates(hive / "config") if t["name"] == name)
+    _load_hooks_module(name, hive / "config" / "hooks" / f"{name}.py")
+
+
+def _cached(hive: Path, name: str) -> None:
+    registry = get_registry(hive)
+    filter_skills(["*"], hive)
+    dict(registry.template_files())
+    load_playbook(name, hive / "config")
+    registry.hooks(name)
+
+
+def _time(fn, hive: Path, args: argparse.Namespace) -> list[float]:
+    latencies = []
+    for i in range(args.samples):
+        name = f"template-{i % args.templates}"
+        start = time.perf_counter()
+        fn(hive, name)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--skills", type=int, default=30)
+    parser.add_argument("--files", type=int, default=5)
+    parser.add_argument("--templates", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hive = Path(tmp)
+        _populate(hive, args)
+        print(
+            f"{args.skills} skills x {args.files} files, "
+            f"{args.templates} templates, {args.samples} task starts"
+        )
+        registry = get_registry(hive)
+        for label, fn, scope in (
+            ("uncached", _uncached, nullcontext),
+            ("revalidate", _cached, nullcontext),
+            ("trusted", _cached, registry.trusted),
+        ):
+            with scope():
+                latencies = _time(fn, hive, args)
+            print(
+                f"  {label:<10} p50 "
+                f"{statistics.median(latencies) * 1000:8.3f} ms  "
+                f"mean {statistics.fmean(latencies) * 1000:8.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
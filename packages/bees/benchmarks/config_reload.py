@@ -0,0 +1,171 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Config-change-to-first-task latency: full restart vs hot reload.
+
+Starts a hive with ``--servers`` MCP servers in ``SYSTEM.yaml`` and
+``--running`` tasks in flight, then adds one more server, the way an
+edit in hivetool would, and creates a new task. Times how long that
+task takes to start, and counts the in-flight tasks that had to start
+over. MCP tool discovery is faked with a ``--discovery`` second sleep
+per server, and sessions with a fake runner that takes ``--duration``
+seconds, so no network or API key is needed.
+
+- **restart** — what ``box.run`` used to do: shut ``Bees`` down and
+  start a new instance, rediscovering every server.
+- **reload** — ``Bees.reload_config``: only the added server is
+  discovered, and running tasks keep going.
+
+Usage::
+
+    python -m benchmarks.config_reload --servers 8 --running 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import yaml
+
+from bees import Bees
+from bees.functions.mcp_bridge import MCPConnection
+from bees.protocols.events import TaskStarted
+
+
+class _FakeStream:
+    """Completes after ``duration`` seconds."""
+
+    def __init__(self, duration: float) -> None:
+        self._duration = duration
+        self._done = False
+
+    def __aiter__(self) -> _FakeStream:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if self._done:
+            raise StopAsyncIteration
+        await asyncio.sleep(self._duration)
+        self._done = True
+        return {"complete": {"result": {"success": True}}}
+
+    async def send_tool_response(self, responses: list[dict[str, Any]]) -> None:
+        pass
+
+    async def send_context(self, parts: list[dict[str, Any]]) -> None:
+        pass
+
+    def resume_state(self) -> bytes | None:
+        return None
+
+
+class _FakeRunner:
+    def __init__(self, duration: float) -> None:
+        self._duration = duration
+
+    async def run(self, config: Any) -> _FakeStream:
+        return _FakeStream(self._duration)
+
+    async def resume(self, config: Any, **kwargs: Any) -> _FakeStream:
+        return _FakeStream(self._duration)
+
+
+def _write_system(hive: Path, servers: int) -> Path:
+    system_path = hive / "config" / "SYSTEM.yaml"
+    system_path.parent.mkdir(parents=True, exist_ok=True)
+    system_path.write_text(yaml.dump({
+        "title": "Benchmark",
+        "mcp": [
+            {"name": f"server{i}", "command": f"server{i}"}
+            for i in range(servers)
+        ],
+    }))
+    return system_path
+
+
+async def _run(hive: Path, args: argparse.Namespace, *, reload: bool) -> None:
+    async def discover(conn: MCPConnection) -> None:
+        await asyncio.sleep(args.discovery)
+        conn.tools = [{"name": "ping", "description": "", "inputSchema": {}}]
+
+    runners = {"generate": _FakeRunner(args.duration)}
+    starts: dict[str, int] = {}
+    started: dict[str, asyncio.Event] = {}
+
+    def on_start(event: TaskStarted) -> None:
+        starts[event.task.id] = starts.get(event.task.id, 0) + 1
+        started.setdefault(event.task.id, asyncio.Event()).set()
+
+    def make_bees() -> Bees:
+        bees = Bees(hive, runners, revalidate=False)
+        bees.on(TaskStarted, on_start)
+        return bees
+
+    with patch.object(MCPConnection, "discover_tools", discover):
+        system_path = _write_system(hive, args.servers)
+        bees = make_bees()
+        await bees.listen()
+        running = [
+            (await bees.create_child(f"Long task {i}")).id
+            for i in range(args.running)
+        ]
+        for task_id in running:
+            await started.setdefault(task_id, asyncio.Event()).wait()
+
+        start = time.perf_counter()
+        system_path = _write_system(hive, args.servers + 1)
+        if reload:
+            await bees.reload_config([system_path])
+        else:
+            await bees.shutdown()
+            bees = make_bees()
+            await bees.listen()
+        task = await bees.create_child("New task")
+        await started.setdefault(task.id, asyncio.Event()).wait()
+        elapsed = time.perf_counter() - start
+
+        await bees.shutdown()
+
+    restarted = sum(1 for task_id in running if starts[task_id] > 1)
+    label = "reload" if reload else "restart"
+    print(
+        f"  {label:<8} first task after {elapsed * 1000:8.1f} ms  "
+        f"{restarted}/{args.running} running tasks restarted"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--servers", type=int, default=8)
+    parser.add_argument("--running", type=int, default=10)
+    parser.add_argument("--discovery", type=float, default=0.25)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(
+        f"{args.servers} MCP servers ({args.discovery * 1000:g} ms discovery "
+        f"each), {args.running} running tasks"
+    )
+    for reload in (False, True):
+        # Task progress lines go to stderr; keep them out of the
+        # benchmark output.
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            asyncio.run(_run(Path(tmp), args, reload=reload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Event-loop lag while many agents read large workspace files.
+
+Each simulated agent owns a ``DiskFileSystem`` holding a few multi-MB
+files and reads them repeatedly through ``get`` and ``get_many``, all on
+one event loop. A probe task sleeps for a millisecond at a time and
+records how late it wakes up — the latency every other coroutine on the
+loop (SSE streams, Gemini streams, the scheduler) sees meanwhile.
+
+- **inline** — the default mode: reads block the loop thread.
+- **async I/O** — ``io_executor=shared_io_executor()``: reads run on the
+  bounded pool and ``get_many`` reads its files in parallel.
+
+Usage::
+
+    python -m benchmarks.disk_io_lag --agents 50 --size-mb 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+
+from bees.disk_file_system import DiskFileSystem, shared_io_executor
+
+_PROBE_INTERVAL_S = 0.001
+
+
+def _populate(root: Path, agents: int, files: int, size: int) -> list[Path]:
+    line = b"lorem ipsum dolor sit amet, consectetur adipiscing elit\n"
+    text = (line * (size // len(line) + 1))[:size]
+    binary = os.urandom(size // 2) + b"\x00" + os.urandom(size // 2)
+    dirs = []
+    for a in range(agents):
+        work_dir = root / f"agent-{a}"
+        work_dir.mkdir()
+        for f in range(files):
+            if f % 2:
+                (work_dir / f"image{f}.png").write_bytes(binary)
+            else:
+                (work_dir / f"notes{f}.md").write_bytes(text)
+        dirs.append(work_dir)
+    return dirs
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        lags.append(time.perf_counter() - start - _PROBE_INTERVAL_S)
+
+
+async def _agent(fs: DiskFileSystem, rounds: int) -> None:
+    paths = (await fs.list_files()).split("\n")
+    for _ in range(rounds):
+        for path in paths:
+            await fs.get(path)
+        await fs.get_many(paths)
+
+
+async def _run(
+    dirs: list[Path], rounds: int, executor: Executor | None,
+) -> tuple[float, list[float]]:
+    systems = [DiskFileSystem(d, io_executor=executor) for d in dirs]
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(_agent(fs, rounds) for fs in systems))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return elapsed, lags
+
+
+def _report(label: str, elapsed: float, lags: list[float]) -> None:
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"  {label:<10} {elapsed:8.2f} s  "
+        f"lag p50 {statistics.median(lags) * 1000:8.1f} ms  "
+        f"p99 {p99 * 1000:8.1f} ms  max {lags[-1] * 1000:8.1f} ms  "
+        f"({len(lags)} probes)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs = _populate(Path(tmp), args.agents, args.files, size)
+        print(
+            f"{args.agents} agents × {args.files} files × {args.size_mb:g} MB, "
+            f"{args.rounds} rounds"
+        )
+        for label, executor in (
+            ("inline", None),
+            ("async I/O", shared_io_executor()),
+        ):
+            elapsed, lags = asyncio.run(_run(dirs, args.rounds, executor))
+            _report(label, elapsed, lags)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Wall time of an eval set run sequentially, in parallel, and from cache.
+
+Builds ``--cases`` one-template hives and runs them through
+``run_set`` with a fake session runner that waits ``--latency`` seconds
+(standing in for the model) and then completes. No network or API key
+is needed.
+
+- **sequential** — ``jobs=1``, no cache: the previous behaviour.
+- **--jobs N** — ``jobs=N``, filling a fresh cache.
+- **cached** — the same run again: every case is unchanged.
+
+Usage::
+
+    python -m benchmarks.eval_batch --cases 40 --jobs 8 --latency 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from bees.eval.batch import run_set
+
+
+class _FakeStream:
+    """Completes after ``latency`` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+        self._done = False
+
+    def __aiter__(self) -> _FakeStream:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if self._done:
+            raise StopAsyncIteration
+        await asyncio.sleep(self._latency)
+        self._done = True
+        return {"complete": {"result": {"success": True}}}
+
+    async def send_tool_response(self, responses: list[dict[str, Any]]) -> None:
+        pass
+
+    async def send_context(self, parts: list[dict[str, Any]]) -> None:
+        pass
+
+    def resume_state(self) -> bytes | None:
+        return None
+
+
+class _FakeRunner:
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    async def run(self, config: Any) -> _FakeStream:
+        return _FakeStream(self._latency)
+
+    async def resume(self, config: Any, **kwargs: Any) -> _FakeStream:
+        return _FakeStream(self._latency)
+
+
+def _populate(root: Path, cases: int) -> Path:
+    eval_set = root / "eval_set"
+    for i in range(cases):
+        config = eval_set / f"case-{i:03d}" / "config"
+        config.mkdir(parents=True)
+        (config / "SYSTEM.yaml").write_text(
+            yaml.dump({"title": f"Case {i}", "root": "simple"}),
+        )
+        (config / "TEMPLATES.yaml").write_text(yaml.dump([{
+            "name": "simple",
+            "title": "Simple",
+            "objective": f"Do thing {i}.",
+        }]))
+    return eval_set
+
+
+async def _run(
+    eval_set: Path, output: Path, args: argparse.Namespace,
+    *, jobs: int, use_cache: bool,
+) -> float:
+    start = time.perf_counter()
+    # The progress lines and summary table go to stderr; keep them out of
+    # the benchmark output.
+    with contextlib.redirect_stderr(io.StringIO()):
+        await run_set(
+            eval_set, output, "",
+            jobs=jobs,
+            use_cache=use_cache,
+            runners_factory=lambda: {"generate": _FakeRunner(args.latency)},
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cases", type=int, default=40)
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        eval_set = _populate(root, args.cases)
+        print(
+            f"{args.cases} cases, {args.latency * 1000:g} ms fake model "
+            f"latency per case"
+        )
+        for label, jobs, use_cache, output in (
+            ("sequential", 1, False, "sequential"),
+            (f"--jobs {args.jobs}", args.jobs, True, "parallel"),
+            ("cached", args.jobs, True, "parallel"),
+        ):
+            elapsed = asyncio.run(_run(
+                eval_set, root / output, args, jobs=jobs, use_cache=use_cache,
+            ))
+            print(
+                f"  {label:<12} {elapsed:7.2f} s  "
+                f"{args.cases / elapsed:7.1f} cases/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
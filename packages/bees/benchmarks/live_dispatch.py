@@ -0,0 +1,116 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tool-dispatch latency and idle cost of live sessions.
+
+A fake browser, on its own thread, writes ``tool_dispatch/{id}.json``
+call files the way hivetool does (create the file, then write it) at
+random intervals and times how long each takes to get its
+``.result.json`` back from a ``ToolDispatchWatcher`` with an instant
+handler. Meanwhile ``--idle`` more watchers sit on empty directories,
+standing in for the other live sessions in the box; the process CPU
+time over the run shows what they cost.
+
+- **polling** — ``notify=False`` with the old 300 ms interval.
+- **notify** — change notifications via ``watchfiles``.
+
+Usage::
+
+    python -m benchmarks.live_dispatch --calls 50 --idle 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from bees.runners.live import ToolDispatchWatcher
+
+_POLL_INTERVAL_S = 0.3
+
+
+async def _echo(args: dict, status: object) -> dict:
+    return args
+
+
+def _browser(
+    dispatch_dir: Path, calls: int, gap: float, latencies: list[float],
+) -> None:
+    rng = random.Random(0)
+    for i in range(calls):
+        time.sleep(rng.uniform(0, gap))
+        call_id = f"call-{i:04d}"
+        call_path = dispatch_dir / f"{call_id}.json"
+        result_path = dispatch_dir / f"{call_id}.result.json"
+        start = time.perf_counter()
+        call_path.touch()
+        call_path.write_text(json.dumps({
+            "functionCall": {"id": call_id, "name": "echo", "args": {"i": i}},
+        }))
+        while not result_path.exists():
+            time.sleep(0.0005)
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run(
+    root: Path, args: argparse.Namespace, notify: bool,
+) -> tuple[list[float], float, float]:
+    dirs = [root / f"session-{n}" / "tool_dispatch" for n in range(args.idle + 1)]
+    watchers = [
+        ToolDispatchWatcher(
+            d, {"echo": _echo}, poll_interval=_POLL_INTERVAL_S, notify=notify,
+        )
+        for d in dirs
+    ]
+    tasks = [asyncio.create_task(w.run()) for w in watchers]
+    await asyncio.sleep(0.5)
+
+    latencies: list[float] = []
+    cpu = time.process_time()
+    start = time.perf_counter()
+    await asyncio.to_thread(_browser, dirs[0], args.calls, args.gap, latencies)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return latencies, elapsed, cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--idle", type=int, default=100)
+    parser.add_argument("--gap", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(
+        f"{args.calls} tool calls, {args.idle} idle sessions, "
+        f"up to {args.gap * 1000:g} ms between calls"
+    )
+    for label, notify in (("polling", False), ("notify", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            latencies, elapsed, cpu = asyncio.run(
+                _run(Path(tmp), args, notify),
+            )
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(
+            f"  {label:<8} latency p50 "
+            f"{statistics.median(latencies) * 1000:7.1f} ms  "
+            f"p95 {p95 * 1000:7.1f} ms  max {latencies[-1] * 1000:7.1f} ms  "
+            f"CPU {cpu / elapsed * 100:5.1f}% over {elapsed:5.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Hot-mutation latency against a long-lived mutations/ directory.
+
+Fills ``mutations/`` with ``--history`` completed mutations (each a
+``{uuid}.json`` plus its ``.result.json``), then times ``--samples``
+fresh ``pause-all`` mutations from write to processed result, the way
+``box.run`` drives them.
+
+- **rescan** — the previous queue: glob and sort every file in
+  ``mutations/``, then check each for a sibling result file. Measured
+  scan-only, since the dispatch itself is the same in every case.
+- **first scan** — a ``MutationManager`` meeting that history for the
+  first time: backfills the journal and compacts it into ``archive/``.
+  A one-off cost per hive.
+- **journaled** — a full ``process_inline()`` after compaction.
+- **targeted** — ``process_inline(paths)`` with only the changed file,
+  as ``box.run`` passes it from ``awatch``.
+
+Usage::
+
+    python -m benchmarks.mutation_queue --history 50000 --samples 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from bees.mutations import MutationManager
+
+
+def _populate(mutations_dir: Path, history: int) -> None:
+    mutations_dir.mkdir(parents=True)
+    result = json.dumps({"status": "ok"})
+    for _ in range(history):
+        name = str(uuid.uuid4())
+        (mutations_dir / f"{name}.json").write_text('{"type": "pause-all"}')
+        (mutations_dir / f"{name}.result.json").write_text(result)
+
+
+def _write(mutations_dir: Path) -> Path:
+    path = mutations_dir / f"{uuid.uuid4()}.json"
+    path.write_text('{"type": "pause-all"}')
+    return path
+
+
+def _legacy_scan(mutations_dir: Path) -> list[Path]:
+    pending = []
+    for path in sorted(mutations_dir.glob("*.json")):
+        if path.stem.endswith(".result"):
+            continue
+        if path.with_suffix("").with_suffix(".result.json").exists():
+            continue
+        json.loads(path.read_text())
+        pending.append(path)
+    return pending
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"  {label:<11} p50 {statistics.median(latencies) * 1000:9.2f} ms  "
+        f"p95 {p95 * 1000:9.2f} ms"
+    )
+
+
+async def _run(hive: Path, args: argparse.Namespace) -> None:
+    mutations_dir = hive / "mutations"
+
+    latencies = []
+    for _ in range(args.samples):
+        path = _write(mutations_dir)
+        start = time.perf_counter()
+        _legacy_scan(mutations_dir)
+        latencies.append(time.perf_counter() - start)
+        path.with_suffix(".result.json").write_text('{"status": "ok"}')
+    _report("rescan", latencies)
+
+    manager = MutationManager(hive)
+    start = time.perf_counter()
+    await manager.process_inline()
+    print(f"  {'first scan':<11} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+    for label, targeted in (("journaled", False), ("targeted", True)):
+        latencies = []
+        for _ in range(args.samples):
+            path = _write(mutations_dir)
+            start = time.perf_counter()
+            await manager.process_inline([path] if targeted else None)
+            latencies.append(time.perf_counter() - start)
+        _report(label, latencies)
+
+    remaining = sum(1 for _ in mutations_dir.iterdir())
+    print(f"  {remaining} files left in mutations/ after compaction")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--history", type=int, default=50_000)
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        hive = Path(tmp)
+        _populate(hive / "mutations", args.history)
+        print(f"{args.history} historical mutations, {args.samples} samples")
+        asyncio.run(_run(hive, args))
+
+
+if __name__ == "__main__":
+    main()
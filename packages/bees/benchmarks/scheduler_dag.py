@@ -0,0 +1,183 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Dependency promotion cost for a large DAG through ``run_all_waves``.
+
+Builds a layered DAG of blocked agents (each node depends on ``--fan-in``
+nodes of the previous layer) and drains it with
+``Scheduler.run_all_waves``. ``TaskRunner.run_task`` is replaced by a stub
+that marks the agent completed, so the timings isolate scheduling and
+store work from any model calls.
+
+Two promotion strategies are compared:
+
+- **indexed** — the scheduler's ``DependencyIndex`` (event-driven);
+- **sweep** — the pre-index behaviour: every cycle re-lists all blocked
+  agents and loads each dependency with ``store.get``.
+
+Usage::
+
+    python -m benchmarks.scheduler_dag --nodes 5000 --layers 25 --skip-sweep
+
+At this size the run is dominated by per-cycle store listings rather
+than promotion; the ``promotion`` column isolates the part this
+benchmark is about. The sweep strategy grows quadratically — use
+``--nodes 1000`` to compare the two. ``--no-revalidate`` runs the store
+the way the box does, trusting its indexes instead of re-stating every
+agent and task file on each read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bees.agent import Agent
+from bees.protocols.session import SessionResult
+from bees.scheduler import Scheduler
+from bees.unified_agent_store import UnifiedAgentStore
+
+
+class _SweepPromotion:
+    """Full-sweep promotion, as the scheduler did before the index."""
+
+    def __init__(self, store: UnifiedAgentStore) -> None:
+        self._store = store
+        self.seconds = 0.0
+
+    def invalidate(self) -> None:
+        pass
+
+    def task_done(self, agent: Agent) -> int:
+        return 0
+
+    def sync(self) -> int:
+        start = time.perf_counter()
+        promoted = 0
+        for agent in self._store.query_all(status="blocked"):
+            statuses = []
+            for dep_id in agent.metadata.depends_on or []:
+                dep = self._store.get(dep_id)
+                statuses.append(dep.metadata.status if dep else None)
+            if "failed" in statuses:
+                agent.metadata.status = "failed"
+                agent.metadata.error = "Dependency failed"
+                self._store.save_metadata(agent)
+            elif all(s == "completed" for s in statuses):
+                agent.metadata.status = "available"
+                self._store.save_metadata(agent)
+                promoted += 1
+        self.seconds += time.perf_counter() - start
+        return promoted
+
+
+class _Timed:
+    """Wraps a promotion strategy and accumulates time spent in it."""
+
+    def __init__(self, inner) -> None:
+        self._inner = inner
+        self.seconds = 0.0
+
+    def __getattr__(self, name):
+        method = getattr(self._inner, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+
+        return timed
+
+
+def _build_dag(
+    store: UnifiedAgentStore, nodes: int, layers: int, fan_in: int,
+) -> None:
+    rng = random.Random(0)
+    per_layer = max(1, nodes // layers)
+    previous: list[Agent] = []
+    for layer in range(layers):
+        current: list[Agent] = []
+        for i in range(per_layer):
+            agent = store.create(f"Node {layer}.{i}")
+            if previous:
+                deps = rng.sample(previous, min(fan_in, len(previous)))
+                agent.metadata.status = "blocked"
+                agent.metadata.depends_on = [d.id for d in deps]
+                store.save_metadata(agent)
+            current.append(agent)
+        previous = current
+
+
+async def _run(
+    nodes: int, layers: int, fan_in: int, sweep: bool, revalidate: bool = True,
+) -> tuple:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = UnifiedAgentStore(Path(tmp), revalidate=revalidate)
+        _build_dag(store, nodes, layers, fan_in)
+
+        scheduler = Scheduler(runners={}, store=store)
+
+        async def run_task(agent: Agent) -> SessionResult:
+            agent.metadata.status = "completed"
+            store.save_metadata(agent)
+            return SessionResult(
+                session_id="", status="completed", events=0, output="",
+            )
+
+        scheduler._task_runner.run_task = run_task
+        strategy = _SweepPromotion(store) if sweep else scheduler._dependencies
+        timed = _Timed(strategy)
+        scheduler._dependencies = timed
+
+        start = time.perf_counter()
+        with contextlib.redirect_stderr(io.StringIO()):
+            summaries = await scheduler.run_all_waves()
+        total = time.perf_counter() - start
+        return total, timed.seconds, len(summaries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--layers", type=int, default=25)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument(
+        "--skip-sweep", action="store_true",
+        help="Only run the indexed strategy (the sweep is slow).",
+    )
+    parser.add_argument(
+        "--no-revalidate", action="store_true",
+        help="Trust the store indexes instead of re-stating files per read.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.nodes} nodes, {args.layers} layers, fan-in {args.fan_in}"
+    )
+    strategies = [("indexed", False)]
+    if not args.skip_sweep:
+        strategies.append(("sweep", True))
+    for name, sweep in strategies:
+        total, promotion, ran = asyncio.run(
+            _run(
+                args.nodes, args.layers, args.fan_in, sweep,
+                revalidate=not args.no_revalidate,
+            )
+        )
+        print(
+            f"  {name:8} total {total:8.2f} s   "
+            f"promotion {promotion:8.2f} s   ({ran} tasks run)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-cycle cost of attaching task records to agents.
+
+Every scheduler cycle lists agents through ``UnifiedAgentStore`` and
+attaches each agent's tasks. Before the ``TaskFileStore`` index, each
+attachment re-read and re-parsed every ``tasks/*.json`` file, so a cycle
+cost O(agents × tasks) file reads. This script measures:
+
+- **full scan** — one cold load of every task file (what each
+  ``query_by_assignee`` call used to cost);
+- **cycle (indexed)** — ``group_by_assignee`` over all agents with stamp
+  revalidation, i.e. what a cycle pays now;
+- **cycle (indexed, 1 edit)** — the same after one task file was
+  rewritten out of process.
+
+Usage::
+
+    python -m benchmarks.task_file_store --tasks 10000 --agents 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from bees.task_file_store import TaskFileStore, TaskRecord
+
+
+def _populate(hive_dir: Path, tasks: int, agents: int) -> list[str]:
+    tasks_dir = hive_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    agent_ids = [str(uuid.uuid4()) for _ in range(agents)]
+    for i in range(tasks):
+        record = TaskRecord(
+            id=str(uuid.uuid4()),
+            objective=f"Synthetic objective {i}",
+            assignee=agent_ids[i % agents],
+            status="completed" if i % 3 else "available",
+            created_at=f"2026-01-01T00:00:{i:08d}",
+        )
+        (tasks_dir / f"{record.id}.json").write_text(
+            json.dumps(record.to_dict(), indent=2) + "\n"
+        )
+    return agent_ids
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--agents", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hive_dir = Path(tmp)
+        agent_ids = _populate(hive_dir, args.tasks, args.agents)
+        store = TaskFileStore(hive_dir)
+
+        def full_scan() -> None:
+            store.invalidate()
+            store.query_all()
+
+        def cycle() -> None:
+            store.group_by_assignee(agent_ids)
+
+        scan = _time(full_scan, args.repeat)
+        warm = _time(cycle, args.repeat)
+
+        victim = next(iter(store.tasks_dir.iterdir()))
+
+        def edited_cycle() -> None:
+            data = json.loads(victim.read_text())
+            data["outcome"] = uuid.uuid4().hex
+            victim.write_text(json.dumps(data) + "\n")
+            cycle()
+
+        edited = _time(edited_cycle, args.repeat)
+
+    print(f"{args.tasks} tasks, {args.agents} agents (best of {args.repeat})")
+    print(f"  full scan               {scan * 1000:10.1f} ms")
+    print(
+        f"  cycle (pre-index est.)  {scan * args.agents * 1000:10.1f} ms"
+        f"  (full scan × agents)"
+    )
+    print(f"  cycle (indexed)         {warm * 1000:10.1f} ms")
+    print(f"  cycle (indexed, 1 edit) {edited * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -106,7 +106,8 @@ class LogStore {
               entries(): AsyncIterable<[string, FileSystemHandle]>;
             }
           ).entries()) {
-            if (sEntry.kind !== "directory") continue;
+            // Dot-directories hold store indexes, not sessions.
+            if (sEntry.kind !== "directory" || sName.startsWith(".")) continue;
 
             const sessionDir = await sessionsDir.getDirectoryHandle(sName);
             const sStatus = (await this.#readText(sessionDir, "status"))?.trim() ?? "unknown";
@@ -316,7 +316,8 @@ class SessionStoreReader {
           entries(): AsyncIterable<[string, FileSystemHandle]>;
         }
       ).entries()) {
-        if (entry.kind !== "directory") continue;
+        // Dot-directories hold store indexes, not sessions.
+        if (entry.kind !== "directory" || name.startsWith(".")) continue;
         const sessionDir = await sessionsDir.getDirectoryHandle(name);
         
         const status = (await this.#readText(sessionDir, "status"))?.trim() ?? "unknown";
@@ -353,16 +354,75 @@ class SessionStoreReader {
     try {
       const sessionsDir = await entityDir.getDirectoryHandle("sessions");
       const sessionDir = await sessionsDir.getDirectoryHandle(sessionId);
-      const turns = await this.#readJson(sessionDir, "turns.json");
-      if (Array.isArray(turns)) {
-        return turns as TurnCheckpointInfo[];
+      const checkpoints = await this.#readTurnLog(sessionDir);
+      if (!checkpoints) return [];
+
+      // Disk-backed sessions record workspace changes as manifest diffs
+      // in fs_manifest.jsonl instead of embedding snapshots in turns.json.
+      const manifests = await this.#readText(sessionDir, "fs_manifest.jsonl");
+      if (manifests) {
+        const byTurn = new Map<number, Record<string, unknown>>();
+        for (const line of manifests.split("\n").filter(Boolean)) {
+          try {
+            const record = JSON.parse(line) as Record<string, unknown>;
+            byTurn.set(record.turn as number, record);
+          } catch {
+            // Skip a torn trailing line.
+          }
+        }
+        for (const cp of checkpoints) {
+          const record = byTurn.get(cp.turn);
+          if (!cp.file_system && record) {
+            cp.file_system = { file_count: record.file_count };
+          }
+        }
       }
-      return [];
+      return checkpoints;
     } catch {
       return [];
     }
   }
 
+  /**
+   * Replay `turns.jsonl`: a `checkpoint` record per turn, with later
+   * `patch` records merged into it. Sessions written before the log
+   * existed have a `turns.json` array instead.
+   */
+  async #readTurnLog(
+    sessionDir: FileSystemDirectoryHandle
+  ): Promise<TurnCheckpointInfo[] | null> {
+    const text = await this.#readText(sessionDir, "turns.jsonl");
+    if (text === null) {
+      const legacy = await this.#readJson(sessionDir, "turns.json");
+      return Array.isArray(legacy) ? (legacy as TurnCheckpointInfo[]) : null;
+    }
+    const checkpoints: TurnCheckpointInfo[] = [];
+    const byTurn = new Map<number, TurnCheckpointInfo>();
+    for (const line of text.split("\n").filter(Boolean)) {
+      let fields: Record<string, unknown>;
+      try {
+        fields = JSON.parse(line) as Record<string, unknown>;
+      } catch {
+        continue; // Skip a torn trailing line.
+      }
+      delete fields.op;
+      const existing = byTurn.get(fields.turn as number);
+      if (existing) {
+        Object.assign(existing, fields);
+        continue;
+      }
+      const checkpoint = {
+        context_length: 0,
+        file_system: null,
+        token_metadata: null,
+        ...fields,
+      } as TurnCheckpointInfo;
+      byTurn.set(checkpoint.turn, checkpoint);
+      checkpoints.push(checkpoint);
+    }
+    return checkpoints;
+  }
+
   async readEvents(ticketId: string, sessionId: string): Promise<unknown[]> {
     const entityDir = await this.#getEntityDir(ticketId);
     if (!entityDir) return [];
@@ -6,11 +6,15 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import pytest
 from pathlib import Path
 
 from bees.agent import Agent, AgentMetadata
-from bees.agent_store import AgentStore
+from bees.agent_store import AgentChange, AgentStore
+
+_LONG_AGO_NS = 1_000_000_000_000_000_000
 
 
 @pytest.fixture
@@ -193,3 +197,159 @@ class TestSaveMetadata:
         reloaded = store.get(agent.id)
         assert reloaded is not None
         assert reloaded.metadata.active_session == "session-123"
+
+
+def _age(agent: Agent) -> None:
+    """Push an agent's file mtimes out of the racy window."""
+    for path in (agent.metadata_path, agent.dir / "objective.md"):
+        if path.exists():
+            os.utime(path, ns=(_LONG_AGO_NS, _LONG_AGO_NS))
+
+
+class TestIndex:
+    def test_shared_across_stores_for_same_hive(
+        self, store: AgentStore, tmp_path: Path,
+    ) -> None:
+        agent = store.create(type="researcher", slug="a")
+        other = AgentStore(tmp_path, revalidate=False)
+        assert [a.id for a in other.query_all()] == [agent.id]
+
+        agent.metadata.status = "running"
+        store.save_metadata(agent)
+        assert [a.id for a in other.query_all(status="running")] == [agent.id]
+
+    def test_returns_copies(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a", tags=["x"])
+        loaded = store.get(agent.id)
+        assert loaded is not None
+        loaded.metadata.status = "failed"
+        loaded.metadata.tags.append("y")
+
+        again = store.get(agent.id)
+        assert again is not None
+        assert again.metadata.status == "available"
+        assert again.metadata.tags == ["x"]
+
+    def test_reparses_only_changed_agents(
+        self, store: AgentStore, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        agents = [store.create(type="researcher", slug=s) for s in "abc"]
+        for agent in agents:
+            _age(agent)
+        store.invalidate()
+
+        loaded: list[str] = []
+        original = AgentMetadata.from_dict
+
+        def counting(data):
+            loaded.append(data["slug"])
+            return original(data)
+
+        monkeypatch.setattr(AgentMetadata, "from_dict", counting)
+        store.query_all()
+        assert loaded == []
+
+        data = json.loads(agents[1].metadata_path.read_text())
+        data["status"] = "completed"
+        agents[1].metadata_path.write_text(json.dumps(data))
+        assert [a.id for a in store.query_all(status="completed")] == [
+            agents[1].id
+        ]
+        assert loaded == ["b"]
+
+    def test_picks_up_external_objective_edit(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a", objective="old")
+        (agent.dir / "objective.md").write_text("new objective")
+
+        loaded = store.get(agent.id)
+        assert loaded is not None
+        assert loaded.objective == "new objective"
+
+    def test_save_metadata_keeps_objective(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a", objective="goal")
+        bare = Agent(id=agent.id, dir=agent.dir, metadata=agent.metadata)
+        store.save_metadata(bare)
+
+        loaded = store.get(agent.id)
+        assert loaded is not None
+        assert loaded.objective == "goal"
+
+    def test_children_index_tracks_reparenting(self, store: AgentStore) -> None:
+        root = store.create(type="orchestrator", slug="root")
+        other = store.create(type="orchestrator", slug="other")
+        child = store.create(type="researcher", slug="c", parent_id=root.id)
+
+        child.metadata.parent_id = other.id
+        store.save_metadata(child)
+        assert store.get_children(root.id) == []
+        assert [a.id for a in store.get_children(other.id)] == [child.id]
+
+    def test_delete_removes_directory_and_record(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a")
+        store.delete(agent.id)
+        assert not agent.dir.exists()
+        assert store.get(agent.id) is None
+        assert store.query_all() == []
+
+
+class TestSubscribe:
+    def test_write_through_changes(self, store: AgentStore) -> None:
+        changes: list[AgentChange] = []
+        store.subscribe(changes.append)
+
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.status = "running"
+        store.save_metadata(agent)
+        store.delete(agent.id)
+
+        assert [(c.kind, c.previous_status) for c in changes] == [
+            ("created", None),
+            ("updated", "available"),
+            ("deleted", "running"),
+        ]
+        assert changes[1].agent is not None
+        assert changes[1].agent.metadata.status == "running"
+        assert changes[2].agent is None
+
+    def test_changes_from_other_store_instances(
+        self, store: AgentStore, tmp_path: Path,
+    ) -> None:
+        changes: list[AgentChange] = []
+        store.subscribe(changes.append)
+        AgentStore(tmp_path).create(type="researcher", slug="a")
+        assert [c.kind for c in changes] == ["created"]
+
+    def test_external_edits_found_on_refresh(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a")
+        doomed = store.create(type="researcher", slug="b")
+        store.query_all()
+
+        changes: list[AgentChange] = []
+        store.subscribe(changes.append)
+        data = json.loads(agent.metadata_path.read_text())
+        data["status"] = "failed"
+        agent.metadata_path.write_text(json.dumps(data))
+        shutil.rmtree(doomed.dir)
+
+        store.refresh()
+        assert sorted((c.kind, c.agent_id) for c in changes) == sorted([
+            ("updated", agent.id), ("deleted", doomed.id),
+        ])
+
+        # Unchanged agents are not re-published.
+        store.refresh()
+        store.invalidate()
+        assert len(changes) == 2
+
+    def test_unsubscribe_and_failing_subscriber(self, store: AgentStore) -> None:
+        changes: list[AgentChange] = []
+
+        def broken(change: AgentChange) -> None:
+            raise RuntimeError("boom")
+
+        store.subscribe(broken)
+        unsubscribe = store.subscribe(changes.append)
+        store.create(type="researcher", slug="a")
+        unsubscribe()
+        store.create(type="researcher", slug="b")
+        assert len(changes) == 1
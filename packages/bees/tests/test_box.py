@@ -100,6 +100,11 @@ class TestClassifyChange:
             HIVE / "mutations" / ".box-active", HIVE
         ) == "ignore"
 
+    def test_mutation_archive_ignored(self):
+        assert classify_change(
+            HIVE / "mutations" / "archive" / "2026-10-17" / "abc-123.json", HIVE
+        ) == "ignore"
+
     def test_trajectory_json_ignored(self):
         assert classify_change(
             HIVE / "agents" / "abc-123" / "antigravity_traj.json", HIVE
@@ -0,0 +1,208 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for bees.config_registry — the cached hive configuration."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import yaml
+
+from bees.bees import Bees
+from bees.config_registry import ConfigRegistry, freeze, get_registry, thaw
+from bees.playbook import load_playbook
+from bees.skill_filter import filter_skills
+
+
+@pytest.fixture
+def hive(tmp_path):
+    (tmp_path / "config" / "hooks").mkdir(parents=True)
+    return tmp_path
+
+
+def _write_system(hive, data):
+    path = hive / "config" / "SYSTEM.yaml"
+    path.write_text(yaml.dump(data))
+    return path
+
+
+def _write_templates(hive, templates):
+    path = hive / "config" / "TEMPLATES.yaml"
+    path.write_text(yaml.dump(templates))
+    return path
+
+
+class TestFreeze:
+    def test_round_trip(self):
+        data = {"a": [1, {"b": "c"}], "d": None}
+        frozen = freeze(data)
+        with pytest.raises(TypeError):
+            frozen["a"] = 2
+        assert isinstance(frozen["a"], tuple)
+        assert thaw(frozen) == data
+
+
+class TestSystemConfig:
+    def test_cached_until_file_changes(self, hive):
+        _write_system(hive, {"title": "One"})
+        registry = ConfigRegistry(hive)
+        first = registry.system_config()
+        assert first["title"] == "One"
+        assert registry.system_config() is first
+
+        _write_system(hive, {"title": "Two, longer"})
+        assert registry.system_config()["title"] == "Two, longer"
+
+    def test_missing_file_is_empty(self, hive):
+        assert dict(ConfigRegistry(hive).system_config()) == {}
+
+    def test_without_revalidate_waits_for_invalidate(self, hive):
+        _write_system(hive, {"title": "One"})
+        registry = ConfigRegistry(hive, revalidate=False)
+        assert registry.system_config()["title"] == "One"
+
+        path = _write_system(hive, {"title": "Two, longer"})
+        assert registry.system_config()["title"] == "One"
+
+        assert registry.invalidate([path]) == ["system"]
+        assert registry.system_config()["title"] == "Two, longer"
+
+
+class TestTemplates:
+    def test_load_playbook_returns_copies(self, hive):
+        _write_templates(hive, [{"name": "worker", "tags": ["a"]}])
+        config_dir = hive / "config"
+
+        first = load_playbook("worker", config_dir)
+        first["tags"].append("b")
+
+        assert load_playbook("worker", config_dir)["tags"] == ["a"]
+
+    def test_template_files_only_explicit_names(self, hive):
+        _write_templates(hive, [
+            {"name": "worker", "objective": "Work."},
+            {"objective": "Unnamed."},
+        ])
+        registry = ConfigRegistry(hive)
+        assert list(registry.template_files()) == ["templates/worker.yaml"]
+        assert set(registry.templates()) == {"worker", "TEMPLATES_1"}
+
+    def test_workspace_templates_always_revalidated(self, hive, tmp_path):
+        registry = ConfigRegistry(hive, revalidate=False)
+        workspace = tmp_path / "workspace"
+        (workspace / "templates").mkdir(parents=True)
+        assert dict(registry.workspace_templates(workspace)) == {}
+
+        (workspace / "templates" / "local.yaml").write_text(
+            yaml.dump({"objective": "Local."}),
+        )
+        assert set(registry.workspace_templates(workspace)) == {"local"}
+
+
+class TestHooks:
+    def test_module_cached_until_file_changes(self, hive):
+        path = hive / "config" / "hooks" / "worker.py"
+        path.write_text("VALUE = 1\n")
+        registry = ConfigRegistry(hive)
+
+        module = registry.hooks("worker")
+        assert module.VALUE == 1
+        assert registry.hooks("worker") is module
+
+        path.write_text("VALUE = 22\n")
+        assert registry.hooks("worker").VALUE == 22
+
+    def test_missing_hooks(self, hive):
+        assert ConfigRegistry(hive).hooks("nobody") is None
+
+
+class TestInvalidate:
+    def test_only_matching_entries_dropped(self, hive):
+        _write_system(hive, {"title": "One"})
+        _write_templates(hive, [{"name": "worker"}])
+        registry = ConfigRegistry(hive, revalidate=False)
+        system = registry.system_config()
+        templates = registry.templates()
+
+        dropped = registry.invalidate([
+            hive / "config" / "TEMPLATES.yaml",
+            hive / "tickets" / "abc" / "metadata.json",
+        ])
+
+        assert dropped == ["templates"]
+        assert registry.system_config() is system
+        assert registry.templates() is not templates
+
+    def test_none_drops_everything(self, hive):
+        _write_system(hive, {"title": "One"})
+        registry = ConfigRegistry(hive)
+        registry.system_config()
+        registry.skills()
+        assert registry.invalidate() == ["skills", "system"]
+
+
+class TestTrusted:
+    def _write_skill(self, hive, name):
+        skill_dir = hive / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ntitle: {name.title()}\n---\nDo {name}.\n"
+        )
+
+    def test_new_skill_visible_after_invalidate(self, hive):
+        registry = get_registry(hive)
+        self._write_skill(hive, "alpha")
+        with registry.trusted():
+            listing, _, _ = filter_skills(["*"], hive)
+            assert "Alpha" in listing
+
+            self._write_skill(hive, "beta")
+            listing, _, _ = filter_skills(["*"], hive)
+            assert "Beta" not in listing  # Trusting the cache.
+
+            registry.invalidate([hive / "skills" / "beta" / "SKILL.md"])
+            listing, files, _ = filter_skills(["*"], hive)
+            assert "Alpha" in listing and "Beta" in listing
+            assert "skills/beta/SKILL.md" in files
+
+    async def test_scoped_to_the_trusting_context(self, hive):
+        _write_system(hive, {"title": "One"})
+        registry = get_registry(hive)
+        registry.system_config()
+        changed = asyncio.Event()
+
+        async def trusting():
+            with registry.trusted():
+                await changed.wait()
+                return registry.system_config()["title"]
+
+        owner = asyncio.create_task(trusting())
+        await asyncio.sleep(0)
+        _write_system(hive, {"title": "Two, longer"})
+        # Another caller on the same hive is not affected by the owner.
+        assert registry.system_config()["title"] == "Two, longer"
+        changed.set()
+        assert await owner == "Two, longer"
+
+        with registry.trusted():
+            _write_system(hive, {"title": "Three, longest"})
+            assert registry.system_config()["title"] == "Two, longer"
+        assert registry.system_config()["title"] == "Three, longest"
+
+    def test_bees_does_not_change_the_shared_mode(self, hive):
+        _write_system(hive, {"title": "One"})
+        Bees(hive, {"generate": Mock()}, revalidate=False)
+        registry = get_registry(hive)
+        assert registry.revalidating()
+        registry.system_config()
+
+        _write_system(hive, {"title": "Two, longer"})
+        assert registry.system_config()["title"] == "Two, longer"
+
+
+class TestGetRegistry:
+    def test_shared_per_hive(self, hive):
+        assert get_registry(hive) is get_registry(hive / "config" / "..")
@@ -0,0 +1,179 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the event-driven DependencyIndex."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bees.agent import Agent
+from bees.dependency_index import DependencyIndex
+from bees.unified_agent_store import UnifiedAgentStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> UnifiedAgentStore:
+    return UnifiedAgentStore(tmp_path)
+
+
+def _blocked(store: UnifiedAgentStore, name: str, *deps: Agent) -> Agent:
+    agent = store.create(name)
+    agent.metadata.status = "blocked"
+    agent.metadata.depends_on = [d.id for d in deps]
+    store.save_metadata(agent)
+    return agent
+
+
+def _finish(store: UnifiedAgentStore, agent: Agent, status: str) -> Agent:
+    agent.metadata.status = status
+    store.save_metadata(agent)
+    return agent
+
+
+def _status(store: UnifiedAgentStore, agent: Agent) -> str:
+    fresh = store.get(agent.id)
+    assert fresh is not None
+    return fresh.metadata.status
+
+
+def test_sync_promotes_when_all_deps_completed(store: UnifiedAgentStore) -> None:
+    a = _finish(store, store.create("A"), "completed")
+    b = _finish(store, store.create("B"), "completed")
+    c = _blocked(store, "C", a, b)
+
+    index = DependencyIndex(store)
+    assert index.sync() == 1
+    assert _status(store, c) == "available"
+
+
+def test_sync_follows_store_changes(
+    store: UnifiedAgentStore, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a = store.create("A")
+    index = DependencyIndex(store)
+    index.sync()
+
+    rebuilds = 0
+    query_all = store.query_all
+
+    def counting_query_all(*args, **kwargs):
+        nonlocal rebuilds
+        rebuilds += 1
+        return query_all(*args, **kwargs)
+
+    monkeypatch.setattr(store, "query_all", counting_query_all)
+
+    # Made outside the index: a new blocked agent, then its dependency
+    # completing. Neither needs a pass over the store.
+    c = _blocked(store, "C", a)
+    assert index.sync() == 0
+    assert index.unmet(c.id) == {a.id}
+
+    _finish(store, a, "completed")
+    assert index.sync() == 1
+    assert _status(store, c) == "available"
+    assert rebuilds == 0
+
+
+def test_sync_ignores_bookkeeping_saves(store: UnifiedAgentStore) -> None:
+    a = store.create("A")
+    index = DependencyIndex(store)
+    index.sync()
+
+    a.metadata.turns = 3
+    store.save_metadata(a)
+    assert index._dirty == set()
+
+
+def test_invalidate_rebuilds(store: UnifiedAgentStore) -> None:
+    a = store.create("A")
+    index = DependencyIndex(store)
+    index.sync()
+
+    index.invalidate()
+    c = _blocked(store, "C", a)
+    _finish(store, a, "completed")
+    assert index.sync() == 1
+    assert _status(store, c) == "available"
+
+
+def test_task_done_promotes_only_at_zero_unmet(store: UnifiedAgentStore) -> None:
+    a = store.create("A")
+    b = store.create("B")
+    c = _blocked(store, "C", a, b)
+
+    index = DependencyIndex(store)
+    index.sync()
+    assert index.unmet(c.id) == {a.id, b.id}
+    assert index.waiting_on(a.id) == {c.id}
+
+    assert index.task_done(_finish(store, a, "completed")) == 0
+    assert _status(store, c) == "blocked"
+    assert index.unmet(c.id) == {b.id}
+
+    assert index.task_done(_finish(store, b, "completed")) == 1
+    assert _status(store, c) == "available"
+    assert index.unmet(c.id) == set()
+
+
+def test_failure_propagates_transitively(store: UnifiedAgentStore) -> None:
+    a = store.create("A")
+    other = store.create("Other")
+    b = _blocked(store, "B", a)
+    c = _blocked(store, "C", b, other)
+    d = _blocked(store, "D", c)
+
+    index = DependencyIndex(store)
+    index.sync()
+    index.task_done(_finish(store, a, "failed"))
+
+    for agent in (b, c, d):
+        fresh = store.get(agent.id)
+        assert fresh is not None
+        assert fresh.metadata.status == "failed"
+        assert fresh.metadata.error == "Dependency failed"
+    # The failed agent no longer waits on its other dependency.
+    assert index.waiting_on(other.id) == set()
+
+
+def test_sync_fails_chain_behind_already_failed_dep(
+    store: UnifiedAgentStore,
+) -> None:
+    a = _finish(store, store.create("A"), "failed")
+    b = _blocked(store, "B", a)
+    c = _blocked(store, "C", b)
+
+    DependencyIndex(store).sync()
+    assert _status(store, b) == "failed"
+    assert _status(store, c) == "failed"
+
+
+@pytest.mark.parametrize("status", ["paused", "cancelled", "suspended"])
+def test_non_terminal_done_leaves_dependents_blocked(
+    store: UnifiedAgentStore, status: str,
+) -> None:
+    a = store.create("A")
+    c = _blocked(store, "C", a)
+
+    index = DependencyIndex(store)
+    index.sync()
+    assert index.task_done(_finish(store, a, status)) == 0
+    assert _status(store, c) == "blocked"
+    assert index.unmet(c.id) == {a.id}
+
+
+def test_task_done_skips_dependents_no_longer_blocked(
+    store: UnifiedAgentStore,
+) -> None:
+    a = store.create("A")
+    c = _blocked(store, "C", a)
+
+    index = DependencyIndex(store)
+    index.sync()
+    _finish(store, c, "cancelled")
+
+    index.task_done(_finish(store, a, "completed"))
+    assert _status(store, c) == "cancelled"
@@ -11,10 +11,12 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from bees.disk_file_system import DiskFileSystem
+from bees.disk_file_system import DiskFileSystem, shared_io_executor
 from bees.protocols.filesystem import FileDescriptor
 
 
@@ -423,3 +425,77 @@ class TestHydrateFromSnapshot:
         assert (tmp_path / "untracked.txt").read_text() == "new-file"
         assert (tmp_path / "a.txt").read_text() == "original-a"
 
+
+
+# ---------------------------------------------------------------------------
+# async I/O mode
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncIO:
+
+    @pytest.fixture
+    def executor(self):
+        executor = ThreadPoolExecutor(4, thread_name_prefix="test-fs-io")
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_reads_match_inline_mode(self, tmp_path, executor):
+        inline = DiskFileSystem(tmp_path)
+        offloaded = DiskFileSystem(tmp_path, io_executor=executor)
+        inline.write("notes.md", "# Notes")
+        (tmp_path / "image.png").write_bytes(b"\x89PNG\x00binary")
+        offloaded.add_system_file("system/status", lambda: "ok")
+        inline.add_system_file("system/status", lambda: "ok")
+
+        for path in ("notes.md", "image.png", "system/status", "missing.md"):
+            assert await offloaded.get(path) == await inline.get(path)
+        assert await offloaded.read_text("notes.md") == "# Notes"
+        assert await offloaded.list_files() == await inline.list_files()
+
+    @pytest.mark.asyncio
+    async def test_reads_run_off_the_loop_thread(self, tmp_path, executor):
+        fs = DiskFileSystem(tmp_path, io_executor=executor)
+        fs.write("a.txt", "alpha")
+        threads: list[str] = []
+        original = fs._read_parts
+
+        def recording(path, normalized):
+            threads.append(threading.current_thread().name)
+            return original(path, normalized)
+
+        fs._read_parts = recording
+        await fs.get("a.txt")
+        assert threads[0].startswith("test-fs-io")
+
+    @pytest.mark.asyncio
+    async def test_get_many_reads_in_parallel_keeping_order(
+        self, tmp_path, executor,
+    ):
+        fs = DiskFileSystem(tmp_path, io_executor=executor)
+        for name in "abcd":
+            fs.write(f"{name}.txt", name)
+        barrier = threading.Barrier(4, timeout=5)
+        original = fs._read_parts
+
+        def rendezvous(path, normalized):
+            # Only passes if all four reads are in flight at once.
+            barrier.wait()
+            return original(path, normalized)
+
+        fs._read_parts = rendezvous
+        parts = await fs.get_many(["d.txt", "a.txt", "c.txt", "b.txt"])
+        assert parts == [{"text": t} for t in "dacb"]
+
+    @pytest.mark.asyncio
+    async def test_get_many_collects_errors(self, tmp_path, executor):
+        fs = DiskFileSystem(tmp_path, io_executor=executor)
+        fs.write("a.txt", "alpha")
+        result = await fs.get_many(["a.txt", "nope.txt", "gone.txt"])
+        assert result == {
+            "$error": 'file "nope.txt" not found,file "gone.txt" not found'
+        }
+
+    def test_shared_executor_is_a_singleton(self):
+        assert shared_io_executor() is shared_io_executor()
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
@@ -400,3 +401,142 @@ async def test_run_case_stateful_simulated_user_loop(tmp_path):
     assert result.status == "completed"
     assert call_count == 3
 
+
+
+# ---------------------------------------------------------------------------
+# Parallel batch runs and the result cache (batch.py)
+# ---------------------------------------------------------------------------
+
+
+class _FakeRunner:
+    """Session runner whose sessions complete after a short sleep."""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, config):
+        self.runs += 1
+        return _FakeStream(self)
+
+
+class _FakeStream:
+    def __init__(self, runner: _FakeRunner) -> None:
+        self._runner = runner
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        self._done = True
+        self._runner.running += 1
+        self._runner.peak = max(self._runner.peak, self._runner.running)
+        await asyncio.sleep(0.05)
+        self._runner.running -= 1
+        return {"complete": {"result": {"success": True}}}
+
+    def resume_state(self):
+        return None
+
+
+def _make_eval_set(root: Path, count: int) -> Path:
+    eval_set = root / "eval_set"
+    for i in range(count):
+        config_dir = eval_set / f"case-{i}" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "SYSTEM.yaml").write_text(
+            yaml.dump({"title": f"Case {i}", "root": "simple"}),
+        )
+        (config_dir / "TEMPLATES.yaml").write_text(yaml.dump([
+            {"name": "simple", "title": "Simple", "objective": "Do it."},
+        ]))
+    return eval_set
+
+
+@pytest.mark.asyncio
+async def test_run_set_runs_cases_concurrently(tmp_path):
+    from bees.eval.batch import run_set
+
+    eval_set = _make_eval_set(tmp_path, 5)
+    runner = _FakeRunner()
+
+    results = await run_set(
+        eval_set, tmp_path / "out", "",
+        jobs=3,
+        runners_factory=lambda: {"generate": runner},
+    )
+
+    assert [r.case_name for r in results] == [f"case-{i}" for i in range(5)]
+    assert all(r.status == "completed" for r in results)
+    assert runner.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_run_set_reuses_cached_results(tmp_path):
+    from bees.eval.batch import run_set
+
+    eval_set = _make_eval_set(tmp_path, 2)
+    runner = _FakeRunner()
+
+    async def _run():
+        return await run_set(
+            eval_set, tmp_path / "out", "",
+            jobs=2, use_cache=True,
+            runners_factory=lambda: {"generate": runner},
+        )
+
+    first = await _run()
+    assert runner.runs == 2
+    assert not any(r.cached for r in first)
+
+    # Edit one case: only that one runs again.
+    (eval_set / "case-1" / "config" / "TEMPLATES.yaml").write_text(yaml.dump([
+        {"name": "simple", "title": "Simple", "objective": "Do it again."},
+    ]))
+    second = await _run()
+    assert runner.runs == 3
+    assert [r.cached for r in second] == [True, False]
+    assert second[0].task_count == first[0].task_count
+    assert second[0].tasks == first[0].tasks
+
+
+@pytest.mark.asyncio
+async def test_run_set_does_not_cache_by_default(tmp_path):
+    from bees.eval.batch import run_set
+
+    eval_set = _make_eval_set(tmp_path, 1)
+    runner = _FakeRunner()
+    for _ in range(2):
+        results = await run_set(
+            eval_set, tmp_path / "out", "",
+            runners_factory=lambda: {"generate": runner},
+        )
+        assert not results[0].cached
+    assert runner.runs == 2
+
+
+def test_case_key_covers_root_override(tmp_path):
+    from bees.eval.batch import case_key
+
+    hive = _make_eval_set(tmp_path, 1) / "case-0"
+    assert case_key(hive) == case_key(hive)
+    assert case_key(hive) != case_key(hive, root_task="other")
+
+
+def test_case_key_covers_runners(tmp_path):
+    from bees.eval.batch import case_key, runners_fingerprint
+
+    def fake_runners():
+        return {}
+
+    hive = _make_eval_set(tmp_path, 1) / "case-0"
+    assert case_key(hive) == case_key(hive, runners=runners_fingerprint())
+    fake = runners_fingerprint(fake_runners)
+    assert case_key(hive, runners=fake) != case_key(hive)
+    assert case_key(hive, runners=fake) != case_key(
+        hive, runners=runners_fingerprint(_FakeRunner),
+    )
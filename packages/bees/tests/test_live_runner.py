@@ -1224,6 +1224,90 @@ async def test_tool_dispatch_watcher_stops_on_cancel(temp_dir):
         await task
 
 
+@pytest.mark.asyncio
+async def test_tool_dispatch_watcher_wakes_on_notification(temp_dir):
+    """With notifications, a new call is handled long before a poll."""
+    dispatch_dir = temp_dir / TOOL_DISPATCH_DIR
+    handler_map = _make_handler_map({"echo": lambda args: args})
+    watcher = ToolDispatchWatcher(dispatch_dir, handler_map, poll_interval=30)
+    task = asyncio.create_task(watcher.run())
+    await asyncio.sleep(0.2)
+
+    (dispatch_dir / "call-fast.json").write_text(json.dumps({
+        "functionCall": {"id": "call-fast", "name": "echo", "args": {"x": 1}},
+    }))
+    result_path = dispatch_dir / "call-fast.result.json"
+    for _ in range(200):
+        if result_path.exists():
+            break
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    result = json.loads(result_path.read_text())
+    assert result["functionResponse"]["response"] == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_tool_dispatch_watcher_retries_partial_call_file(temp_dir):
+    """A call file that is still empty is retried, not failed."""
+    dispatch_dir = temp_dir / TOOL_DISPATCH_DIR
+    dispatch_dir.mkdir()
+    handler_map = _make_handler_map({"echo": lambda args: args})
+    watcher = ToolDispatchWatcher(dispatch_dir, handler_map, notify=False)
+
+    call_path = dispatch_dir / "call-partial.json"
+    call_path.write_text("")
+    await watcher._scan_once(["call-partial.json"])
+    result_path = dispatch_dir / "call-partial.result.json"
+    assert not result_path.exists()
+
+    call_path.write_text(json.dumps({
+        "functionCall": {"id": "call-partial", "name": "echo", "args": {}},
+    }))
+    await watcher._scan_once(["call-partial.json"])
+    result = json.loads(result_path.read_text())
+    assert result["functionResponse"]["response"] == {}
+
+
+@pytest.mark.asyncio
+async def test_live_stream_wakes_on_notification(temp_dir):
+    """With notifications, events arrive long before a poll would."""
+    events_dir = temp_dir / LIVE_EVENTS_DIR
+    events_dir.mkdir()
+    stream = LiveStream(temp_dir, poll_interval=30)
+
+    async def _write_later():
+        await asyncio.sleep(0.2)
+        # Created empty first, as the browser does.
+        (events_dir / "000000.json").write_text("")
+        await asyncio.sleep(0.05)
+        _write_event(events_dir, 0, {"type": "sessionEnd", "status": "completed"})
+
+    writer = asyncio.create_task(_write_later())
+    events = await asyncio.wait_for(
+        _collect(stream), timeout=5,
+    )
+    await writer
+    assert "complete" in events[-1]
+
+
+@pytest.mark.asyncio
+async def test_live_stream_polls_without_notifications(temp_dir):
+    events_dir = temp_dir / LIVE_EVENTS_DIR
+    events_dir.mkdir()
+    stream = LiveStream(temp_dir, poll_interval=0.02, notify=False)
+    _write_event(events_dir, 0, {"type": "sessionEnd", "status": "completed"})
+
+    events = await _collect(stream)
+    assert "complete" in events[-1]
+
+
+async def _collect(stream: LiveStream) -> list[dict]:
+    return [event async for event in stream]
+
+
 @pytest.mark.asyncio
 async def test_live_stream_cancels_watcher(temp_dir):
     """LiveStream cancels the watcher task when the stream exhausts."""
@@ -548,6 +548,89 @@ class TestRegistry:
             await registry.connect_all(configs)
 
 
+# ---------------------------------------------------------------------------
+# Registry update
+# ---------------------------------------------------------------------------
+
+
+async def _fake_discover(self: MCPConnection) -> None:
+    self.tools = [{"name": "ping", "description": "", "inputSchema": {}}]
+
+
+class TestRegistryUpdate:
+    """Test MCPRegistry.update reconnects only changed servers."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_servers_keep_connection(self):
+        registry = MCPRegistry()
+        configs = [
+            {"name": "alpha", "command": "alpha-server"},
+            {"name": "beta", "command": "beta-server"},
+        ]
+        with patch.object(MCPConnection, "discover_tools", _fake_discover):
+            await registry.discover_all(configs)
+            before = list(registry._connections)
+
+            changed = await registry.update([
+                {"name": "alpha", "command": "alpha-server"},
+                {"name": "beta", "command": "beta-server --verbose"},
+                {"name": "gamma", "url": "https://example.com/mcp"},
+            ])
+
+        assert changed == ["beta", "gamma"]
+        names = [conn.name for conn in registry._connections]
+        assert names == ["alpha", "beta", "gamma"]
+        assert registry._connections[0] is before[0]
+        assert registry._connections[1] is not before[1]
+        assert registry._connections[1].config["command"] == "beta-server --verbose"
+        assert len(registry.get_factories()) == 3
+
+    @pytest.mark.asyncio
+    async def test_removed_server_is_disconnected(self):
+        registry = MCPRegistry()
+        with patch.object(MCPConnection, "discover_tools", _fake_discover):
+            await registry.discover_all([
+                {"name": "alpha", "command": "alpha-server"},
+                {"name": "beta", "command": "beta-server"},
+            ])
+        beta = registry._connections[1]
+        beta.disconnect = AsyncMock()
+
+        changed = await registry.update([
+            {"name": "alpha", "command": "alpha-server"},
+        ])
+
+        assert changed == ["beta"]
+        beta.disconnect.assert_awaited()
+        assert [conn.name for conn in registry._connections] == ["alpha"]
+        assert len(registry.get_factories()) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_change_is_a_no_op(self):
+        registry = MCPRegistry()
+        configs = [{"name": "alpha", "command": "alpha-server"}]
+        with patch.object(MCPConnection, "discover_tools", _fake_discover):
+            await registry.discover_all(configs)
+        factories = registry.get_factories()
+
+        assert await registry.update(list(configs)) == []
+        assert registry.get_factories() == factories
+
+    @pytest.mark.asyncio
+    async def test_invalid_update_leaves_registry_unchanged(self):
+        registry = MCPRegistry()
+        with patch.object(MCPConnection, "discover_tools", _fake_discover):
+            await registry.discover_all([
+                {"name": "alpha", "command": "alpha-server"},
+            ])
+        before = list(registry._connections)
+
+        with pytest.raises(ValueError, match="requires either"):
+            await registry.update([{"name": "alpha"}])
+
+        assert registry._connections == before
+
+
 # ---------------------------------------------------------------------------
 # Registry OAuth validation
 # ---------------------------------------------------------------------------
@@ -1014,3 +1014,85 @@ class TestSentinel:
         manager.activate()
         pending = manager._scan_pending()
         assert len(pending) == 0
+
+
+# ---------------------------------------------------------------------------
+# Journal and compaction
+# ---------------------------------------------------------------------------
+
+
+class TestJournal:
+    """Processed journal, targeted scans, and archival."""
+
+    def test_processed_mutation_is_journaled(self, hive, store):
+        path = _write_mutation(hive, {"type": "pause-all"})
+        manager = MutationManager(hive)
+        asyncio.run(manager.process_inline())
+
+        journal = (hive / "mutations" / ".processed").read_text()
+        assert journal.splitlines() == [path.name]
+
+        # The journal alone marks it processed, even for a new manager.
+        path.with_suffix(".result.json").unlink()
+        assert MutationManager(hive)._scan_pending() == []
+
+    def test_existing_results_are_backfilled(self, hive):
+        path = _write_mutation(hive, {"type": "reset"})
+        path.with_suffix(".result.json").write_text(json.dumps({"status": "ok"}))
+
+        manager = MutationManager(hive)
+        assert manager._scan_pending() == []
+        journal = (hive / "mutations" / ".processed").read_text()
+        assert journal.splitlines() == [path.name]
+
+    def test_targeted_scan_reads_only_given_paths(self, hive, store):
+        _create_task(store, status="available")
+        first = _write_mutation(hive, {"type": "pause-all"})
+        second = _write_mutation(hive, {"type": "resume-paused"})
+        manager = MutationManager(hive)
+
+        outcome = asyncio.run(manager.process_inline([first]))
+
+        assert outcome.hot_processed == 1
+        assert first.with_suffix(".result.json").exists()
+        assert not second.with_suffix(".result.json").exists()
+
+    def test_targeted_scan_skips_deleted_paths(self, hive):
+        manager = MutationManager(hive)
+        missing = hive / "mutations" / "gone.json"
+        outcome = asyncio.run(manager.process_inline([missing]))
+        assert outcome.hot_processed == 0
+
+    def test_compaction_archives_oldest(self, hive, store):
+        manager = MutationManager(hive, compact_threshold=4, retain_completed=2)
+        paths = []
+        for _ in range(5):
+            path = _write_mutation(hive, {"type": "pause-all"})
+            asyncio.run(manager.process_inline([path]))
+            paths.append(path)
+
+        mutations_dir = hive / "mutations"
+        archived = list((mutations_dir / "archive").glob("*/*.json"))
+        assert sorted(p.name for p in archived) == sorted(
+            name
+            for path in paths[:3]
+            for name in (path.name, path.with_suffix(".result.json").name)
+        )
+        for path in paths[3:]:
+            assert path.exists()
+            assert path.with_suffix(".result.json").exists()
+
+        journal = (mutations_dir / ".processed").read_text().splitlines()
+        assert journal == [path.name for path in paths[3:]]
+        assert MutationManager(hive)._scan_pending() == []
+
+    def test_reset_clears_journal(self, hive, store):
+        _write_mutation(hive, {"type": "pause-all"})
+        manager = MutationManager(hive)
+        asyncio.run(manager.process_inline())
+
+        reset = _write_mutation(hive, {"type": "reset"})
+        asyncio.run(manager.process_cold())
+
+        journal = (hive / "mutations" / ".processed").read_text()
+        assert journal.splitlines() == [reset.name]
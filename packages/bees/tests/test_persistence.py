@@ -0,0 +1,247 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for atomic writes and write-behind agent persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bees.agent_store import AgentStore
+from bees.persistence import WriteBehind, atomic_write_text
+
+
+def _on_disk(store: AgentStore, agent_id: str) -> dict:
+    return json.loads((store.agents_dir / agent_id / "metadata.json").read_text())
+
+
+@pytest.fixture
+def writer():
+    writer = WriteBehind(delay=60)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def store(tmp_path: Path, writer: WriteBehind) -> AgentStore:
+    return AgentStore(tmp_path, write_behind=writer)
+
+
+class TestAtomicWrite:
+    def test_failed_replace_keeps_old_contents(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        target = tmp_path / "metadata.json"
+        atomic_write_text(target, "old")
+
+        def crash(src, dst):
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(os, "replace", crash)
+        with pytest.raises(OSError):
+            atomic_write_text(target, "new")
+        assert target.read_text() == "old"
+        assert os.listdir(tmp_path) == ["metadata.json"]
+
+
+class TestWriteBehind:
+    def test_coalesces_per_key(self, writer: WriteBehind) -> None:
+        written: list[int] = []
+        for i in range(10):
+            writer.schedule("a", lambda i=i: written.append(i))
+        writer.schedule("b", lambda: written.append(100))
+        assert written == []
+
+        writer.flush()
+        assert sorted(written) == [9, 100]
+        assert writer.coalesced == 9
+
+    def test_writes_after_delay_off_thread(self) -> None:
+        writer = WriteBehind(delay=0.01)
+        done = threading.Event()
+        threads: list[str] = []
+
+        def write() -> None:
+            threads.append(threading.current_thread().name)
+            done.set()
+
+        writer.schedule("a", write)
+        assert done.wait(5)
+        writer.close()
+        assert threads[0] != threading.current_thread().name
+
+    def test_same_key_never_overlaps(self) -> None:
+        writer = WriteBehind(delay=0)
+        active = 0
+        overlaps = 0
+        order: list[int] = []
+
+        def write(i: int) -> None:
+            nonlocal active, overlaps
+            active += 1
+            overlaps += active > 1
+            time.sleep(0.005)
+            order.append(i)
+            active -= 1
+
+        for i in range(20):
+            writer.schedule("a", lambda i=i: write(i))
+            time.sleep(0.001)
+        writer.close()
+        assert overlaps == 0
+        assert order == sorted(order)
+        assert order[-1] == 19
+
+    def test_discard_drops_pending(self, writer: WriteBehind) -> None:
+        written: list[str] = []
+        writer.schedule("a", lambda: written.append("a"))
+        writer.discard("a")
+        writer.flush()
+        assert written == []
+
+    def test_schedule_after_close_writes_inline(self) -> None:
+        writer = WriteBehind()
+        writer.close()
+        written: list[str] = []
+        writer.schedule("a", lambda: written.append("a"))
+        assert written == ["a"]
+
+
+class TestDeferredAgentSaves:
+    def test_bookkeeping_is_deferred_but_visible(
+        self, store: AgentStore, writer: WriteBehind,
+    ) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.status = "running"
+        store.save_metadata(agent)
+        store.flush()
+        assert _on_disk(store, agent.id)["status"] == "running"
+
+        for turn in range(1, 6):
+            agent.metadata.turns = turn
+            store.save_metadata(agent)
+        assert _on_disk(store, agent.id)["turns"] == 0
+        loaded = store.get(agent.id)
+        assert loaded is not None
+        assert loaded.metadata.turns == 5
+
+        store.flush()
+        assert _on_disk(store, agent.id)["turns"] == 5
+        assert writer.coalesced == 4
+
+    @pytest.mark.parametrize("status", ["completed", "failed", "cancelled"])
+    def test_terminal_states_skip_the_window(
+        self, store: AgentStore, status: str,
+    ) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.status = "running"
+        store.save_metadata(agent)
+        agent.metadata.turns = 3
+        store.save_metadata(agent)
+
+        agent.metadata.status = status
+        store.save_metadata(agent)
+        # Handed to the pool rather than written on the calling thread;
+        # the fixture's 60 s window would otherwise hold it back.
+        deadline = time.monotonic() + 5
+        while _on_disk(store, agent.id)["status"] != status:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        assert _on_disk(store, agent.id)["turns"] == 3
+
+    def test_lifecycle_steps_are_deferred(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.status = "running"
+        agent.metadata.active_session = "s1"
+        store.save_metadata(agent)
+        assert _on_disk(store, agent.id)["status"] != "running"
+        assert store.get(agent.id).metadata.active_session == "s1"
+
+    async def test_aflush_writes_off_the_event_loop(
+        self, store: AgentStore,
+    ) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.turns = 2
+        store.save_metadata(agent)
+
+        await store.aflush(agent.id)
+        assert _on_disk(store, agent.id)["turns"] == 2
+
+    def test_delete_drops_pending_write(self, store: AgentStore) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.turns = 1
+        store.save_metadata(agent)
+        store.delete(agent.id)
+        store.flush()
+        assert not agent.dir.exists()
+
+    def test_revalidation_keeps_pending_state(
+        self, store: AgentStore, tmp_path: Path,
+    ) -> None:
+        agent = store.create(type="researcher", slug="a")
+        agent.metadata.turns = 7
+        store.save_metadata(agent)
+
+        store.refresh()
+        other = AgentStore(tmp_path)
+        loaded = other.get(agent.id)
+        assert loaded is not None
+        assert loaded.metadata.turns == 7
+
+
+_CRASH_WRITER = textwrap.dedent("""
+    import sys
+    from pathlib import Path
+    from bees.agent_store import AgentStore
+    from bees.persistence import WriteBehind
+
+    store = AgentStore(Path(sys.argv[1]), write_behind=WriteBehind(delay=0))
+    agents = [store.create(type="t", slug=f"a{i}") for i in range(8)]
+    for agent in agents:
+        agent.metadata.status = "running"
+        store.save_metadata(agent)
+    print("ready", flush=True)
+    turn = 0
+    while True:
+        turn += 1
+        for agent in agents:
+            agent.metadata.turns = turn
+            agent.metadata.context = "x" * (turn % 5000)
+            store.save_metadata(agent)
+""")
+
+
+def test_crash_mid_write_leaves_parseable_metadata(tmp_path: Path) -> None:
+    """SIGKILL during a storm of writes never leaves a torn metadata.json."""
+    root = Path(__file__).resolve().parent.parent
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _CRASH_WRITER, str(tmp_path)],
+        cwd=root,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert proc.stdout is not None
+        assert proc.stdout.readline().strip() == "ready"
+        time.sleep(0.3)
+    finally:
+        proc.send_signal(signal.SIGKILL)
+        proc.wait()
+
+    store = AgentStore(tmp_path)
+    agents = store.query_all()
+    assert len(agents) == 8
+    for agent in agents:
+        data = json.loads(agent.metadata_path.read_text())
+        assert data["status"] == "running"
+        assert len(data.get("context", "")) == data["turns"] % 5000
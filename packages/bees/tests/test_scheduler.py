@@ -438,3 +438,42 @@ async def test_returns_none_when_no_system_yaml(mock_clients, tmp_path):
 
     ticket = await scheduler._boot_root_template([])
     assert ticket is None
+
+
+# --- reload_config ---
+
+@pytest.mark.asyncio
+async def test_reload_config_boots_new_root(mock_clients, write_template, tmp_path):
+    write_template({"name": "opie", "title": "Opie", "objective": "Be helpful."})
+    system_path = tmp_path / "config" / "SYSTEM.yaml"
+    system_path.write_text(yaml.dump({"title": "My Hive"}))
+
+    _, backend = mock_clients
+    scheduler = Scheduler(store=GLOBAL_STORE, runners={"generate": backend})
+    await scheduler.startup()
+    assert GLOBAL_STORE.query_all() == []
+
+    system_path.write_text(yaml.dump({"title": "My Hive", "root": "opie"}))
+    assert await scheduler.reload_config() == []
+
+    [root] = GLOBAL_STORE.query_all()
+    assert root.metadata.playbook_id == "opie"
+
+
+@pytest.mark.asyncio
+async def test_reload_config_keeps_running_tasks(mock_clients, tmp_path):
+    system_path = tmp_path / "config" / "SYSTEM.yaml"
+    system_path.parent.mkdir(parents=True, exist_ok=True)
+    system_path.write_text(yaml.dump({"title": "My Hive"}))
+
+    ticket = GLOBAL_STORE.create("Objective")
+    ticket.metadata.status = "running"
+    GLOBAL_STORE.save_metadata(ticket)
+
+    _, backend = mock_clients
+    scheduler = Scheduler(store=GLOBAL_STORE, runners={"generate": backend})
+    system_path.write_text(yaml.dump({"title": "Renamed"}))
+    await scheduler.reload_config()
+
+    # Unlike startup, a reload doesn't treat running tasks as stuck.
+    assert GLOBAL_STORE.get(ticket.id).metadata.status == "running"
@@ -1,10 +1,10 @@
 # Copyright 2026 Google LLC
 # SPDX-License-Identifier: Apache-2.0
 
-"""Tests for merge_function_filter in bees.skill_filter."""
+"""Tests for bees.skill_filter."""
 
 import pytest
-from bees.skill_filter import merge_function_filter
+from bees.skill_filter import filter_skills, merge_function_filter
 
 
 class TestMergeFunctionFilter:
@@ -73,3 +73,32 @@ class TestMergeFunctionFilter:
             allowed_skills=["x"],
         )
         assert result == ["sandbox.*", "system.*", "events.*", "skills.*"]
+
+
+class TestFilterSkills:
+    """filter_skills reads skills through the config registry."""
+
+    def _write_skill(self, hive_dir, name):
+        skill_dir = hive_dir / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ntitle: {name.title()}\n---\nDo {name}.\n"
+        )
+
+    def test_selects_files_of_allowed_skills(self, tmp_path):
+        self._write_skill(tmp_path, "alpha")
+        self._write_skill(tmp_path, "beta")
+        (tmp_path / "skills" / "beta" / "notes.md").write_text("Notes.")
+
+        listing, files, _ = filter_skills(["beta"], tmp_path)
+
+        assert "Beta" in listing and "Alpha" not in listing
+        assert set(files) == {"skills/beta/SKILL.md", "skills/beta/notes.md"}
+
+    def test_all_skills_share_registry_files(self, tmp_path):
+        self._write_skill(tmp_path, "alpha")
+        _, first, _ = filter_skills(["*"], tmp_path)
+        _, second, _ = filter_skills(["*"], tmp_path)
+        assert first is second
+        with pytest.raises(TypeError):
+            first["skills/alpha/SKILL.md"] = "changed"
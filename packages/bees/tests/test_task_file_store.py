@@ -198,3 +198,105 @@ class TestDeleteByAssignee:
         assert deleted == []
         assert len(store.query_all()) == 1
 
+
+
+class TestIndex:
+    def test_picks_up_out_of_process_edit(self, store: TaskFileStore) -> None:
+        task = store.create("Task A", assignee="agent-1")
+        assert len(store.query_by_assignee("agent-1")) == 1
+
+        # Another process reassigns the task by rewriting the file.
+        path = store.tasks_dir / f"{task.id}.json"
+        data = json.loads(path.read_text())
+        data["assignee"] = "agent-2"
+        data["status"] = "completed"
+        path.write_text(json.dumps(data, indent=2) + "\n")
+
+        assert store.query_by_assignee("agent-1") == []
+        assert [t.id for t in store.query_by_assignee("agent-2")] == [task.id]
+        assert [t.id for t in store.query_all(status="completed")] == [task.id]
+
+    def test_picks_up_out_of_process_create_and_delete(
+        self, store: TaskFileStore
+    ) -> None:
+        task = store.create("Task A")
+        other = TaskFileStore(store.hive_dir)
+        created = other.create("Task B")
+        other.delete(task.id)
+
+        assert [t.id for t in store.query_all()] == [created.id]
+        assert store.get(task.id) is None
+
+    def test_returns_copies(self, store: TaskFileStore) -> None:
+        task = store.create("Task A", assignee="agent-1")
+        loaded = store.get(task.id)
+        assert loaded is not None
+        loaded.status = "completed"
+
+        # Unsaved mutations must not leak into the index.
+        assert store.query_by_assignee("agent-1")[0].status == "available"
+        assert store.query_all(status="completed") == []
+
+    def test_returns_copies_of_containers(self, store: TaskFileStore) -> None:
+        task = store.create("Task A", tags=["a"], depends_on=["dep"])
+        task.tags.append("unsaved")
+        loaded = store.get(task.id)
+        assert loaded is not None
+        loaded.depends_on.append("other")
+        loaded.outcome_content = {"parts": []}
+
+        fresh = store.query_all()[0]
+        assert fresh.tags == ["a"]
+        assert fresh.depends_on == ["dep"]
+        assert fresh.outcome_content is None
+
+    def test_save_moves_task_between_indexes(self, store: TaskFileStore) -> None:
+        task = store.create("Task A", assignee="agent-1")
+        task.assignee = "agent-2"
+        task.status = "queued"
+        store.save(task)
+
+        assert store.query_by_assignee("agent-1") == []
+        assert store.query_all(status="available") == []
+        assert [t.id for t in store.query_all(status="queued")] == [task.id]
+
+    def test_query_by_creator(self, store: TaskFileStore) -> None:
+        store.create("Child 1", created_by="parent-1")
+        store.create("Child 2", created_by="parent-1")
+        store.create("Other", created_by="parent-2")
+
+        assert len(store.query_by_creator("parent-1")) == 2
+        assert store.query_by_creator("parent-x") == []
+
+    def test_group_by_assignee(self, store: TaskFileStore) -> None:
+        store.create("Task 1", assignee="agent-1")
+        store.create("Task 2", assignee="agent-1")
+        store.create("Task 3", assignee="agent-2")
+
+        grouped = store.group_by_assignee(["agent-1", "agent-2", "agent-3"])
+        assert len(grouped["agent-1"]) == 2
+        assert len(grouped["agent-2"]) == 1
+        assert grouped["agent-3"] == []
+
+    def test_without_revalidation_requires_invalidate(
+        self, tmp_path: Path
+    ) -> None:
+        store = TaskFileStore(tmp_path, revalidate=False)
+        task = store.create("Task A", assignee="agent-1")
+        assert len(store.query_by_assignee("agent-1")) == 1
+
+        path = store.tasks_dir / f"{task.id}.json"
+        data = json.loads(path.read_text())
+        data["assignee"] = "agent-2"
+        path.write_text(json.dumps(data) + "\n")
+
+        # The index is trusted until told otherwise.
+        assert len(store.query_by_assignee("agent-1")) == 1
+
+        store.invalidate(task.id)
+        assert store.query_by_assignee("agent-1") == []
+        assert len(store.query_by_assignee("agent-2")) == 1
+
+        path.unlink()
+        store.invalidate()
+        assert store.query_all() == []
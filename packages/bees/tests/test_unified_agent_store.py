@@ -5,9 +5,13 @@
 
 from __future__ import annotations
 
+import json
+import os
+
 import pytest
 from pathlib import Path
 
+from bees.task_file_store import TaskFileStore
 from bees.unified_agent_store import UnifiedAgentStore
 
 
@@ -66,3 +70,72 @@ class TestHasPendingTasks:
         )
 
         assert store.has_pending_tasks("agent-1") is False
+
+
+class TestSubscribe:
+    def test_create_publishes_one_complete_change(
+        self, store: UnifiedAgentStore,
+    ) -> None:
+        changes = []
+        store.subscribe(changes.append)
+        agent = store.create("Write a poem", title="Poem", slug="poet")
+
+        assert [c.kind for c in changes] == ["created"]
+        created = changes[0].agent
+        assert created.objective == "Write a poem"
+        assert created.metadata.title == "Poem"
+
+        store.delete_agent(agent.id)
+        assert [c.kind for c in changes] == ["created", "deleted"]
+        assert store.get(agent.id) is None
+
+
+
+class TestTrustedIndexes:
+    def test_external_task_seen_after_refresh(self, tmp_path: Path) -> None:
+        store = UnifiedAgentStore(tmp_path, revalidate=False)
+        agent = store.create("Objective")
+        store.query_all()
+
+        # Written by another process (a separate, unshared task index).
+        other = TaskFileStore(tmp_path)
+        queued = other.create("More work", assignee=agent.id, status="queued")
+
+        fresh = store.get(agent.id)
+        assert fresh is not None
+        assert queued.id not in {t.id for t in fresh.tasks}
+
+        store.refresh()
+        fresh = store.get(agent.id)
+        assert fresh is not None
+        assert queued.id in {t.id for t in fresh.tasks}
+
+    def test_invalidate_paths_rereads_only_changed_entities(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        store = UnifiedAgentStore(tmp_path, revalidate=False)
+        agent = store.create("Objective")
+        untouched = store.create("Other")
+        store.query_all()
+
+        other = TaskFileStore(tmp_path)
+        queued = other.create("More work", assignee=agent.id, status="queued")
+        metadata = json.loads((agent.dir / "metadata.json").read_text())
+        metadata["title"] = "Edited"
+        (agent.dir / "metadata.json").write_text(json.dumps(metadata))
+
+        def no_scan(*args, **kwargs):
+            raise AssertionError("full rescan")
+
+        monkeypatch.setattr(os, "scandir", no_scan)
+        store.invalidate_paths([
+            agent.dir / "metadata.json",
+            agent.dir / "workspace" / "notes.md",
+            untouched.dir / "sessions" / "log.jsonl",
+            tmp_path / "tasks" / f"{queued.id}.json",
+        ])
+
+        fresh = store.get(agent.id)
+        assert fresh is not None
+        assert fresh.metadata.title == "Edited"
+        assert queued.id in {t.id for t in fresh.tasks}
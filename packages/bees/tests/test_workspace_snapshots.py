@@ -0,0 +1,191 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for manifest-based workspace snapshots and the blob store."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from bees.disk_file_system import DiskFileSystem
+from bees.workspace_snapshots import BlobStore, WorkspaceSnapshotLog
+
+_PNG = b"\x89PNG\r\n\x1a\n\x00\x00binary"
+_LONG_AGO_NS = 1_000_000_000_000_000_000
+
+
+def _age(path: Path) -> None:
+    """Push a file's mtime out of the racy window."""
+    os.utime(path, ns=(_LONG_AGO_NS, _LONG_AGO_NS))
+
+
+@pytest.fixture
+def ticket_dir(tmp_path: Path) -> Path:
+    return tmp_path / "ticket"
+
+
+@pytest.fixture
+def fs(ticket_dir: Path) -> DiskFileSystem:
+    return DiskFileSystem(ticket_dir / "workspace")
+
+
+@pytest.fixture
+def log(ticket_dir: Path) -> WorkspaceSnapshotLog:
+    return WorkspaceSnapshotLog(
+        ticket_dir / "sessions" / "s1", BlobStore(ticket_dir / "blobs"),
+    )
+
+
+def _records(log: WorkspaceSnapshotLog) -> list[dict]:
+    return [
+        json.loads(line)
+        for line in log.path.read_text().splitlines()
+        if line.strip()
+    ]
+
+
+class TestManifest:
+    def test_describes_text_and_binary(self, fs: DiskFileSystem) -> None:
+        fs.write("notes.md", "# Hello")
+        (fs._work_dir / "image.png").write_bytes(_PNG)
+
+        manifest = fs.manifest()
+        assert manifest.files["notes.md"].type == "text"
+        assert manifest.files["notes.md"].mime_type == "text/markdown"
+        assert manifest.files["image.png"].type == "inlineData"
+        assert manifest.files["image.png"].mime_type == "image/png"
+        assert manifest.files["image.png"].size == len(_PNG)
+
+    def test_rehashes_only_changed_files(
+        self, fs: DiskFileSystem, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        fs.write("a.md", "a")
+        fs.write("b.md", "b")
+        for name in ("a.md", "b.md"):
+            _age(fs._work_dir / name)
+        first = fs.manifest()
+
+        hashed: list[str] = []
+        original = DiskFileSystem._manifest_entry
+
+        def counting(disk_path, raw, mtime_ns):
+            hashed.append(disk_path.name)
+            return original(disk_path, raw, mtime_ns)
+
+        monkeypatch.setattr(DiskFileSystem, "_manifest_entry", staticmethod(counting))
+        fs.overwrite("b.md", "changed")
+        second = fs.manifest()
+
+        assert hashed == ["b.md"]
+        assert second.files["a.md"] == first.files["a.md"]
+        assert second.files["b.md"].sha256 != first.files["b.md"].sha256
+
+    def test_stores_blobs_once(self, fs: DiskFileSystem, ticket_dir: Path) -> None:
+        blobs = BlobStore(ticket_dir / "blobs")
+        fs.write("a.md", "same")
+        fs.write("b.md", "same")
+
+        manifest = fs.manifest(blobs)
+        sha = manifest.files["a.md"].sha256
+        assert manifest.files["b.md"].sha256 == sha
+        assert blobs.get(sha) == b"same"
+        assert len(list((ticket_dir / "blobs").rglob("*"))) == 2  # dir + blob
+
+
+class TestSnapshotLog:
+    def test_first_record_is_full_then_diffs_only(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog,
+    ) -> None:
+        fs.write("a.md", "a")
+        fs.write("b.md", "b")
+        assert log.record(0, fs) is True
+
+        # Unchanged workspace: nothing is written.
+        assert log.record(1, fs) is False
+
+        fs.overwrite("a.md", "a2")
+        (fs._work_dir / "b.md").unlink()
+        assert log.record(2, fs) is True
+
+        records = _records(log)
+        assert [r["turn"] for r in records] == [0, 2]
+        assert set(records[0]["files"]) == {"a.md", "b.md"}
+        assert set(records[1]["files"]) == {"a.md"}
+        assert records[1]["removed"] == ["b.md"]
+
+    def test_materialize_replays_to_turn(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog,
+    ) -> None:
+        fs.write("a.md", "v1")
+        (fs._work_dir / "image.png").write_bytes(_PNG)
+        log.record(0, fs)
+        fs.overwrite("a.md", "v2")
+        log.record(1, fs)
+
+        at0 = log.materialize(0)
+        assert at0 is not None
+        assert at0.files["a.md"].data == "v1"
+        assert base64.b64decode(at0.files["image.png"].data) == _PNG
+        assert at0.files["image.png"].type == "inlineData"
+
+        at5 = log.materialize(5)
+        assert at5 is not None
+        assert at5.files["a.md"].data == "v2"
+
+        # Matches what a full snapshot would have captured.
+        full = fs.snapshot
+        assert {p: (d.data, d.mime_type, d.type) for p, d in at5.files.items()} == {
+            p: (d.data, d.mime_type, d.type) for p, d in full.files.items()
+        }
+
+    def test_materialize_before_first_record(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog,
+    ) -> None:
+        assert log.materialize(0) is None
+        fs.write("a.md", "a")
+        log.record(3, fs)
+        assert log.materialize(2) is None
+
+    def test_resumes_from_existing_log(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog, ticket_dir: Path,
+    ) -> None:
+        fs.write("a.md", "a")
+        log.record(0, fs)
+
+        reopened = WorkspaceSnapshotLog(
+            ticket_dir / "sessions" / "s1", BlobStore(ticket_dir / "blobs"),
+        )
+        assert set(reopened.current()) == {"a.md"}
+        assert reopened.record(1, fs) is False
+
+    def test_copy_to_keeps_turns_before_fork(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog, ticket_dir: Path,
+    ) -> None:
+        for turn in range(3):
+            fs.overwrite("a.md", f"v{turn}")
+            log.record(turn, fs)
+
+        fork_dir = ticket_dir / "sessions" / "s2"
+        log.copy_to(fork_dir, before_turn=2)
+        forked = WorkspaceSnapshotLog(fork_dir, BlobStore(ticket_dir / "blobs"))
+        assert [r["turn"] for r in _records(forked)] == [0, 1]
+        snapshot = forked.materialize(10)
+        assert snapshot is not None
+        assert snapshot.files["a.md"].data == "v1"
+
+    def test_skips_torn_trailing_line(
+        self, fs: DiskFileSystem, log: WorkspaceSnapshotLog,
+    ) -> None:
+        fs.write("a.md", "a")
+        log.record(0, fs)
+        with open(log.path, "a") as f:
+            f.write('{"turn": 1, "fil')
+
+        snapshot = log.materialize(1)
+        assert snapshot is not None
+        assert snapshot.files["a.md"].data == "a"
@@ -10,6 +10,7 @@ import type { TaskData } from "../../../../../common/types.js";
 import {
   onAgentAdded,
   onAgentUpdated,
+  onAgentRemoved,
   onSessionEvent,
   onInitTickets,
   onSchedulerStarted,
@@ -27,7 +28,11 @@ async function doUpsertTicket(ticket: TaskData) {
 
   if (idx >= 0) {
     const updated = [...current];
-    updated[idx] = ticket;
+    // Agent deltas don't carry the session events gathered client-side.
+    updated[idx] = {
+      ...ticket,
+      events_log: ticket.events_log ?? current[idx].events_log,
+    };
     c.tickets = updated;
   } else {
     c.tickets = [ticket, ...current];
@@ -71,6 +76,21 @@ export const upsertTicketOnUpdate = asAction(
   }
 );
 
+export const removeTicketOnRemove = asAction(
+  "Remove Ticket On Remove",
+  {
+    mode: ActionMode.Immediate,
+    triggeredBy: () => onAgentRemoved(bind),
+  },
+  async (evt?: Event) => {
+    if (!evt) return;
+    const id = (evt as CustomEvent<string>).detail;
+    if (!id) return;
+    const c = bind.controller.global;
+    c.tickets = c.tickets.filter((t) => t.id !== id);
+  }
+);
+
 export const appendSessionEvent = asAction(
   "Append Session Event",
   {
@@ -24,6 +24,11 @@ export function onAgentUpdated(bind: ActionBind): EventTrigger {
   return eventTrigger("Agent Updated", services.stateEventBus, "agent_updated");
 }
 
+export function onAgentRemoved(bind: ActionBind): EventTrigger {
+  const { services } = bind;
+  return eventTrigger("Agent Removed", services.stateEventBus, "agent_removed");
+}
+
 export function onSessionEvent(bind: ActionBind): EventTrigger {
   const { services } = bind;
   return eventTrigger("Session Event", services.stateEventBus, "session_event");
@@ -33,6 +33,12 @@ export class SSEClient {
       );
     });
 
+    this.source.addEventListener("agent:removed", (e: MessageEvent) => {
+      this.bus.dispatchEvent(
+        new CustomEvent("agent_removed", { detail: JSON.parse(e.data).id })
+      );
+    });
+
     this.source.addEventListener("session:event", (e: MessageEvent) => {
       this.bus.dispatchEvent(
         new CustomEvent("session_event", { detail: JSON.parse(e.data) })
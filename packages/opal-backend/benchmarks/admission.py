@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Wave completion time against a rate-limited fake Gemini backend.
+
+A wave of ``--tasks`` agents starts at once; each makes ``--calls``
+sequential ``stream_generate_content`` calls. The fake backend enforces a
+quota of ``--quota`` requests per second (token bucket, one second of
+burst) and answers over-quota requests with a 429 carrying a Retry-After
+hint. Successful streams take ``--latency`` seconds.
+
+Two client strategies are compared:
+
+- **blind** — every stream retries on its own with full-jitter backoff
+  (an admission controller that never throttles);
+- **admission** — the shared ``AdmissionController``, which adapts its
+  rate to the 429s and Retry-After hints.
+
+Usage::
+
+    python -m benchmarks.admission --tasks 60 --calls 3 --quota 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator
+
+from opal_backend.admission import (
+    AdmissionController,
+    LimiterConfig,
+    ModelLimiter,
+)
+from opal_backend.gemini_client import GeminiAPIError, stream_generate_content
+
+_CHUNK = {"candidates": [{"content": {"parts": [{"text": "ok"}]}}]}
+
+
+class _QuotaBackend:
+    """Fake backend with a per-second request quota."""
+
+    def __init__(self, quota: float, latency: float) -> None:
+        self._quota = quota
+        self._latency = latency
+        self._tokens = quota
+        self._refilled_at = time.monotonic()
+        self.requests = 0
+        self.rejected = 0
+
+    async def stream_generate_content(
+        self, model: str, body: dict[str, Any],
+    ) -> AsyncIterator[dict[str, Any]]:
+        self.requests += 1
+        now = time.monotonic()
+        self._tokens = min(
+            self._quota,
+            self._tokens + (now - self._refilled_at) * self._quota,
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            self.rejected += 1
+            raise GeminiAPIError(
+                "Gemini API error 429: Resource exhausted",
+                status_code=429,
+                retry_after=(1 - self._tokens) / self._quota,
+            )
+        self._tokens -= 1
+        await asyncio.sleep(self._latency)
+        yield _CHUNK
+
+
+class _Unthrottled(ModelLimiter):
+    """Admits everything at once and ignores rate-limit feedback."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            LimiterConfig(max_rate=1e9, min_rate=1e9, max_concurrency=10**6)
+        )
+
+    def on_rate_limited(
+        self, retry_after: float | None = None, *, admitted: int | None = None,
+    ) -> None:
+        self._throttled += 1
+
+
+class _Blind(AdmissionController):
+    def limiter(self, model: str) -> ModelLimiter:
+        return self._limiters.setdefault(model, _Unthrottled())
+
+
+async def _run(args: argparse.Namespace, admission: AdmissionController):
+    backend = _QuotaBackend(args.quota, args.latency)
+    failures = 0
+
+    async def task() -> None:
+        nonlocal failures
+        for _ in range(args.calls):
+            try:
+                async for _ in stream_generate_content(
+                    "model", {}, backend=backend, admission=admission,
+                ):
+                    pass
+            except GeminiAPIError:
+                failures += 1
+                return
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task() for _ in range(args.tasks)))
+    elapsed = time.perf_counter() - start
+    return elapsed, backend.requests, backend.rejected, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=60)
+    parser.add_argument("--calls", type=int, default=3)
+    parser.add_argument("--quota", type=float, default=20.0)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    strategies = [
+        ("blind", _Blind()),
+        ("admission", AdmissionController()),
+    ]
+    ideal = args.tasks * args.calls / args.quota
+    print(
+        f"{args.tasks} tasks × {args.calls} calls, quota {args.quota:g}/s "
+        f"(ideal ≈ {ideal:.1f} s)"
+    )
+    for name, admission in strategies:
+        elapsed, requests, rejected, failures = asyncio.run(
+            _run(args, admission)
+        )
+        metrics = admission.metrics()["model"]
+        print(
+            f"  {name:9} wave {elapsed:6.2f} s   requests {requests:5}   "
+            f"429s {rejected:5}   failed tasks {failures:3}   "
+            f"mean wait {metrics.mean_wait_s:5.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Request size per turn with and without the rolling conversation cache.
+
+A fake backend answers every turn with a call to a ``work`` function that
+returns ``--output-kb`` of text, so the conversation grows steadily for
+``--turns`` turns. The fake reports Gemini-like usage (about four bytes
+per token, with cached tokens counted separately) and accepts
+``cachedContents`` creation.
+
+- **uncached** — the default: every request resends the whole history.
+- **rolling** — ``AgentRunArgs.context_cache`` with ``--min-tokens``.
+
+Prints the request bytes of every ``--every``-th turn, then totals.
+
+Usage::
+
+    python -m benchmarks.context_cache --turns 40 --output-kb 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator
+
+from opal_backend.context_cache import ContextCacheConfig
+from opal_backend.function_definition import FunctionDefinition, FunctionGroup
+from opal_backend.loop import AgentRunArgs, Loop, LoopController
+
+
+def _tokens(value: Any) -> int:
+    return len(json.dumps(value)) // 4
+
+
+class _ConversationBackend:
+    """Calls ``work`` every turn and accounts for cached tokens."""
+
+    def __init__(self) -> None:
+        self.request_bytes: list[int] = []
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.created = 0
+        self._cached: dict[str, int] = {}
+
+    async def stream_generate_content(
+        self, model: str, body: dict[str, Any],
+    ) -> AsyncIterator[dict[str, Any]]:
+        self.request_bytes.append(len(json.dumps(body)))
+        cached = self._cached.get(body.get("cachedContent", ""), 0)
+        uncached = _tokens(body["contents"])
+        self.input_tokens += uncached
+        self.cached_tokens += cached
+        yield {
+            "candidates": [{
+                "content": {
+                    "parts": [{"functionCall": {"name": "work", "args": {}}}],
+                    "role": "model",
+                },
+            }],
+            "usageMetadata": {
+                "promptTokenCount": uncached + cached,
+                "cachedContentTokenCount": cached,
+            },
+        }
+
+    async def create_cached_content(self, body: dict[str, Any]) -> dict[str, Any]:
+        self.created += 1
+        name = f"cachedContents/conv-{self.created}"
+        self._cached[name] = _tokens(body["contents"])
+        return {"name": name}
+
+    async def delete_cached_content(self, name: str) -> None:
+        self._cached.pop(name, None)
+
+
+def _work_group(
+    controller: LoopController, turns: int, output: str,
+) -> FunctionGroup:
+    calls = 0
+
+    async def handler(args: dict[str, Any], status_cb: Any) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if calls >= turns:
+            controller.terminate({"success": True, "outcomes": None})
+        return {"output": output}
+
+    return FunctionGroup(
+        instruction="Call work until told otherwise.",
+        declarations=[{"name": "work", "parameters": {}}],
+        definitions=[(
+            "work",
+            FunctionDefinition(
+                name="work",
+                description="Do some work.",
+                handler=handler,
+            ),
+        )],
+    )
+
+
+async def _run(
+    args: argparse.Namespace, context_cache: ContextCacheConfig | None,
+) -> _ConversationBackend:
+    backend = _ConversationBackend()
+    controller = LoopController()
+    loop = Loop(backend=backend, controller=controller)  # type: ignore[arg-type]
+    await loop.run(AgentRunArgs(
+        objective={"parts": [{"text": "Start working."}], "role": "user"},
+        function_groups=[
+            _work_group(controller, args.turns, "x" * (args.output_kb * 1024)),
+        ],
+        context_cache=context_cache,
+    ))
+    return backend
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--output-kb", type=int, default=8)
+    parser.add_argument("--min-tokens", type=int, default=32_768)
+    parser.add_argument("--every", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    uncached = asyncio.run(_run(args, None))
+    rolling = asyncio.run(
+        _run(args, ContextCacheConfig(min_tokens=args.min_tokens))
+    )
+
+    print(
+        f"{args.turns} turns, {args.output_kb} KB per function result, "
+        f"roll at {args.min_tokens} tokens"
+    )
+    print(f"  {'turn':>5} {'uncached':>12} {'rolling':>12}")
+    for turn in range(0, args.turns, args.every):
+        print(
+            f"  {turn + 1:>5} {uncached.request_bytes[turn]:>10,} B"
+            f" {rolling.request_bytes[turn]:>10,} B"
+        )
+    for name, backend in (("uncached", uncached), ("rolling", rolling)):
+        print(
+            f"  {name:9} total {sum(backend.request_bytes) / 1e6:8.2f} MB   "
+            f"uncached input {backend.input_tokens:>11,} tok   "
+            f"cached input {backend.cached_tokens:>11,} tok   "
+            f"caches {backend.created}"
+        )
+
+
+if __name__ == "__main__":
+    main()
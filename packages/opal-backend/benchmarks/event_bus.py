@@ -0,0 +1,139 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Publish latency of the in-memory event bus against its subscriber count.
+
+For each subscriber count in ``--subscribers``, publishes ``--events``
+events to one session and times every ``publish()`` call. Subscribers
+either keep up (a reader task per subscriber drains its queue) or are
+**stalled** (nobody reads, so every queue fills up to ``--max-pending``
+and stays at the overflow policy's steady state).
+
+- **unbounded** — the previous bus: an unbounded ``asyncio.Queue`` per
+  subscriber and a sequential ``await queue.put()`` for each.
+- **drop_oldest**, **coalesce** — ``InMemoryEventBus`` with that overflow
+  policy. (``disconnect`` is left out: stalled subscribers are gone after
+  the first overflow.)
+
+Prints the median and p99 publish latency and, for the stalled runs, the
+events left queued across all subscribers.
+
+Usage::
+
+    python -m benchmarks.event_bus --subscribers 1 10 100 1000 --events 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from opal_backend.local.event_bus_impl import InMemoryEventBus
+
+
+class _UnboundedBus:
+    def __init__(self) -> None:
+        self._queues: list[asyncio.Queue[Any]] = []
+
+    def subscribe(self) -> asyncio.Queue[Any]:
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._queues.append(queue)
+        return queue
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        for queue in self._queues:
+            await queue.put(event)
+
+    def pending(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+
+async def _measure(
+    args: argparse.Namespace, policy: str, subscribers: int, stalled: bool,
+) -> tuple[list[float], int]:
+    readers: list[asyncio.Task[None]] = []
+    if policy == "unbounded":
+        unbounded = _UnboundedBus()
+        queues = [unbounded.subscribe() for _ in range(subscribers)]
+
+        async def publish(event: dict[str, Any], index: int) -> None:
+            await unbounded.publish(event)
+
+        if not stalled:
+            async def drain(queue: asyncio.Queue[Any]) -> None:
+                while True:
+                    await queue.get()
+            readers = [asyncio.ensure_future(drain(q)) for q in queues]
+        pending = unbounded.pending
+    else:
+        bus = InMemoryEventBus(
+            max_pending=args.max_pending, overflow=policy,  # type: ignore[arg-type]
+        )
+        subscriptions = [bus.subscribe("s1") for _ in range(subscribers)]
+
+        async def publish(event: dict[str, Any], index: int) -> None:
+            await bus.publish("s1", event, index=index)
+
+        if not stalled:
+            async def drain(subscription: Any) -> None:
+                async for _ in subscription:
+                    pass
+            readers = [asyncio.ensure_future(drain(s)) for s in subscriptions]
+
+        def pending() -> int:
+            return bus.metrics()["s1"].queue_depth
+
+    latencies = []
+    for i in range(args.events):
+        event = {"type": "nodeEnd", "nodeId": f"n{i % 10}", "index": i}
+        start = time.perf_counter()
+        await publish(event, i)
+        latencies.append(time.perf_counter() - start)
+        if not stalled:
+            await asyncio.sleep(0)
+    left = pending()
+    for reader in readers:
+        reader.cancel()
+    return latencies, left
+
+
+async def _run(args: argparse.Namespace) -> None:
+    print(
+        f"{args.events:,} events per run, max_pending={args.max_pending}"
+    )
+    print(
+        f"  {'policy':<12} {'subs':>6} {'readers':<8} "
+        f"{'p50 µs':>9} {'p99 µs':>9} {'queued':>12}"
+    )
+    for subscribers in args.subscribers:
+        for stalled in (False, True):
+            for policy in ("unbounded", "drop_oldest", "coalesce"):
+                latencies, left = await _measure(
+                    args, policy, subscribers, stalled,
+                )
+                quantiles = statistics.quantiles(latencies, n=100)
+                print(
+                    f"  {policy:<12} {subscribers:>6} "
+                    f"{'stalled' if stalled else 'reading':<8} "
+                    f"{statistics.median(latencies) * 1e6:9.1f} "
+                    f"{quantiles[98] * 1e6:9.1f} {left:>12,}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--subscribers", type=int, nargs="+", default=[1, 10, 100, 1000],
+    )
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--max-pending", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
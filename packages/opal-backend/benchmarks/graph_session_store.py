@@ -0,0 +1,162 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cost of driving a large graph through the graph session stores.
+
+Builds a synthetic layered DAG of ``--nodes`` nodes, ``--width`` nodes per
+layer, where every node reads from ``--fan-in`` nodes of the previous
+layer, and plans it with ``create_plan``. The run then does what
+``GraphRunner`` does for every node, in schedule order: load its config
+and inputs, and complete it. A second session fails every node of layer
+``--fail-layer`` on its way through, which marks the rest of the graph
+behind it as skipped.
+
+- **memory** — ``InMemoryGraphSessionStore``.
+- **sqlite** — ``SqliteGraphSessionStore`` on a temporary file, with the
+  default ``synchronous=NORMAL``.
+- **sqlite full** — the same with ``synchronous=FULL`` (an fsync per
+  transaction).
+
+Prints the time of each phase per store, the per-node cost, and the
+completion throughput of the successful run.
+
+Usage::
+
+    python -m benchmarks.graph_session_store --nodes 10000 --width 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from opal_backend.graph_plan import create_plan
+from opal_backend.graph_session_store import GraphSessionStore
+from opal_backend.graph_types import (
+    Edge, GraphDescriptor, GraphPlan, NodeDescriptor,
+)
+from opal_backend.local.graph_session_store_impl import (
+    InMemoryGraphSessionStore,
+)
+from opal_backend.local.sqlite_graph_session_store_impl import (
+    SqliteGraphSessionStore,
+)
+
+
+def _graph(nodes: int, width: int, fan_in: int) -> GraphDescriptor:
+    descriptors = [
+        NodeDescriptor(id=f"n{i}", type="generate", configuration={"i": i})
+        for i in range(nodes)
+    ]
+    edges = []
+    for i in range(width, nodes):
+        layer_start = (i // width - 1) * width
+        for k in range(fan_in):
+            source = layer_start + (i + k) % width
+            edges.append(Edge(
+                from_node=f"n{source}", to_node=f"n{i}",
+                out_port="context", in_port=f"p{k}",
+            ))
+    return GraphDescriptor(nodes=descriptors, edges=edges)
+
+
+async def _drive(
+    store: GraphSessionStore, session_id: str, fail: set[str],
+) -> None:
+    plan = await store.get_plan(session_id)
+    assert plan is not None
+    queue = [info.node.id for info in plan.stages[0]]
+    # mark_node_failed returns every ready node, including queued ones.
+    seen: set[str] = set()
+    while queue:
+        node_id = queue.pop()
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        await store.get_node_config(session_id, node_id)
+        await store.get_node_inputs(session_id, node_id)
+        if node_id in fail:
+            queue.extend(
+                await store.mark_node_failed(session_id, node_id, "boom")
+            )
+        else:
+            queue.extend(
+                await store.complete_node(
+                    session_id, node_id, {"context": node_id},
+                )
+            )
+
+
+async def _measure(
+    args: argparse.Namespace, store: GraphSessionStore, plan: GraphPlan,
+) -> dict[str, float]:
+    start = time.perf_counter()
+    await store.create("ok", plan)
+    await store.create("failing", plan)
+    created = (time.perf_counter() - start) / 2
+
+    start = time.perf_counter()
+    await _drive(store, "ok", set())
+    completed = time.perf_counter() - start
+    assert await store.is_graph_complete("ok")
+
+    first = args.fail_layer * args.width
+    fail = {f"n{i}" for i in range(first, first + args.width)}
+    start = time.perf_counter()
+    await _drive(store, "failing", fail)
+    failed = time.perf_counter() - start
+    assert await store.is_graph_complete("failing")
+
+    return {"create": created, "run": completed, "run, failing": failed}
+
+
+async def _run(args: argparse.Namespace) -> None:
+    graph = _graph(args.nodes, args.width, args.fan_in)
+    start = time.perf_counter()
+    plan = create_plan(graph)
+    planned = time.perf_counter() - start
+
+    results: dict[str, dict[str, float]] = {}
+    results["memory"] = await _measure(args, InMemoryGraphSessionStore(), plan)
+    for label, synchronous in (("sqlite", "NORMAL"), ("sqlite full", "FULL")):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SqliteGraphSessionStore(
+                Path(tmp) / "graph.db", synchronous=synchronous,
+            )
+            try:
+                results[label] = await _measure(args, store, plan)
+            finally:
+                store.close()
+
+    print(
+        f"{args.nodes:,} nodes, {len(graph.edges):,} edges, "
+        f"{len(plan.stages)} stages; create_plan {planned * 1000:.1f} ms"
+    )
+    for label, phases in results.items():
+        for phase, elapsed in phases.items():
+            print(
+                f"  {label:<12} {phase:<13} {elapsed * 1000:10.1f} ms"
+                f"  {elapsed / args.nodes * 1e6:8.1f} µs/node"
+            )
+        print(
+            f"  {label:<12} {'throughput':<13} "
+            f"{args.nodes / phases['run']:10,.0f} completions/s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--fail-layer", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Time-to-first-chunk and throughput of concurrent Gemini streams.
+
+Starts a local stub of ``streamGenerateContent`` (uvicorn, in a thread)
+that answers each request with ``--chunks`` SSE events of ``--payload``
+bytes, ``--interval`` seconds apart. ``--streams`` streams then run at
+once through ``HttpBackendClient.stream_generate_content``, for
+``--rounds`` rounds, the way concurrent agent sessions would.
+
+- **client per request** — what the dev server did before: a new
+  ``httpx.AsyncClient`` for every backend client, with ``aiter_lines``
+  decoding.
+- **shared pool** — ``HttpBackendClient`` without a client, using the
+  shared per-upstream pool in ``http_transport`` and its incremental
+  SSE decoder. HTTP/2 is used when ``h2`` is installed; the stub server
+  speaks HTTP/1.1 only, so here this measures connection reuse.
+
+Prints time-to-first-chunk percentiles, total wall time, chunk
+throughput and the number of TCP connections the stub accepted.
+
+Usage::
+
+    python -m benchmarks.http_transport --streams 200 --chunks 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+from typing import Any
+
+import httpx
+import uvicorn
+
+from opal_backend.local import backend_client_impl
+from opal_backend.local.backend_client_impl import HttpBackendClient
+from opal_backend.local.http_transport import (
+    HTTP2_AVAILABLE,
+    aclose_http_clients,
+)
+
+
+class _Stub:
+    """ASGI app streaming fixed SSE chunks; counts connections."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        chunk = {"candidates": [{"content": {"parts": [
+            {"text": "x" * args.payload},
+        ]}}]}
+        self._event = b"data: " + json.dumps(chunk).encode() + b"\r\n\r\n"
+        self._chunks = args.chunks
+        self._interval = args.interval
+        self.peers: set[tuple[str, int]] = set()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        self.peers.add(tuple(scope["client"]))
+        while (await receive()).get("more_body"):
+            pass
+        await send({
+            "type": "http.response.start", "status": 200,
+            "headers": [(b"content-type", b"text/event-stream")],
+        })
+        for _ in range(self._chunks):
+            await send({
+                "type": "http.response.body", "body": self._event,
+                "more_body": True,
+            })
+            await asyncio.sleep(self._interval)
+        await send({"type": "http.response.body", "body": b""})
+
+
+def _serve(app: _Stub) -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="warning",
+        backlog=4096, timeout_keep_alive=60,
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def _per_request_stream(model: str) -> Any:
+    """The previous path: own client, line-by-line decoding."""
+    url = (
+        f"{backend_client_impl.GENAI_API_BASE}/{model}"
+        ":streamGenerateContent?alt=sse"
+    )
+    client = httpx.AsyncClient(timeout=120.0)
+    try:
+        async with client.stream("POST", url, json={}) as response:
+            async for line in response.aiter_lines():
+                line = line.strip()
+                if line.startswith("data: "):
+                    yield json.loads(line[len("data: "):])
+    finally:
+        await client.aclose()
+
+
+async def _one_stream(shared: bool) -> tuple[float, int]:
+    start = time.perf_counter()
+    first = None
+    count = 0
+    if shared:
+        stream = HttpBackendClient(
+            upstream_base="http://unused", access_token="",
+        ).stream_generate_content("stub", {})
+    else:
+        stream = _per_request_stream("stub")
+    async for _ in stream:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    return first or 0.0, count
+
+
+async def _measure(
+    args: argparse.Namespace, shared: bool,
+) -> tuple[list[float], float, int]:
+    ttfc: list[float] = []
+    chunks = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        results = await asyncio.gather(
+            *(_one_stream(shared) for _ in range(args.streams)),
+        )
+        ttfc.extend(first for first, _ in results)
+        chunks += sum(count for _, count in results)
+    elapsed = time.perf_counter() - start
+    if shared:
+        await aclose_http_clients()
+    return ttfc, elapsed, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--payload", type=int, default=512)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    app = _Stub(args)
+    server, base = _serve(app)
+    backend_client_impl.GENAI_API_BASE = f"{base}/v1beta/models"
+    try:
+        print(
+            f"{args.streams} concurrent streams × {args.rounds} rounds, "
+            f"{args.chunks} chunks of ~{args.payload} B "
+            f"(HTTP/2 {'available' if HTTP2_AVAILABLE else 'unavailable'})"
+        )
+        for label, shared in (
+            ("client per request", False), ("shared pool", True),
+        ):
+            app.peers.clear()
+            ttfc, elapsed, chunks = asyncio.run(_measure(args, shared))
+            quantiles = statistics.quantiles(ttfc, n=100)
+            print(
+                f"  {label:<19} ttfc p50 {quantiles[49] * 1000:7.1f} ms"
+                f"  p95 {quantiles[94] * 1000:7.1f} ms"
+                f"  wall {elapsed:6.2f} s"
+                f"  {chunks / elapsed:9,.0f} chunks/s"
+                f"  {len(app.peers):5d} connections"
+            )
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
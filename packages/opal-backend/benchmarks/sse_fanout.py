@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Fan-out cost of streaming one session's events to many SSE clients.
+
+Opens ``--clients`` concurrent ``stream_events`` streams on one session of
+an ``InMemoryEventBus``, then publishes ``--events`` events of roughly
+``--payload`` bytes the way ``GraphRunner`` does: append to the event log,
+then publish with the log index. Half of the events are stored before the
+clients connect, so every stream also replays part of the log while new
+events arrive.
+
+- **shared** — the live path as shipped: each event is JSON-encoded once
+  (``PublishedEvent.data``) and the bytes are framed for every client.
+- **per-client** — the previous behaviour, re-encoding the event dict for
+  every client it is forwarded to.
+
+Every client checks that it received each event exactly once, in order.
+Prints the end-to-end time, the per-delivery cost, and the peak traced
+memory of each run.
+
+Usage::
+
+    python -m benchmarks.sse_fanout --clients 1000 --events 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import AsyncIterator
+
+from opal_backend.local.event_bus_impl import InMemoryEventBus
+from opal_backend.local.sse_stream import sse_frame, stream_events
+
+
+class _Session:
+    def __init__(self, bus: InMemoryEventBus, payload: int) -> None:
+        self.bus = bus
+        self.events: list[dict] = []
+        self.live = True
+        self._text = "x" * payload
+
+    async def emit(self) -> None:
+        index = len(self.events)
+        self.events.append(
+            {"type": "nodeEnd", "nodeId": f"n{index}", "output": self._text,
+             "index": index}
+        )
+        await self.bus.publish("s1", self.events[-1], index=index)
+
+    async def replay(self, after: int) -> AsyncIterator[tuple[int, bytes]]:
+        for event in self.events[after + 1:]:
+            yield event["index"], json.dumps(event).encode()
+
+    async def is_live(self) -> bool:
+        return self.live
+
+
+async def _per_client_stream(
+    session: _Session, after: int,
+) -> AsyncIterator[bytes]:
+    subscription = session.bus.subscribe("s1")
+    try:
+        yield sse_frame(b"{}", event="start")
+        last = after
+        async for index, data in session.replay(last):
+            yield sse_frame(data, id=index)
+            last = index
+        async for event in subscription:
+            index = event.get("index")
+            if index is not None and index <= last:
+                continue
+            last = index
+            yield sse_frame(json.dumps(event).encode(), id=index)
+        yield sse_frame(b"{}", event="done")
+    finally:
+        session.bus.unsubscribe("s1", subscription)
+
+
+async def _client(stream: AsyncIterator[bytes], expected: int) -> None:
+    ids = []
+    async for frame in stream:
+        if frame.startswith(b"id: "):
+            ids.append(int(frame[4:frame.index(b"\r")]))
+    assert ids == list(range(expected)), "missing or duplicate events"
+
+
+async def _measure(args: argparse.Namespace, shared: bool) -> tuple[float, int]:
+    bus = InMemoryEventBus(max_pending=args.events)
+    session = _Session(bus, args.payload)
+    stored = args.events // 2
+    for _ in range(stored):
+        await session.emit()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    clients = []
+    for _ in range(args.clients):
+        if shared:
+            stream = stream_events(
+                session_id="s1", event_bus=bus, after=-1,
+                replay=session.replay, is_live=session.is_live,
+            )
+        else:
+            stream = _per_client_stream(session, -1)
+        clients.append(asyncio.ensure_future(_client(stream, args.events)))
+    await asyncio.sleep(0)
+
+    for _ in range(stored, args.events):
+        await session.emit()
+        await asyncio.sleep(0)
+    session.live = False
+    await bus.close("s1")
+    await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def _run(args: argparse.Namespace) -> None:
+    deliveries = args.clients * args.events
+    print(
+        f"{args.clients:,} clients × {args.events} events "
+        f"(~{args.payload} B each, half replayed)"
+    )
+    for label, shared in (("shared", True), ("per-client", False)):
+        elapsed, peak = await _measure(args, shared)
+        print(
+            f"  {label:<11} {elapsed * 1000:10.1f} ms"
+            f"  {elapsed / deliveries * 1e6:6.2f} µs/delivery"
+            f"  peak {peak / 2**20:7.1f} MiB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--payload", type=int, default=2048)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
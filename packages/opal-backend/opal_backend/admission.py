@@ -0,0 +1,269 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide admission control for Gemini streams.
+
+When many agents run in one process (e.g. a bees scheduler wave), they all
+call Gemini at once, hit the per-model quota together, and then retry
+independently. The ``AdmissionController`` keeps one ``ModelLimiter`` per
+model that every stream passes through before calling the backend:
+
+- a **token bucket** paces request starts at the limiter's current rate,
+  admitting waiters in FIFO order;
+- a **concurrency cap** bounds how many streams are open at once;
+- the rate **adapts** (AIMD): a rate-limited response halves it and a
+  ``Retry-After`` hint pauses admissions for the whole model, while each
+  successful stream nudges it back up towards the ceiling. The rate is
+  cut at most once per congestion window: a rate-limited stream that was
+  admitted before the last cut only reports congestion that cut already
+  answered, so a wave of streams hitting quota together halves the rate
+  once rather than once per stream.
+
+Counters for each limiter (queue depth, wait time, throttles, rejections)
+are available from ``AdmissionController.metrics()``.
+
+``gemini_client.stream_generate_content`` uses the shared controller from
+``get_admission_controller()`` unless one is passed explicitly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionMetrics",
+    "AdmissionRejected",
+    "LimiterConfig",
+    "ModelLimiter",
+    "get_admission_controller",
+    "set_admission_controller",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a limiter's wait queue is full."""
+
+
+@dataclass(frozen=True)
+class LimiterConfig:
+    """Tuning for a ``ModelLimiter``.
+
+    Rates are in request starts per second. The bucket holds at most one
+    second's worth of tokens at the current rate (and at least one).
+    """
+
+    max_rate: float = 50.0
+    min_rate: float = 0.2
+    # Additive increase per successful stream.
+    increase: float = 0.5
+    # Multiplicative decrease per congestion window.
+    decrease: float = 0.5
+    max_concurrency: int = 64
+    # Waiters beyond this are rejected; None means unbounded.
+    max_queue: int | None = None
+
+
+@dataclass
+class AdmissionMetrics:
+    """Point-in-time counters for one model's limiter."""
+
+    rate: float
+    queue_depth: int
+    in_flight: int
+    admitted: int
+    throttled: int
+    rejected: int
+    total_wait_s: float
+    max_wait_s: float
+
+    @property
+    def mean_wait_s(self) -> float:
+        return self.total_wait_s / self.admitted if self.admitted else 0.0
+
+
+class ModelLimiter:
+    """Adaptive token bucket plus concurrency cap for one model."""
+
+    def __init__(self, config: LimiterConfig | None = None) -> None:
+        self.config = config or LimiterConfig()
+        self._rate = self.config.max_rate
+        self._tokens = self._capacity()
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        # Admission number at the last rate cut; streams admitted up to
+        # then belong to the congestion window that cut answered.
+        self._decreased_at = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore
+        self._pacing: asyncio.Lock
+
+        self._queue_depth = 0
+        self._in_flight = 0
+        self._admitted = 0
+        self._throttled = 0
+        self._rejected = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[int]:
+        """Wait for admission; hold a concurrency slot for the block.
+
+        Yields the admission number, to pass back to ``on_rate_limited``.
+        """
+        max_queue = self.config.max_queue
+        if max_queue is not None and self._queue_depth >= max_queue:
+            self._rejected += 1
+            raise AdmissionRejected(
+                f"Admission queue full ({self._queue_depth} waiting)"
+            )
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # asyncio primitives belong to one loop; the process-wide
+            # controller can outlive it (e.g. successive asyncio.run calls).
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.config.max_concurrency)
+            # asyncio.Lock wakes waiters in FIFO order, keeping pacing fair.
+            self._pacing = asyncio.Lock()
+
+        start = time.monotonic()
+        self._queue_depth += 1
+        try:
+            await self._slots.acquire()
+            try:
+                async with self._pacing:
+                    await self._take_token()
+            except BaseException:
+                self._slots.release()
+                raise
+        finally:
+            self._queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self._admitted += 1
+        ticket = self._admitted
+        self._total_wait_s += waited
+        self._max_wait_s = max(self._max_wait_s, waited)
+        self._in_flight += 1
+        try:
+            yield ticket
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    def on_success(self) -> None:
+        """Additively raise the rate after a successful stream."""
+        self._rate = min(self.config.max_rate, self._rate + self.config.increase)
+
+    def on_rate_limited(
+        self, retry_after: float | None = None, *, admitted: int | None = None,
+    ) -> None:
+        """Cut the rate after a 429/503, honouring a Retry-After hint.
+
+        ``admitted`` is the admission number ``admit`` yielded for the
+        stream. If it was admitted before the last cut, the rate is left
+        alone; without it, every call cuts the rate.
+
+        A hint pauses admissions for every waiter on this model, not just
+        the stream that received it.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._throttled += 1
+        if retry_after is not None and retry_after > 0:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        if admitted is not None and admitted <= self._decreased_at:
+            return
+        self._decreased_at = self._admitted
+        self._rate = max(self.config.min_rate, self._rate * self.config.decrease)
+        # Drop the burst so queued waiters are paced at the new rate.
+        self._tokens = min(self._tokens, 0.0)
+        logger.info(
+            "Rate limited: admission rate now %.2f/s%s",
+            self._rate,
+            f", paused {retry_after:.1f}s" if retry_after else "",
+        )
+
+    def metrics(self) -> AdmissionMetrics:
+        return AdmissionMetrics(
+            rate=self._rate,
+            queue_depth=self._queue_depth,
+            in_flight=self._in_flight,
+            admitted=self._admitted,
+            throttled=self._throttled,
+            rejected=self._rejected,
+            total_wait_s=self._total_wait_s,
+            max_wait_s=self._max_wait_s,
+        )
+
+    # -- internal ----------------------------------------------------------
+
+    def _capacity(self) -> float:
+        return max(1.0, self._rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self._capacity(), self._tokens + elapsed * self._rate)
+
+    async def _take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._paused_until - now
+            if wait <= 0:
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+
+class AdmissionController:
+    """Registry of ``ModelLimiter`` instances, one per model."""
+
+    def __init__(self, config: LimiterConfig | None = None) -> None:
+        self._config = config or LimiterConfig()
+        self._limiters: dict[str, ModelLimiter] = {}
+
+    def limiter(self, model: str) -> ModelLimiter:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limiter = ModelLimiter(self._config)
+            self._limiters[model] = limiter
+        return limiter
+
+    def metrics(self) -> dict[str, AdmissionMetrics]:
+        """Counters for every model seen so far."""
+        return {
+            model: limiter.metrics()
+            for model, limiter in self._limiters.items()
+        }
+
+
+_controller = AdmissionController()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide controller."""
+    return _controller
+
+
+def set_admission_controller(controller: AdmissionController) -> None:
+    """Replace the process-wide controller (e.g. to change its config)."""
+    global _controller
+    _controller = controller
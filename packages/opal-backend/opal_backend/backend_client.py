@@ -45,7 +45,10 @@ class BackendClient(Protocol):
 
     Credentials are a transport concern: each implementation carries its
     own auth mechanism (``HttpBackendClient`` uses an access token;
-    google3 uses service accounts).
+    google3 uses service accounts). An implementation may also expose a
+    ``cache_principal`` string identifying those credentials; uploads are
+    only shared through ``GeminiFileCache`` between clients reporting the
+    same one.
     """
 
     async def execute_step(
@@ -177,3 +180,17 @@ class BackendClient(Protocol):
         """
         ...
 
+    async def delete_cached_content(self, name: str) -> None:
+        """Delete a Gemini cached content resource.
+
+        Sends a DELETE to the ``cachedContents/{name}`` API.
+
+        Args:
+            name: The cached content resource name
+                (e.g. ``"cachedContents/abc123"``).
+
+        Raises:
+            GeminiAPIError: If the API returns a non-200 status.
+        """
+        ...
+
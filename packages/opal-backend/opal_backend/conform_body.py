@@ -21,6 +21,12 @@ Transform table:
   storedData blob UUID  → fileData via /v1beta1/uploadGeminiFile
   fileData drive:/*     → fileData via /v1beta1/uploadGeminiFile
   fileData already OK   → passthrough
+
+Upload results are memoized process-wide by ``GeminiFileCache``, per
+backend principal, so a handle is uploaded once per File API lifetime
+rather than once per turn.
+``ContentConformer`` additionally remembers conformed entries of a growing
+conversation, so the agent loop only transforms newly appended contents.
 """
 
 from __future__ import annotations
@@ -31,11 +37,13 @@ import re
 from typing import Any
 
 from .backend_client import BackendClient
+from .gemini_file_cache import GeminiFileCache, get_gemini_file_cache
 
 logger = logging.getLogger(__name__)
 
 # Type aliases (same as loop.py)
 GeminiBody = dict[str, Any]
+LLMContent = dict[str, Any]
 LLMContentPart = dict[str, Any]
 
 GENAI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/"
@@ -57,6 +65,7 @@ async def conform_body(
     body: GeminiBody,
     *,
     backend: BackendClient,
+    file_cache: GeminiFileCache | None = None,
 ) -> GeminiBody:
     """Transform Breadboard-specific parts to Gemini-native formats.
 
@@ -64,6 +73,8 @@ async def conform_body(
         body: The full Gemini request body (contents, tools, etc.).
         backend: BackendClient implementation for upload calls
             (carries credentials internally).
+        file_cache: Cache of upload results. Defaults to the
+            process-wide cache.
 
     Returns:
         A new body dict with transformed contents.
@@ -72,30 +83,84 @@ async def conform_body(
     if not contents:
         return body
 
-    transformed_contents = []
-    for content in contents:
-        parts = content.get("parts")
-        if not parts:
-            transformed_contents.append(content)
-            continue
-
-        new_parts = []
-        for part in parts:
-            transformed = await _transform_part(
-                part,
-                backend=backend,
-            )
-            new_parts.append(transformed)
+    file_cache = file_cache or get_gemini_file_cache()
+    transformed_contents = [
+        await _conform_content(content, backend=backend, file_cache=file_cache)
+        for content in contents
+    ]
+    return {**body, "contents": transformed_contents}
 
-        transformed_contents.append({**content, "parts": new_parts})
 
-    return {**body, "contents": transformed_contents}
+class ContentConformer:
+    """Conforms the request bodies of one conversation, turn after turn.
+
+    The agent loop resends its whole history on every turn but only ever
+    appends to it. Each content entry is transformed once and the result
+    reused on later turns, so a turn only pays for the entries appended
+    since the previous one. Entries are matched by identity and must not
+    be mutated after they have been sent.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: BackendClient,
+        file_cache: GeminiFileCache | None = None,
+    ) -> None:
+        self._backend = backend
+        self._file_cache = file_cache
+        # id(source) → (source, conformed). Holding the source keeps its
+        # id from being reused by a different object.
+        self._conformed: dict[int, tuple[LLMContent, LLMContent]] = {}
+
+    async def conform(self, body: GeminiBody) -> GeminiBody:
+        """Same as ``conform_body``, reusing earlier transforms."""
+        contents = body.get("contents", [])
+        if not contents:
+            return body
+
+        file_cache = self._file_cache or get_gemini_file_cache()
+        transformed_contents = []
+        for content in contents:
+            memo = self._conformed.get(id(content))
+            if memo is None or memo[0] is not content:
+                conformed = await _conform_content(
+                    content, backend=self._backend, file_cache=file_cache,
+                )
+                memo = (content, conformed)
+                self._conformed[id(content)] = memo
+            transformed_contents.append(memo[1])
+        return {**body, "contents": transformed_contents}
+
+
+async def _conform_content(
+    content: LLMContent,
+    *,
+    backend: BackendClient,
+    file_cache: GeminiFileCache,
+) -> LLMContent:
+    """Transform the parts of a single content entry."""
+    parts = content.get("parts")
+    if not parts:
+        return content
+
+    new_parts = []
+    for part in parts:
+        transformed = await _transform_part(
+            part,
+            backend=backend,
+            file_cache=file_cache,
+        )
+        new_parts.append(transformed)
+
+    return {**content, "parts": new_parts}
 
 
 async def _transform_part(
     part: LLMContentPart,
     *,
     backend: BackendClient,
+    file_cache: GeminiFileCache,
 ) -> LLMContentPart:
     """Transform a single content part."""
 
@@ -119,6 +184,7 @@ async def _transform_part(
             return await _upload_gemini_file(
                 {"driveFileId": drive_file_id},
                 backend=backend,
+                file_cache=file_cache,
             )
 
         # Blob handle → uploadGeminiFile
@@ -127,6 +193,7 @@ async def _transform_part(
             return await _upload_gemini_file(
                 {"blobId": blob_id},
                 backend=backend,
+                file_cache=file_cache,
             )
 
         # Unknown storedData — error (matches TS err("Unknown part"))
@@ -156,6 +223,7 @@ async def _transform_part(
             return await _upload_gemini_file(
                 request,
                 backend=backend,
+                file_cache=file_cache,
             )
 
         # Unknown fileData — error (matches TS err("Unknown part"))
@@ -169,11 +237,14 @@ async def _upload_gemini_file(
     request: dict[str, str],
     *,
     backend: BackendClient,
+    file_cache: GeminiFileCache,
 ) -> LLMContentPart:
     """Upload a file to Gemini File API via the backend.
 
-    Delegates to ``backend.upload_gemini_file()`` and builds the
-    ``fileData`` part from the response.
+    Delegates to ``backend.upload_gemini_file()`` through ``file_cache``
+    and builds the ``fileData`` part from the response. Backends without
+    a ``cache_principal`` upload every time: without one there is no way
+    to tell whose access an earlier upload was checked against.
 
     Returns:
         A ``fileData`` part with the resolved Gemini File API URL.
@@ -181,7 +252,13 @@ async def _upload_gemini_file(
     Raises:
         ValueError: If the upload fails.
     """
-    data = await backend.upload_gemini_file(request)
+    principal = getattr(backend, "cache_principal", None)
+    if isinstance(principal, str) and principal:
+        data = await file_cache.resolve(
+            request, backend.upload_gemini_file, principal=principal,
+        )
+    else:
+        data = await backend.upload_gemini_file(request)
 
     file_url = data.get("fileUrl", "")
     mime_type = data.get("mimeType", "")
@@ -0,0 +1,200 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Rolling conversation cache for long agent runs.
+
+Every turn of the agent loop sends the whole conversation so far. The
+singleton prefix cache (``singleton_cache.py``) only covers the system
+instruction and tools, so request size grows with every turn and the
+input tokens billed over a run grow quadratically.
+
+When ``AgentRunArgs.context_cache`` is set, the loop keeps a
+``ConversationCache``. Once the uncached part of a request grows past
+``ContextCacheConfig.min_tokens``, the stable prefix of the conversation
+(everything up to the latest model turn) is rolled into a per-session
+``cachedContents`` resource together with the system instruction and
+tools. Later requests reference that resource and send only the entries
+after it; each roll replaces the previous resource, which is deleted.
+``Loop.run`` calls ``close`` when the run ends (completed, failed,
+suspended or paused), so the last resource is not left billing storage
+until its TTL.
+
+If creating a resource fails, the run carries on with whatever it was
+using before and stops rolling. If Gemini rejects a request because the
+resource has expired, the loop drops it and retries uncached (see
+``Loop.run``); the next turn rolls a fresh one. A resource rejected on
+its very first use is not retried.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from .backend_client import BackendClient
+
+__all__ = ["ContextCacheConfig", "ConversationCache"]
+
+logger = logging.getLogger(__name__)
+
+GeminiBody = dict[str, Any]
+LLMContent = dict[str, Any]
+
+# Rough size of a token in serialized JSON, used when Gemini does not
+# report usage for a turn.
+_BYTES_PER_TOKEN = 4
+
+
+@dataclass(frozen=True)
+class ContextCacheConfig:
+    """Tuning for the rolling conversation cache."""
+
+    # Roll once a request carries at least this many uncached input
+    # tokens. Must stay above Gemini's minimum cacheable size.
+    min_tokens: int = 32_768
+    # TTL of each per-session resource. A turn that waits longer than
+    # this (e.g. on a slow function call) falls back to an uncached retry.
+    ttl_seconds: int = 10 * 60
+
+
+class ConversationCache:
+    """Per-run state of the rolling conversation cache.
+
+    ``name`` and ``count`` describe the current resource: requests send
+    ``cachedContent=name`` and ``contents[count:]``.
+    """
+
+    def __init__(
+        self,
+        config: ContextCacheConfig,
+        *,
+        backend: BackendClient,
+        model: str,
+        system_instruction: dict[str, Any] | None,
+        tools: list[dict[str, Any]],
+        tool_config: dict[str, Any],
+    ) -> None:
+        self.config = config
+        self._backend = backend
+        self._model = model
+        self._system_instruction = system_instruction
+        self._tools = tools
+        self._tool_config = tool_config
+
+        self.name: str | None = None
+        self.count = 0
+        self.rolls = 0
+        self._uncached_tokens = 0
+        self._used = False
+        self._disabled = False
+
+    def observe(
+        self, body: GeminiBody, usage_metadata: dict[str, Any] | None,
+    ) -> None:
+        """Record how much of the request just sent was not cached."""
+        if self.name and body.get("cachedContent") == self.name:
+            self._used = True
+        if usage_metadata and "promptTokenCount" in usage_metadata:
+            self._uncached_tokens = usage_metadata["promptTokenCount"] - (
+                usage_metadata.get("cachedContentTokenCount", 0)
+            )
+        else:
+            size = len(json.dumps(body.get("contents", [])))
+            self._uncached_tokens = size // _BYTES_PER_TOKEN
+
+    async def maybe_roll(
+        self,
+        contents: list[LLMContent],
+        conform: Callable[[GeminiBody], Awaitable[GeminiBody]],
+    ) -> bool:
+        """Roll the stable prefix into a new resource if the tail is large.
+
+        ``conform`` resolves data parts in the prefix, as for a request.
+        Returns True if a new resource was created.
+        """
+        if self._disabled or self._uncached_tokens < self.config.min_tokens:
+            return False
+        boundary = _stable_prefix(contents)
+        if boundary <= self.count or boundary >= len(contents):
+            return False
+
+        prefix = (await conform({"contents": contents[:boundary]}))["contents"]
+        payload: dict[str, Any] = {
+            "model": f"models/{self._model}",
+            "tools": self._tools,
+            "toolConfig": self._tool_config,
+            "contents": prefix,
+            "ttl": f"{self.config.ttl_seconds}s",
+        }
+        if self._system_instruction:
+            payload["systemInstruction"] = self._system_instruction
+        try:
+            response = await self._backend.create_cached_content(payload)
+        except Exception as exc:
+            logger.warning(
+                "Failed to cache conversation prefix, "
+                "continuing without it: %s",
+                exc,
+            )
+            self._disabled = True
+            return False
+
+        name = response.get("name")
+        if not name:
+            logger.warning("cachedContents response has no name: %s", response)
+            self._disabled = True
+            return False
+
+        logger.info(
+            "Cached %d conversation entries (~%d uncached tokens) as %s",
+            boundary,
+            self._uncached_tokens,
+            name,
+        )
+        superseded = self.name
+        self.name = name
+        self.count = boundary
+        self.rolls += 1
+        self._uncached_tokens = 0
+        self._used = False
+        if superseded:
+            await self._delete(superseded)
+        return True
+
+    def drop(self) -> None:
+        """Forget the current resource, e.g. after it expired.
+
+        A resource that Gemini rejects before it served a single request
+        did not expire; rolling stops for the rest of the run.
+        """
+        if self.name and not self._used:
+            self._disabled = True
+        self.name = None
+        self.count = 0
+
+    async def close(self) -> None:
+        """Delete the current resource and stop rolling."""
+        name = self.name
+        self.name = None
+        self.count = 0
+        self._disabled = True
+        if name:
+            await self._delete(name)
+
+    async def _delete(self, name: str) -> None:
+        try:
+            await self._backend.delete_cached_content(name)
+        except Exception as exc:
+            # Non-fatal: the resource expires on its own.
+            logger.warning("Failed to delete cached content %s: %s", name, exc)
+
+
+def _stable_prefix(contents: list[LLMContent]) -> int:
+    """Number of entries up to and including the latest model turn."""
+    for i in range(len(contents) - 1, -1, -1):
+        if contents[i].get("role") == "model":
+            return i + 1
+    return 0
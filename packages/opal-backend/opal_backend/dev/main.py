@@ -23,6 +23,7 @@ import json
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 
 import httpx
 from fastapi import FastAPI, Request, Response
@@ -39,13 +40,19 @@ from opal_backend.local.drive_operations_client_impl import (
 from opal_backend.local.interaction_store_impl import InMemoryInteractionStore
 from opal_backend.local.event_bus_impl import InMemoryEventBus
 from opal_backend.local.graph_session_store_impl import InMemoryGraphSessionStore
+from opal_backend.local.sqlite_graph_session_store_impl import (
+    SqliteGraphSessionStore,
+)
 from opal_backend.local.graph_session_router import create_graph_session_router
 from opal_backend.local.task_scheduler_impl import LocalTaskScheduler
 from opal_backend.graph_runner import GraphRunner
+from opal_backend.graph_session_store import GraphSessionStore
 from opal_backend.run import run_agent as run_agent_fn
 from opal_backend.run import resume_agent as resume_agent_fn
 from opal_backend.sessions.in_memory_store import InMemorySessionStore
 from opal_backend.local.session_router import SessionDeps, create_session_router
+from opal_backend.local.http_transport import aclose_http_clients
+from opal_backend.local.sse_stream import sse_frame
 from opal_backend.sessions.api import (
     new_session, register_task, start_session,
     resume_session as resume_session_fn, update_context,
@@ -54,10 +61,28 @@ from opal_backend.sessions.store import SessionStatus
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    held = await _graph_runner.recover()
+    if held:
+        logger.info(
+            "Holding %d interrupted graph nodes until their sessions "
+            "reconnect", held,
+        )
+    try:
+        yield
+    finally:
+        await aclose_http_clients()
+        if isinstance(_graph_session_store, SqliteGraphSessionStore):
+            _graph_session_store.close()
+
+
 app = FastAPI(
     title="Opal Dev Backend",
     description="Local development backend for Opal",
     version="0.1.0",
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -80,7 +105,6 @@ _proxy_client = httpx.AsyncClient(timeout=120.0)
 def _make_backend(token: str, origin: str = "") -> HttpBackendClient:
     return HttpBackendClient(
         upstream_base=UPSTREAM_BASE,
-        httpx_client=httpx.AsyncClient(timeout=120.0),
         access_token=token,
         origin=origin,
         gemini_key=GEMINI_KEY,
@@ -106,7 +130,15 @@ _session_router = create_session_router(
 )
 
 # Graph session infrastructure (Heartstone).
-_graph_session_store = InMemoryGraphSessionStore()
+# Set OPAL_GRAPH_SESSION_DB to a file path to keep graph sessions across
+# restarts; interrupted nodes are re-scheduled when a request for their
+# session brings the user's token again.
+_GRAPH_SESSION_DB = os.environ.get("OPAL_GRAPH_SESSION_DB", "")
+_graph_session_store: GraphSessionStore
+if _GRAPH_SESSION_DB:
+    _graph_session_store = SqliteGraphSessionStore(_GRAPH_SESSION_DB)
+else:
+    _graph_session_store = InMemoryGraphSessionStore()
 _graph_runner = GraphRunner(
     store=_graph_session_store,
     event_bus=_event_bus,
@@ -116,8 +148,12 @@ _graph_runner = GraphRunner(
     run_agent_fn=run_agent_fn,
     resume_agent_fn=resume_agent_fn,
 )
-_graph_scheduler = LocalTaskScheduler(run_fn=_graph_runner.run_node)
+_graph_scheduler = LocalTaskScheduler(
+    run_fn=_graph_runner.run_node, store=_graph_session_store,
+)
 _graph_runner._scheduler = _graph_scheduler
+
+
 _graph_session_router = create_graph_session_router(
     store=_graph_session_store,
     event_bus=_event_bus,
@@ -279,7 +315,6 @@ class DevAgentBackend:
 
         backend = HttpBackendClient(
             upstream_base=UPSTREAM_BASE,
-            httpx_client=httpx.AsyncClient(timeout=120.0),
             access_token=access_token,
             origin=origin,
             gemini_key=GEMINI_KEY,
@@ -335,7 +370,6 @@ class DevAgentBackend:
                 session_id,
                 backend=HttpBackendClient(
                     upstream_base=UPSTREAM_BASE,
-                    httpx_client=httpx.AsyncClient(timeout=120.0),
                     access_token=access_token,
                     origin=origin,
                     gemini_key=GEMINI_KEY,
@@ -372,8 +406,8 @@ class DevAgentBackend:
         """Stream events from an EventBus subscription as SSE."""
         async def stream():
             try:
-                async for item in queue:
-                    yield {"data": json.dumps(item)}
+                async for published in queue.published():
+                    yield sse_frame(published.data, event=None)
             finally:
                 _event_bus.unsubscribe(session_id, queue)
         return EventSourceResponse(content=stream())
@@ -480,7 +514,6 @@ async def singleton_prefix_cache(request: Request) -> Response:
 
     backend = HttpBackendClient(
         upstream_base=UPSTREAM_BASE,
-        httpx_client=httpx.AsyncClient(timeout=120.0),
         access_token=access_token,
         gemini_key=GEMINI_KEY,
     )
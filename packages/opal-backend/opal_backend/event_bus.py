@@ -14,13 +14,73 @@ implementations:
 
 Both agent sessions and graph sessions share this protocol for live
 event delivery to SSE streams.
+
+Events that are also appended to a session's event log are published with
+their log ``index``. A stream that subscribes *before* replaying the log
+can then drop the live events it already replayed, so no event is lost
+between replay and live delivery. Events published without an index are
+live-only (e.g. thought streaming).
 """
 
 from __future__ import annotations
 
+import json
 from typing import Any, AsyncIterator, Protocol, runtime_checkable
 
-__all__ = ["EventBus"]
+__all__ = ["EventBus", "EventSubscription", "PublishedEvent"]
+
+
+class PublishedEvent:
+    """One published event, shared by every subscriber that receives it.
+
+    Attributes:
+        event: The event dict as published.
+        index: The event's index in the session's event log, or None
+            for live-only events.
+    """
+
+    __slots__ = ("event", "index", "_data")
+
+    def __init__(self, event: dict[str, Any], index: int | None = None) -> None:
+        self.event = event
+        self.index = index
+        self._data: bytes | None = None
+
+    @property
+    def data(self) -> bytes:
+        """The event encoded as JSON, computed on first use."""
+        if self._data is None:
+            self._data = json.dumps(self.event).encode()
+        return self._data
+
+
+@runtime_checkable
+class EventSubscription(Protocol):
+    """A live subscription returned by ``EventBus.subscribe()``.
+
+    Iterating yields event dicts; ``published()`` yields the same events
+    as ``PublishedEvent`` for consumers that want the index or the shared
+    encoding. Use one or the other.
+    """
+
+    # Index of the latest indexed event published to the session before
+    # this subscription was created (-1 if none). Every later indexed
+    # event is delivered to the subscription.
+    position: int
+
+    # True if the subscription ended because its consumer fell too far
+    # behind, rather than because the session closed.
+    overflowed: bool
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        ...
+
+    async def __anext__(self) -> dict[str, Any]:
+        ...
+
+    def published(self) -> AsyncIterator[PublishedEvent]:
+        """Iterate the subscription as ``PublishedEvent`` records."""
+        ...
 
 
 @runtime_checkable
@@ -38,19 +98,25 @@ class EventBus(Protocol):
 
     def subscribe(
         self, session_id: str,
-    ) -> AsyncIterator[dict[str, Any] | None]:
+    ) -> EventSubscription:
         """Subscribe to live events for a session.
 
-        Returns an async iterator that yields event dicts. A ``None``
-        value is the end-of-stream sentinel — no more events will
-        follow for this session.
+        Returns an async iterator that yields event dicts until the
+        session is closed (or the subscriber falls too far behind).
         """
         ...
 
     async def publish(
         self, session_id: str, event: dict[str, Any],
+        *,
+        index: int | None = None,
     ) -> None:
-        """Publish an event to all subscribers of a session."""
+        """Publish an event to all subscribers of a session.
+
+        Args:
+            index: The event's index in the session's event log, if it
+                was appended there first.
+        """
         ...
 
     async def close(self, session_id: str) -> None:
@@ -58,7 +124,7 @@ class EventBus(Protocol):
         ...
 
     def unsubscribe(
-        self, session_id: str, subscription: AsyncIterator[dict[str, Any] | None],
+        self, session_id: str, subscription: EventSubscription,
     ) -> None:
         """Remove a subscription before the stream ends naturally.
 
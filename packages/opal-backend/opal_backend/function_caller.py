@@ -12,21 +12,60 @@ the production code path. Changes to the TS source may need to be ported here.
 Collects async function call tasks,
 awaits them all in parallel, and returns a combined ``LLMContent``
 with all function responses.
+
+Calls to functions that declare a ``concurrency_class`` share that
+class's process-wide slot limit (``FunctionConcurrency``), so twenty
+parallel ``generate_video`` calls run a few at a time instead of all at
+once. A function's ``timeout_s`` bounds its handler; a call that runs
+over gets an error response instead of holding up the turn forever.
+
+Each call's queue wait and run time can be reported through
+``on_latency``; ``FunctionLatencyHistograms`` collects them per function.
+With ``on_result``, each result is also reported as soon as its call
+finishes rather than when the whole turn is done.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
+import time
 import uuid
-from dataclasses import dataclass
-from typing import Any
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
 
 from .function_definition import FunctionDefinition
 from .suspend import SuspendError
 
+__all__ = [
+    "CONTEXT_PARTS_KEY",
+    "FunctionCallResult",
+    "FunctionCaller",
+    "FunctionConcurrency",
+    "FunctionLatency",
+    "FunctionLatencyHistograms",
+    "get_function_concurrency",
+    "set_function_concurrency",
+]
+
 logger = logging.getLogger(__name__)
 
+# Slots per concurrency class. Classes not listed are unlimited.
+DEFAULT_CONCURRENCY_LIMITS: dict[str, int] = {
+    "video": 2,
+    "audio": 4,
+    "image": 4,
+    "text": 16,
+}
+
+# Upper bounds (seconds) of the latency histogram buckets; the last
+# bucket is unbounded.
+LATENCY_BUCKETS_S: tuple[float, ...] = (
+    0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600,
+)
+
 # Types matching the Gemini API parts format.
 LLMContent = dict[str, Any]
 FunctionCallPart = dict[str, Any]  # {"functionCall": {"name": ..., "args": ...}}
@@ -50,6 +89,112 @@ class FunctionCallResult:
     context_parts: list[dict[str, Any]] | None = None
 
 
+class FunctionConcurrency:
+    """Slot limits per concurrency class, shared by every FunctionCaller.
+
+    The semaphores are created lazily and re-created if the event loop
+    changes (as it does between tests).
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None) -> None:
+        self.limits = dict(
+            DEFAULT_CONCURRENCY_LIMITS if limits is None else limits
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, concurrency_class: str | None) -> AsyncIterator[None]:
+        """Hold one slot of ``concurrency_class`` (no-op if unlimited)."""
+        limit = self.limits.get(concurrency_class) if concurrency_class else None
+        if limit is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {}
+        semaphore = self._semaphores.get(concurrency_class)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[concurrency_class] = semaphore
+        async with semaphore:
+            yield
+
+
+_concurrency = FunctionConcurrency()
+
+
+def get_function_concurrency() -> FunctionConcurrency:
+    """Return the process-wide concurrency limits."""
+    return _concurrency
+
+
+def set_function_concurrency(concurrency: FunctionConcurrency) -> None:
+    """Replace the process-wide concurrency limits."""
+    global _concurrency
+    _concurrency = concurrency
+
+
+@dataclass
+class FunctionLatency:
+    """Latency histogram for one function.
+
+    ``buckets[i]`` counts calls whose run time was at most
+    ``LATENCY_BUCKETS_S[i]``; the last bucket counts the rest.
+    """
+
+    count: int = 0
+    total_run_s: float = 0.0
+    max_run_s: float = 0.0
+    total_wait_s: float = 0.0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_S) + 1)
+    )
+
+    @property
+    def mean_run_s(self) -> float:
+        return self.total_run_s / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                if i < len(LATENCY_BUCKETS_S):
+                    return LATENCY_BUCKETS_S[i]
+                break
+        return self.max_run_s
+
+
+class FunctionLatencyHistograms:
+    """Per-function latency histograms.
+
+    ``record`` has the ``LoopHooks.on_function_latency`` signature, so
+    it can be passed as that hook directly.
+    """
+
+    def __init__(self) -> None:
+        self._latencies: dict[str, FunctionLatency] = {}
+
+    def record(self, name: str, wait_s: float, run_s: float) -> None:
+        latency = self._latencies.get(name)
+        if latency is None:
+            latency = self._latencies[name] = FunctionLatency()
+        latency.count += 1
+        latency.total_run_s += run_s
+        latency.max_run_s = max(latency.max_run_s, run_s)
+        latency.total_wait_s += wait_s
+        latency.buckets[bisect.bisect_left(LATENCY_BUCKETS_S, run_s)] += 1
+
+    def snapshot(self) -> dict[str, FunctionLatency]:
+        return dict(self._latencies)
+
+
 class FunctionCaller:
     """Collects and dispatches function calls from a single Gemini turn.
 
@@ -58,13 +203,28 @@ class FunctionCaller:
         caller.call(call_id, part, status_cb)
         caller.call(call_id, part, status_cb)
         results = await caller.get_results()
+
+    Args:
+        built_in: Function definitions by name.
+        on_result: Called with each ``FunctionCallResult`` as soon as its
+            call finishes.
+        on_latency: Called with ``(name, wait_s, run_s)`` for each call:
+            the time spent waiting for a concurrency slot and running.
+        concurrency: Slot limits; defaults to the process-wide ones.
     """
 
     def __init__(
         self,
         built_in: dict[str, FunctionDefinition],
+        *,
+        on_result: Callable[[FunctionCallResult], None] | None = None,
+        on_latency: Callable[[str, float, float], None] | None = None,
+        concurrency: FunctionConcurrency | None = None,
     ) -> None:
         self._built_in = built_in
+        self._on_result = on_result
+        self._on_latency = on_latency
+        self._concurrency = concurrency or get_function_concurrency()
         self._tasks: list[asyncio.Task[FunctionCallResult | dict[str, Any] | None]] = []
 
     def call(
@@ -82,8 +242,18 @@ class FunctionCaller:
         task = asyncio.create_task(
             self._execute(call_id, part, status_callback, reporter)
         )
+        if self._on_result:
+            task.add_done_callback(self._report)
         self._tasks.append(task)
 
+    def _report(
+        self, task: asyncio.Task[FunctionCallResult | dict[str, Any] | None],
+    ) -> None:
+        if self._on_result and not task.cancelled() and not task.exception():
+            result = task.result()
+            if isinstance(result, FunctionCallResult):
+                self._on_result(result)
+
     async def _execute(
         self,
         call_id: str,
@@ -116,11 +286,17 @@ class FunctionCaller:
 
         cb = status_callback or noop_status
 
+        queued_at = time.monotonic()
+        started_at = queued_at
+        deadline = asyncio.timeout(definition.timeout_s)
         try:
-            # Run precondition gate (e.g. consent check) before handler.
-            if definition.precondition:
-                await definition.precondition(args)
-            response = await definition.handler(args, cb)
+            async with self._concurrency.slot(definition.concurrency_class):
+                started_at = time.monotonic()
+                # Run precondition gate (e.g. consent check) before handler.
+                if definition.precondition:
+                    await definition.precondition(args)
+                async with deadline:
+                    response = await definition.handler(args, cb)
             # If the handler returned a $error outcome (fatal error),
             # propagate it directly — don't wrap in functionResponse.
             # Port of FunctionCallerImpl.#callBuiltIn check from TS.
@@ -144,16 +320,39 @@ class FunctionCaller:
             # Let SuspendError propagate — the loop catches it to save state.
             raise
         except Exception as e:
-            logger.exception("Function %s failed", name)
+            # Only our own deadline is reported as a timeout; a TimeoutError
+            # raised by the handler itself is an ordinary failure.
+            if (
+                isinstance(e, TimeoutError)
+                and definition.timeout_s is not None
+                and deadline.expired()
+            ):
+                logger.warning(
+                    "Function %s timed out after %ss",
+                    name, definition.timeout_s,
+                )
+                error = (
+                    f"{name} timed out after "
+                    f"{definition.timeout_s:g} seconds"
+                )
+            else:
+                logger.exception("Function %s failed", name)
+                error = str(e)
             return FunctionCallResult(
                 call_id=call_id,
                 response={
                     "functionResponse": {
                         "name": name,
-                        "response": {"error": str(e)},
+                        "response": {"error": error},
                     }
                 },
             )
+        finally:
+            if self._on_latency:
+                finished_at = time.monotonic()
+                self._on_latency(
+                    name, started_at - queued_at, finished_at - started_at,
+                )
 
     async def get_results(
         self,
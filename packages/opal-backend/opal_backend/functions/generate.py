@@ -89,6 +89,27 @@ IMAGE_FLASH_MODEL_NAME = "gemini-2.5-flash-image"
 # Video model name
 VIDEO_MODEL_NAME = "veo-3.1-generate-preview"
 
+# Concurrency class per function: calls in one class share a slot limit
+# across sessions (see ``function_caller.DEFAULT_CONCURRENCY_LIMITS``).
+CONCURRENCY_CLASSES: dict[str, str] = {
+    GENERATE_TEXT_FUNCTION: "text",
+    GENERATE_AND_EXECUTE_CODE_FUNCTION: "text",
+    GENERATE_IMAGES_FUNCTION: "image",
+    GENERATE_SPEECH_FUNCTION: "audio",
+    GENERATE_MUSIC_FUNCTION: "audio",
+    GENERATE_VIDEO_FUNCTION: "video",
+}
+
+# Handler timeouts in seconds. Generous: they only catch calls that hang.
+TIMEOUTS: dict[str, float] = {
+    GENERATE_TEXT_FUNCTION: 600,
+    GENERATE_AND_EXECUTE_CODE_FUNCTION: 600,
+    GENERATE_IMAGES_FUNCTION: 600,
+    GENERATE_SPEECH_FUNCTION: 600,
+    GENERATE_MUSIC_FUNCTION: 900,
+    GENERATE_VIDEO_FUNCTION: 1200,
+}
+
 # Voice map — port of VoiceMap from audio-generator/main.ts
 VOICE_MAP: dict[str, str] = {
     "Male (English)": "en-US-male",
@@ -846,7 +867,11 @@ def get_generate_function_group(
         consents_granted=consents_granted,
     )
     return assemble_function_group(
-        _LOADED, handlers, preconditions=preconditions
+        _LOADED,
+        handlers,
+        preconditions=preconditions,
+        concurrency_classes=CONCURRENCY_CLASSES,
+        timeouts=TIMEOUTS,
     )
 
 
@@ -865,7 +890,12 @@ def get_image_function_group(
         enable_g1_quota=enable_g1_quota,
     )
     return assemble_function_group(
-        _LOADED, handlers, name="image", instruction_override=""
+        _LOADED,
+        handlers,
+        name="image",
+        instruction_override="",
+        concurrency_classes=CONCURRENCY_CLASSES,
+        timeouts=TIMEOUTS,
     )
 
 
@@ -885,7 +915,12 @@ def get_audio_function_group(
         enable_g1_quota=enable_g1_quota,
     )
     return assemble_function_group(
-        _LOADED, handlers, name="audio", instruction_override=""
+        _LOADED,
+        handlers,
+        name="audio",
+        instruction_override="",
+        concurrency_classes=CONCURRENCY_CLASSES,
+        timeouts=TIMEOUTS,
     )
 
 
@@ -904,5 +939,10 @@ def get_video_function_group(
         enable_g1_quota=enable_g1_quota,
     )
     return assemble_function_group(
-        _LOADED, handlers, name="video", instruction_override=""
+        _LOADED,
+        handlers,
+        name="video",
+        instruction_override="",
+        concurrency_classes=CONCURRENCY_CLASSES,
+        timeouts=TIMEOUTS,
     )
@@ -20,6 +20,11 @@ retries on transient API errors (429 rate-limited, 503 resource exhausted)
 using the Full Jitter algorithm. This was added to support fault-tolerant
 bees sessions where Gemini rate-limiting is common during parallel ticket
 execution.
+
+Every attempt is also admitted through the process-wide, per-model
+``AdmissionController`` (see ``admission.py``), so concurrent streams
+share one adaptive rate instead of retrying against the quota
+independently.
 """
 
 from __future__ import annotations
@@ -27,8 +32,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from typing import Any, AsyncIterator
+from typing import Any, AsyncGenerator
 
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    get_admission_controller,
+)
 from .backend_client import BackendClient
 
 logger = logging.getLogger(__name__)
@@ -67,12 +77,20 @@ class GeminiAPIError(Exception):
     """Raised when the Gemini API returns a non-200 response.
 
     Carries the HTTP ``status_code`` so callers can distinguish
-    transient failures (429, 503) from permanent ones (400, 403).
+    transient failures (429, 503) from permanent ones (400, 403), and the
+    server's ``retry_after`` hint in seconds, when it sent one.
     """
 
-    def __init__(self, message: str, *, status_code: int = 0) -> None:
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int = 0,
+        retry_after: float | None = None,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
 
     @property
     def is_transient(self) -> bool:
@@ -113,7 +131,8 @@ async def stream_generate_content(
     body: GeminiBody,
     *,
     backend: BackendClient,
-) -> AsyncIterator[GeminiChunk]:
+    admission: AdmissionController | None = None,
+) -> AsyncGenerator[GeminiChunk, None]:
     """Stream content from Gemini with automatic retry on failures.
 
     Retries on two classes of transient failure:
@@ -127,10 +146,21 @@ async def stream_generate_content(
     Both use exponential backoff with full jitter. The retry budget is
     shared across both failure modes.
 
+    Each attempt first waits for admission from the model's limiter.
+    Transient errors are reported to the limiter, which slows (or, given a
+    Retry-After hint, pauses) admissions for every stream on that model.
+
+    The admission slot is held while the upstream stream is open, which
+    includes the time the caller spends on each yielded chunk, and is
+    released when the stream ends or this generator is closed. A caller
+    that stops iterating early should ``aclose()`` the generator rather
+    than leave the slot to garbage collection.
+
     Args:
         model: Gemini model name (e.g. "gemini-3-flash-preview").
         body: The full request body (contents, tools, etc.).
         backend: BackendClient implementation (handles transport).
+        admission: Admission controller; defaults to the process-wide one.
 
     Yields:
         Parsed JSON chunks from the Gemini streaming response.
@@ -139,6 +169,7 @@ async def stream_generate_content(
         GeminiAPIError: If retries are exhausted or the error is
             non-transient.
     """
+    limiter = (admission or get_admission_controller()).limiter(model)
     for attempt in range(STREAM_MAX_RETRIES):
         try:
             found_content = False
@@ -147,22 +178,27 @@ async def stream_generate_content(
             # consumers receive updates in real time instead of
             # all-at-once after the full response completes.
             buffer: list[GeminiChunk] = []
-
-            async for chunk in backend.stream_generate_content(model, body):
-                if has_content(chunk):
-                    found_content = True
-
-                if found_content:
-                    # Flush any pre-content chunks we buffered earlier.
-                    if buffer:
-                        for b in buffer:
-                            yield b
-                        buffer.clear()
-                    yield chunk
-                else:
-                    buffer.append(chunk)
+            ticket: int | None = None
+
+            async with limiter.admit() as ticket:
+                async for chunk in backend.stream_generate_content(
+                    model, body
+                ):
+                    if has_content(chunk):
+                        found_content = True
+
+                    if found_content:
+                        # Flush any pre-content chunks we buffered earlier.
+                        if buffer:
+                            for b in buffer:
+                                yield b
+                            buffer.clear()
+                        yield chunk
+                    else:
+                        buffer.append(chunk)
 
             if found_content:
+                limiter.on_success()
                 return
 
             # Empty response — retry with backoff.
@@ -179,10 +215,28 @@ async def stream_generate_content(
                 for chunk in buffer:
                     yield chunk
 
+        except AdmissionRejected as e:
+            if attempt >= STREAM_MAX_RETRIES - 1:
+                raise GeminiAPIError(
+                    f"Gemini admission rejected: {e}", status_code=429,
+                ) from e
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                "Gemini admission rejected (attempt %d/%d), "
+                "retrying in %.1fs: %s",
+                attempt + 1, STREAM_MAX_RETRIES, delay, e,
+            )
+            await asyncio.sleep(delay)
+
         except GeminiAPIError as e:
+            if e.is_transient:
+                limiter.on_rate_limited(e.retry_after, admitted=ticket)
             if not e.is_transient or attempt >= STREAM_MAX_RETRIES - 1:
                 raise
 
+            # The limiter now paces the retry together with every other
+            # stream on this model; the jittered delay only de-syncs the
+            # streams that failed together.
             delay = _backoff_delay(attempt)
             logger.warning(
                 "Transient Gemini API error %d (attempt %d/%d), "
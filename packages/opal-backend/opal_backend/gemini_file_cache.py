@@ -0,0 +1,208 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide cache of Gemini File API uploads.
+
+``conform_body`` resolves Drive and blob references by asking the backend
+to copy them into the Gemini File API (``uploadGeminiFile``). The uploaded
+file stays usable until the File API deletes it, 48 hours later, so a
+conversation that keeps a PDF in its history only needs to upload it once.
+The ``GeminiFileCache`` remembers each upload response keyed by the
+caller's principal and the upload request (``driveFileId`` +
+``driveResourceKey``, or ``blobId``):
+
+- entries expire a safety margin before the file does, using the
+  response's ``expirationTime`` when present and the File API's 48-hour
+  retention otherwise;
+- concurrent resolutions of the same request share one upload;
+- failed uploads are not cached.
+
+The upload is made with the caller's credentials, which is what checks
+their access to the Drive file or blob, so an upload is only reused by
+callers with the same principal (for ``HttpBackendClient``, a hash of its
+access token). ``conform_body`` uses the shared cache from
+``get_gemini_file_cache()`` unless one is passed explicitly, and skips it
+for backends that do not report a principal.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+__all__ = [
+    "GeminiFileCache",
+    "GeminiFileCacheStats",
+    "get_gemini_file_cache",
+    "set_gemini_file_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+# The Gemini File API deletes uploaded files after 48 hours.
+FILE_TTL_SECONDS = 48 * 60 * 60
+
+# Stop handing out a file this long before it expires, so a request that
+# is built from the cache does not reach Gemini after the file is gone.
+EXPIRY_MARGIN_SECONDS = 60 * 60
+
+DEFAULT_MAX_ENTRIES = 4096
+
+UploadFn = Callable[[dict[str, str]], Awaitable[dict[str, Any]]]
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class GeminiFileCacheStats:
+    """Point-in-time counters for a ``GeminiFileCache``."""
+
+    entries: int
+    hits: int
+    misses: int
+    shared: int
+    expired: int
+
+
+@dataclass
+class _Entry:
+    response: dict[str, Any]
+    expires_at: float
+
+
+class GeminiFileCache:
+    """LRU cache of ``uploadGeminiFile`` responses with single-flight uploads.
+
+    Args:
+        max_entries: Least recently used entries beyond this are dropped.
+        margin: Seconds before a file's expiry at which its entry is
+            treated as expired.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        margin: float = EXPIRY_MARGIN_SECONDS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._margin = margin
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._inflight: dict[_Key, asyncio.Future[dict[str, Any]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+        self._expired = 0
+
+    async def resolve(
+        self, request: dict[str, str], upload: UploadFn, *, principal: str,
+    ) -> dict[str, Any]:
+        """Return the upload response for ``request``, uploading on a miss.
+
+        ``upload`` is only called when there is neither a live entry nor
+        an upload of the same request already in flight for the same
+        ``principal`` — the identity whose credentials ``upload`` uses.
+        """
+        key = _key(request, principal)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return dict(entry.response)
+            self._expired += 1
+            del self._entries[key]
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # In-flight uploads belong to one loop; the process-wide cache
+            # can outlive it (e.g. successive asyncio.run calls).
+            self._loop = loop
+            self._inflight = {}
+
+        future = self._inflight.get(key)
+        if future is None:
+            self._misses += 1
+            future = asyncio.ensure_future(self._upload(key, request, upload))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._settle(key, f))
+        else:
+            self._shared += 1
+
+        # Shielded so that one cancelled caller does not cancel the upload
+        # for everyone else waiting on it.
+        return dict(await asyncio.shield(future))
+
+    def invalidate(self, request: dict[str, str], *, principal: str) -> None:
+        """Forget the entry for ``request``, e.g. after Gemini rejected it."""
+        self._entries.pop(_key(request, principal), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> GeminiFileCacheStats:
+        return GeminiFileCacheStats(
+            entries=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            shared=self._shared,
+            expired=self._expired,
+        )
+
+    # -- internal ----------------------------------------------------------
+
+    async def _upload(
+        self, key: _Key, request: dict[str, str], upload: UploadFn,
+    ) -> dict[str, Any]:
+        uploaded_at = time.time()
+        response = await upload(request)
+        expires_at = _expiration(response, uploaded_at) - self._margin
+        self._entries[key] = _Entry(response=dict(response), expires_at=expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return response
+
+    def _settle(self, key: _Key, future: asyncio.Future[dict[str, Any]]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug("Gemini file upload failed for %s", dict(key[1]))
+
+
+def _key(request: dict[str, str], principal: str) -> _Key:
+    return principal, tuple(sorted(request.items()))
+
+
+def _expiration(response: dict[str, Any], uploaded_at: float) -> float:
+    """When the uploaded file expires, per the response or the default TTL."""
+    default = uploaded_at + FILE_TTL_SECONDS
+    raw = response.get("expirationTime")
+    if not isinstance(raw, str) or not raw:
+        return default
+    try:
+        expires = datetime.fromisoformat(raw).timestamp()
+    except ValueError:
+        return default
+    return min(expires, default)
+
+
+_cache = GeminiFileCache()
+
+
+def get_gemini_file_cache() -> GeminiFileCache:
+    """Return the process-wide cache."""
+    return _cache
+
+
+def set_gemini_file_cache(cache: GeminiFileCache) -> None:
+    """Replace the process-wide cache (e.g. to change its size)."""
+    global _cache
+    _cache = cache
@@ -13,13 +13,18 @@ specially:
 - If ALL entry nodes are standalone, pick only the first one.
 - If some are standalone and some connected, ignore standalone.
 - If none are standalone, start from all entry nodes.
+
+``PlanIndex`` compiles a plan into lookup tables keyed by node id, so
+executors can find a node and its edges without walking the stages.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 from .graph_types import Edge, GraphDescriptor, GraphPlan, PlanNodeInfo
 
-__all__ = ["create_plan"]
+__all__ = ["PlanIndex", "create_plan"]
 
 
 def create_plan(graph: GraphDescriptor) -> GraphPlan:
@@ -116,3 +121,34 @@ def create_plan(graph: GraphDescriptor) -> GraphPlan:
         queue = next_queue
 
     return GraphPlan(stages=stages, assets=graph.assets or {})
+
+
+@dataclass
+class PlanIndex:
+    """Node-id lookup tables for a ``GraphPlan``.
+
+    Attributes:
+        nodes: node_id → ``PlanNodeInfo``.
+        upstream: node_id → edges into the node.
+        downstream: node_id → edges out of the node.
+        order: node_id → position of the node in plan order (stage by
+            stage), for returning node ids in a stable order.
+    """
+
+    nodes: dict[str, PlanNodeInfo] = field(default_factory=dict)
+    upstream: dict[str, list[Edge]] = field(default_factory=dict)
+    downstream: dict[str, list[Edge]] = field(default_factory=dict)
+    order: dict[str, int] = field(default_factory=dict)
+
+    @staticmethod
+    def from_plan(plan: GraphPlan) -> PlanIndex:
+        """Compile ``plan`` in one pass over its stages."""
+        index = PlanIndex()
+        for stage in plan.stages:
+            for info in stage:
+                node_id = info.node.id
+                index.order[node_id] = len(index.nodes)
+                index.nodes[node_id] = info
+                index.upstream[node_id] = info.upstream
+                index.downstream[node_id] = info.downstream
+        return index
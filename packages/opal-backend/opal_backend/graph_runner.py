@@ -26,6 +26,7 @@ from typing import Any, AsyncIterator, Callable
 from .backend_client import BackendClient
 from .event_bus import EventBus
 from .events import AgentEvent
+from .graph_plan import PlanIndex
 from .graph_session_store import GraphSessionStore, SuspendedNodeState
 from .interaction_store import InteractionStore
 from .node_handlers import (
@@ -79,8 +80,14 @@ class GraphRunner:
         self._interaction_store = interaction_store
         self._run_agent_fn = run_agent_fn
         self._resume_agent_fn = resume_agent_fn
-        # Per-session auth context, set by start_graph().
+        # Per-session auth context, set by start_graph() and authorize().
         self._session_auth: dict[str, tuple[str, str]] = {}
+        # Nodes found by recover(), held until authorize() supplies
+        # credentials for their session.
+        self._awaiting_auth: dict[str, list[str]] = {}
+        # Per-session plan index, compiled on first lookup. Plans do not
+        # change once stored.
+        self._plan_indexes: dict[str, PlanIndex] = {}
 
     async def start_graph(
         self, session_id: str,
@@ -104,11 +111,7 @@ class GraphRunner:
             return
 
         # Emit graphStart event.
-        await self._store.append_event(session_id, {
-            "type": "graphStart",
-            "sessionId": session_id,
-        })
-        await self._event_bus.publish(session_id, {
+        await self._emit(session_id, {
             "type": "graphStart",
             "sessionId": session_id,
         })
@@ -118,6 +121,55 @@ class GraphRunner:
             for info in plan.stages[0]:
                 await self._scheduler.schedule(session_id, info.node.id)
 
+    async def recover(self) -> int:
+        """Hold the nodes that a restart interrupted for re-running.
+
+        Called once at server startup, before serving requests. The
+        credentials of the original requests are not persisted, so the
+        nodes are not run yet: ``authorize`` re-schedules them once a
+        request for their session brings a token. Nodes that were running
+        start over from their inputs, so a node may run more than once
+        across a restart. Suspended nodes stay suspended and resume
+        through ``resume_node`` as usual.
+
+        Returns the number of nodes held.
+        """
+        interrupted = await self._store.list_interrupted_nodes()
+        for session_id, node_id in interrupted:
+            self._awaiting_auth.setdefault(session_id, []).append(node_id)
+        return len(interrupted)
+
+    async def authorize(
+        self, session_id: str,
+        *,
+        access_token: str,
+        origin: str = "",
+    ) -> int:
+        """Use fresh credentials for a session's remaining node tasks.
+
+        Schedules any nodes ``recover`` held for the session. Does nothing
+        without a token.
+
+        Returns the number of nodes scheduled.
+        """
+        if not access_token:
+            return 0
+        self._session_auth[session_id] = (access_token, origin)
+        held = self._awaiting_auth.pop(session_id, [])
+        for node_id in held:
+            await self._scheduler.schedule(session_id, node_id)
+        return len(held)
+
+    def forget(self, session_id: str) -> None:
+        """Drop the per-session state kept for a session's node tasks.
+
+        Called when the session ends: on ``graphComplete``, and by the
+        ``:cancel`` endpoint after cancelling its tasks.
+        """
+        self._plan_indexes.pop(session_id, None)
+        self._session_auth.pop(session_id, None)
+        self._awaiting_auth.pop(session_id, None)
+
     async def run_node(
         self, session_id: str, node_id: str,
     ) -> None:
@@ -130,7 +182,13 @@ class GraphRunner:
         except NodeSuspended as suspended:
             await self._handle_suspend(session_id, node_id, suspended)
         except Exception as exc:
-            await self._handle_node_error(session_id, node_id, exc)
+            try:
+                await self._handle_node_error(session_id, node_id, exc)
+            except Exception:
+                # The failure could not be recorded, so the session will
+                # never reach graphComplete.
+                self.forget(session_id)
+                raise
 
     async def resume_node(
         self, session_id: str, interaction_id: str,
@@ -205,11 +263,9 @@ class GraphRunner:
         self, session_id: str, node_id: str,
     ) -> None:
         """Inner node execution — no error handling."""
-        # 1. Emit nodeStart.
-        await self._store.append_event(session_id, {
-            "type": "nodeStart", "nodeId": node_id,
-        })
-        await self._event_bus.publish(session_id, {
+        # 1. Mark the node running and emit nodeStart.
+        await self._store.start_node(session_id, node_id)
+        await self._emit(session_id, {
             "type": "nodeStart", "nodeId": node_id,
         })
 
@@ -242,10 +298,7 @@ class GraphRunner:
             session_id, node_id, outputs,
         )
 
-        await self._store.append_event(session_id, {
-            "type": "nodeEnd", "nodeId": node_id, "outputs": outputs,
-        })
-        await self._event_bus.publish(session_id, {
+        await self._emit(session_id, {
             "type": "nodeEnd", "nodeId": node_id, "outputs": outputs,
         })
 
@@ -281,8 +334,7 @@ class GraphRunner:
                 "nodeId": node_id,
                 "event": event_dict,
             }
-            await self._store.append_event(session_id, wrapped)
-            await self._event_bus.publish(session_id, wrapped)
+            await self._emit(session_id, wrapped)
 
         async def on_thought_event(text: str) -> None:
             """Forward thought events from generateWebpageStream."""
@@ -432,8 +484,7 @@ class GraphRunner:
             "interactionId": suspended.interaction_id,
             "suspendEvent": suspended.suspend_event,
         }
-        await self._store.append_event(session_id, event)
-        await self._event_bus.publish(session_id, event)
+        await self._emit(session_id, event)
 
     async def _is_headless_session(
         self, session_id: str,
@@ -445,13 +496,22 @@ class GraphRunner:
         self, session_id: str, node_id: str,
     ) -> str:
         """Look up node type from the stored plan."""
-        plan = await self._store.get_plan(session_id)
-        if plan:
-            for stage in plan.stages:
-                for info in stage:
-                    if info.node.id == node_id:
-                        return info.node.type
-        return "unknown"
+        index = await self._get_plan_index(session_id)
+        info = index.nodes.get(node_id) if index else None
+        return info.node.type if info else "unknown"
+
+    async def _get_plan_index(
+        self, session_id: str,
+    ) -> PlanIndex | None:
+        """Return the compiled index of the session's plan."""
+        index = self._plan_indexes.get(session_id)
+        if index is None:
+            plan = await self._store.get_plan(session_id)
+            if not plan:
+                return None
+            index = PlanIndex.from_plan(plan)
+            self._plan_indexes[session_id] = index
+        return index
 
     async def _check_graph_complete(
         self, session_id: str,
@@ -459,17 +519,18 @@ class GraphRunner:
         """Emit graphComplete if all nodes are done."""
         if await self._store.is_graph_complete(session_id):
             outputs = await self._store.get_graph_outputs(session_id)
-            await self._store.set_status(session_id, "completed")
-            await self._store.append_event(session_id, {
-                "type": "graphComplete",
-                "sessionId": session_id,
-                "outputs": outputs,
-            })
-            await self._event_bus.publish(session_id, {
+            # Store graphComplete before the status changes, so a stream
+            # that sees "completed" finds it in the log.
+            event = await self._record(session_id, {
                 "type": "graphComplete",
                 "sessionId": session_id,
                 "outputs": outputs,
             })
+            await self._store.set_status(session_id, "completed")
+            self.forget(session_id)
+            await self._event_bus.publish(
+                session_id, event, index=event["index"],
+            )
             # Close the event bus for this session.
             await self._event_bus.close(session_id)
 
@@ -477,10 +538,21 @@ class GraphRunner:
         self, session_id: str, node_id: str, error: str,
     ) -> None:
         """Emit nodeError event."""
-        await self._store.append_event(session_id, {
-            "type": "nodeError", "nodeId": node_id, "error": error,
-        })
-        await self._event_bus.publish(session_id, {
+        await self._emit(session_id, {
             "type": "nodeError", "nodeId": node_id, "error": error,
         })
 
+    async def _record(
+        self, session_id: str, event: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Append an event to the session log; return it with its index."""
+        index = await self._store.append_event(session_id, event)
+        return {**event, "index": index}
+
+    async def _emit(
+        self, session_id: str, event: dict[str, Any],
+    ) -> None:
+        """Append an event to the session log, then publish it live."""
+        event = await self._record(session_id, event)
+        await self._event_bus.publish(session_id, event, index=event["index"])
+
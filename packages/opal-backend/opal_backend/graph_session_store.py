@@ -46,6 +46,8 @@ class GraphSessionStore(Protocol):
 
     Implementations:
     - ``InMemoryGraphSessionStore`` (``local/``) — dict-backed, dev server
+    - ``SqliteGraphSessionStore`` (``local/``) — SQLite file, survives
+      restarts of the dev server
     - Production — database with atomic operations
     """
 
@@ -73,6 +75,12 @@ class GraphSessionStore(Protocol):
 
     # ── Node Lifecycle ──
 
+    async def start_node(
+        self, session_id: str, node_id: str,
+    ) -> None:
+        """Mark a ready node as running (its task has started)."""
+        ...
+
     async def complete_node(
         self, session_id: str, node_id: str, outputs: dict[str, Any],
     ) -> list[str]:
@@ -164,6 +172,17 @@ class GraphSessionStore(Protocol):
         """
         ...
 
+    async def list_interrupted_nodes(
+        self,
+    ) -> list[tuple[str, str]]:
+        """Return ``(session_id, node_id)`` for work a restart cut short.
+
+        These are nodes that are ready or running in sessions that
+        have not finished (status ``running`` or ``suspended``). A
+        store that does not outlive the process returns an empty list.
+        """
+        ...
+
     # ── Event Log ──
 
     async def append_event(
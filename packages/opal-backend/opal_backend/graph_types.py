@@ -178,6 +178,23 @@ class PlanNodeInfo:
     downstream: list[Edge] = field(default_factory=list)
     upstream: list[Edge] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> PlanNodeInfo:
+        """Create a PlanNodeInfo from its ``to_dict()`` form."""
+        return PlanNodeInfo(
+            node=NodeDescriptor.from_dict(d["node"]),
+            downstream=[Edge.from_dict(e) for e in d.get("downstream", [])],
+            upstream=[Edge.from_dict(e) for e in d.get("upstream", [])],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "node": self.node.to_dict(),
+            "downstream": [e.to_dict() for e in self.downstream],
+            "upstream": [e.to_dict() for e in self.upstream],
+        }
+
 
 @dataclass
 class GraphPlan:
@@ -191,6 +208,26 @@ class GraphPlan:
     stages: list[list[PlanNodeInfo]] = field(default_factory=list)
     assets: dict[str, Any] = field(default_factory=dict)
 
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> GraphPlan:
+        """Create a GraphPlan from its ``to_dict()`` form."""
+        return GraphPlan(
+            stages=[
+                [PlanNodeInfo.from_dict(info) for info in stage]
+                for stage in d.get("stages", [])
+            ],
+            assets=d.get("assets") or {},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict, e.g. for a durable store."""
+        return {
+            "stages": [
+                [info.to_dict() for info in stage] for stage in self.stages
+            ],
+            "assets": self.assets,
+        }
+
 
 # ---------------------------------------------------------------------------
 # Node lifecycle state
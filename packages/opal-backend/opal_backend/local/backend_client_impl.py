@@ -7,13 +7,17 @@ HTTP-based implementation of ``BackendClient``.
 POSTs to One Platform and Gemini endpoints via ``httpx``. Used by the dev
 backend and local testing. This module is NOT synced to google3 —
 it lives in ``local/``.
+
+Unless given a client, requests go through the shared per-upstream pools
+in ``http_transport``, with its per-endpoint timeouts.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Mapping
 
 import httpx
 
@@ -25,6 +29,7 @@ from ..backend_client import (
     UPLOAD_BLOB_FILE_ENDPOINT,
 )
 from ..gemini_client import GeminiAPIError
+from .http_transport import ENDPOINT_TIMEOUTS, get_http_client, iter_sse_data
 
 __all__ = ["HttpBackendClient"]
 
@@ -39,22 +44,42 @@ class HttpBackendClient:
 
     POSTs to One Platform and Gemini endpoints via ``httpx``. Used by
     the dev backend and local testing.
+
+    Args:
+        httpx_client: Client for every request. When omitted, each
+            upstream's shared pool from ``http_transport`` is used.
+        timeouts: Overrides for ``http_transport.ENDPOINT_TIMEOUTS``.
     """
 
     def __init__(
         self,
         *,
         upstream_base: str,
-        httpx_client: httpx.AsyncClient,
+        httpx_client: httpx.AsyncClient | None = None,
         access_token: str,
         origin: str = "",
         gemini_key: str = "",
+        timeouts: Mapping[str, httpx.Timeout] | None = None,
     ) -> None:
         self._upstream_base = upstream_base
         self._httpx = httpx_client
         self._access_token = access_token
         self._origin = origin
         self._gemini_key = gemini_key
+        self._timeouts = {**ENDPOINT_TIMEOUTS, **(timeouts or {})}
+
+    @property
+    def cache_principal(self) -> str:
+        """Identity for ``GeminiFileCache``: a hash of the access token.
+
+        Uploads are checked against the token's Drive access, so they are
+        only reused by clients holding the same token.
+        """
+        return hashlib.sha256(self._access_token.encode()).hexdigest()
+
+    def _client(self, url: str) -> httpx.AsyncClient:
+        """The given client, or the shared pool for ``url``'s upstream."""
+        return self._httpx or get_http_client(url)
 
     def _headers(self) -> dict[str, str]:
         """Build standard request headers."""
@@ -73,7 +98,10 @@ class HttpBackendClient:
         url = f"{self._upstream_base.rstrip('/')}{EXECUTE_STEP_ENDPOINT}"
         headers = self._headers()
 
-        response = await self._httpx.post(url, json=body, headers=headers)
+        response = await self._client(url).post(
+            url, json=body, headers=headers,
+            timeout=self._timeouts["execute_step"],
+        )
 
         if response.status_code >= 400:
             error_text = response.text[:500]
@@ -110,8 +138,9 @@ class HttpBackendClient:
             **request, "accessToken": self._access_token
         }
 
-        response = await self._httpx.post(
-            url, json=augmented_request, headers=headers
+        response = await self._client(url).post(
+            url, json=augmented_request, headers=headers,
+            timeout=self._timeouts["upload"],
         )
         if response.status_code >= 400:
             logger.error(
@@ -136,13 +165,14 @@ class HttpBackendClient:
         # OP requires the access token in the JSON body (same pattern as
         # upload_gemini_file — see shouldAddAccessTokenToJsonBody in
         # fetch-allowlist.ts).
-        response = await self._httpx.post(
+        response = await self._client(url).post(
             url,
             json={
                 "driveFileId": drive_file_id,
                 "accessToken": self._access_token,
             },
             headers=headers,
+            timeout=self._timeouts["upload"],
         )
         response.raise_for_status()
         data = response.json()
@@ -158,7 +188,8 @@ class HttpBackendClient:
         """Stream from Gemini via httpx and parse SSE chunks.
 
         Builds the ``streamGenerateContent`` URL, sends an authenticated
-        POST, and yields parsed JSON chunks from the SSE stream.
+        POST, and yields each JSON chunk as soon as its SSE event is
+        complete.
         """
         url = f"{GENAI_API_BASE}/{model}:streamGenerateContent?alt=sse"
         headers: dict[str, str] = {
@@ -169,27 +200,23 @@ class HttpBackendClient:
         elif self._gemini_key:
             url += f"&key={self._gemini_key}"
 
-        async with self._httpx.stream(
-            "POST", url, json=body, headers=headers
+        async with self._client(url).stream(
+            "POST", url, json=body, headers=headers,
+            timeout=self._timeouts["stream"],
         ) as response:
             if response.status_code != 200:
-                error_text = await response.aread()
+                error_text = (await response.aread()).decode()
                 raise GeminiAPIError(
                     f"Gemini API error {response.status_code}: "
-                    f"{error_text.decode()}",
+                    f"{error_text}",
                     status_code=response.status_code,
+                    retry_after=_retry_after(
+                        response.headers.get("retry-after"), error_text
+                    ),
                 )
 
-            async for line in response.aiter_lines():
-                line = line.strip()
-                if line.startswith("data: "):
-                    json_str = line[len("data: "):]
-                    try:
-                        yield json.loads(json_str)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "Failed to parse SSE chunk: %s", json_str[:100]
-                        )
+            async for chunk in _parse_sse_json(response, "SSE"):
+                yield chunk
 
     async def stream_generate_webpage(
         self, body: dict[str, Any],
@@ -204,8 +231,9 @@ class HttpBackendClient:
         # AppCatalyst requires the access token in the JSON body.
         augmented_body = {**body, "accessToken": self._access_token}
 
-        async with self._httpx.stream(
-            "POST", url, json=augmented_body, headers=headers
+        async with self._client(url).stream(
+            "POST", url, json=augmented_body, headers=headers,
+            timeout=self._timeouts["stream"],
         ) as response:
             if response.status_code != 200:
                 error_text = await response.aread()
@@ -214,17 +242,8 @@ class HttpBackendClient:
                     f"{error_text.decode()[:500]}"
                 )
 
-            async for line in response.aiter_lines():
-                line = line.strip()
-                if line.startswith("data: "):
-                    json_str = line[len("data: "):]
-                    try:
-                        yield json.loads(json_str)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "Failed to parse webpage SSE chunk: %s",
-                            json_str[:100],
-                        )
+            async for chunk in _parse_sse_json(response, "webpage SSE"):
+                yield chunk
 
 
     async def create_cached_content(
@@ -238,8 +257,9 @@ class HttpBackendClient:
         url = f"{GENAI_CACHE_URL}?key={self._gemini_key}"
         headers = {"Content-Type": "application/json"}
 
-        response = await self._httpx.post(
-            url, json=body, headers=headers
+        response = await self._client(url).post(
+            url, json=body, headers=headers,
+            timeout=self._timeouts["cached_content"],
         )
         if response.status_code != 200:
             error_text = response.text[:500]
@@ -263,8 +283,9 @@ class HttpBackendClient:
         url = f"{base}/{name}?key={self._gemini_key}"
         headers = {"Content-Type": "application/json"}
 
-        response = await self._httpx.patch(
-            url, json=body, headers=headers
+        response = await self._client(url).patch(
+            url, json=body, headers=headers,
+            timeout=self._timeouts["cached_content"],
         )
         if response.status_code != 200:
             error_text = response.text[:500]
@@ -274,6 +295,35 @@ class HttpBackendClient:
             )
         return response.json()
 
+    async def delete_cached_content(self, name: str) -> None:
+        """DELETE a Gemini cachedContents resource."""
+        if not self._gemini_key:
+            raise GeminiAPIError("gemini_key is required for delete_cached_content")
+
+        base = "https://generativelanguage.googleapis.com/v1beta"
+        url = f"{base}/{name}?key={self._gemini_key}"
+
+        response = await self._client(url).delete(
+            url, timeout=self._timeouts["cached_content"],
+        )
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            raise GeminiAPIError(
+                f"cachedContents DELETE error {response.status_code}: "
+                f"{error_text}"
+            )
+
+
+async def _parse_sse_json(
+    response: httpx.Response, what: str,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the JSON payload of each SSE event in ``response``."""
+    async for data in iter_sse_data(response.aiter_bytes()):
+        try:
+            yield json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse %s chunk: %s", what, data[:100])
+
 
 def _decode_error(text: str) -> str:
     """Try to extract error message from JSON error response."""
@@ -282,3 +332,26 @@ def _decode_error(text: str) -> str:
         return data.get("error", {}).get("message", "Unknown error")
     except Exception:
         return "Unknown error"
+
+
+def _retry_after(header: str | None, text: str) -> float | None:
+    """Seconds to wait before retrying, from the response if it says.
+
+    Prefers the ``Retry-After`` header (delta-seconds form); otherwise looks
+    for a ``google.rpc.RetryInfo`` detail (``"retryDelay": "12s"``) in the
+    JSON error body.
+    """
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+    try:
+        details = json.loads(text).get("error", {}).get("details", [])
+        for detail in details:
+            delay = detail.get("retryDelay")
+            if isinstance(delay, str) and delay.endswith("s"):
+                return max(0.0, float(delay[:-1]))
+    except Exception:
+        pass
+    return None
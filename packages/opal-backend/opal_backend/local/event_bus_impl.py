@@ -3,8 +3,32 @@
 
 """In-memory EventBus implementation for the dev and fake servers.
 
-Uses ``asyncio.Queue`` per subscriber — the same mechanism that the
-old ``Subscribers`` class used, now behind the ``EventBus`` protocol.
+Each subscriber has its own bounded queue. ``publish()`` never waits on
+a subscriber: it appends to every queue synchronously, so one stalled
+browser tab can neither slow the graph down nor grow memory without
+limit.
+
+Each published event is wrapped once in a ``PublishedEvent`` that all
+subscriber queues share, so its JSON encoding is computed at most once
+however many SSE streams forward it.
+
+When a subscriber already has ``max_pending`` events queued, the bus's
+overflow policy decides what happens to the next one:
+
+- ``"disconnect"`` (default) — end the subscription with ``overflowed``
+  set. SSE clients reconnect and replay the rest from the event log.
+- ``"drop_oldest"`` — discard the oldest queued event.
+- ``"coalesce"`` — the new event takes the place of the queued event
+  with the same ``coalesce_key`` (by default the event ``type`` and
+  ``nodeId``), so a slow subscriber sees only the latest of a run of
+  similar events; when none matches, drop the oldest.
+
+Dropped events that carry a log index are not lost to SSE clients:
+``sse_stream.stream_events`` notices the gap in indexes and fills it
+from the event log.
+
+``metrics()`` reports queue depth, lag and overflow counters per
+session.
 
 Since asyncio is single-threaded, there are no race conditions. The
 production implementation would use a pub/sub system for cross-server
@@ -14,85 +38,264 @@ delivery.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, AsyncIterator
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Hashable, Literal
+
+from ..event_bus import EventSubscription, PublishedEvent
+
+__all__ = ["EventBusMetrics", "InMemoryEventBus", "OverflowPolicy"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 1024
+
+OverflowPolicy = Literal["disconnect", "drop_oldest", "coalesce"]
 
-from ..event_bus import EventBus
 
-__all__ = ["InMemoryEventBus"]
+def _default_coalesce_key(event: dict[str, Any]) -> Hashable:
+    return event.get("type"), event.get("nodeId")
+
+
+@dataclass(frozen=True)
+class EventBusMetrics:
+    """Point-in-time gauges and counters for one session's subscribers.
+
+    ``max_lag`` is how many indexed events the furthest-behind subscriber
+    has yet to consume.
+    """
+
+    subscribers: int
+    queue_depth: int
+    max_queue_depth: int
+    max_lag: int
+    published: int
+    dropped: int
+    coalesced: int
+    disconnected: int
+
+
+class _SessionCounters:
+    __slots__ = ("published", "dropped", "coalesced", "disconnected")
+
+    def __init__(self) -> None:
+        self.published = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.disconnected = 0
 
 
 class InMemoryEventBus:
-    """EventBus backed by asyncio.Queue — single-process only.
+    """EventBus backed by per-subscriber queues — single-process only.
 
     Each call to ``subscribe()`` creates a new queue. ``publish()``
-    fans out to all queues. ``close()`` sends a ``None`` sentinel
-    and removes all queues for the session.
+    fans out to all queues without blocking. ``close()`` ends every
+    subscription for the session.
 
     Satisfies the ``EventBus`` protocol.
+
+    Args:
+        max_pending: Events a subscriber may have queued before the
+            overflow policy applies.
+        overflow: What to do with a full queue; see the module docstring.
+        coalesce_key: For the ``"coalesce"`` policy, maps an event to
+            the key under which later events supersede it.
     """
 
-    def __init__(self) -> None:
-        self._queues: dict[str, list[asyncio.Queue]] = {}
+    def __init__(
+        self,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        overflow: OverflowPolicy = "disconnect",
+        coalesce_key: Callable[[dict[str, Any]], Hashable] = (
+            _default_coalesce_key
+        ),
+    ) -> None:
+        if overflow not in ("disconnect", "drop_oldest", "coalesce"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self._max_pending = max_pending
+        self._overflow = overflow
+        self._coalesce_key = coalesce_key
+        self._subscriptions: dict[str, list[_Subscription]] = {}
+        # session_id → index of the latest indexed event published.
+        self._positions: dict[str, int] = {}
+        self._counters: dict[str, _SessionCounters] = {}
 
     def subscribe(
         self, session_id: str,
-    ) -> AsyncIterator[dict[str, Any] | None]:
+    ) -> _Subscription:
         """Create and register a subscriber for a session.
 
-        Returns an async iterator backed by an asyncio.Queue. The
-        iterator yields event dicts until a ``None`` sentinel arrives.
+        Returns an async iterator that yields event dicts until the
+        session is closed.
         """
-        queue: asyncio.Queue = asyncio.Queue()
-        self._queues.setdefault(session_id, []).append(queue)
-        return _QueueIterator(queue, self, session_id)
+        subscription = _Subscription(self._positions.get(session_id, -1))
+        self._subscriptions.setdefault(session_id, []).append(subscription)
+        return subscription
 
     async def publish(
         self, session_id: str, event: dict[str, Any],
+        *,
+        index: int | None = None,
     ) -> None:
-        """Push an event dict to all subscriber queues."""
-        for queue in self._queues.get(session_id, []):
-            await queue.put(event)
+        """Append an event to every subscriber queue. Never blocks."""
+        if index is not None:
+            self._positions[session_id] = max(
+                index, self._positions.get(session_id, -1),
+            )
+        counters = self._counters.get(session_id)
+        if counters is None:
+            counters = self._counters[session_id] = _SessionCounters()
+        counters.published += 1
+        subscriptions = self._subscriptions.get(session_id)
+        if not subscriptions:
+            return
+        published = PublishedEvent(event, index)
+        key = (
+            self._coalesce_key(event) if self._overflow == "coalesce"
+            else None
+        )
+        for subscription in list(subscriptions):
+            if len(subscription._pending) < self._max_pending:
+                subscription._put(published, key)
+            elif self._overflow == "disconnect":
+                logger.warning(
+                    "Disconnecting slow subscriber of %s "
+                    "(%d events pending)",
+                    session_id,
+                    self._max_pending,
+                )
+                subscriptions.remove(subscription)
+                subscription._disconnect()
+                counters.disconnected += 1
+            elif subscription._replace(published, key):
+                counters.coalesced += 1
+            else:
+                subscription._pop()
+                subscription._put(published, key)
+                counters.dropped += 1
 
     async def close(self, session_id: str) -> None:
-        """Send sentinel to all subscribers and clean up."""
-        for queue in self._queues.get(session_id, []):
-            await queue.put(None)
-        self._queues.pop(session_id, None)
+        """End every subscription for the session and clean up."""
+        for subscription in self._subscriptions.pop(session_id, []):
+            subscription._close()
+        self._positions.pop(session_id, None)
+        self._counters.pop(session_id, None)
 
     def unsubscribe(
         self, session_id: str,
-        subscription: AsyncIterator[dict[str, Any] | None],
+        subscription: EventSubscription,
     ) -> None:
         """Remove a subscription's underlying queue."""
-        if not isinstance(subscription, _QueueIterator):
-            return
-        queues = self._queues.get(session_id, [])
-        if subscription._queue in queues:
-            queues.remove(subscription._queue)
+        subscriptions = self._subscriptions.get(session_id, [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+
+    def metrics(self) -> dict[str, EventBusMetrics]:
+        """Gauges and counters for every session with open subscribers
+        or published events."""
+        result: dict[str, EventBusMetrics] = {}
+        for session_id in self._subscriptions.keys() | self._counters.keys():
+            subscriptions = self._subscriptions.get(session_id, [])
+            counters = self._counters.get(session_id) or _SessionCounters()
+            position = self._positions.get(session_id, -1)
+            depths = [len(s._pending) for s in subscriptions]
+            result[session_id] = EventBusMetrics(
+                subscribers=len(subscriptions),
+                queue_depth=sum(depths),
+                max_queue_depth=max(depths, default=0),
+                max_lag=max(
+                    (position - s.consumed for s in subscriptions),
+                    default=0,
+                ),
+                published=counters.published,
+                dropped=counters.dropped,
+                coalesced=counters.coalesced,
+                disconnected=counters.disconnected,
+            )
+        return result
 
 
-class _QueueIterator:
-    """Async iterator wrapper around an asyncio.Queue.
+class _Subscription:
+    """Async iterator over one subscriber's queue.
 
-    Yields event dicts until a ``None`` sentinel is received, then
-    stops iteration.
+    Yields event dicts until the session is closed; ``published()``
+    yields the queued ``PublishedEvent`` records instead.
     """
 
-    def __init__(
-        self,
-        queue: asyncio.Queue,
-        bus: InMemoryEventBus,
-        session_id: str,
-    ) -> None:
-        self._queue = queue
-        self._bus = bus
-        self._session_id = session_id
+    def __init__(self, position: int) -> None:
+        # (event, coalesce key) pairs; the key is None unless coalescing.
+        self._pending: deque[tuple[PublishedEvent, Hashable]] = deque()
+        # Coalesce key → sequence number of its pending event. Sequence
+        # numbers count every event ever queued; _head is that of
+        # _pending[0].
+        self._keyed: dict[Hashable, int] = {}
+        self._head = 0
+        self._waiter: asyncio.Future[None] | None = None
+        self._closed = False
+        self.position = position
+        # Log index of the latest indexed event handed to the consumer.
+        self.consumed = position
+        self.overflowed = False
 
-    def __aiter__(self) -> AsyncIterator[dict[str, Any] | None]:
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
         return self
 
-    async def __anext__(self) -> dict[str, Any] | None:
-        item = await self._queue.get()
+    async def __anext__(self) -> dict[str, Any]:
+        item = await self._get()
         if item is None:
             raise StopAsyncIteration
+        return item.event
+
+    async def published(self) -> AsyncIterator[PublishedEvent]:
+        while (item := await self._get()) is not None:
+            yield item
+
+    async def _get(self) -> PublishedEvent | None:
+        while not self._pending:
+            if self._closed:
+                return None
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        item = self._pop()
+        if item.index is not None:
+            self.consumed = item.index
+        return item
+
+    def _pop(self) -> PublishedEvent:
+        item, key = self._pending.popleft()
+        if key is not None and self._keyed.get(key) == self._head:
+            del self._keyed[key]
+        self._head += 1
         return item
+
+    def _put(self, published: PublishedEvent, key: Hashable) -> None:
+        if key is not None:
+            self._keyed[key] = self._head + len(self._pending)
+        self._pending.append((published, key))
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _replace(self, published: PublishedEvent, key: Hashable) -> bool:
+        """Put ``published`` in place of the pending event with its key."""
+        seq = self._keyed.get(key) if key is not None else None
+        if seq is None:
+            return False
+        self._pending[seq - self._head] = (published, key)
+        return True
+
+    def _close(self) -> None:
+        self._closed = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _disconnect(self) -> None:
+        # Drop the backlog; the consumer replays it from the event log.
+        self.overflowed = True
+        self._pending.clear()
+        self._keyed.clear()
+        self._close()
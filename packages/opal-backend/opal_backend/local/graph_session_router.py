@@ -10,6 +10,11 @@ provides the HTTP endpoints for graph execution:
     GET  /v1beta1/graphSessions/{id}   → SSE stream (replay + live)
     GET  /v1beta1/graphSessions/{id}/status → lightweight status
     POST /v1beta1/graphSessions/{id}:cancel → cancel running tasks
+
+Every endpoint for an existing session that carries the user's token
+(``accessToken`` in the body, or an ``Authorization: Bearer`` header)
+hands it to ``GraphRunner.authorize``, which is what restarts nodes held
+by crash recovery.
 """
 
 from __future__ import annotations
@@ -29,10 +34,21 @@ from ..graph_runner import GraphRunner
 from ..graph_session_store import GraphSessionStore
 from ..graph_types import GraphDescriptor
 from ..task_scheduler import TaskScheduler
+from . import sse_stream
 
 __all__ = ["create_graph_session_router"]
 
 
+def _access_token(request: Request, body: dict[str, Any] | None = None) -> str:
+    """The user's token from the body, else the Authorization header."""
+    if body and body.get("accessToken"):
+        return body["accessToken"]
+    auth_header = request.headers.get("authorization", "")
+    if auth_header.startswith("Bearer "):
+        return auth_header[len("Bearer "):]
+    return ""
+
+
 def create_graph_session_router(
     *,
     store: GraphSessionStore,
@@ -134,53 +150,37 @@ def create_graph_session_router(
 
         Query params:
             after: Only return events with index > this value.
-                   Default -1 means all events.
+                   Default -1 means all events. A ``Last-Event-ID``
+                   header from a reconnecting client also counts.
         """
         status = await store.get_status(session_id)
         if status is None:
             return JSONResponse(
                 {"error": "Graph session not found"}, status_code=404,
             )
+        await runner.authorize(
+            session_id,
+            access_token=_access_token(request),
+            origin=request.headers.get("origin", ""),
+        )
 
-        async def event_generator():
-            yield {
-                "event": "start",
-                "data": json.dumps({"sessionId": session_id}),
-            }
-
-            # Phase 1: replay stored events.
-            events = await store.get_events(session_id, after=after)
-            next_index = after + 1
-            for i, event in enumerate(events):
-                idx = next_index + i
-                yield {
-                    "event": "event",
-                    "id": str(idx),
-                    "data": json.dumps({**event, "index": idx}),
-                }
-            next_index += len(events)
-
-            # Phase 2: subscribe for live events if still running.
-            current_status = await store.get_status(session_id)
-            if current_status in ("running", "suspended"):
-                subscription = event_bus.subscribe(session_id)
-                try:
-                    async for item in subscription:
-                        yield {
-                            "event": "event",
-                            "id": str(next_index),
-                            "data": json.dumps(
-                                {**item, "index": next_index},
-                            ),
-                        }
-                        next_index += 1
-                finally:
-                    event_bus.unsubscribe(session_id, subscription)
-
-            yield {"event": "done", "data": "{}"}
+        async def replay(after: int):
+            for event in await store.get_events(session_id, after=after):
+                yield event["index"], json.dumps(event).encode()
+
+        async def is_live() -> bool:
+            return await store.get_status(session_id) in (
+                "running", "suspended",
+            )
 
         return EventSourceResponse(
-            content=event_generator(),
+            content=sse_stream.stream_events(
+                session_id=session_id,
+                event_bus=event_bus,
+                after=sse_stream.resume_index(request, after),
+                replay=replay,
+                is_live=is_live,
+            ),
             media_type="text/event-stream",
         )
 
@@ -204,6 +204,7 @@ def create_graph_session_router(
             )
 
         await scheduler.cancel(session_id)
+        runner.forget(session_id)
         await store.set_status(session_id, "cancelled")
         await event_bus.publish(session_id, {
             "type": "graphCancelled", "sessionId": session_id,
@@ -220,7 +221,7 @@ def create_graph_session_router(
     ) -> JSONResponse:
         """Resume a suspended node after user input.
 
-        Body: {interactionId: str, response: dict}
+        Body: {interactionId: str, response: dict, accessToken?: str}
         """
         status = await store.get_status(session_id)
         if status is None:
@@ -237,6 +238,11 @@ def create_graph_session_router(
             )
 
         response = body.get("response", {})
+        await runner.authorize(
+            session_id,
+            access_token=_access_token(request, body),
+            origin=request.headers.get("origin", ""),
+        )
 
         try:
             await runner.resume_node(
@@ -5,6 +5,10 @@
 
 Stores all graph execution state in plain Python dicts. Single-process,
 no concurrency hazards (asyncio cooperative multitasking = no races).
+
+The plan is compiled into a ``PlanIndex`` at ``create()``, and the set of
+ready nodes is kept up to date as nodes change state, so node operations
+cost O(edges of the node) rather than O(nodes in the plan).
 """
 
 from __future__ import annotations
@@ -12,6 +16,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..graph_plan import PlanIndex
 from ..graph_types import GraphPlan
 from ..graph_session_store import SuspendedNodeState
 
@@ -33,7 +38,10 @@ class _SessionState:
     """All state for a single graph session."""
 
     plan: GraphPlan
+    index: PlanIndex
     nodes: dict[str, _NodeState] = field(default_factory=dict)
+    # Node ids whose status is "ready".
+    ready: set[str] = field(default_factory=set)
     events: list[dict[str, Any]] = field(default_factory=list)
     status: str = "running"
     suspended: dict[str, SuspendedNodeState] = field(default_factory=dict)
@@ -46,8 +54,9 @@ class _SessionState:
 class InMemoryGraphSessionStore:
     """Dict-backed implementation of GraphSessionStore.
 
-    Suitable for dev / fake server use. All operations are O(nodes)
-    at worst. No external dependencies.
+    Suitable for dev / fake server use. Node operations are O(edges of
+    the node); ``mark_node_failed`` is O(edges of the nodes it skips).
+    No external dependencies.
     """
 
     def __init__(self) -> None:
@@ -61,18 +70,19 @@ class InMemoryGraphSessionStore:
         headless_inputs: dict[str, Any] | None = None,
     ) -> None:
         """Store plan with initial dependency counts."""
-        state = _SessionState(plan=plan, headless_inputs=headless_inputs)
+        index = PlanIndex.from_plan(plan)
+        state = _SessionState(
+            plan=plan, index=index, headless_inputs=headless_inputs,
+        )
 
-        # Compute per-node pending dep counts from plan stages.
-        for stage in plan.stages:
-            for info in stage:
-                ns = _NodeState(
-                    pending_deps=len(info.upstream),
-                )
-                # Entry nodes (no upstream) are immediately ready.
-                if ns.pending_deps == 0:
-                    ns.status = "ready"
-                state.nodes[info.node.id] = ns
+        # Compute per-node pending dep counts from the upstream edges.
+        for node_id, upstream in index.upstream.items():
+            ns = _NodeState(pending_deps=len(upstream))
+            # Entry nodes (no upstream) are immediately ready.
+            if ns.pending_deps == 0:
+                ns.status = "ready"
+                state.ready.add(node_id)
+            state.nodes[node_id] = ns
 
         self._sessions[session_id] = state
 
@@ -85,6 +95,14 @@ class InMemoryGraphSessionStore:
 
     # ── Node Lifecycle ──
 
+    async def start_node(
+        self, session_id: str, node_id: str,
+    ) -> None:
+        """Mark a ready node as running."""
+        state = self._sessions[session_id]
+        state.nodes[node_id].status = "running"
+        state.ready.discard(node_id)
+
     async def complete_node(
         self, session_id: str, node_id: str, outputs: dict[str, Any],
     ) -> list[str]:
@@ -93,22 +111,19 @@ class InMemoryGraphSessionStore:
         ns = state.nodes[node_id]
         ns.outputs = outputs
         ns.status = "completed"
+        state.ready.discard(node_id)
 
-        # Find downstream nodes from plan and decrement.
+        # Decrement downstream dep counts.
         newly_ready: list[str] = []
-        for stage in state.plan.stages:
-            for info in stage:
-                if info.node.id != node_id:
-                    continue
-                for edge in info.downstream:
-                    target_id = edge.to_node
-                    target_ns = state.nodes.get(target_id)
-                    if target_ns and target_ns.pending_deps > 0:
-                        target_ns.pending_deps -= 1
-                        if target_ns.pending_deps == 0:
-                            target_ns.status = "ready"
-                            newly_ready.append(target_id)
-                break  # Node only appears once in the plan.
+        for edge in state.index.downstream.get(node_id, ()):
+            target_id = edge.to_node
+            target_ns = state.nodes.get(target_id)
+            if target_ns and target_ns.pending_deps > 0:
+                target_ns.pending_deps -= 1
+                if target_ns.pending_deps == 0:
+                    target_ns.status = "ready"
+                    state.ready.add(target_id)
+                    newly_ready.append(target_id)
 
         return newly_ready
 
@@ -119,21 +134,15 @@ class InMemoryGraphSessionStore:
         state = self._sessions[session_id]
         inputs: dict[str, list[Any]] = {}
 
-        # Walk the plan to find upstream edges for this node.
-        for stage in state.plan.stages:
-            for info in stage:
-                if info.node.id != node_id:
-                    continue
-                for edge in info.upstream:
-                    upstream_ns = state.nodes.get(edge.from_node)
-                    if not upstream_ns or upstream_ns.outputs is None:
-                        continue
-                    in_port = edge.in_port or "input"
-                    out_port = edge.out_port or "output"
-                    value = upstream_ns.outputs.get(out_port)
-                    if value is not None:
-                        inputs.setdefault(in_port, []).append(value)
-                return inputs
+        for edge in state.index.upstream.get(node_id, ()):
+            upstream_ns = state.nodes.get(edge.from_node)
+            if not upstream_ns or upstream_ns.outputs is None:
+                continue
+            in_port = edge.in_port or "input"
+            out_port = edge.out_port or "output"
+            value = upstream_ns.outputs.get(out_port)
+            if value is not None:
+                inputs.setdefault(in_port, []).append(value)
 
         return inputs
 
@@ -142,11 +151,10 @@ class InMemoryGraphSessionStore:
     ) -> dict[str, Any]:
         """Load node configuration from the stored plan."""
         state = self._sessions[session_id]
-        for stage in state.plan.stages:
-            for info in stage:
-                if info.node.id == node_id:
-                    return info.node.configuration or {}
-        return {}
+        info = state.index.nodes.get(node_id)
+        if info is None:
+            return {}
+        return info.node.configuration or {}
 
     # ── Headless Inputs ──
 
@@ -179,6 +187,7 @@ class InMemoryGraphSessionStore:
         state = self._sessions[session_id]
         ns = state.nodes[node_id]
         ns.status = "suspended"
+        state.ready.discard(node_id)
         state.suspended[node_id] = suspended_state
         state.interaction_index[interaction_id] = node_id
 
@@ -232,57 +241,49 @@ class InMemoryGraphSessionStore:
         ns = state.nodes[node_id]
         ns.status = "failed"
         ns.error = error
+        state.ready.discard(node_id)
 
         # Find and skip downstream dependents that have no other path.
-        skipped: list[str] = []
         to_skip = [node_id]
         while to_skip:
             current = to_skip.pop()
-            for stage in state.plan.stages:
-                for info in stage:
-                    if info.node.id != current:
-                        continue
-                    for edge in info.downstream:
-                        target_id = edge.to_node
-                        target_ns = state.nodes.get(target_id)
-                        if not target_ns:
-                            continue
-                        if target_ns.status in ("completed", "failed", "skipped"):
-                            continue
-                        # Check if target has any OTHER completed upstream.
-                        has_alt = self._has_alternative_path(
-                            state, target_id, node_id,
-                        )
-                        if not has_alt:
-                            target_ns.status = "skipped"
-                            skipped.append(target_id)
-                            to_skip.append(target_id)
+            for edge in state.index.downstream.get(current, ()):
+                target_id = edge.to_node
+                target_ns = state.nodes.get(target_id)
+                if not target_ns:
+                    continue
+                if target_ns.status in ("completed", "failed", "skipped"):
+                    continue
+                # Check if target has any OTHER completed upstream.
+                has_alt = self._has_alternative_path(
+                    state, target_id, node_id,
+                )
+                if not has_alt:
+                    target_ns.status = "skipped"
+                    state.ready.discard(target_id)
+                    to_skip.append(target_id)
 
         # Return any nodes that are now newly ready (from other paths).
-        newly_ready: list[str] = []
-        for nid, nstate in state.nodes.items():
-            if nstate.status == "ready" and nid not in skipped:
-                newly_ready.append(nid)
-
-        return newly_ready
+        return sorted(state.ready, key=state.index.order.__getitem__)
 
     def _has_alternative_path(
         self, state: _SessionState, target_id: str, failed_id: str,
     ) -> bool:
         """Check if target has any completed upstream other than failed_id."""
-        for stage in state.plan.stages:
-            for info in stage:
-                if info.node.id != target_id:
-                    continue
-                for edge in info.upstream:
-                    if edge.from_node == failed_id:
-                        continue
-                    upstream_ns = state.nodes.get(edge.from_node)
-                    if upstream_ns and upstream_ns.status == "completed":
-                        return True
-                return False
+        for edge in state.index.upstream.get(target_id, ()):
+            if edge.from_node == failed_id:
+                continue
+            upstream_ns = state.nodes.get(edge.from_node)
+            if upstream_ns and upstream_ns.status == "completed":
+                return True
         return False
 
+    async def list_interrupted_nodes(
+        self,
+    ) -> list[tuple[str, str]]:
+        """Always empty: nothing here outlives the process."""
+        return []
+
     # ── Event Log ──
 
     async def append_event(
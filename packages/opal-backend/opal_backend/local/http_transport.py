@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Shared HTTP transport for ``HttpBackendClient``.
+
+One ``httpx.AsyncClient`` per upstream origin (One Platform, Gemini),
+created on first use and shared by every backend client in the process,
+so concurrent sessions reuse warm keep-alive connections instead of each
+opening its own. Clients speak HTTP/2 when the ``h2`` package is
+installed (``httpx[http2]``, part of the ``local`` extra); many
+concurrent Gemini streams are then multiplexed over a few connections.
+Without it they fall back to HTTP/1.1 keep-alive.
+
+Timeouts are set per endpoint (``ENDPOINT_TIMEOUTS``) rather than per
+client: ``executeStep`` may block for minutes on media generation, a
+stream's read timeout bounds the gap between chunks, and cache calls
+should fail fast.
+
+``iter_sse_data`` decodes an SSE body incrementally from raw bytes,
+yielding each event's ``data`` payload as soon as its blank line
+arrives.
+
+The clients belong to the event loop they were created on. When
+``get_http_client`` is called from a different loop (e.g. successive
+``asyncio.run`` calls, or a test harness that starts a fresh loop), the
+old clients are dropped rather than reused, and new ones are created on
+the current loop. Call ``aclose_http_clients()`` at shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+
+__all__ = [
+    "ENDPOINT_TIMEOUTS",
+    "HTTP2_AVAILABLE",
+    "POOL_LIMITS",
+    "aclose_http_clients",
+    "get_http_client",
+    "iter_sse_data",
+]
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=256,
+    max_keepalive_connections=64,
+    keepalive_expiry=60.0,
+)
+
+_CONNECT_S = 10.0
+
+ENDPOINT_TIMEOUTS: dict[str, httpx.Timeout] = {
+    # Media generation runs inside the request.
+    "execute_step": httpx.Timeout(300.0, connect=_CONNECT_S),
+    "upload": httpx.Timeout(120.0, connect=_CONNECT_S),
+    # For streams, "read" is the longest allowed gap between chunks.
+    "stream": httpx.Timeout(120.0, connect=_CONNECT_S),
+    "cached_content": httpx.Timeout(30.0, connect=_CONNECT_S),
+}
+
+_clients: dict[str, httpx.AsyncClient] = {}
+# The loop ``_clients`` were created on.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Return the shared client for ``url``'s origin, creating it once."""
+    global _loop
+    loop = asyncio.get_running_loop()
+    if loop is not _loop:
+        # A client's connections are bound to the loop that opened them;
+        # the old loop may be closed, so its clients can't be reused.
+        _loop = loop
+        _clients.clear()
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    client = _clients.get(origin)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
+            timeout=httpx.Timeout(60.0, connect=_CONNECT_S),
+        )
+        _clients[origin] = client
+        logger.debug(
+            "HTTP pool for %s (%s)",
+            origin,
+            "HTTP/2" if HTTP2_AVAILABLE else "HTTP/1.1",
+        )
+    return client
+
+
+async def aclose_http_clients() -> None:
+    """Close every shared client.
+
+    Clients created on another event loop are dropped without closing.
+    """
+    global _loop
+    clients = list(_clients.values())
+    _clients.clear()
+    owned = _loop is asyncio.get_running_loop()
+    _loop = None
+    if not owned:
+        return
+    for client in clients:
+        await client.aclose()
+
+
+async def iter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield the ``data`` of each SSE event in a byte stream.
+
+    Splits lines on LF (dropping a trailing CR) across chunk boundaries,
+    joins multi-line ``data`` fields with LF as the SSE spec does, and
+    ignores other fields and comments. Events without data are skipped.
+    """
+    buffer = b""
+    data: list[bytes] = []
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                if data:
+                    yield b"\n".join(data)
+                    data = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                data.append(value[1:] if value.startswith(b" ") else value)
+        buffer = buffer[start:]
+    if buffer.startswith(b"data:"):
+        value = buffer[5:].rstrip(b"\r")
+        data.append(value[1:] if value.startswith(b" ") else value)
+    if data:
+        yield b"\n".join(data)
@@ -30,6 +30,7 @@ from ..sessions.api import (
     resume_session, start_session, update_context,
 )
 from ..sessions.store import SessionStatus, SessionStore
+from . import sse_stream
 
 __all__ = ["create_session_router"]
 
@@ -134,9 +135,9 @@ def create_session_router(
     ) -> EventSourceResponse:
         """SSE event stream: replay stored events, then stream live.
 
-        Clients can reconnect at any time with ``?after=N`` to resume
-        from event N. If the session is still running, the stream stays
-        open for live events.
+        Clients can reconnect at any time with ``?after=N`` (or a
+        ``Last-Event-ID`` header) to resume after event N. If the
+        session is still running, the stream stays open for live events.
         """
         status = await store.get_status(session_id)
         if status is None:
@@ -144,42 +145,26 @@ def create_session_router(
                 {"error": "Session not found"}, status_code=404,
             )
 
-        async def event_generator():
-            yield {"event": "start", "data": json.dumps({"sessionId": session_id})}
-
-            # Phase 1: replay stored events.
-            events = await store.get_events(session_id, after=after)
-            next_index = after + 1
-            for i, event in enumerate(events):
-                yield {
-                    "event": "event",
-                    "id": str(next_index + i),
-                    "data": json.dumps(event),
-                }
-            next_index += len(events)
-
-            # Only subscribe for live events when a real loop is running.
+        async def replay(after: int):
+            index = after + 1
+            async for event in store.iter_events(session_id, after=after):
+                yield index, json.dumps(event).encode()
+                index += 1
+
+        async def is_live() -> bool:
+            # Only stream live events when a real loop is running.
             # In stub mode (deps is None), no background task exists.
-            current_status = await store.get_status(session_id)
-            if (
-                deps is not None
-                and current_status in (SessionStatus.RUNNING, SessionStatus.SUSPENDED)
-            ):
-                subscription = event_bus.subscribe(session_id)
-                try:
-                    async for item in subscription:
-                        yield {
-                            "event": "event",
-                            "id": str(next_index),
-                            "data": json.dumps(item),
-                        }
-                        next_index += 1
-                finally:
-                    event_bus.unsubscribe(session_id, subscription)
-
-            yield {"event": "done", "data": "{}"}
-
-        return EventSourceResponse(event_generator())
+            return deps is not None and await store.get_status(session_id) in (
+                SessionStatus.RUNNING, SessionStatus.SUSPENDED,
+            )
+
+        return EventSourceResponse(sse_stream.stream_events(
+            session_id=session_id,
+            event_bus=event_bus,
+            after=sse_stream.resume_index(request, after),
+            replay=replay,
+            is_live=is_live,
+        ))
 
     @router.post("/{session_id}:resume")
     async def resume_session_endpoint(
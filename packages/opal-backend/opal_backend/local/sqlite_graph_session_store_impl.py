@@ -0,0 +1,595 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""SqliteGraphSessionStore — SQLite-backed GraphSessionStore for dev server.
+
+Keeps graph execution state in a single SQLite file, so running graph
+sessions, their event logs and suspended nodes survive a restart of the
+server, and event logs live on disk rather than in RAM.
+
+- The plan is stored as JSON and compiled into a ``PlanIndex`` on first
+  use; plans never change after ``create()``.
+- Node state changes are checkpointed in one transaction per call:
+  ``complete_node`` writes the outputs, the node status and the
+  downstream dependency counts together, so a crash leaves either all
+  of them or none.
+- The event log is an append-only table.
+
+After a restart, ``GraphRunner.recover()`` holds the nodes that were
+ready or running (``list_interrupted_nodes``) until their session is
+authorized again.
+
+All database work runs on one dedicated thread, which keeps the event
+loop free and serializes the transactions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from ..graph_plan import PlanIndex
+from ..graph_session_store import SuspendedNodeState
+from ..graph_types import GraphPlan
+
+__all__ = ["SqliteGraphSessionStore"]
+
+_T = TypeVar("_T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    plan TEXT NOT NULL,
+    status TEXT NOT NULL,
+    headless_inputs TEXT
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    session_id TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    pending_deps INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    outputs TEXT,
+    error TEXT,
+    PRIMARY KEY (session_id, node_id)
+);
+CREATE INDEX IF NOT EXISTS nodes_by_status ON nodes (session_id, status);
+CREATE TABLE IF NOT EXISTS suspended (
+    session_id TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    interaction_id TEXT NOT NULL,
+    context TEXT NOT NULL,
+    PRIMARY KEY (session_id, node_id)
+);
+CREATE TABLE IF NOT EXISTS interactions (
+    session_id TEXT NOT NULL,
+    interaction_id TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    PRIMARY KEY (session_id, interaction_id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    session_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (session_id, idx)
+);
+"""
+
+_TERMINAL = ("completed", "failed", "skipped")
+
+
+class SqliteGraphSessionStore:
+    """SQLite implementation of GraphSessionStore.
+
+    Args:
+        path: Database file. Created (with its tables) if missing.
+        synchronous: SQLite ``synchronous`` pragma. ``NORMAL`` survives
+            a crash of the process; ``FULL`` also survives power loss,
+            at the cost of an fsync per transaction.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        self._conn = sqlite3.connect(
+            os.fspath(path), isolation_level=None, check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="graph-session-store",
+        )
+        # session_id → (plan, index). Filled on the store thread; plans
+        # are immutable, so the loop thread reads hits without a hop.
+        self._plans: dict[str, tuple[GraphPlan, PlanIndex]] = {}
+
+    def close(self) -> None:
+        """Wait for pending work and close the database."""
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+    # ── Plan Storage ──
+
+    async def create(
+        self, session_id: str, plan: GraphPlan,
+        *,
+        headless_inputs: dict[str, Any] | None = None,
+    ) -> None:
+        """Store plan with initial dependency counts."""
+        await self._run(self._create, session_id, plan, headless_inputs)
+
+    async def get_plan(
+        self, session_id: str,
+    ) -> GraphPlan | None:
+        """Load the stored plan."""
+        loaded = await self._plan(session_id)
+        return loaded[0] if loaded else None
+
+    # ── Node Lifecycle ──
+
+    async def start_node(
+        self, session_id: str, node_id: str,
+    ) -> None:
+        """Mark a ready node as running."""
+        await self._run(
+            self._set_node_status, session_id, node_id, "running",
+        )
+
+    async def complete_node(
+        self, session_id: str, node_id: str, outputs: dict[str, Any],
+    ) -> list[str]:
+        """Mark node complete, decrement downstream deps, return newly-ready."""
+        return await self._run(
+            self._complete_node, session_id, node_id, json.dumps(outputs),
+        )
+
+    async def get_node_inputs(
+        self, session_id: str, node_id: str,
+    ) -> dict[str, list[Any]]:
+        """Gather upstream outputs connected to this node's input ports."""
+        return await self._run(self._get_node_inputs, session_id, node_id)
+
+    async def get_node_config(
+        self, session_id: str, node_id: str,
+    ) -> dict[str, Any]:
+        """Load node configuration from the stored plan."""
+        loaded = await self._plan(session_id)
+        info = loaded[1].nodes.get(node_id) if loaded else None
+        if info is None:
+            return {}
+        return info.node.configuration or {}
+
+    # ── Headless Inputs ──
+
+    async def get_headless_input(
+        self, session_id: str, node_id: str,
+    ) -> Any | None:
+        """Look up a pre-supplied input for headless mode."""
+        inputs = await self._run(self._headless_inputs, session_id)
+        if inputs is None:
+            return None
+        return inputs.get(node_id)
+
+    async def is_headless_session(
+        self, session_id: str,
+    ) -> bool:
+        """Return True if the session was created in headless mode."""
+        return await self._run(self._headless_inputs, session_id) is not None
+
+    # ── Suspend / Resume ──
+
+    async def suspend_node(
+        self, session_id: str, node_id: str,
+        interaction_id: str,
+        suspended_state: SuspendedNodeState,
+    ) -> None:
+        """Save suspended node state."""
+        await self._run(
+            self._suspend_node, session_id, node_id, interaction_id,
+            json.dumps(suspended_state.context),
+        )
+
+    async def load_suspended_node(
+        self, session_id: str, interaction_id: str,
+    ) -> tuple[str, SuspendedNodeState] | None:
+        """Load suspended node by interaction ID."""
+        return await self._run(
+            self._load_suspended_node, session_id, interaction_id,
+        )
+
+    # ── Graph Lifecycle ──
+
+    async def is_graph_complete(
+        self, session_id: str,
+    ) -> bool:
+        """True when all nodes are in a terminal state."""
+        return await self._run(self._is_graph_complete, session_id)
+
+    async def get_graph_outputs(
+        self, session_id: str,
+    ) -> dict[str, Any]:
+        """Load outputs from all completed nodes."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT node_id, outputs FROM nodes WHERE session_id = ? "
+            "AND outputs IS NOT NULL ORDER BY position",
+            (session_id,),
+        )
+        return {node_id: json.loads(outputs) for node_id, outputs in rows}
+
+    async def mark_node_failed(
+        self, session_id: str, node_id: str, error: str,
+    ) -> list[str]:
+        """Mark node failed, skip dependents without alternative paths."""
+        return await self._run(
+            self._mark_node_failed, session_id, node_id, error,
+        )
+
+    async def list_interrupted_nodes(
+        self,
+    ) -> list[tuple[str, str]]:
+        """Ready or running nodes of sessions that have not finished."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT n.session_id, n.node_id FROM nodes n "
+            "JOIN sessions s ON s.session_id = n.session_id "
+            "WHERE s.status IN ('running', 'suspended') "
+            "AND n.status IN ('ready', 'running') "
+            "ORDER BY n.session_id, n.position",
+            (),
+        )
+        return [(session_id, node_id) for session_id, node_id in rows]
+
+    # ── Event Log ──
+
+    async def append_event(
+        self, session_id: str, event: dict[str, Any],
+    ) -> int:
+        """Append event to session log. Returns event index."""
+        return await self._run(
+            self._append_event, session_id, json.dumps(event),
+        )
+
+    async def get_events(
+        self, session_id: str, *, after: int = -1,
+    ) -> list[dict[str, Any]]:
+        """Return events with index > after."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT idx, body FROM events WHERE session_id = ? AND idx > ? "
+            "ORDER BY idx",
+            (session_id, after),
+        )
+        return [{**json.loads(body), "index": idx} for idx, body in rows]
+
+    # ── Status ──
+
+    async def get_status(
+        self, session_id: str,
+    ) -> str | None:
+        """Return session status."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT status FROM sessions WHERE session_id = ?",
+            (session_id,),
+        )
+        return rows[0][0] if rows else None
+
+    async def set_status(
+        self, session_id: str, status: str,
+    ) -> None:
+        """Set session status."""
+        await self._run(
+            self._execute,
+            "UPDATE sessions SET status = ? WHERE session_id = ?",
+            (status, session_id),
+        )
+
+    # -------------------------------------------------------------------
+    # Store thread
+    # -------------------------------------------------------------------
+
+    async def _run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def _plan(
+        self, session_id: str,
+    ) -> tuple[GraphPlan, PlanIndex] | None:
+        loaded = self._plans.get(session_id)
+        if loaded is None:
+            loaded = await self._run(self._load_plan, session_id)
+        return loaded
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _fetchall(self, sql: str, params: tuple[Any, ...]) -> list[Any]:
+        return self._conn.execute(sql, params).fetchall()
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> None:
+        self._conn.execute(sql, params)
+
+    def _create(
+        self,
+        session_id: str,
+        plan: GraphPlan,
+        headless_inputs: dict[str, Any] | None,
+    ) -> None:
+        index = PlanIndex.from_plan(plan)
+        rows = []
+        for node_id, upstream in index.upstream.items():
+            # Entry nodes (no upstream) are immediately ready.
+            status = "inactive" if upstream else "ready"
+            rows.append((
+                session_id, node_id, index.order[node_id], len(upstream),
+                status,
+            ))
+        headless = (
+            json.dumps(headless_inputs) if headless_inputs is not None
+            else None
+        )
+        with self._transaction() as conn:
+            # Re-creating a session replaces it entirely.
+            for table in ("nodes", "suspended", "interactions", "events"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE session_id = ?",
+                    (session_id,),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, 'running', ?)",
+                (session_id, json.dumps(plan.to_dict()), headless),
+            )
+            conn.executemany(
+                "INSERT INTO nodes (session_id, node_id, position, "
+                "pending_deps, status) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._plans[session_id] = (plan, index)
+
+    def _load_plan(
+        self, session_id: str,
+    ) -> tuple[GraphPlan, PlanIndex] | None:
+        loaded = self._plans.get(session_id)
+        if loaded is None:
+            row = self._conn.execute(
+                "SELECT plan FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            plan = GraphPlan.from_dict(json.loads(row[0]))
+            loaded = (plan, PlanIndex.from_plan(plan))
+            self._plans[session_id] = loaded
+        return loaded
+
+    def _index(self, session_id: str) -> PlanIndex:
+        loaded = self._load_plan(session_id)
+        if loaded is None:
+            raise KeyError(session_id)
+        return loaded[1]
+
+    def _node_row(
+        self, session_id: str, node_id: str, columns: str,
+    ) -> tuple[Any, ...] | None:
+        return self._conn.execute(
+            f"SELECT {columns} FROM nodes WHERE session_id = ? AND node_id = ?",
+            (session_id, node_id),
+        ).fetchone()
+
+    def _set_node_status(
+        self, session_id: str, node_id: str, status: str,
+    ) -> None:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE nodes SET status = ? "
+                "WHERE session_id = ? AND node_id = ?",
+                (status, session_id, node_id),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(node_id)
+
+    def _complete_node(
+        self, session_id: str, node_id: str, outputs: str,
+    ) -> list[str]:
+        index = self._index(session_id)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE nodes SET status = 'completed', outputs = ? "
+                "WHERE session_id = ? AND node_id = ?",
+                (outputs, session_id, node_id),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(node_id)
+
+            # Decrement downstream dep counts.
+            pending: dict[str, int] = {}
+            newly_ready: list[str] = []
+            for edge in index.downstream.get(node_id, ()):
+                target_id = edge.to_node
+                if target_id not in pending:
+                    row = self._node_row(session_id, target_id, "pending_deps")
+                    if row is None:
+                        continue
+                    pending[target_id] = row[0]
+                if pending[target_id] > 0:
+                    pending[target_id] -= 1
+                    if pending[target_id] == 0:
+                        newly_ready.append(target_id)
+            conn.executemany(
+                "UPDATE nodes SET pending_deps = ?, "
+                "status = CASE WHEN ? = 0 THEN 'ready' ELSE status END "
+                "WHERE session_id = ? AND node_id = ?",
+                [
+                    (count, count, session_id, target_id)
+                    for target_id, count in pending.items()
+                ],
+            )
+        return newly_ready
+
+    def _get_node_inputs(
+        self, session_id: str, node_id: str,
+    ) -> dict[str, list[Any]]:
+        index = self._index(session_id)
+        inputs: dict[str, list[Any]] = {}
+        outputs_by_node: dict[str, dict[str, Any] | None] = {}
+        for edge in index.upstream.get(node_id, ()):
+            if edge.from_node not in outputs_by_node:
+                row = self._node_row(session_id, edge.from_node, "outputs")
+                outputs_by_node[edge.from_node] = (
+                    json.loads(row[0]) if row and row[0] is not None else None
+                )
+            upstream_outputs = outputs_by_node[edge.from_node]
+            if upstream_outputs is None:
+                continue
+            in_port = edge.in_port or "input"
+            out_port = edge.out_port or "output"
+            value = upstream_outputs.get(out_port)
+            if value is not None:
+                inputs.setdefault(in_port, []).append(value)
+        return inputs
+
+    def _headless_inputs(self, session_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT headless_inputs FROM sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def _suspend_node(
+        self, session_id: str, node_id: str, interaction_id: str,
+        context: str,
+    ) -> None:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE nodes SET status = 'suspended' "
+                "WHERE session_id = ? AND node_id = ?",
+                (session_id, node_id),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(node_id)
+            conn.execute(
+                "INSERT OR REPLACE INTO suspended VALUES (?, ?, ?, ?)",
+                (session_id, node_id, interaction_id, context),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO interactions VALUES (?, ?, ?)",
+                (session_id, interaction_id, node_id),
+            )
+
+    def _load_suspended_node(
+        self, session_id: str, interaction_id: str,
+    ) -> tuple[str, SuspendedNodeState] | None:
+        row = self._conn.execute(
+            "SELECT s.node_id, s.interaction_id, s.context "
+            "FROM interactions i JOIN suspended s "
+            "ON s.session_id = i.session_id AND s.node_id = i.node_id "
+            "WHERE i.session_id = ? AND i.interaction_id = ?",
+            (session_id, interaction_id),
+        ).fetchone()
+        if row is None:
+            return None
+        node_id, saved_interaction_id, context = row
+        return (node_id, SuspendedNodeState(
+            node_id=node_id,
+            interaction_id=saved_interaction_id,
+            context=json.loads(context),
+        ))
+
+    def _is_graph_complete(self, session_id: str) -> bool:
+        if self._load_plan(session_id) is None:
+            return False
+        row = self._conn.execute(
+            "SELECT 1 FROM nodes WHERE session_id = ? "
+            "AND status NOT IN (?, ?, ?) LIMIT 1",
+            (session_id, *_TERMINAL),
+        ).fetchone()
+        return row is None
+
+    def _mark_node_failed(
+        self, session_id: str, node_id: str, error: str,
+    ) -> list[str]:
+        index = self._index(session_id)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE nodes SET status = 'failed', error = ? "
+                "WHERE session_id = ? AND node_id = ?",
+                (error, session_id, node_id),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(node_id)
+
+            statuses: dict[str, str | None] = {node_id: "failed"}
+
+            def status_of(nid: str) -> str | None:
+                if nid not in statuses:
+                    row = self._node_row(session_id, nid, "status")
+                    statuses[nid] = row[0] if row else None
+                return statuses[nid]
+
+            def has_alternative_path(target_id: str) -> bool:
+                for edge in index.upstream.get(target_id, ()):
+                    if edge.from_node == node_id:
+                        continue
+                    if status_of(edge.from_node) == "completed":
+                        return True
+                return False
+
+            # Find and skip downstream dependents that have no other path.
+            skipped: list[str] = []
+            to_skip = [node_id]
+            while to_skip:
+                current = to_skip.pop()
+                for edge in index.downstream.get(current, ()):
+                    target_id = edge.to_node
+                    status = status_of(target_id)
+                    if status is None or status in _TERMINAL:
+                        continue
+                    if not has_alternative_path(target_id):
+                        statuses[target_id] = "skipped"
+                        skipped.append(target_id)
+                        to_skip.append(target_id)
+            conn.executemany(
+                "UPDATE nodes SET status = 'skipped' "
+                "WHERE session_id = ? AND node_id = ?",
+                [(session_id, nid) for nid in skipped],
+            )
+
+            # Return any nodes that are now newly ready (from other paths).
+            rows = conn.execute(
+                "SELECT node_id FROM nodes WHERE session_id = ? "
+                "AND status = 'ready' ORDER BY position",
+                (session_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _append_event(self, session_id: str, body: str) -> int:
+        with self._transaction() as conn:
+            (idx,) = conn.execute(
+                "SELECT COALESCE(MAX(idx) + 1, 0) FROM events "
+                "WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            conn.execute(
+                "INSERT INTO events VALUES (?, ?, ?)",
+                (session_id, idx, body),
+            )
+        return idx
@@ -0,0 +1,105 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Replay-then-live SSE streams for the session routers.
+
+``session_router.py`` and ``graph_session_router.py`` stream a session's
+stored events followed by its live ones. To do that without losing the
+events published while the replay runs, ``stream_events`` subscribes to
+the ``EventBus`` *first*, replays the event log, and then forwards live
+events, dropping those whose log index it has already replayed.
+
+Frames are written as raw bytes. Live events reuse the JSON encoding the
+bus shares between subscribers (``PublishedEvent.data``), so fanning an
+event out to many clients does not re-serialize it per client.
+
+When the bus drops or coalesces events for a slow client, the stream
+notices the gap in log indexes and fills it from the event log. A client
+the bus disconnects instead sees its stream end without a ``done``
+event, and the browser's ``EventSource`` reconnects with
+``Last-Event-ID`` to replay the rest.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request
+
+from ..event_bus import EventBus
+
+__all__ = ["resume_index", "sse_frame", "stream_events"]
+
+ReplayFn = Callable[[int], AsyncIterator[tuple[int, bytes]]]
+
+
+def sse_frame(
+    data: bytes, *, event: str | None = "event", id: int | None = None,
+) -> bytes:
+    """Encode one SSE frame. ``data`` must not contain line breaks."""
+    head = b"" if id is None else b"id: %d\r\n" % id
+    if event is not None:
+        head += b"event: %b\r\n" % event.encode()
+    return b"%bdata: %b\r\n\r\n" % (head, data)
+
+
+def resume_index(request: Request, after: int) -> int:
+    """Combine ``?after=`` with a reconnecting client's ``Last-Event-ID``."""
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        return max(after, int(last_event_id))
+    return after
+
+
+async def stream_events(
+    *,
+    session_id: str,
+    event_bus: EventBus,
+    after: int,
+    replay: ReplayFn,
+    is_live: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[bytes]:
+    """Yield SSE frames: ``start``, stored events, live events, ``done``.
+
+    Args:
+        after: Only stream events with a log index greater than this.
+        replay: ``replay(after)`` yields ``(index, json_bytes)`` for the
+            stored events with index > after.
+        is_live: Whether the session may still publish events, checked
+            after the replay.
+    """
+    subscription = event_bus.subscribe(session_id)
+    try:
+        yield sse_frame(
+            json.dumps({"sessionId": session_id}).encode(), event="start",
+        )
+
+        last = after
+        async for index, data in replay(last):
+            yield sse_frame(data, id=index)
+            last = index
+
+        if await is_live():
+            async for published in subscription.published():
+                if published.index is not None:
+                    if published.index > last + 1:
+                        # The bus dropped or coalesced events for us.
+                        async for index, data in replay(last):
+                            yield sse_frame(data, id=index)
+                            last = index
+                    if published.index <= last:
+                        continue  # Already replayed.
+                    last = published.index
+                yield sse_frame(published.data, id=published.index)
+            if subscription.overflowed:
+                return
+        else:
+            # Events stored while the session was finishing.
+            async for index, data in replay(last):
+                yield sse_frame(data, id=index)
+
+        yield sse_frame(b"{}", event="done")
+    finally:
+        event_bus.unsubscribe(session_id, subscription)
@@ -5,14 +5,155 @@
 
 Runs node tasks as asyncio tasks in the same process. Tracks
 tasks for cancellation support.
+
+Scheduled nodes wait in a queue until ``SchedulerLimits`` allow them to
+run:
+
+- a **global cap** and a **per-session cap** on running node tasks;
+- **pools** — caps per kind of work (``node_handlers.node_pool``: video,
+  image, text, agent, ...), so a wide stage of video nodes cannot take
+  every slot or blow the media quota;
+- **fair queuing** — a free slot goes to the session with the fewest
+  running tasks, taking turns on ties, so one large graph does not
+  starve the others;
+- **critical path first** — within a session, the node with the longest
+  chain of work still behind it in the ``GraphPlan`` runs first, with
+  plan order breaking ties.
+
+Pools and priorities come from the plan, so they need the
+``GraphSessionStore``; without one every node is in the ``"default"``
+pool and queues in FIFO order.
+
+``metrics()`` reports queue depth, running tasks and queue wait.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Coroutine
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Mapping
+
+from ..graph_plan import PlanIndex
+from ..graph_session_store import GraphSessionStore
+from ..graph_types import GraphPlan
+from ..node_handlers import node_pool
+
+__all__ = [
+    "LocalTaskScheduler",
+    "QueueMetrics",
+    "SchedulerLimits",
+    "SchedulerMetrics",
+]
+
+DEFAULT_POOL = "default"
+
+
+@dataclass(frozen=True)
+class SchedulerLimits:
+    """Caps on concurrently running node tasks. ``None`` is unlimited.
+
+    Attributes:
+        max_running: Across all sessions.
+        max_running_per_session: Within one graph session.
+        pools: Pool name → cap, for pools that need one.
+        pool_weights: Pool name → relative cost of one node, used to
+            weigh the critical path. Unlisted pools weigh 1.
+    """
+
+    max_running: int | None = 32
+    max_running_per_session: int | None = 8
+    pools: Mapping[str, int] = field(default_factory=lambda: {
+        "video": 2, "music": 2, "image-pro": 4, "image": 8, "audio": 8,
+    })
+    pool_weights: Mapping[str, float] = field(default_factory=lambda: {
+        "video": 10.0, "music": 5.0, "agent": 5.0,
+        "image-pro": 3.0, "image": 2.0, "audio": 2.0,
+    })
+
+
+@dataclass(frozen=True)
+class QueueMetrics:
+    """Queued and running node tasks for one pool or session."""
 
-__all__ = ["LocalTaskScheduler"]
+    queued: int
+    running: int
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    """Point-in-time counters for a ``LocalTaskScheduler``."""
+
+    queued: int
+    running: int
+    dispatched: int
+    total_wait_s: float
+    max_wait_s: float
+    pools: dict[str, QueueMetrics]
+    sessions: dict[str, QueueMetrics]
+
+    @property
+    def mean_wait_s(self) -> float:
+        return self.total_wait_s / self.dispatched if self.dispatched else 0.0
+
+
+@dataclass
+class _Entry:
+    session_id: str
+    node_id: str
+    pool: str
+    enqueued_at: float
+    cancelled: bool = False
+
+
+@dataclass
+class _PlanInfo:
+    """Per-node pool and priority for one session's plan."""
+
+    plan: GraphPlan
+    pools: dict[str, str]
+    # node_id → (-critical path weight, plan order): smaller runs first.
+    priority: dict[str, tuple[float, int]]
+
+    @staticmethod
+    def from_plan(
+        plan: GraphPlan, weights: Mapping[str, float],
+    ) -> _PlanInfo:
+        index = PlanIndex.from_plan(plan)
+        pools: dict[str, str] = {}
+        remaining: dict[str, float] = {}
+        # Plan order is topological, so downstream nodes come first
+        # when walking it backwards.
+        for node_id in reversed(index.order):
+            node = index.nodes[node_id].node
+            pool = node_pool(node.type, node.configuration)
+            pools[node_id] = pool
+            remaining[node_id] = weights.get(pool, 1.0) + max(
+                (
+                    remaining.get(edge.to_node, 0.0)
+                    for edge in index.downstream[node_id]
+                ),
+                default=0.0,
+            )
+        priority = {
+            node_id: (-remaining[node_id], order)
+            for node_id, order in index.order.items()
+        }
+        return _PlanInfo(plan=plan, pools=pools, priority=priority)
+
+
+@dataclass
+class _Session:
+    # pool → heap of (priority, seq, entry).
+    heaps: dict[str, list[tuple[Any, int, _Entry]]] = field(
+        default_factory=dict,
+    )
+    queued: int = 0
+    running: int = 0
+    plan_info: _PlanInfo | None = None
 
 
 class LocalTaskScheduler:
@@ -21,41 +162,232 @@ class LocalTaskScheduler:
     The ``run_fn`` callback receives ``(session_id, node_id)`` and
     is responsible for the full node lifecycle (load inputs, run
     handler, complete node, schedule downstream).
+
+    Args:
+        run_fn: The node task.
+        store: Where to read each session's plan for pools and
+            priorities.
+        limits: Concurrency caps; see ``SchedulerLimits``.
     """
 
     def __init__(
         self,
         run_fn: Callable[[str, str], Coroutine[Any, Any, None]],
+        *,
+        store: GraphSessionStore | None = None,
+        limits: SchedulerLimits | None = None,
     ) -> None:
         self._run_fn = run_fn
+        self._store = store
+        self._limits = limits or SchedulerLimits()
         self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._queued: dict[str, _Entry] = {}
+        self._sessions: dict[str, _Session] = {}
+        # Sessions with queued nodes, in turn order.
+        self._rotation: deque[str] = deque()
+        self._pool_queued: dict[str, int] = {}
+        self._pool_running: dict[str, int] = {}
+        self._running = 0
+        self._seq = itertools.count()
+        self._dispatched = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
 
     async def schedule(
         self, session_id: str, node_id: str,
     ) -> None:
-        """Dispatch a node task as an asyncio.Task."""
-        task = asyncio.create_task(
-            self._run_fn(session_id, node_id),
-            name=f"node-{session_id}-{node_id}",
-        )
+        """Queue a node task; it starts as soon as the limits allow.
+
+        A node that is already queued is not queued twice.
+        """
         key = f"{session_id}:{node_id}"
-        self._tasks[key] = task
-        # Auto-cleanup when task completes.
-        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        if key in self._queued:
+            return
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session()
+        pool, priority = await self._classify(session, session_id, node_id)
+        if key in self._queued:  # Scheduled again while awaiting the plan.
+            return
+        # The session may have gone idle and been dropped meanwhile.
+        session = self._sessions.setdefault(session_id, session)
+
+        entry = _Entry(session_id, node_id, pool, time.monotonic())
+        self._queued[key] = entry
+        heapq.heappush(
+            session.heaps.setdefault(pool, []),
+            (priority, next(self._seq), entry),
+        )
+        session.queued += 1
+        self._pool_queued[pool] = self._pool_queued.get(pool, 0) + 1
+        if session.queued == 1:
+            self._rotation.append(session_id)
+        self._dispatch()
 
     async def cancel(
         self, session_id: str, node_id: str | None = None,
     ) -> None:
-        """Cancel a running node task (or all tasks in a session)."""
+        """Cancel a queued or running node task (or all tasks in a
+        session)."""
         if node_id:
-            key = f"{session_id}:{node_id}"
+            keys = [f"{session_id}:{node_id}"]
+        else:
+            prefix = f"{session_id}:"
+            keys = [
+                key for key in itertools.chain(self._queued, self._tasks)
+                if key.startswith(prefix)
+            ]
+        for key in keys:
+            entry = self._queued.pop(key, None)
+            if entry is not None:
+                entry.cancelled = True
+                self._pool_queued[entry.pool] -= 1
+                session = self._sessions[entry.session_id]
+                session.queued -= 1
+                if not session.queued:
+                    self._rotation.remove(entry.session_id)
+                self._forget_if_idle(entry.session_id, session)
             task = self._tasks.pop(key, None)
             if task and not task.done():
                 task.cancel()
-        else:
-            prefix = f"{session_id}:"
-            for key in list(self._tasks):
-                if key.startswith(prefix):
-                    task = self._tasks.pop(key)
-                    if not task.done():
-                        task.cancel()
+
+    def metrics(self) -> SchedulerMetrics:
+        """Queue depth, running tasks and queue wait, overall and per
+        pool and session."""
+        return SchedulerMetrics(
+            queued=len(self._queued),
+            running=self._running,
+            dispatched=self._dispatched,
+            total_wait_s=self._total_wait_s,
+            max_wait_s=self._max_wait_s,
+            pools={
+                pool: QueueMetrics(
+                    queued=self._pool_queued.get(pool, 0),
+                    running=self._pool_running.get(pool, 0),
+                )
+                for pool in self._pool_queued.keys() | self._pool_running.keys()
+            },
+            sessions={
+                session_id: QueueMetrics(
+                    queued=session.queued, running=session.running,
+                )
+                for session_id, session in self._sessions.items()
+            },
+        )
+
+    # -- internal ----------------------------------------------------------
+
+    async def _classify(
+        self, session: _Session, session_id: str, node_id: str,
+    ) -> tuple[str, tuple[float, int]]:
+        """Return the node's pool and queue priority."""
+        if self._store is None:
+            return DEFAULT_POOL, (0.0, 0)
+        plan = await self._store.get_plan(session_id)
+        if plan is None:
+            return DEFAULT_POOL, (0.0, 0)
+        info = session.plan_info
+        if info is None or info.plan is not plan:
+            info = session.plan_info = _PlanInfo.from_plan(
+                plan, self._limits.pool_weights,
+            )
+        if node_id not in info.pools:
+            return DEFAULT_POOL, (0.0, 0)
+        return info.pools[node_id], info.priority[node_id]
+
+    def _dispatch(self) -> None:
+        """Start queued tasks while limits allow.
+
+        Each start goes to the session with the fewest running tasks
+        that has an eligible node, earliest in turn order on ties; that
+        session then moves to the back of the turn order.
+        """
+        limit = self._limits.max_running
+        while self._rotation:
+            if limit is not None and self._running >= limit:
+                return
+            candidates = sorted(
+                self._rotation,
+                key=lambda session_id: self._sessions[session_id].running,
+            )
+            for session_id in candidates:
+                session = self._sessions[session_id]
+                entry = self._pop_eligible(session)
+                if entry is not None:
+                    break
+            else:
+                return
+            self._rotation.remove(session_id)
+            if session.queued:
+                self._rotation.append(session_id)
+            self._start(session, entry)
+
+    def _pop_eligible(self, session: _Session) -> _Entry | None:
+        """Take the session's best queued node whose pool has room."""
+        session_limit = self._limits.max_running_per_session
+        if session_limit is not None and session.running >= session_limit:
+            return None
+        best: list[tuple[Any, int, _Entry]] | None = None
+        for pool, heap in session.heaps.items():
+            while heap and heap[0][2].cancelled:
+                heapq.heappop(heap)
+            if not heap:
+                continue
+            pool_limit = self._limits.pools.get(pool)
+            if (
+                pool_limit is not None
+                and self._pool_running.get(pool, 0) >= pool_limit
+            ):
+                continue
+            if best is None or heap[0] < best[0]:
+                best = heap
+        if best is None:
+            return None
+        entry = heapq.heappop(best)[2]
+        session.queued -= 1
+        return entry
+
+    def _start(self, session: _Session, entry: _Entry) -> None:
+        key = f"{entry.session_id}:{entry.node_id}"
+        del self._queued[key]
+        self._pool_queued[entry.pool] -= 1
+        self._pool_running[entry.pool] = (
+            self._pool_running.get(entry.pool, 0) + 1
+        )
+        session.running += 1
+        self._running += 1
+        wait = time.monotonic() - entry.enqueued_at
+        self._dispatched += 1
+        self._total_wait_s += wait
+        self._max_wait_s = max(self._max_wait_s, wait)
+
+        task = asyncio.create_task(
+            self._run_fn(entry.session_id, entry.node_id),
+            name=f"node-{entry.session_id}-{entry.node_id}",
+        )
+        self._tasks[key] = task
+        task.add_done_callback(
+            lambda _: self._finished(key, task, session, entry),
+        )
+
+    def _finished(
+        self,
+        key: str,
+        task: asyncio.Task[None],
+        session: _Session,
+        entry: _Entry,
+    ) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        self._pool_running[entry.pool] -= 1
+        session.running -= 1
+        self._running -= 1
+        self._forget_if_idle(entry.session_id, session)
+        self._dispatch()
+
+    def _forget_if_idle(self, session_id: str, session: _Session) -> None:
+        if (
+            not session.queued and not session.running
+            and self._sessions.get(session_id) is session
+        ):
+            del self._sessions[session_id]
@@ -33,7 +33,8 @@ from .backend_client import BackendClient
 from .events import AgentResult, FileData, LLMContent
 from .function_caller import FunctionCallResult, FunctionCaller
 from .function_definition import FunctionGroup
-from .conform_body import conform_body
+from .conform_body import ContentConformer
+from .context_cache import ContextCacheConfig, ConversationCache
 from .gemini_client import (
     GeminiAPIError,
     GeminiBody,
@@ -83,6 +84,12 @@ class AgentRunArgs:
     custom ``functionDeclarations`` and ``includeServerSideToolInvocations``
     is set in the tool config to enable tool context circulation.
     """
+    context_cache: ContextCacheConfig | None = None
+    """Opt in to rolling the conversation prefix into per-session
+    cached content as the run grows (see ``context_cache.py``)."""
+    stream_function_results: bool = False
+    """Report each function result through ``on_function_result`` as soon
+    as its call finishes, instead of once every call in the turn is done."""
 
 
 @dataclass
@@ -113,6 +120,9 @@ class LoopHooks:
     on_turn_complete: Callable[[], None] | None = None
     on_send_request: Callable[[str, GeminiBody], None] | None = None
     on_usage_metadata: Callable[[dict[str, Any]], None] | None = None
+    on_function_latency: Callable[[str, float, float], None] | None = None
+    """Called with ``(name, wait_s, run_s)`` after each function call
+    (see ``FunctionLatencyHistograms``)."""
 
 
 class LoopController:
@@ -186,6 +196,7 @@ class Loop:
 
         _suspended = False
         _paused = False
+        conversation_cache: ConversationCache | None = None
 
         try:
             # Merge all function declarations into a single tool set
@@ -229,6 +240,28 @@ class Loop:
             if args.builtin_tools:
                 tool_config["includeServerSideToolInvocations"] = True
 
+            # Transforms each history entry once across turns.
+            conformer = (
+                ContentConformer(backend=self._backend)
+                if self._backend else None
+            )
+
+            if args.context_cache and self._backend:
+                conversation_cache = ConversationCache(
+                    args.context_cache,
+                    backend=self._backend,
+                    model=model,
+                    system_instruction=(
+                        {
+                            "parts": [{"text": system_instruction_text}],
+                            "role": "user",
+                        }
+                        if system_instruction_text else None
+                    ),
+                    tools=tools,
+                    tool_config=tool_config,
+                )
+
             while not self.controller.terminated:
                 generation_config: dict[str, Any] = {
                     "temperature": 1,
@@ -239,6 +272,15 @@ class Loop:
                     },
                 }
 
+                if conversation_cache and conformer:
+                    if await conversation_cache.maybe_roll(
+                        contents, conformer.conform,
+                    ):
+                        # The per-session resource carries SI and tools
+                        # itself, so it supersedes the singleton.
+                        cached_content_name = conversation_cache.name
+                        cached_content_count = conversation_cache.count
+
                 if cached_content_name:
                     # Cached path: reference the cache, send only
                     # contents accumulated after what's cached.
@@ -265,29 +307,38 @@ class Loop:
                     hooks.on_send_request(model, body)
 
                 # Resolve storedData/fileData/json parts before calling Gemini
-                if self._backend:
-                    body = await conform_body(
-                        body,
-                        backend=self._backend,
-                    )
+                if conformer:
+                    body = await conformer.conform(body)
 
                 # Stream from Gemini
-                function_caller = FunctionCaller(definition_map)
+                stream_results = (
+                    args.stream_function_results and hooks.on_function_result
+                )
+                function_caller = FunctionCaller(
+                    definition_map,
+                    on_result=(
+                        (lambda r: hooks.on_function_result(
+                            r.call_id, {"parts": [r.response]},
+                        ))
+                        if stream_results else None
+                    ),
+                    on_latency=hooks.on_function_latency,
+                )
                 turn_usage_metadata: dict[str, Any] | None = None
 
                 if not self._backend:
                     return err("No BackendClient provided")
 
+                chunks_iter = stream_generate_content(
+                    model,
+                    body,
+                    backend=self._backend,
+                )
+                # Peek for errors before entering the chunk loop.
+                # If the cached resource expired, we'll catch it
+                # and retry without cache.
+                first_chunk_seen = False
                 try:
-                    chunks_iter = stream_generate_content(
-                        model,
-                        body,
-                        backend=self._backend,
-                    )
-                    # Peek for errors before entering the chunk loop.
-                    # If the cached resource expired, we'll catch it
-                    # and retry without cache.
-                    first_chunk_seen = False
                     async for chunk in chunks_iter:
                         first_chunk_seen = True
                         candidates = chunk.get("candidates", [])
@@ -377,8 +428,17 @@ class Loop:
                         )
                         cached_content_name = None
                         cached_content_count = 0
+                        if conversation_cache:
+                            conversation_cache.drop()
                         continue
                     raise
+                finally:
+                    # Returning mid-stream must not leave the stream (and
+                    # its admission slot) open until garbage collection.
+                    await chunks_iter.aclose()
+
+                if conversation_cache:
+                    conversation_cache.observe(body, turn_usage_metadata)
 
                 if turn_usage_metadata and hooks.on_usage_metadata:
                     hooks.on_usage_metadata(turn_usage_metadata)
@@ -390,7 +450,7 @@ class Loop:
                     # Emit results for sibling functions that completed
                     # alongside the suspend, so the client sees matching
                     # FunctionResultEvents for their FunctionCallEvents.
-                    if hooks.on_function_result:
+                    if hooks.on_function_result and not stream_results:
                         for result in suspend.completed_responses:
                             hooks.on_function_result(
                                 result.call_id,
@@ -429,7 +489,7 @@ class Loop:
                     return function_results
 
                 # Report each function result individually
-                if hooks.on_function_result:
+                if hooks.on_function_result and not stream_results:
                     for r in function_results["results"]:
                         hooks.on_function_result(
                             r.call_id,
@@ -485,6 +545,9 @@ class Loop:
             return err(f"Agent error: {error_message}")
 
         finally:
+            # A resumed run rolls its own resource.
+            if conversation_cache:
+                await conversation_cache.close()
             # Don't fire on_finish when suspending or pausing — the agent
             # is not done.  Firing it would close the progress UI session.
             if hooks.on_finish and not _suspended and not _paused:
@@ -27,15 +27,18 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine
 
+from .admission import get_admission_controller
 from .backend_client import BackendClient
 from .conform_body import conform_body
 from .events import SUSPEND_TYPES, AgentEvent
+from .gemini_client import GeminiAPIError
 from .step_executor import execute_step, resolve_part_to_chunk, encode_base64
 
 __all__ = [
     "NodeSuspended",
     "consume_agent_events",
     "dispatch_handler",
+    "node_pool",
     "output_handler",
     "text_gen_handler",
     "media_gen_handler",
@@ -259,6 +262,22 @@ async def dispatch_handler(
             return _passthrough(inputs)
 
 
+def node_pool(node_type: str, config: dict[str, Any]) -> str:
+    """Name the kind of work a node does, for scheduling.
+
+    Generate nodes map to ``"agent"``, their media mode (``"image"``,
+    ``"video"``, ...) or ``"text"``, mirroring ``dispatch_handler``.
+    Other nodes map to their canonical type.
+    """
+    effective_type = _effective_node_type(node_type)
+    if effective_type != "generate":
+        return effective_type
+    mode = _get_mode(config)
+    if mode == "agent" or mode in MEDIA_MODES:
+        return mode
+    return "text"
+
+
 def _passthrough(inputs: dict[str, list[Any]]) -> dict[str, Any]:
     """Simple passthrough — returns inputs as outputs (legacy behavior).
 
@@ -662,17 +681,28 @@ async def text_gen_handler(
             logger.error("text_gen_handler conform_body error: %s", exc)
             # Continue with untransformed body — may fail at API level.
 
-        # Stream from Gemini.
+        # Stream from Gemini, admitted by the shared per-model limiter.
         model = _get_model(config)
+        limiter = get_admission_controller().limiter(model)
         result_text = ""
-        async for chunk in backend.stream_generate_content(model, body):
-            # Accumulate text from streaming chunks.
-            candidates = chunk.get("candidates", [])
-            for candidate in candidates:
-                content = candidate.get("content", {})
-                for part in content.get("parts", []):
-                    if "text" in part:
-                        result_text += part["text"]
+        ticket: int | None = None
+        try:
+            async with limiter.admit() as ticket:
+                async for chunk in backend.stream_generate_content(
+                    model, body
+                ):
+                    # Accumulate text from streaming chunks.
+                    candidates = chunk.get("candidates", [])
+                    for candidate in candidates:
+                        content = candidate.get("content", {})
+                        for part in content.get("parts", []):
+                            if "text" in part:
+                                result_text += part["text"]
+        except GeminiAPIError as e:
+            if e.is_transient:
+                limiter.on_rate_limited(e.retry_after, admitted=ticket)
+            raise
+        limiter.on_success()
 
         return {
             "context": [
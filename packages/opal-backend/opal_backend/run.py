@@ -62,6 +62,7 @@ from .functions.system import get_system_function_group
 from .function_caller import FunctionCaller
 from .function_definition import FunctionDefinition, FunctionGroup, FunctionGroupFactory
 from .interaction_store import InteractionState, InteractionStore
+from .context_cache import ContextCacheConfig
 from .loop import AgentRunArgs, Loop, LoopController
 from .sheet_manager import SheetManager
 from .singleton_cache import get_singleton_prefix_cache
@@ -167,6 +168,7 @@ async def run_agent(
     file_system: FileSystem | None = None,
     context_queue: asyncio.Queue | None = None,
     session_id: str | None = None,
+    context_cache: ContextCacheConfig | None = None,
 ) -> AsyncIterator[AgentEvent]:
     """Start a new agent run.
 
@@ -193,6 +195,8 @@ async def run_agent(
             used instead of creating a new ``AgentFileSystem``.  This
             is the injection point for disk-backed implementations.
             Defaults to ``AgentFileSystem()`` when ``None``.
+        context_cache: Opt in to caching the growing conversation in
+            per-session cached content (see ``context_cache.py``).
 
     Yields:
         Typed ``AgentEvent`` instances.
@@ -309,6 +313,7 @@ async def run_agent(
         model=model,
         context_queue=context_queue,
         builtin_tools=builtin_tools,
+        context_cache=context_cache,
     )
 
     async for event in _stream_loop(
@@ -341,6 +346,7 @@ async def resume_agent(
     file_system: FileSystem | None = None,
     context_parts: list[dict[str, Any]] | None = None,
     context_queue: asyncio.Queue | None = None,
+    context_cache: ContextCacheConfig | None = None,
 ) -> AsyncIterator[AgentEvent]:
     """Resume a suspended agent run.
 
@@ -363,6 +369,8 @@ async def resume_agent(
         file_system: Optional pre-built file system.  When provided,
             used instead of reconstructing from the snapshot.  This
             is the injection point for disk-backed implementations.
+        context_cache: Opt in to caching the growing conversation in
+            per-session cached content (see ``context_cache.py``).
 
     Yields:
         Typed ``AgentEvent`` instances.
@@ -487,6 +495,7 @@ async def resume_agent(
         model=model_override,
         context_queue=context_queue,
         builtin_tools=builtin_tools,
+        context_cache=context_cache,
     )
 
     async for event in _stream_loop(
@@ -285,8 +285,8 @@ async def _tee_events(
     try:
         async for event in events:
             event_dict = event.to_dict()
-            await store.append_event(session_id, event_dict)
-            await event_bus.publish(session_id, event_dict)
+            index = await store.append_event(session_id, event_dict)
+            await event_bus.publish(session_id, event_dict, index=index)
 
             # Detect terminal events to set the right status.
             if isinstance(event, CompleteEvent):
@@ -316,8 +316,9 @@ async def _tee_events(
 
     except Exception as e:
         logger.exception("Session %s failed", session_id)
-        await store.append_event(session_id, {"error": {"message": str(e)}})
-        await event_bus.publish(session_id, {"error": {"message": str(e)}})
+        error = {"error": {"message": str(e)}}
+        index = await store.append_event(session_id, error)
+        await event_bus.publish(session_id, error, index=index)
         terminal_status = SessionStatus.FAILED
 
     finally:
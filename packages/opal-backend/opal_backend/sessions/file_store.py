@@ -11,17 +11,35 @@ for offline debugging and inspection.
 from dataclasses import asdict
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any
+import struct
+from typing import Any, AsyncIterator
 
 from ..agent_file_system import FileDescriptor, FileSystemSnapshot
 from ..interaction_store import InteractionState
-from .store import SessionStatus, TurnCheckpoint
+from .store import DEFAULT_EVENT_BATCH_SIZE, SessionStatus, TurnCheckpoint
 
 __all__ = ["FileBasedSessionStore"]
 
 logger = logging.getLogger(__name__)
 
+EVENTS_FILENAME = "events.jsonl"
+EVENTS_INDEX_FILENAME = "events.idx"
+TURNS_LOG_FILENAME = "turns.jsonl"
+# Store-level indexes live in a dot-directory so that rewriting them does
+# not change the modification time of the sessions directory itself.
+INDEX_DIRNAME = ".index"
+RESUME_INDEX_FILENAME = "resume_ids.json"
+LEGACY_TURNS_FILENAME = "turns.json"
+
+# Compact a turn log once it holds at least this many patch records (and
+# at least as many patches as turns).
+_COMPACT_MIN_PATCHES = 64
+
+# One little-endian uint64 byte offset per event in events.idx.
+_OFFSET = struct.Struct("<Q")
+
 
 class FileBasedSessionStore:
     """File-backed session and interaction store.
@@ -29,8 +47,11 @@ class FileBasedSessionStore:
     Stores session artifacts under a base directory:
     - ``{base_dir}/{session_id}/status``
     - ``{base_dir}/{session_id}/events.jsonl``
+    - ``{base_dir}/{session_id}/events.idx`` (byte offset of each event)
     - ``{base_dir}/{session_id}/interaction.json``
     - ``{base_dir}/{session_id}/resume_id``
+    - ``{base_dir}/{session_id}/turns.jsonl``
+    - ``{base_dir}/.index/resume_ids.json`` (interaction_id → session_id)
     """
 
     def __init__(self, base_dir: Path | str) -> None:
@@ -38,6 +59,13 @@ class FileBasedSessionStore:
         self.base_dir.mkdir(parents=True, exist_ok=True)
         # In-memory cache of event counts to avoid parsing events.jsonl on every append.
         self._event_counts: dict[str, int] = {}
+        # In-memory index of turn checkpoints, revalidated against turns.jsonl.
+        self._turns: dict[str, _TurnLog] = {}
+        # interaction_id → session_id for pending resumes, mirrored in
+        # .index/resume_ids.json and revalidated by a stat of that file.
+        self._resume_index: dict[str, str] | None = None
+        self._resume_index_stamp: tuple[int, int] | None = None
+        self._resume_index_dir_mtime_ns: int | None = None
 
     def _session_dir(self, session_id: str) -> Path:
         """Return the directory path for a session ID."""
@@ -46,25 +74,88 @@ class FileBasedSessionStore:
     def _get_event_count(self, session_id: str) -> int:
         """Initialize or retrieve the cached event count for a session."""
         if session_id not in self._event_counts:
-            events_file = self._session_dir(session_id) / "events.jsonl"
-            if events_file.exists():
-                try:
-                    with open(events_file, "rb") as f:
-                        self._event_counts[session_id] = sum(1 for _ in f)
-                except Exception:
-                    self._event_counts[session_id] = 0
-            else:
+            try:
+                self._event_counts[session_id] = self._repair_event_index(
+                    session_id
+                )
+            except Exception:
                 self._event_counts[session_id] = 0
         return self._event_counts[session_id]
 
+    def _scan_event_index(self, session_id: str) -> tuple[int, list[int]]:
+        """Read ``events.idx`` and the part of ``events.jsonl`` it misses.
+
+        The index holds one fixed-width byte offset per event, so event N
+        starts at the offset stored at ``N * 8``. Events appended without
+        updating the index (older sessions, a crash between the two
+        writes, a reader racing the writer) are found by scanning forward
+        from the last indexed event; only that tail is read.
+
+        Returns the number of usable index entries and the offsets of the
+        complete events after them. Nothing is written, so readers in
+        other processes never touch the index.
+        """
+        sdir = self._session_dir(session_id)
+        events_file = sdir / EVENTS_FILENAME
+        index_file = sdir / EVENTS_INDEX_FILENAME
+        if not events_file.exists():
+            return 0, []
+        events_size = events_file.stat().st_size
+
+        count = 0
+        start = 0
+        if index_file.exists():
+            with open(index_file, "rb") as idx:
+                # A torn trailing entry is ignored.
+                count = idx.seek(0, os.SEEK_END) // _OFFSET.size
+                if count:
+                    idx.seek((count - 1) * _OFFSET.size)
+                    (last,) = _OFFSET.unpack(idx.read(_OFFSET.size))
+                    if last >= events_size:
+                        # The log was rewritten under the index.
+                        count = 0
+                    else:
+                        start = last
+        tail: list[int] = []
+        with open(events_file, "rb") as f:
+            f.seek(start)
+            if count:
+                f.readline()  # The last indexed event.
+            pos = f.tell()
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # An append still in progress.
+                tail.append(pos)
+                pos += len(line)
+        return count, tail
+
+    def _repair_event_index(self, session_id: str) -> int:
+        """Bring ``events.idx`` up to date with ``events.jsonl``.
+
+        Only the writer calls this. Returns the number of events.
+        """
+        count, tail = self._scan_event_index(session_id)
+        index_file = self._session_dir(session_id) / EVENTS_INDEX_FILENAME
+        if count or tail:
+            with open(index_file, "a+b") as idx:
+                idx.truncate(count * _OFFSET.size)
+                idx.seek(0, os.SEEK_END)
+                idx.write(b"".join(_OFFSET.pack(o) for o in tail))
+        return count + len(tail)
+
     # ── SessionStore Lifecycle ──
 
     async def create(self, session_id: str) -> None:
         """Create a new session. Initial status: RUNNING."""
         sdir = self._session_dir(session_id)
-        sdir.mkdir(parents=True, exist_ok=True)
+        if not sdir.is_dir():
+            # Record the new directory listing so the resume index isn't
+            # considered stale because of a session this store created.
+            index = self._load_resume_index()
+            sdir.mkdir(parents=True, exist_ok=True)
+            self._save_resume_index(index)
         await self.set_status(session_id, SessionStatus.RUNNING)
-        events_file = sdir / "events.jsonl"
+        events_file = sdir / EVENTS_FILENAME
         if not events_file.exists():
             events_file.touch(exist_ok=True)
 
@@ -99,29 +190,80 @@ class FileBasedSessionStore:
         if not sdir.is_dir():
             raise KeyError(f"Session not found: {session_id}")
         index = self._get_event_count(session_id)
-        events_file = sdir / "events.jsonl"
-        with open(events_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        line = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(sdir / EVENTS_FILENAME, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        with open(sdir / EVENTS_INDEX_FILENAME, "ab") as idx:
+            aligned = idx.tell() == index * _OFFSET.size
+            if aligned:
+                idx.write(_OFFSET.pack(offset))
+        if not aligned:
+            # The index no longer ends at the previous event; rebuild its
+            # tail rather than append an offset at the wrong position.
+            index = self._repair_event_index(session_id) - 1
         self._event_counts[session_id] = index + 1
         return index
 
     async def get_events(
-        self, session_id: str, *, after: int = -1
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Return events with index > after. after=-1 returns all."""
-        events_file = self._session_dir(session_id) / "events.jsonl"
+        """Return events with index > after. after=-1 returns all.
+
+        At most ``limit`` events are returned when it is given. The read
+        seeks straight to event ``after + 1`` via the offset index, so its
+        cost does not depend on how many events precede it.
+        """
+        events_file = self._session_dir(session_id) / EVENTS_FILENAME
         if not events_file.exists():
             return []
+        start = max(after + 1, 0)
         result: list[dict[str, Any]] = []
         try:
-            with open(events_file, "r", encoding="utf-8") as f:
-                for idx, line in enumerate(f):
-                    if idx > after:
-                        result.append(json.loads(line))
+            indexed, tail = self._scan_event_index(session_id)
+            count = indexed + len(tail)
+            if start >= count:
+                return []
+            if start < indexed:
+                index_file = (
+                    self._session_dir(session_id) / EVENTS_INDEX_FILENAME
+                )
+                with open(index_file, "rb") as idx:
+                    idx.seek(start * _OFFSET.size)
+                    (offset,) = _OFFSET.unpack(idx.read(_OFFSET.size))
+            else:
+                offset = tail[start - indexed]
+            wanted = count - start if limit is None else min(limit, count - start)
+            with open(events_file, "rb") as f:
+                f.seek(offset)
+                for _ in range(wanted):
+                    result.append(json.loads(f.readline()))
         except Exception as e:
             logger.warning("Failed to read events for %s: %s", session_id, e)
         return result
 
+    async def iter_events(
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream events with index > after, reading ``batch_size`` at a time."""
+        while True:
+            batch = await self.get_events(
+                session_id, after=after, limit=batch_size
+            )
+            for event in batch:
+                yield event
+            if len(batch) < batch_size:
+                return
+            after += len(batch)
+
     # ── SessionStore Interaction State (suspend/resume) ──
 
     async def save_interaction(
@@ -152,6 +294,7 @@ class FileBasedSessionStore:
             state = InteractionState.from_dict(data)
             # Destructive clear of the resume capability
             resume_id_file.unlink(missing_ok=True)
+            self._forget_resume_ids(session_id)
             return state
         except Exception as e:
             logger.warning("Failed to load interaction for %s: %s", session_id, e)
@@ -164,9 +307,15 @@ class FileBasedSessionStore:
     ) -> None:
         """Stash the interaction_id for a pending resume."""
         sdir = self._session_dir(session_id)
+        index = self._load_resume_index()
         sdir.mkdir(parents=True, exist_ok=True)
         resume_id_file = sdir / "resume_id"
         resume_id_file.write_text(interaction_id, encoding="utf-8")
+        for rid, sid in list(index.items()):
+            if sid == session_id:
+                del index[rid]
+        index[interaction_id] = session_id
+        self._save_resume_index(index)
 
     async def get_resume_id(self, session_id: str) -> str | None:
         """Retrieve and clear the stashed interaction_id."""
@@ -175,25 +324,96 @@ class FileBasedSessionStore:
             return None
         rid = resume_id_file.read_text(encoding="utf-8").strip()
         resume_id_file.unlink(missing_ok=True)
+        self._forget_resume_ids(session_id)
         return rid
 
     async def get_session_by_resume_id(
         self, interaction_id: str
     ) -> str | None:
-        """Reverse lookup: find the session that owns this interaction_id."""
-        if not self.base_dir.is_dir():
+        """Reverse lookup: find the session that owns this interaction_id.
+
+        Served from the resume index. A hit is confirmed against the
+        session's ``resume_id`` file, and the index is rebuilt from disk
+        if that file no longer matches.
+        """
+        session_id = self._load_resume_index().get(interaction_id)
+        if session_id is None:
             return None
+        if self._read_resume_id(session_id) == interaction_id:
+            return session_id
+        # resume_id was cleared or replaced outside this store.
+        return self._rebuild_resume_index().get(interaction_id)
+
+    def _read_resume_id(self, session_id: str) -> str | None:
+        try:
+            return (
+                (self._session_dir(session_id) / "resume_id")
+                .read_text(encoding="utf-8")
+                .strip()
+            )
+        except OSError:
+            return None
+
+    def _load_resume_index(self) -> dict[str, str]:
+        """Return the resume index, reloading or rebuilding it as needed.
+
+        The index file is reloaded when another store instance rewrote it,
+        and rebuilt from the session directories when it is missing,
+        unreadable, or was written before the last change to the set of
+        session directories (i.e. sessions created outside the store).
+        """
+        index_file = self.base_dir / INDEX_DIRNAME / RESUME_INDEX_FILENAME
+        stamp = _stat_stamp(index_file)
+        if stamp is None:
+            return self._rebuild_resume_index()
+        if self._resume_index is None or stamp != self._resume_index_stamp:
+            try:
+                data = json.loads(index_file.read_text(encoding="utf-8"))
+                dir_mtime_ns = int(data["dir_mtime_ns"])
+                sessions = dict(data["sessions"])
+            except (OSError, ValueError, KeyError, TypeError):
+                return self._rebuild_resume_index()
+            self._resume_index = sessions
+            self._resume_index_stamp = stamp
+            self._resume_index_dir_mtime_ns = dir_mtime_ns
+        if self._resume_index_dir_mtime_ns != self.base_dir.stat().st_mtime_ns:
+            return self._rebuild_resume_index()
+        return self._resume_index
+
+    def _rebuild_resume_index(self) -> dict[str, str]:
+        """Scan every session directory and rewrite the resume index."""
+        index: dict[str, str] = {}
         for sdir in self.base_dir.iterdir():
-            if sdir.is_dir():
-                resume_id_file = sdir / "resume_id"
-                if resume_id_file.exists():
-                    try:
-                        rid = resume_id_file.read_text(encoding="utf-8").strip()
-                        if rid == interaction_id:
-                            return sdir.name
-                    except Exception:
-                        pass
-        return None
+            if sdir.is_dir() and not sdir.name.startswith("."):
+                rid = self._read_resume_id(sdir.name)
+                if rid:
+                    index[rid] = sdir.name
+        self._save_resume_index(index)
+        return index
+
+    def _save_resume_index(self, index: dict[str, str]) -> None:
+        """Atomically write the resume index (temp file + rename)."""
+        index_dir = self.base_dir / INDEX_DIRNAME
+        index_dir.mkdir(exist_ok=True)
+        dir_mtime_ns = self.base_dir.stat().st_mtime_ns
+        tmp_file = index_dir / f"{RESUME_INDEX_FILENAME}.tmp"
+        tmp_file.write_text(
+            json.dumps({"dir_mtime_ns": dir_mtime_ns, "sessions": index}),
+            encoding="utf-8",
+        )
+        index_file = index_dir / RESUME_INDEX_FILENAME
+        os.replace(tmp_file, index_file)
+        self._resume_index = index
+        self._resume_index_stamp = _stat_stamp(index_file)
+        self._resume_index_dir_mtime_ns = dir_mtime_ns
+
+    def _forget_resume_ids(self, session_id: str) -> None:
+        index = self._load_resume_index()
+        stale = [rid for rid, sid in index.items() if sid == session_id]
+        if stale:
+            for rid in stale:
+                del index[rid]
+            self._save_resume_index(index)
 
     # ── InteractionStore Protocol Methods ──
 
@@ -221,10 +441,21 @@ class FileBasedSessionStore:
         if not self.base_dir.is_dir():
             return
         for sdir in self.base_dir.iterdir():
-            if sdir.is_dir():
+            if sdir.is_dir() and not sdir.name.startswith("."):
                 (sdir / "resume_id").unlink(missing_ok=True)
+        self._save_resume_index({})
 
     # ── Turn Checkpoints ──
+    #
+    # Checkpoints live in an append-only ``turns.jsonl``. The first record
+    # for a turn is a full ``checkpoint``; later updates to the same turn
+    # (e.g. token metadata from ``usageMetadata``) append a ``patch`` record
+    # holding only the changed fields. Each session's log is replayed once
+    # into an in-memory index and revalidated by a stat of the file, so
+    # writes are O(record) and reads never re-parse an unchanged log.
+    #
+    # Sessions written before the log existed have a ``turns.json`` array;
+    # it is read as-is and migrated to ``turns.jsonl`` on the next write.
 
     async def record_turn_boundary(
         self,
@@ -237,21 +468,9 @@ class FileBasedSessionStore:
         """Record a turn boundary checkpoint."""
         sdir = self._session_dir(session_id)
         sdir.mkdir(parents=True, exist_ok=True)
-        turns_file = sdir / "turns.json"
-
-        turns = []
-        if turns_file.exists():
-            try:
-                turns = json.loads(turns_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-
-        # Find if checkpoint already exists for this turn
-        existing_idx = None
-        for idx, cp in enumerate(turns):
-            if cp["turn"] == turn_index:
-                existing_idx = idx
-                break
+        turns = self._load_turns(session_id)
+        if turns.legacy:
+            self._write_compacted(session_id, turns)
 
         fs_dict = None
         if file_system is not None:
@@ -264,37 +483,43 @@ class FileBasedSessionStore:
                 "file_count": file_system.file_count,
             }
 
-        if existing_idx is not None:
-            existing = turns[existing_idx]
+        existing = turns.get(turn_index)
+        if existing is not None:
+            patch: dict[str, Any] = {}
             if context_length > 0:
-                existing["context_length"] = context_length
+                patch["context_length"] = context_length
             if fs_dict is not None:
-                existing["file_system"] = fs_dict
+                patch["file_system"] = fs_dict
             if token_metadata is not None:
-                existing["token_metadata"] = token_metadata
+                patch["token_metadata"] = token_metadata
+            if not patch:
+                return
+            existing.update(patch)
+            self._append_turn_record(
+                session_id, turns, {"op": "patch", "turn": turn_index, **patch}
+            )
+            turns.patches += 1
         else:
-            turns.append({
+            entry = {
                 "turn": turn_index,
                 "context_length": context_length,
                 "file_system": fs_dict,
                 "token_metadata": token_metadata,
-            })
+            }
+            turns.add(entry)
+            self._append_turn_record(
+                session_id, turns, {"op": "checkpoint", **entry}
+            )
 
-        turns_file.write_text(
-            json.dumps(turns, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if turns.patches >= max(_COMPACT_MIN_PATCHES, len(turns.entries)):
+            self._write_compacted(session_id, turns)
 
     async def get_turn_boundaries(self, session_id: str) -> list[TurnCheckpoint]:
         """Retrieve the recorded checkpoints for a session."""
-        turns_file = self._session_dir(session_id) / "turns.json"
-        if not turns_file.exists():
-            return []
-
         try:
-            data = json.loads(turns_file.read_text(encoding="utf-8"))
+            turns = self._load_turns(session_id)
             result = []
-            for entry in data:
+            for entry in turns.entries:
                 fs_data = entry.get("file_system")
                 fs_snapshot = None
                 if fs_data is not None:
@@ -303,7 +528,7 @@ class FileBasedSessionStore:
                             path: FileDescriptor(**fd)
                             for path, fd in fs_data["files"].items()
                         },
-                        routes=fs_data["routes"],
+                        routes=dict(fs_data["routes"]),
                         file_count=fs_data["file_count"],
                     )
                 result.append({
@@ -317,3 +542,117 @@ class FileBasedSessionStore:
             logger.warning("Failed to read turns for %s: %s", session_id, e)
             return []
 
+    async def compact_turns(self, session_id: str) -> None:
+        """Rewrite a session's turn log as one checkpoint record per turn.
+
+        Folds patch records into their checkpoints and migrates a legacy
+        ``turns.json``. The rewrite is atomic (temp file + rename).
+        """
+        turns = self._load_turns(session_id)
+        if turns.entries or turns.legacy:
+            self._write_compacted(session_id, turns)
+
+    def _load_turns(self, session_id: str) -> "_TurnLog":
+        """Return the session's turn index, replaying the log if it changed."""
+        sdir = self._session_dir(session_id)
+        log_file = sdir / TURNS_LOG_FILENAME
+        stamp = _stat_stamp(log_file)
+        cached = self._turns.get(session_id)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+
+        turns = _TurnLog(stamp=stamp)
+        if stamp is not None:
+            with open(log_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append.
+                        logger.warning("Skipping malformed line in %s", log_file)
+                        continue
+                    turns.apply(record)
+        else:
+            legacy_file = sdir / LEGACY_TURNS_FILENAME
+            if legacy_file.exists():
+                try:
+                    entries = json.loads(
+                        legacy_file.read_text(encoding="utf-8")
+                    )
+                except (json.JSONDecodeError, OSError) as e:
+                    # Treated as empty, like a torn line in the log.
+                    logger.warning(
+                        "Failed to read turns for %s: %s", session_id, e
+                    )
+                else:
+                    for entry in entries:
+                        turns.add(dict(entry))
+                    turns.legacy = True
+        self._turns[session_id] = turns
+        return turns
+
+    def _append_turn_record(
+        self, session_id: str, turns: "_TurnLog", record: dict[str, Any]
+    ) -> None:
+        log_file = self._session_dir(session_id) / TURNS_LOG_FILENAME
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        turns.stamp = _stat_stamp(log_file)
+
+    def _write_compacted(self, session_id: str, turns: "_TurnLog") -> None:
+        sdir = self._session_dir(session_id)
+        log_file = sdir / TURNS_LOG_FILENAME
+        tmp_file = sdir / f".{TURNS_LOG_FILENAME}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for entry in turns.entries:
+                record = {"op": "checkpoint", **entry}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_file, log_file)
+        if turns.legacy:
+            (sdir / LEGACY_TURNS_FILENAME).unlink(missing_ok=True)
+            turns.legacy = False
+        turns.patches = 0
+        turns.stamp = _stat_stamp(log_file)
+
+
+class _TurnLog:
+    """In-memory index of one session's turn checkpoints."""
+
+    def __init__(self, stamp: tuple[int, int] | None) -> None:
+        self.stamp = stamp
+        self.entries: list[dict[str, Any]] = []
+        self.by_turn: dict[int, dict[str, Any]] = {}
+        self.patches = 0
+        self.legacy = False
+
+    def get(self, turn: int) -> dict[str, Any] | None:
+        return self.by_turn.get(turn)
+
+    def add(self, entry: dict[str, Any]) -> None:
+        self.entries.append(entry)
+        self.by_turn[entry["turn"]] = entry
+
+    def apply(self, record: dict[str, Any]) -> None:
+        """Apply one ``turns.jsonl`` record."""
+        fields = {k: v for k, v in record.items() if k != "op"}
+        existing = self.by_turn.get(record["turn"])
+        if existing is None:
+            fields.setdefault("context_length", 0)
+            fields.setdefault("file_system", None)
+            fields.setdefault("token_metadata", None)
+            self.add(fields)
+            return
+        existing.update(fields)
+        if record.get("op") == "patch":
+            self.patches += 1
+
+
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
+    """``(mtime_ns, size)`` of a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
@@ -11,11 +11,16 @@ that implements the same protocol.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator
 
 from ..agent_file_system import FileSystemSnapshot
 from ..interaction_store import InteractionState
-from .store import SessionStatus, SessionStore, TurnCheckpoint
+from .store import (
+    DEFAULT_EVENT_BATCH_SIZE,
+    SessionStatus,
+    SessionStore,
+    TurnCheckpoint,
+)
 
 __all__ = ["InMemorySessionStore"]
 
@@ -70,13 +75,37 @@ class InMemorySessionStore:
         return index
 
     async def get_events(
-        self, session_id: str, *, after: int = -1
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Return events with index > after. after=-1 returns all."""
         session = self._sessions.get(session_id)
         if not session:
             return []
-        return session.events[after + 1 :]
+        start = max(after + 1, 0)
+        end = None if limit is None else start + limit
+        return session.events[start:end]
+
+    async def iter_events(
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream events with index > after, in batches of ``batch_size``."""
+        while True:
+            batch = await self.get_events(
+                session_id, after=after, limit=batch_size
+            )
+            for event in batch:
+                yield event
+            if len(batch) < batch_size:
+                return
+            after += len(batch)
 
     async def save_interaction(
         self, session_id: str, state: InteractionState
@@ -17,12 +17,20 @@ Implementations:
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Any, Protocol, runtime_checkable, TypedDict
+from typing import Any, AsyncIterator, Protocol, runtime_checkable, TypedDict
 
 from ..agent_file_system import FileSystemSnapshot
 from ..interaction_store import InteractionState
 
-__all__ = ["SessionStatus", "SessionStore", "TurnCheckpoint"]
+__all__ = [
+    "DEFAULT_EVENT_BATCH_SIZE",
+    "SessionStatus",
+    "SessionStore",
+    "TurnCheckpoint",
+]
+
+# Events fetched per read by ``SessionStore.iter_events``.
+DEFAULT_EVENT_BATCH_SIZE = 500
 
 
 class TurnCheckpoint(TypedDict):
@@ -78,9 +86,26 @@ class SessionStore(Protocol):
         ...
 
     async def get_events(
-        self, session_id: str, *, after: int = -1
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Return events with index > after. after=-1 returns all."""
+        """Return events with index > after. after=-1 returns all.
+
+        Returns at most ``limit`` events when it is given.
+        """
+        ...
+
+    def iter_events(
+        self,
+        session_id: str,
+        *,
+        after: int = -1,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream events with index > after, in batches of ``batch_size``."""
         ...
 
     # ── Interaction State (suspend/resume) ──
@@ -4,29 +4,51 @@
 """
 Singleton prefix cache for agent runs.
 
-Caches Gemini ``cachedContents`` resources keyed by the combination of
-boolean flags that determine which function groups are active. Because
-the system instruction + tool declarations are fully determined by these
-flags, multiple clients with the same flag combination can share a single
-cached content resource.
-
-Uses ``BackendClient.create_cached_content()`` for the Gemini API call,
-so the same logic works in both dev (GEMINI_KEY + httpx) and prod (RPC
-bindings).
+Caches Gemini ``cachedContents`` resources for the static prefix of an
+agent run (system instruction + tool declarations). The prefix is fully
+determined by which function groups are active, so multiple clients with
+the same flag combination can share a single cached content resource.
+
+Entries are keyed by a hash of the payload ``build_prefix_payload``
+returns, so any change to the prefix — a new flag combination or edited
+declarations — gets its own resource without changes here.
+
+- Concurrent misses for the same payload share one
+  ``create_cached_content`` call, so a burst of sessions starting after
+  expiry creates one resource instead of one each.
+- An entry is valid until its Gemini-side expiry, which moves forward
+  every time the TTL is extended.
+- The first hit after ``EXTEND_THRESHOLD_SECONDS`` refreshes the entry in
+  the background: it extends the TTL or, if that fails, creates a
+  replacement. At most one refresh per entry runs at a time.
+- Superseded resources — replaced after expiry or a failed extension, or
+  left behind when the payload for a flag combination changes — are
+  deleted.
+
+``get_singleton_cache_stats()`` reports hits, misses and creates.
+
+Uses ``BackendClient`` for the Gemini API calls, so the same logic works
+in both dev (GEMINI_KEY + httpx) and prod (RPC bindings).
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from .backend_client import BackendClient
 from .prefix_payload import build_prefix_payload, CACHE_TTL_SECONDS
 
-__all__ = ["get_singleton_prefix_cache"]
+__all__ = [
+    "SingletonCacheStats",
+    "get_singleton_cache_stats",
+    "get_singleton_prefix_cache",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -35,48 +57,64 @@ logger = logging.getLogger(__name__)
 # once per EXTEND_THRESHOLD window regardless of request volume.
 EXTEND_THRESHOLD_SECONDS = CACHE_TTL_SECONDS * 2 // 3
 
+# Entries this close to their Gemini-side expiry are not handed out, so a
+# session does not start on a resource that is about to disappear.
+EXPIRY_MARGIN_SECONDS = 60
+
+_Flags = tuple[bool, bool, bool]
+
 
 @dataclass
 class _CacheEntry:
-    """A cached content name with its creation timestamp."""
+    """A cached content name with its creation and extension timestamps."""
 
     name: str
     created_at: float
     last_extended_at: float = field(default_factory=time.time)
+    refreshing: bool = False
+
+    @property
+    def expires_at(self) -> float:
+        return self.last_extended_at + CACHE_TTL_SECONDS
+
+
+@dataclass
+class SingletonCacheStats:
+    """Counters for the singleton prefix cache."""
+
+    hits: int = 0
+    misses: int = 0
+    creates: int = 0
+    create_failures: int = 0
+    extensions: int = 0
+    deletes: int = 0
 
 
-# In-memory cache: (useMemory, useNotebookLM, useGoogleDrive) → _CacheEntry.
+# In-memory cache: payload hash → _CacheEntry.
 # OK to be per-process — each process maintains its own set of handles.
-_cache: dict[tuple[bool, bool, bool], _CacheEntry] = {}
+_cache: dict[str, _CacheEntry] = {}
 
+# Latest payload hash seen for each flag combination, to spot entries
+# superseded by a payload change.
+_keys_by_flags: dict[_Flags, str] = {}
 
-def _cache_key(
-    use_memory: bool, use_notebooklm: bool, use_google_drive: bool
-) -> tuple[bool, bool, bool]:
-    return (use_memory, use_notebooklm, use_google_drive)
+_inflight: dict[str, asyncio.Future[_CacheEntry]] = {}
+_inflight_loop: asyncio.AbstractEventLoop | None = None
 
+# Strong references to background refreshes and deletions.
+_background: set[asyncio.Future[Any]] = set()
 
-async def _maybe_extend_ttl(entry: _CacheEntry, client: BackendClient) -> None:
-    """Extend the Gemini-side TTL if the entry is getting stale.
+_stats = SingletonCacheStats()
 
-    Throttled: only PATCHes when more than EXTEND_THRESHOLD_SECONDS have
-    elapsed since the last extension. Fire-and-forget — failures are
-    logged but don't affect the caller.
-    """
-    now = time.time()
-    if now - entry.last_extended_at < EXTEND_THRESHOLD_SECONDS:
-        return  # Plenty of TTL left, skip.
 
-    try:
-        await client.update_cached_content(
-            entry.name, {"ttl": f"{CACHE_TTL_SECONDS}s"}
-        )
-        entry.last_extended_at = now
-        logger.info("Extended TTL for %s", entry.name)
-    except Exception as exc:
-        # Non-fatal — the cache may expire, but the client-side
-        # fallback in loop.ts handles that gracefully.
-        logger.warning("Failed to extend TTL for %s: %s", entry.name, exc)
+def _cache_key(payload: dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_singleton_cache_stats() -> SingletonCacheStats:
+    """Return a snapshot of the cache counters."""
+    return replace(_stats)
 
 
 async def get_singleton_prefix_cache(
@@ -91,38 +129,186 @@ async def get_singleton_prefix_cache(
     Returns ``{"cachedContent": {"name": "..."}}`` on success, or
     ``{"errorMessage": "..."}`` on failure.
     """
-    key = _cache_key(use_memory, use_notebooklm, use_google_drive)
-    now = time.time()
-
-    # Check cache — expire entries older than TTL.
-    entry = _cache.get(key)
-    if entry and (now - entry.created_at) < CACHE_TTL_SECONDS:
-        logger.info("Singleton cache hit: %s → %s", key, entry.name)
-
-        # Extend Gemini-side TTL in the background (throttled).
-        asyncio.ensure_future(_maybe_extend_ttl(entry, client))
-
-        return {"cachedContent": {"name": entry.name}}
-
-    # Cache miss or expired — create a new cached content resource.
     payload = build_prefix_payload(
         use_memory=use_memory,
         use_notebooklm=use_notebooklm,
         use_google_drive=use_google_drive,
     )
+    key = _cache_key(payload)
+    _retire_superseded_payload(
+        (use_memory, use_notebooklm, use_google_drive), key, client
+    )
 
-    logger.info("Singleton cache miss for %s — creating new cached content", key)
+    entry = _cache.get(key)
+    if entry and time.time() < entry.expires_at - EXPIRY_MARGIN_SECONDS:
+        _stats.hits += 1
+        logger.info("Singleton cache hit: %s → %s", key[:12], entry.name)
+        _schedule_refresh(key, entry, payload, client)
+        return {"cachedContent": {"name": entry.name}}
 
+    _stats.misses += 1
+    logger.info("Singleton cache miss for %s — creating new cached content", key[:12])
     try:
-        resp_body = await client.create_cached_content(payload)
+        entry = await _create_once(key, payload, client, superseded=entry)
     except Exception as exc:
         logger.error("Failed to create cached content: %s", exc)
         return {"errorMessage": str(exc)}
 
-    cached_name = resp_body.get("name", "")
+    return {"cachedContent": {"name": entry.name}}
+
+
+async def _maybe_extend_ttl(entry: _CacheEntry, client: BackendClient) -> bool:
+    """Extend the Gemini-side TTL if the entry is getting stale.
+
+    Throttled: only PATCHes when more than EXTEND_THRESHOLD_SECONDS have
+    elapsed since the last extension. Failures are logged, not raised.
+
+    Returns False if the PATCH failed, True otherwise.
+    """
+    now = time.time()
+    if now - entry.last_extended_at < EXTEND_THRESHOLD_SECONDS:
+        return True  # Plenty of TTL left, skip.
+
+    try:
+        await client.update_cached_content(
+            entry.name, {"ttl": f"{CACHE_TTL_SECONDS}s"}
+        )
+    except Exception as exc:
+        logger.warning("Failed to extend TTL for %s: %s", entry.name, exc)
+        return False
+    entry.last_extended_at = now
+    _stats.extensions += 1
+    logger.info("Extended TTL for %s", entry.name)
+    return True
+
+
+# -- internal ----------------------------------------------------------------
+
+
+async def _create_once(
+    key: str,
+    payload: dict[str, Any],
+    client: BackendClient,
+    *,
+    superseded: _CacheEntry | None,
+) -> _CacheEntry:
+    """Create the resource for ``key``, sharing any creation in flight."""
+    global _inflight_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _inflight_loop:
+        # Futures belong to one loop; the module-level cache can outlive
+        # it (e.g. successive asyncio.run calls).
+        _inflight_loop = loop
+        _inflight.clear()
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            _create(key, payload, client, superseded=superseded)
+        )
+        _inflight[key] = future
+        future.add_done_callback(lambda f: _settle(key, f))
+    # Shielded so that one cancelled caller does not cancel the creation
+    # for everyone else waiting on it.
+    return await asyncio.shield(future)
+
+
+async def _create(
+    key: str,
+    payload: dict[str, Any],
+    client: BackendClient,
+    *,
+    superseded: _CacheEntry | None,
+) -> _CacheEntry:
+    try:
+        resp_body = await client.create_cached_content(payload)
+    except Exception:
+        _stats.create_failures += 1
+        raise
+    _stats.creates += 1
+
+    now = time.time()
+    entry = _CacheEntry(
+        name=resp_body.get("name", ""), created_at=now, last_extended_at=now,
+    )
+    _cache[key] = entry
+    logger.info("Singleton cache created: %s → %s", key[:12], entry.name)
+    if superseded and superseded.name != entry.name:
+        _spawn(_delete(superseded.name, client))
+    return entry
+
+
+def _settle(key: str, future: asyncio.Future[_CacheEntry]) -> None:
+    if _inflight.get(key) is future:
+        del _inflight[key]
+    if not future.cancelled():
+        # Mark the exception retrieved; every waiter has already seen it.
+        future.exception()
+
+
+def _schedule_refresh(
+    key: str,
+    entry: _CacheEntry,
+    payload: dict[str, Any],
+    client: BackendClient,
+) -> None:
+    """Refresh ``entry`` in the background once it is due."""
+    if entry.refreshing:
+        return
+    if time.time() - entry.last_extended_at < EXTEND_THRESHOLD_SECONDS:
+        return
+    entry.refreshing = True
+    _spawn(_refresh(key, entry, payload, client))
+
+
+async def _refresh(
+    key: str,
+    entry: _CacheEntry,
+    payload: dict[str, Any],
+    client: BackendClient,
+) -> None:
+    try:
+        if await _maybe_extend_ttl(entry, client):
+            return
+        if _cache.get(key) is not entry:
+            return
+        # The resource could not be extended (it may be gone): replace it
+        # before it runs out.
+        await _create_once(key, payload, client, superseded=entry)
+    except Exception as exc:
+        logger.warning("Failed to refresh cached content %s: %s", entry.name, exc)
+    finally:
+        entry.refreshing = False
+
+
+def _retire_superseded_payload(
+    flags: _Flags, key: str, client: BackendClient,
+) -> None:
+    """Drop the entry a flag combination used before its payload changed."""
+    previous = _keys_by_flags.get(flags)
+    _keys_by_flags[flags] = key
+    if previous is None or previous == key:
+        return
+    if previous in _keys_by_flags.values():
+        return  # Another flag combination still produces that payload.
+    old = _cache.pop(previous, None)
+    if old is not None:
+        _spawn(_delete(old.name, client))
+
+
+async def _delete(name: str, client: BackendClient) -> None:
+    """Delete a superseded resource. Failures are non-fatal — it expires
+    on its own."""
+    try:
+        await client.delete_cached_content(name)
+    except Exception as exc:
+        logger.warning("Failed to delete cached content %s: %s", name, exc)
+        return
+    _stats.deletes += 1
+    logger.info("Deleted superseded cached content %s", name)
 
-    # Store in cache.
-    _cache[key] = _CacheEntry(name=cached_name, created_at=now)
-    logger.info("Singleton cache created: %s → %s", key, cached_name)
 
-    return {"cachedContent": resp_body}
+def _spawn(coro: Any) -> None:
+    task = asyncio.ensure_future(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
@@ -0,0 +1,186 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for admission.py — the per-model adaptive admission limiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from opal_backend.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    LimiterConfig,
+    ModelLimiter,
+)
+
+
+async def _admit_n(limiter: ModelLimiter, n: int) -> float:
+    start = time.monotonic()
+    for _ in range(n):
+        async with limiter.admit():
+            pass
+    return time.monotonic() - start
+
+
+class TestModelLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_is_admitted_immediately(self):
+        limiter = ModelLimiter(LimiterConfig(max_rate=10))
+        assert await _admit_n(limiter, 10) < 0.05
+
+        metrics = limiter.metrics()
+        assert metrics.admitted == 10
+        assert metrics.queue_depth == 0
+        assert metrics.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_paces_beyond_burst(self):
+        limiter = ModelLimiter(LimiterConfig(max_rate=50))
+        # 50 from the bucket, then 5 more at 50/s ≈ 0.1 s.
+        elapsed = await _admit_n(limiter, 55)
+        assert 0.07 < elapsed < 0.5
+        assert limiter.metrics().max_wait_s > 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_halves_rate_and_drains_burst(self):
+        limiter = ModelLimiter(LimiterConfig(max_rate=40, min_rate=1))
+        limiter.on_rate_limited()
+        assert limiter.rate == 20
+        # No burst left: the next admission waits ~1/20 s.
+        elapsed = await _admit_n(limiter, 1)
+        assert elapsed >= 0.03
+        assert limiter.metrics().throttled == 1
+
+    def test_rate_bounds(self):
+        limiter = ModelLimiter(
+            LimiterConfig(max_rate=4, min_rate=1, increase=1)
+        )
+        for _ in range(5):
+            limiter.on_rate_limited()
+        assert limiter.rate == 1
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.rate == 4
+
+    @pytest.mark.asyncio
+    async def test_one_cut_per_congestion_window(self):
+        limiter = ModelLimiter(LimiterConfig(max_rate=64, min_rate=1))
+        wave = []
+        for _ in range(8):
+            async with limiter.admit() as ticket:
+                wave.append(ticket)
+
+        # The whole wave hits quota together: one cut, not eight.
+        for ticket in wave:
+            limiter.on_rate_limited(admitted=ticket)
+        assert limiter.rate == 32
+        assert limiter.metrics().throttled == 8
+
+        # A stream admitted after the cut opens a new window.
+        async with limiter.admit() as ticket:
+            pass
+        limiter.on_rate_limited(admitted=ticket)
+        assert limiter.rate == 16
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_admission(self):
+        limiter = ModelLimiter(LimiterConfig(max_rate=1000))
+        limiter.on_rate_limited(retry_after=0.2)
+        elapsed = await _admit_n(limiter, 1)
+        assert elapsed >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        limiter = ModelLimiter(LimiterConfig(max_concurrency=2))
+        peak = 0
+        release = asyncio.Event()
+
+        async def stream():
+            nonlocal peak
+            async with limiter.admit():
+                peak = max(peak, limiter.metrics().in_flight)
+                await release.wait()
+
+        tasks = [asyncio.create_task(stream()) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        metrics = limiter.metrics()
+        assert metrics.in_flight == 2
+        assert metrics.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 2
+        assert limiter.metrics().admitted == 5
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        limiter = ModelLimiter(LimiterConfig(max_concurrency=1, max_queue=1))
+        release = asyncio.Event()
+
+        async def stream():
+            async with limiter.admit():
+                await release.wait()
+
+        holder = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected):
+            async with limiter.admit():
+                pass
+        assert limiter.metrics().rejected == 1
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_slot(self):
+        limiter = ModelLimiter(LimiterConfig(max_concurrency=1))
+        release = asyncio.Event()
+
+        async def stream():
+            async with limiter.admit():
+                await release.wait()
+
+        holder = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.metrics().queue_depth == 0
+
+        release.set()
+        await holder
+        assert await _admit_n(limiter, 1) < 0.05
+
+    def test_survives_successive_event_loops(self):
+        limiter = ModelLimiter(LimiterConfig(max_concurrency=1))
+        asyncio.run(_admit_n(limiter, 2))
+        asyncio.run(_admit_n(limiter, 2))
+        assert limiter.metrics().admitted == 4
+
+
+class TestAdmissionController:
+    def test_one_limiter_per_model(self):
+        controller = AdmissionController()
+        assert controller.limiter("a") is controller.limiter("a")
+        assert controller.limiter("a") is not controller.limiter("b")
+
+    def test_metrics_by_model(self):
+        controller = AdmissionController(LimiterConfig(max_rate=8))
+        controller.limiter("a").on_rate_limited()
+        controller.limiter("b")
+
+        metrics = controller.metrics()
+        assert metrics["a"].throttled == 1
+        assert metrics["a"].rate == 4
+        assert metrics["b"].rate == 8
@@ -7,18 +7,31 @@ Tests for conform_body.py.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
+from opal_backend import gemini_file_cache
 from opal_backend.conform_body import (
+    ContentConformer,
     conform_body,
     _maybe_blob,
 )
+from opal_backend.gemini_file_cache import GeminiFileCache
+from opal_backend.local.backend_client_impl import HttpBackendClient
 
 TOKEN = "test-token"
 
+
+@pytest.fixture(autouse=True)
+def _fresh_file_cache(monkeypatch):
+    """Isolate the process-wide upload cache per test."""
+    monkeypatch.setattr(gemini_file_cache, "_cache", GeminiFileCache())
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -37,9 +50,11 @@ def first_parts(result: dict) -> list[dict]:
 def mock_backend(
     file_url: str = "files/abc",
     mime_type: str = "image/png",
+    principal: str | None = TOKEN,
 ):
     """Create a mock BackendClient that returns upload responses."""
     backend = AsyncMock()
+    backend.cache_principal = principal
     backend.upload_gemini_file = AsyncMock(
         return_value={"fileUrl": file_url, "mimeType": mime_type}
     )
@@ -407,3 +422,204 @@ class TestMixedContent:
         )
         assert result["tools"] == body["tools"]
         assert result["generationConfig"] == body["generationConfig"]
+
+
+# ---------------------------------------------------------------------------
+# Upload cache
+# ---------------------------------------------------------------------------
+
+
+def drive_part(file_id: str, resource_key: str | None = None) -> dict:
+    file_data = {"fileUri": f"drive:/{file_id}", "mimeType": "application/pdf"}
+    if resource_key:
+        file_data["resourceKey"] = resource_key
+    return {"fileData": file_data}
+
+
+class TestUploadCache:
+    @pytest.mark.asyncio
+    async def test_uploads_each_handle_once_across_calls(self):
+        """A handle is uploaded once, even from a different session."""
+        first = mock_backend("files/pdf", "application/pdf")
+        second = mock_backend("files/other", "application/pdf")
+        body = body_with_parts([drive_part("doc")])
+
+        await conform_body(body, backend=first)
+        result = await conform_body(body, backend=second)
+
+        assert first.upload_gemini_file.await_count == 1
+        second.upload_gemini_file.assert_not_awaited()
+        assert first_parts(result)[0]["fileData"]["fileUri"].endswith("files/pdf")
+
+    @pytest.mark.asyncio
+    async def test_uploads_are_not_shared_across_tokens(self):
+        """Each token's upload is what checks its access to the file."""
+        uploads: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            token = json.loads(request.content)["accessToken"]
+            uploads.append(token)
+            return httpx.Response(
+                200, json={"fileUrl": f"files/{token}", "mimeType": "x"},
+            )
+
+        def backend(token: str) -> HttpBackendClient:
+            return HttpBackendClient(
+                upstream_base="http://op.example.com",
+                httpx_client=httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler),
+                ),
+                access_token=token,
+            )
+
+        body = body_with_parts([drive_part("doc")])
+        alice = await conform_body(body, backend=backend("alice"))
+        bob = await conform_body(body, backend=backend("bob"))
+        await conform_body(body, backend=backend("alice"))
+
+        assert uploads == ["alice", "bob"]
+        assert first_parts(alice)[0]["fileData"]["fileUri"].endswith("alice")
+        assert first_parts(bob)[0]["fileData"]["fileUri"].endswith("bob")
+
+    @pytest.mark.asyncio
+    async def test_backend_without_principal_is_not_cached(self):
+        backend = mock_backend(principal=None)
+        body = body_with_parts([drive_part("doc")])
+        await conform_body(body, backend=backend)
+        await conform_body(body, backend=backend)
+        assert backend.upload_gemini_file.await_count == 2
+        assert gemini_file_cache.get_gemini_file_cache().stats().entries == 0
+
+    @pytest.mark.asyncio
+    async def test_resource_key_is_part_of_the_key(self):
+        backend = mock_backend()
+        await conform_body(body_with_parts([drive_part("doc")]), backend=backend)
+        await conform_body(
+            body_with_parts([drive_part("doc", "rk")]), backend=backend
+        )
+        assert backend.upload_gemini_file.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_uploads_are_shared(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def upload(request):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"fileUrl": "files/once", "mimeType": "application/pdf"}
+
+        backend = mock_backend()
+        backend.upload_gemini_file = upload
+        body = body_with_parts([drive_part("doc")])
+        tasks = [
+            asyncio.create_task(conform_body(body, backend=backend))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(first_parts(r) == first_parts(results[0]) for r in results)
+        stats = gemini_file_cache.get_gemini_file_cache().stats()
+        assert (stats.misses, stats.shared) == (1, 4)
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_not_cached(self):
+        backend = mock_backend()
+        backend.upload_gemini_file = AsyncMock(
+            side_effect=[ValueError("boom"), {"fileUrl": "files/ok", "mimeType": "x"}]
+        )
+        body = body_with_parts([drive_part("doc")])
+        with pytest.raises(ValueError):
+            await conform_body(body, backend=backend)
+        result = await conform_body(body, backend=backend)
+        assert first_parts(result)[0]["fileData"]["fileUri"].endswith("files/ok")
+
+    @pytest.mark.asyncio
+    async def test_honors_expiration_time(self):
+        soon = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 30 * 60)
+        )
+        backend = mock_backend()
+        backend.upload_gemini_file = AsyncMock(
+            return_value={
+                "fileUrl": "files/short",
+                "mimeType": "application/pdf",
+                "expirationTime": soon,
+            }
+        )
+        body = body_with_parts([drive_part("doc")])
+        await conform_body(body, backend=backend)
+        # Expires within the safety margin, so it is uploaded again.
+        await conform_body(body, backend=backend)
+        assert backend.upload_gemini_file.await_count == 2
+        assert gemini_file_cache.get_gemini_file_cache().stats().expired == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = GeminiFileCache(max_entries=2)
+        backend = mock_backend()
+        for file_id in ("a", "b", "a", "c", "a"):
+            await conform_body(
+                body_with_parts([drive_part(file_id)]),
+                backend=backend,
+                file_cache=cache,
+            )
+        # "b" was evicted by "c"; "a" stayed warm throughout.
+        assert backend.upload_gemini_file.await_count == 3
+        assert cache.stats().entries == 2
+
+
+# ---------------------------------------------------------------------------
+# ContentConformer
+# ---------------------------------------------------------------------------
+
+
+class TestContentConformer:
+    @pytest.mark.asyncio
+    async def test_transforms_only_appended_contents(self):
+        backend = mock_backend()
+        cache = GeminiFileCache()
+        conformer = ContentConformer(backend=backend, file_cache=cache)
+        contents = [{"parts": [drive_part("doc")], "role": "user"}]
+
+        first = await conformer.conform({"contents": contents})
+        contents.append({"parts": [{"json": {"turn": 1}}], "role": "model"})
+        contents.append({"parts": [drive_part("other")], "role": "user"})
+        second = await conformer.conform({"contents": contents})
+
+        # One lookup per handle: the first entry was not transformed again.
+        assert cache.stats().misses + cache.stats().hits == 2
+        assert second["contents"][0] is first["contents"][0]
+        assert second["contents"][1]["parts"] == [{"text": '{"turn": 1}'}]
+        assert "fileData" in second["contents"][2]["parts"][0]
+
+    @pytest.mark.asyncio
+    async def test_matches_conform_body(self):
+        backend = mock_backend("files/x", "image/png")
+        contents = [
+            {"parts": [{"json": {"a": 1}}], "role": "user"},
+            {"parts": [], "role": "model"},
+            {"parts": [drive_part("d"), {"text": "t"}], "role": "user"},
+        ]
+        conformer = ContentConformer(backend=backend)
+        assert await conformer.conform({"contents": contents}) == (
+            await conform_body({"contents": contents}, backend=backend)
+        )
+
+    @pytest.mark.asyncio
+    async def test_slices_reuse_earlier_transforms(self):
+        """A body carrying only the uncached tail still hits the memo."""
+        backend = mock_backend()
+        cache = GeminiFileCache()
+        conformer = ContentConformer(backend=backend, file_cache=cache)
+        contents = [
+            {"parts": [drive_part("a")], "role": "user"},
+            {"parts": [drive_part("b")], "role": "user"},
+        ]
+        await conformer.conform({"contents": contents})
+        await conformer.conform({"contents": contents[1:]})
+        assert cache.stats().misses + cache.stats().hits == 2
@@ -0,0 +1,158 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for InMemoryEventBus."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from opal_backend.event_bus import EventBus, EventSubscription
+from opal_backend.local.event_bus_impl import InMemoryEventBus
+
+
+async def _publish(bus: InMemoryEventBus, count: int, **extra) -> None:
+    for i in range(count):
+        await bus.publish("s1", {"n": i, **extra}, index=i)
+
+
+class TestProtocol:
+    def test_satisfies_protocol(self):
+        bus = InMemoryEventBus()
+        assert isinstance(bus, EventBus)
+        assert isinstance(bus.subscribe("s1"), EventSubscription)
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            InMemoryEventBus(overflow="block")  # type: ignore[arg-type]
+
+
+class TestFanOut:
+    async def test_subscribers_share_one_encoding(self):
+        bus = InMemoryEventBus()
+        first = bus.subscribe("s1")
+        second = bus.subscribe("s1")
+
+        await bus.publish("s1", {"type": "x"}, index=0)
+        await bus.close("s1")
+        a = [p async for p in first.published()]
+        b = [p async for p in second.published()]
+
+        assert a[0] is b[0]
+        assert a[0].data is b[0].data
+        assert a[0].data == b'{"type": "x"}'
+
+    async def test_position_and_dict_iteration(self):
+        bus = InMemoryEventBus()
+        await bus.publish("s1", {"type": "x"}, index=4)
+        subscription = bus.subscribe("s1")
+        assert subscription.position == 4
+
+        await bus.publish("s1", {"type": "y"}, index=5)
+        await bus.close("s1")
+        assert [e async for e in subscription] == [{"type": "y"}]
+
+    async def test_slow_subscriber_disconnected(self):
+        bus = InMemoryEventBus(max_pending=2)
+        slow = bus.subscribe("s1")
+        fast = bus.subscribe("s1")
+
+        for i in range(3):
+            await bus.publish("s1", {"n": i}, index=i)
+            if i < 2:
+                await fast.__anext__()
+
+        assert slow.overflowed
+        assert [e async for e in slow] == []
+        assert not fast.overflowed
+        assert bus._subscriptions["s1"] == [fast]
+
+    async def test_publish_does_not_wait_for_readers(self):
+        bus = InMemoryEventBus(max_pending=10, overflow="drop_oldest")
+        bus.subscribe("s1")
+        # No reader ever runs; publishing must still complete.
+        await asyncio.wait_for(_publish(bus, 100), timeout=1)
+
+
+class TestOverflowPolicies:
+    async def test_drop_oldest(self):
+        bus = InMemoryEventBus(max_pending=3, overflow="drop_oldest")
+        subscription = bus.subscribe("s1")
+        await _publish(bus, 5)
+        await bus.close("s1")
+
+        assert [e["n"] async for e in subscription] == [2, 3, 4]
+        assert not subscription.overflowed
+
+    async def test_coalesce_replaces_same_key(self):
+        bus = InMemoryEventBus(max_pending=2, overflow="coalesce")
+        subscription = bus.subscribe("s1")
+        await bus.publish("s1", {"type": "nodeStart", "nodeId": "a"})
+        await bus.publish("s1", {"type": "progress", "nodeId": "a", "p": 1})
+        await bus.publish("s1", {"type": "progress", "nodeId": "a", "p": 2})
+        await bus.publish("s1", {"type": "progress", "nodeId": "a", "p": 3})
+        await bus.close("s1")
+
+        assert [e async for e in subscription] == [
+            {"type": "nodeStart", "nodeId": "a"},
+            {"type": "progress", "nodeId": "a", "p": 3},
+        ]
+
+    async def test_coalesce_after_consuming(self):
+        bus = InMemoryEventBus(
+            max_pending=2, overflow="coalesce",
+            coalesce_key=lambda event: event["k"],
+        )
+        subscription = bus.subscribe("s1")
+        await bus.publish("s1", {"k": "a", "n": 0})
+        await bus.publish("s1", {"k": "b", "n": 1})
+        assert (await subscription.__anext__())["n"] == 0
+        await bus.publish("s1", {"k": "b", "n": 2})
+        await bus.publish("s1", {"k": "b", "n": 3})
+        await bus.close("s1")
+
+        # The newest "b" replaced n=2, not the older n=1.
+        assert [e["n"] async for e in subscription] == [1, 3]
+
+    async def test_coalesce_falls_back_to_drop_oldest(self):
+        bus = InMemoryEventBus(
+            max_pending=2, overflow="coalesce",
+            coalesce_key=lambda event: event["n"],
+        )
+        subscription = bus.subscribe("s1")
+        await _publish(bus, 3)
+        await bus.close("s1")
+
+        assert [e["n"] async for e in subscription] == [1, 2]
+
+
+class TestMetrics:
+    async def test_depth_lag_and_counters(self):
+        bus = InMemoryEventBus(max_pending=4, overflow="drop_oldest")
+        slow = bus.subscribe("s1")
+        fast = bus.subscribe("s1")
+        await _publish(bus, 6)
+        for _ in range(4):
+            await fast.__anext__()
+        await slow.__anext__()
+
+        metrics = bus.metrics()["s1"]
+        assert metrics.subscribers == 2
+        assert metrics.queue_depth == 3
+        assert metrics.max_queue_depth == 3
+        # slow consumed index 2 of 5.
+        assert metrics.max_lag == 3
+        assert metrics.published == 6
+        assert metrics.dropped == 4
+
+    async def test_disconnect_counted_and_close_clears(self):
+        bus = InMemoryEventBus(max_pending=1)
+        bus.subscribe("s1")
+        await _publish(bus, 2)
+        assert bus.metrics()["s1"].disconnected == 1
+        assert bus.metrics()["s1"].subscribers == 0
+
+        await bus.close("s1")
+        assert bus.metrics() == {}
@@ -100,6 +100,126 @@ async def test_get_events_after(store):
     assert len(events) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_events_limit(store):
+    await store.create("sess-1")
+    for i in range(10):
+        await store.append_event("sess-1", {"i": i, "text": "é" * i})
+
+    events = await store.get_events("sess-1", after=6, limit=2)
+    assert [e["i"] for e in events] == [7, 8]
+    assert events[0]["text"] == "é" * 7
+
+    events = await store.get_events("sess-1", after=8, limit=5)
+    assert [e["i"] for e in events] == [9]
+
+
+@pytest.mark.asyncio
+async def test_iter_events_streams_in_batches(store):
+    await store.create("sess-1")
+    for i in range(7):
+        await store.append_event("sess-1", {"i": i})
+
+    streamed = [
+        e["i"] async for e in store.iter_events("sess-1", after=1, batch_size=2)
+    ]
+    assert streamed == [2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_event_index_rebuilt_for_unindexed_log(store, tmp_path):
+    """A session written without events.idx is indexed by its writer."""
+    import json
+
+    await store.create("sess-1")
+    (tmp_path / "sess-1" / "events.jsonl").write_text(
+        "".join(json.dumps({"i": i}) + "\n" for i in range(4))
+    )
+
+    fresh = FileBasedSessionStore(tmp_path)
+    events = await fresh.get_events("sess-1", after=2)
+    assert [e["i"] for e in events] == [3]
+    # Reads never write the index.
+    assert not (tmp_path / "sess-1" / "events.idx").exists()
+    assert await fresh.append_event("sess-1", {"i": 4}) == 4
+    assert (tmp_path / "sess-1" / "events.idx").stat().st_size == 5 * 8
+
+
+@pytest.mark.asyncio
+async def test_event_index_catches_up_with_external_appends(store, tmp_path):
+    import json
+
+    await store.create("sess-1")
+    await store.append_event("sess-1", {"i": 0})
+    # Appended by a writer that doesn't maintain the index.
+    with open(tmp_path / "sess-1" / "events.jsonl", "a") as f:
+        f.write(json.dumps({"i": 1}) + "\n")
+        f.write('{"i": 2')  # Still being written.
+
+    events = await store.get_events("sess-1")
+    assert [e["i"] for e in events] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_reader_between_writes_leaves_index_alone(
+    store, tmp_path, monkeypatch
+):
+    """A reader that reads between the writer's two writes can't shift it."""
+    from opal_backend.sessions import file_store
+
+    await store.create("sess-1")
+    await store.append_event("sess-1", {"i": 0})
+    reader = FileBasedSessionStore(tmp_path)
+    seen = []
+
+    def open_after_reading(file, mode="r", *args, **kwargs):
+        # Read just before the writer appends its offset to events.idx.
+        if str(file).endswith("events.idx") and mode == "ab":
+            seen.append(reader._scan_event_index("sess-1"))
+        return open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(file_store, "open", open_after_reading, raising=False)
+    assert await store.append_event("sess-1", {"i": 1}) == 1
+    monkeypatch.undo()
+
+    assert seen == [(1, [seen[0][1][0]])]
+    assert (tmp_path / "sess-1" / "events.idx").stat().st_size == 2 * 8
+    assert await store.append_event("sess-1", {"i": 2}) == 2
+    events = await reader.get_events("sess-1", after=0)
+    assert [e["i"] for e in events] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_event_index_recovers_from_torn_entry(store, tmp_path):
+    await store.create("sess-1")
+    for i in range(3):
+        await store.append_event("sess-1", {"i": i})
+    with open(tmp_path / "sess-1" / "events.idx", "ab") as f:
+        f.write(b"\x01\x02")
+
+    fresh = FileBasedSessionStore(tmp_path)
+    events = await fresh.get_events("sess-1", after=0)
+    assert [e["i"] for e in events] == [1, 2]
+    assert await fresh.append_event("sess-1", {"i": 3}) == 3
+    events = await fresh.get_events("sess-1", after=2)
+    assert [e["i"] for e in events] == [3]
+
+
+@pytest.mark.asyncio
+async def test_event_index_rebuilt_when_log_rewritten(store, tmp_path):
+    import json
+
+    await store.create("sess-1")
+    for i in range(5):
+        await store.append_event("sess-1", {"i": i, "pad": "x" * 50})
+    (tmp_path / "sess-1" / "events.jsonl").write_text(
+        json.dumps({"i": "new"}) + "\n"
+    )
+
+    events = await FileBasedSessionStore(tmp_path).get_events("sess-1")
+    assert events == [{"i": "new"}]
+
+
 @pytest.mark.asyncio
 async def test_append_event_not_found(store):
     with pytest.raises(KeyError):
@@ -205,6 +325,91 @@ async def test_interaction_store_clear(store):
     assert await store.has("int-b") is False
 
 
+# ── Resume ID Index ──
+
+
+@pytest.mark.asyncio
+async def test_resume_lookup_uses_index(store, monkeypatch):
+    for i in range(5):
+        await store.create(f"sess-{i}")
+        await store.set_resume_id(f"sess-{i}", f"int-{i}")
+
+    def no_scan():
+        raise AssertionError("lookup rescanned the session directories")
+
+    monkeypatch.setattr(store, "_rebuild_resume_index", no_scan)
+    assert await store.get_session_by_resume_id("int-3") == "sess-3"
+    assert await store.get_session_by_resume_id("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_resume_index_is_persisted(store, tmp_path, monkeypatch):
+    await store.create("sess-1")
+    await store.set_resume_id("sess-1", "int-1")
+
+    fresh = FileBasedSessionStore(tmp_path)
+    monkeypatch.setattr(fresh, "_rebuild_resume_index", None)
+    assert await fresh.get_session_by_resume_id("int-1") == "sess-1"
+
+
+@pytest.mark.asyncio
+async def test_resume_index_replaces_previous_id(store):
+    await store.create("sess-1")
+    await store.set_resume_id("sess-1", "int-old")
+    await store.set_resume_id("sess-1", "int-new")
+
+    assert await store.get_session_by_resume_id("int-old") is None
+    assert await store.get_session_by_resume_id("int-new") == "sess-1"
+
+
+@pytest.mark.asyncio
+async def test_resume_index_cleared_by_consumers(store):
+    await store.create("sess-a")
+    await store.create("sess-b")
+    await store.save("int-a", _make_interaction_state("sess-a"))
+    await store.set_resume_id("sess-b", "int-b")
+
+    await store.load("int-a")
+    assert await store.get_resume_id("sess-b") == "int-b"
+
+    fresh = FileBasedSessionStore(store.base_dir)
+    assert fresh._load_resume_index() == {}
+
+
+@pytest.mark.asyncio
+async def test_resume_index_rebuilt_when_missing(store, tmp_path):
+    await store.create("sess-1")
+    await store.set_resume_id("sess-1", "int-1")
+    (tmp_path / ".index" / "resume_ids.json").unlink()
+
+    fresh = FileBasedSessionStore(tmp_path)
+    assert await fresh.get_session_by_resume_id("int-1") == "sess-1"
+    assert (tmp_path / ".index" / "resume_ids.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_resume_index_sees_sessions_created_outside(store, tmp_path):
+    await store.create("sess-1")
+    assert await store.get_session_by_resume_id("int-2") is None
+
+    # Written directly, as legacy migrations do.
+    sdir = tmp_path / "sess-2"
+    sdir.mkdir()
+    (sdir / "resume_id").write_text("int-2")
+
+    assert await store.get_session_by_resume_id("int-2") == "sess-2"
+
+
+@pytest.mark.asyncio
+async def test_resume_index_drops_ids_cleared_outside(store, tmp_path):
+    await store.create("sess-1")
+    await store.set_resume_id("sess-1", "int-1")
+    (tmp_path / "sess-1" / "resume_id").unlink()
+
+    assert await store.get_session_by_resume_id("int-1") is None
+    assert await store.has("int-1") is False
+
+
 # ── Turn Checkpoints ──
 
 
@@ -253,3 +458,150 @@ async def test_turn_checkpoints(store):
     assert checkpoints2[1]["token_metadata"] == {"totalTokens": 42}  # Updated
 
 
+
+
+@pytest.mark.asyncio
+async def test_turn_updates_append_patch_records(store, tmp_path):
+    import json
+
+    await store.create("sess-1")
+    await store.record_turn_boundary("sess-1", 0, 3, None)
+    await store.record_turn_boundary(
+        "sess-1", 0, 0, None, token_metadata={"totalTokens": 7},
+    )
+    # Nothing to change: no record is written.
+    await store.record_turn_boundary("sess-1", 0, 0, None)
+
+    lines = (tmp_path / "sess-1" / "turns.jsonl").read_text().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert records == [
+        {
+            "op": "checkpoint", "turn": 0, "context_length": 3,
+            "file_system": None, "token_metadata": None,
+        },
+        {"op": "patch", "turn": 0, "token_metadata": {"totalTokens": 7}},
+    ]
+    assert not (tmp_path / "sess-1" / "turns.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_turn_log_is_read_by_a_fresh_store(store, tmp_path):
+    await store.create("sess-1")
+    for turn in range(3):
+        await store.record_turn_boundary("sess-1", turn, turn + 1, None)
+        await store.record_turn_boundary(
+            "sess-1", turn, 0, None, token_metadata={"turn": turn},
+        )
+
+    reopened = FileBasedSessionStore(tmp_path)
+    checkpoints = await reopened.get_turn_boundaries("sess-1")
+    assert [cp["context_length"] for cp in checkpoints] == [1, 2, 3]
+    assert [cp["token_metadata"] for cp in checkpoints] == [
+        {"turn": 0}, {"turn": 1}, {"turn": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_turn_index_sees_appends_from_another_store(store, tmp_path):
+    await store.create("sess-1")
+    await store.record_turn_boundary("sess-1", 0, 1, None)
+    assert len(await store.get_turn_boundaries("sess-1")) == 1
+
+    other = FileBasedSessionStore(tmp_path)
+    await other.record_turn_boundary("sess-1", 1, 2, None)
+    assert len(await store.get_turn_boundaries("sess-1")) == 2
+
+
+@pytest.mark.asyncio
+async def test_turn_log_skips_torn_trailing_line(store, tmp_path):
+    await store.create("sess-1")
+    await store.record_turn_boundary("sess-1", 0, 1, None)
+    with open(tmp_path / "sess-1" / "turns.jsonl", "a") as f:
+        f.write('{"op": "patch", "tu')
+
+    reopened = FileBasedSessionStore(tmp_path)
+    checkpoints = await reopened.get_turn_boundaries("sess-1")
+    assert [cp["turn"] for cp in checkpoints] == [0]
+
+
+@pytest.mark.asyncio
+async def test_compact_turns_folds_patches(store, tmp_path):
+    from opal_backend.agent_file_system import FileDescriptor
+
+    await store.create("sess-1")
+    fs_snap = FileSystemSnapshot(
+        files={
+            "a.md": FileDescriptor(
+                data="a", mime_type="text/markdown", type="text",
+            ),
+        },
+        routes={},
+        file_count=1,
+    )
+    await store.record_turn_boundary("sess-1", 0, 1, None)
+    await store.record_turn_boundary("sess-1", 0, 0, fs_snap)
+    await store.record_turn_boundary(
+        "sess-1", 0, 0, None, token_metadata={"totalTokens": 1},
+    )
+    before = await store.get_turn_boundaries("sess-1")
+
+    await store.compact_turns("sess-1")
+    log_file = tmp_path / "sess-1" / "turns.jsonl"
+    assert len(log_file.read_text().splitlines()) == 1
+    after = await FileBasedSessionStore(tmp_path).get_turn_boundaries("sess-1")
+    assert after == before
+    assert after[0]["file_system"].files["a.md"].data == "a"
+
+
+@pytest.mark.asyncio
+async def test_turn_log_compacts_when_patches_dominate(store, tmp_path):
+    await store.create("sess-1")
+    await store.record_turn_boundary("sess-1", 0, 1, None)
+    for i in range(100):
+        await store.record_turn_boundary(
+            "sess-1", 0, 0, None, token_metadata={"i": i},
+        )
+
+    lines = (tmp_path / "sess-1" / "turns.jsonl").read_text().splitlines()
+    assert len(lines) < 64
+    checkpoints = await FileBasedSessionStore(tmp_path).get_turn_boundaries(
+        "sess-1"
+    )
+    assert checkpoints[0]["token_metadata"] == {"i": 99}
+
+
+@pytest.mark.asyncio
+async def test_legacy_turns_json_is_read_and_migrated(store, tmp_path):
+    import json
+
+    sdir = tmp_path / "sess-1"
+    await store.create("sess-1")
+    (sdir / "turns.json").write_text(json.dumps([
+        {
+            "turn": 0, "context_length": 4,
+            "file_system": {"files": {}, "routes": {}, "file_count": 0},
+            "token_metadata": None,
+        },
+    ]))
+
+    checkpoints = await store.get_turn_boundaries("sess-1")
+    assert checkpoints[0]["context_length"] == 4
+    assert checkpoints[0]["file_system"] is not None
+
+    await store.record_turn_boundary("sess-1", 1, 9, None)
+    assert not (sdir / "turns.json").exists()
+    checkpoints = await FileBasedSessionStore(tmp_path).get_turn_boundaries(
+        "sess-1"
+    )
+    assert [cp["context_length"] for cp in checkpoints] == [4, 9]
+
+
+@pytest.mark.asyncio
+async def test_malformed_legacy_turns_json_reads_as_empty(store, tmp_path):
+    await store.create("sess-1")
+    (tmp_path / "sess-1" / "turns.json").write_text('[{"turn": 0, "con')
+
+    assert await store.get_turn_boundaries("sess-1") == []
+    await store.record_turn_boundary("sess-1", 0, 3, None)
+    checkpoints = await store.get_turn_boundaries("sess-1")
+    assert [cp["context_length"] for cp in checkpoints] == [3]
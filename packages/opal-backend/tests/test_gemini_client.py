@@ -11,6 +11,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from opal_backend import admission
+from opal_backend.admission import AdmissionController, LimiterConfig
 from opal_backend.gemini_client import (
     GeminiAPIError,
     _backoff_delay,
@@ -18,6 +20,12 @@ from opal_backend.gemini_client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_admission(monkeypatch):
+    """Isolate the process-wide admission controller per test."""
+    monkeypatch.setattr(admission, "_controller", AdmissionController())
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -285,6 +293,86 @@ class TestTransientErrorRetry:
         assert text == "finally"
 
 
+class TestAdmission:
+    """Streams pass through the shared per-model admission limiter."""
+
+    @pytest.mark.asyncio
+    async def test_each_attempt_is_admitted(self):
+        controller = AdmissionController()
+        backend = _make_backend([
+            GeminiAPIError("429", status_code=429),
+            [_content_chunk("ok")],
+        ])
+
+        async for _ in stream_generate_content(
+            "model", {}, backend=backend, admission=controller,
+        ):
+            pass
+
+        metrics = controller.metrics()["model"]
+        assert metrics.admitted == 2
+        assert metrics.throttled == 1
+        assert metrics.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_admission_slot(self):
+        controller = AdmissionController()
+        backend = _make_backend([
+            [_content_chunk("one"), _content_chunk("two")],
+        ])
+
+        stream = stream_generate_content(
+            "model", {}, backend=backend, admission=controller,
+        )
+        await anext(stream)
+        assert controller.metrics()["model"].in_flight == 1
+
+        await stream.aclose()
+        assert controller.metrics()["model"].in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_reaches_limiter(self):
+        controller = AdmissionController(LimiterConfig(max_rate=1000))
+        limiter = controller.limiter("model")
+        seen: list[float | None] = []
+        limiter.on_rate_limited = (  # type: ignore[method-assign]
+            lambda retry_after, **_: seen.append(retry_after)
+        )
+        backend = _make_backend([
+            GeminiAPIError("429", status_code=429, retry_after=0.01),
+            [_content_chunk("ok")],
+        ])
+
+        async for _ in stream_generate_content(
+            "model", {}, backend=backend, admission=controller,
+        ):
+            pass
+
+        assert seen == [0.01]
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_do_not_throttle(self):
+        controller = AdmissionController()
+        backend = _make_backend([GeminiAPIError("400", status_code=400)])
+
+        with pytest.raises(GeminiAPIError):
+            async for _ in stream_generate_content(
+                "model", {}, backend=backend, admission=controller,
+            ):
+                pass
+
+        assert controller.metrics()["model"].throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_uses_process_wide_controller_by_default(self):
+        backend = _make_backend([[_content_chunk("ok")]])
+
+        async for _ in stream_generate_content("m", {}, backend=backend):
+            pass
+
+        assert admission.get_admission_controller().metrics()["m"].admitted == 1
+
+
 class TestGeminiAPIError:
     """Tests for GeminiAPIError classification."""
 
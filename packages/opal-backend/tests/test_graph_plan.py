@@ -8,7 +8,7 @@ Ported from visual-editor/tests/runtime/create-plan.ts.
 
 import pytest
 
-from opal_backend.graph_plan import create_plan
+from opal_backend.graph_plan import PlanIndex, create_plan
 from opal_backend.graph_types import Edge, GraphDescriptor, NodeDescriptor
 
 
@@ -254,3 +254,25 @@ class TestPortHandling:
 
         transform = plan.stages[1][0]
         assert transform.upstream[0].in_port == "text"
+
+
+# ── plan index ──
+
+
+class TestPlanIndex:
+    def test_indexes_nodes_and_edges(self):
+        g = _graph(
+            [{"id": "a"}, {"id": "b", "type": "llm"}, {"id": "c"}],
+            [{"from": "a", "to": "b"}, {"from": "a", "to": "c"},
+             {"from": "b", "to": "c"}],
+        )
+        index = PlanIndex.from_plan(create_plan(g))
+        assert index.nodes["b"].node.type == "llm"
+        assert [e.to_node for e in index.downstream["a"]] == ["b", "c"]
+        assert [e.from_node for e in index.upstream["c"]] == ["a", "b"]
+        assert index.upstream["a"] == []
+        assert index.order == {"a": 0, "b": 1, "c": 2}
+
+    def test_empty_plan(self):
+        index = PlanIndex.from_plan(create_plan(_graph([], [])))
+        assert index.nodes == {}
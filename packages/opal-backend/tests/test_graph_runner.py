@@ -159,6 +159,27 @@ class TestTwoNodeLinear:
         assert "gen" in outputs
         assert "out" in outputs
 
+    @pytest.mark.asyncio
+    async def test_plan_index_dropped_on_completion(self):
+        store = InMemoryGraphSessionStore()
+        bus = InMemoryEventBus()
+        runner = GraphRunner(store=store, event_bus=bus, scheduler=None)
+        scheduler = LocalTaskScheduler(run_fn=runner.run_node)
+        runner._scheduler = scheduler
+
+        await store.create("s1", _two_node_plan())
+        assert await runner._get_node_type("s1", "out") == "output"
+        assert await runner._get_node_type("s1", "nope") == "unknown"
+        assert "s1" in runner._plan_indexes
+
+        await runner.start_graph("s1")
+        subscriber = bus.subscribe("s1")
+        async for event in subscriber:
+            if event.get("type") == "graphComplete":
+                break
+
+        assert "s1" not in runner._plan_indexes
+
 
 class TestThreeNodeLinear:
     @pytest.mark.asyncio
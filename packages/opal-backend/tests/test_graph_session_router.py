@@ -35,7 +35,7 @@ def _create_app():
 
     app = FastAPI()
     app.include_router(router)
-    return app, store, bus
+    return app, store, bus, runner
 
 
 def _simple_graph() -> dict:
@@ -102,7 +102,7 @@ class TestCreateGraphSession:
 
 class TestStreamGraphEvents:
     def test_sse_stream_has_events(self):
-        app, store, bus = _create_app()
+        app, store, bus, _ = _create_app()
         client = TestClient(app)
 
         # Create session.
@@ -155,7 +155,7 @@ class TestStreamGraphEvents:
         assert resp.status_code == 404
 
     def test_replay_with_after_parameter(self):
-        app, store, bus = _create_app()
+        app, store, bus, _ = _create_app()
         client = TestClient(app)
 
         resp = client.post(
@@ -221,6 +221,21 @@ class TestCancelEndpoint:
         data = resp.json()
         assert data["status"] == "cancelled"
 
+    def test_cancel_forgets_session_state(self):
+        app, _, _, runner = _create_app()
+        client = TestClient(app)
+
+        resp = client.post(
+            "/v1beta1/graphSessions/new",
+            json={"graph": _simple_graph(), "accessToken": "token"},
+        )
+        session_id = resp.json()["sessionId"]
+        runner._plan_indexes[session_id] = object()
+
+        client.post(f"/v1beta1/graphSessions/{session_id}:cancel")
+        assert session_id not in runner._plan_indexes
+        assert session_id not in runner._session_auth
+
     def test_cancel_not_found(self):
         app, *_ = _create_app()
         client = TestClient(app)
@@ -245,7 +260,7 @@ def _input_output_graph() -> dict:
 
 class TestResumeEndpoint:
     def test_resume_completes_suspended_graph(self):
-        app, store, bus = _create_app()
+        app, store, bus, _ = _create_app()
         client = TestClient(app)
 
         # Create — will suspend at input.
@@ -246,6 +246,44 @@ class TestMarkNodeFailed:
         state = store._sessions["s1"]
         assert state.nodes["c"].status == "skipped"
 
+    @pytest.mark.asyncio
+    async def test_returns_ready_nodes_on_other_paths(self):
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _diamond_plan())
+        await store.complete_node("s1", "start", {"data": "x"})
+
+        ready = await store.mark_node_failed("s1", "left", "error")
+        assert ready == ["right"]
+        state = store._sessions["s1"]
+        assert state.nodes["merge"].status == "skipped"
+        assert state.ready == {"right"}
+
+    @pytest.mark.asyncio
+    async def test_ready_set_tracks_status(self):
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _diamond_plan())
+        state = store._sessions["s1"]
+        assert state.ready == {"start"}
+
+        await store.complete_node("s1", "start", {"data": "x"})
+        assert state.ready == {"left", "right"}
+
+        await store.suspend_node(
+            "s1", "left", "int-1",
+            SuspendedNodeState(node_id="left", interaction_id="int-1"),
+        )
+        assert state.ready == {"right"}
+
+    @pytest.mark.asyncio
+    async def test_running_nodes_not_returned(self):
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _diamond_plan())
+        await store.complete_node("s1", "start", {"data": "x"})
+        await store.start_node("s1", "right")
+
+        assert await store.mark_node_failed("s1", "left", "error") == []
+        assert store._sessions["s1"].nodes["right"].status == "running"
+
 
 class TestEventLog:
     @pytest.mark.asyncio
@@ -0,0 +1,121 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the shared HTTP transport and the incremental SSE decoder."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from opal_backend.local.backend_client_impl import HttpBackendClient
+from opal_backend.local.http_transport import (
+    ENDPOINT_TIMEOUTS,
+    aclose_http_clients,
+    get_http_client,
+    iter_sse_data,
+)
+
+
+async def _chunks(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+async def _decode(body: bytes, size: int) -> list[bytes]:
+    return [data async for data in iter_sse_data(_chunks(body, size))]
+
+
+class TestIterSseData:
+    @pytest.mark.parametrize("size", [1, 3, 64])
+    async def test_events_split_across_chunks(self, size):
+        body = b'data: {"a": 1}\r\n\r\ndata: {"b": 2}\n\n'
+        assert await _decode(body, size) == [b'{"a": 1}', b'{"b": 2}']
+
+    async def test_multi_line_data_and_other_fields(self):
+        body = (
+            b": keep-alive\n\n"
+            b"event: message\nid: 7\ndata: line one\ndata:line two\n\n"
+        )
+        assert await _decode(body, 5) == [b"line one\nline two"]
+
+    async def test_unterminated_last_event(self):
+        assert await _decode(b"data: x\n\ndata: y", 4) == [b"x", b"y"]
+
+
+class TestSharedClients:
+    async def test_one_client_per_origin(self):
+        try:
+            a = get_http_client("https://example.com/v1/a")
+            assert get_http_client("https://example.com/v1/b") is a
+            assert get_http_client("https://other.example.com/") is not a
+        finally:
+            await aclose_http_clients()
+        assert a.is_closed
+        assert get_http_client("https://example.com/") is not a
+        await aclose_http_clients()
+
+    def test_new_event_loop_gets_new_clients(self):
+        async def client():
+            return get_http_client("https://example.com/")
+
+        first = asyncio.run(client())
+
+        async def second_loop():
+            try:
+                second = await client()
+                assert second is not first
+                assert await client() is second
+            finally:
+                await aclose_http_clients()
+            return second
+
+        assert asyncio.run(second_loop()).is_closed
+
+
+class TestBackendClientTransport:
+    async def test_per_endpoint_timeouts(self):
+        seen: dict[str, dict] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen[request.url.path] = request.extensions["timeout"]
+            if "streamGenerateContent" in request.url.path:
+                return httpx.Response(200, content=b'data: {"ok": 1}\n\n')
+            return httpx.Response(200, json={})
+
+        backend = HttpBackendClient(
+            upstream_base="http://op.example.com",
+            httpx_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(handler),
+            ),
+            access_token="token",
+            timeouts={"stream": httpx.Timeout(5.0)},
+        )
+        await backend.execute_step({})
+        chunks = [
+            chunk async for chunk in backend.stream_generate_content("m", {})
+        ]
+
+        assert chunks == [{"ok": 1}]
+        assert seen["/v1beta1/executeStep"]["read"] == (
+            ENDPOINT_TIMEOUTS["execute_step"].read
+        )
+        assert seen["/v1beta/models/m:streamGenerateContent"]["read"] == 5.0
+
+    async def test_stream_skips_unparseable_chunks(self):
+        body = b"data: not json\n\ndata: " + json.dumps({"n": 1}).encode()
+
+        backend = HttpBackendClient(
+            upstream_base="http://op.example.com",
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body),
+            )),
+            access_token="token",
+        )
+        chunks = [
+            chunk async for chunk in backend.stream_generate_content("m", {})
+        ]
+        assert chunks == [{"n": 1}]
@@ -14,7 +14,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from opal_backend.function_caller import FunctionCaller
+from opal_backend.function_caller import (
+    FunctionCaller,
+    FunctionConcurrency,
+    FunctionLatencyHistograms,
+)
 from opal_backend.function_definition import (
     FunctionDefinition,
     FunctionGroup,
@@ -216,6 +220,96 @@ class TestFunctionCaller:
         result = await caller.get_results()
         assert result["combined"]["role"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_concurrency_class_caps_running_calls(self):
+        running = 0
+        peak = 0
+
+        async def render(args, status_cb):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {}
+
+        defn = FunctionDefinition(
+            name="render", description="Render", handler=render,
+            concurrency_class="video",
+        )
+        caller = FunctionCaller(
+            {"render": defn},
+            concurrency=FunctionConcurrency({"video": 2}),
+        )
+        for i in range(6):
+            caller.call(f"c{i}", {"functionCall": {"name": "render", "args": {}}})
+
+        result = await caller.get_results()
+        assert len(result["results"]) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_error_response(self):
+        async def hang(args, status_cb):
+            await asyncio.sleep(10)
+
+        defn = FunctionDefinition(
+            name="hang", description="Hangs", handler=hang, timeout_s=0.01,
+        )
+        caller = FunctionCaller({"hang": defn})
+        caller.call("c1", {"functionCall": {"name": "hang", "args": {}}})
+
+        result = await caller.get_results()
+        response = result["results"][0].response["functionResponse"]["response"]
+        assert "timed out" in response["error"]
+
+    @pytest.mark.asyncio
+    async def test_handler_timeout_error_is_a_plain_failure(self):
+        """A TimeoutError from the handler itself is not our deadline."""
+        async def flaky(args, status_cb):
+            raise TimeoutError("socket read timed out")
+
+        for timeout_s in (None, 10):
+            defn = FunctionDefinition(
+                name="flaky", description="Flaky", handler=flaky,
+                timeout_s=timeout_s,
+            )
+            caller = FunctionCaller({"flaky": defn})
+            caller.call("c1", {"functionCall": {"name": "flaky", "args": {}}})
+
+            result = await caller.get_results()
+            assert len(result["results"]) == 1
+            response = result["results"][0].response["functionResponse"]
+            assert response["response"] == {"error": "socket read timed out"}
+
+    @pytest.mark.asyncio
+    async def test_results_streamed_as_they_finish(self):
+        async def sleep_for(args, status_cb):
+            await asyncio.sleep(args["s"])
+            return {"s": args["s"]}
+
+        defn = FunctionDefinition(
+            name="sleep", description="Sleeps", handler=sleep_for,
+        )
+        streamed: list[str] = []
+        histograms = FunctionLatencyHistograms()
+        caller = FunctionCaller(
+            {"sleep": defn},
+            on_result=lambda r: streamed.append(r.call_id),
+            on_latency=histograms.record,
+        )
+        caller.call("slow", {"functionCall": {"name": "sleep", "args": {"s": 0.05}}})
+        caller.call("fast", {"functionCall": {"name": "sleep", "args": {"s": 0}}})
+
+        result = await caller.get_results()
+        assert streamed == ["fast", "slow"]
+        # Combined results keep call order.
+        assert [r.call_id for r in result["results"]] == ["slow", "fast"]
+        latency = histograms.snapshot()["sleep"]
+        assert latency.count == 2
+        assert latency.max_run_s >= 0.05
+        assert sum(latency.buckets) == 2
+
 
 # =============================================================================
 # FunctionDefinition Tests
@@ -532,6 +626,82 @@ class TestLoop:
         # And they must share the same callId
         assert function_call_ids[0] == function_result_ids[0]
 
+    @pytest.mark.asyncio
+    async def test_stream_function_results(self):
+        """With stream_function_results, a finished call is reported while
+        its siblings are still running."""
+        loop = Loop(backend=MagicMock())
+        fast_reported = asyncio.Event()
+
+        async def fast(args, status_cb):
+            return {}
+
+        async def slow(args, status_cb):
+            await asyncio.wait_for(fast_reported.wait(), timeout=1)
+            return {}
+
+        mapped = map_definitions([
+            FunctionDefinition(name="fast", description="Fast", handler=fast),
+            FunctionDefinition(name="slow", description="Slow", handler=slow),
+            *make_system_functions(loop.controller),
+        ])
+        group = FunctionGroup(
+            definitions=mapped.definitions,
+            declarations=mapped.declarations,
+        )
+
+        reported: list[str] = []
+        latencies: list[str] = []
+
+        def on_function_call(part, icon=None, title=None):
+            return {"callId": part["functionCall"]["name"]}
+
+        def on_function_result(call_id, content):
+            reported.append(call_id)
+            if call_id == "fast":
+                fast_reported.set()
+
+        hooks = LoopHooks(
+            on_function_call=on_function_call,
+            on_function_result=on_function_result,
+            on_function_latency=lambda name, wait_s, run_s: latencies.append(name),
+        )
+
+        turn = 0
+
+        async def mock_stream(*args, **kwargs):
+            nonlocal turn
+            turn += 1
+            if turn == 1:
+                yield {"candidates": [{"content": {"role": "model", "parts": [
+                    {"functionCall": {"name": "slow", "args": {}}},
+                    {"functionCall": {"name": "fast", "args": {}}},
+                ]}}]}
+            else:
+                yield make_function_call_chunk(
+                    "system_objective_fulfilled",
+                    {"objective_outcome": "Done"},
+                )
+
+        with patch(
+            "opal_backend.loop.stream_generate_content",
+            side_effect=mock_stream,
+        ):
+            result = await loop.run(
+                AgentRunArgs(
+                    objective={"parts": [{"text": "Test"}], "role": "user"},
+                    function_groups=[group],
+                    hooks=hooks,
+                    stream_function_results=True,
+                )
+            )
+
+        assert isinstance(result, AgentResult)
+        assert reported == ["fast", "slow", "system_objective_fulfilled"]
+        assert sorted(latencies) == [
+            "fast", "slow", "system_objective_fulfilled",
+        ]
+
     @pytest.mark.asyncio
     async def test_loop_handles_empty_candidates(self):
         """The loop should return an error if Gemini returns no candidates."""
@@ -760,26 +930,27 @@ class TestGeminiClient:
 
     @pytest.mark.asyncio
     async def test_stream_generate_content_parses_sse(self):
-        """HttpBackendClient.stream_generate_content parses SSE lines."""
+        """HttpBackendClient.stream_generate_content parses SSE events."""
         from unittest.mock import AsyncMock
         from opal_backend.local.backend_client_impl import HttpBackendClient
 
-        # Build SSE lines that the mock httpx stream will yield.
-        sse_lines = [
-            'data: {"candidates": [{"content": {"parts": [{"text": "Hello"}]}}]}',
-            "",
-            'data: {"candidates": [{"content": {"parts": [{"text": " World"}]}}]}',
-        ]
+        # SSE body that the mock httpx stream will yield, split at
+        # arbitrary points.
+        sse_body = (
+            b'data: {"candidates": [{"content": {"parts": [{"text": "Hello"}]}}]}\r\n'
+            b"\r\n"
+            b'data: {"candidates": [{"content": {"parts": [{"text": " World"}]}}]}\r\n'
+        )
 
         # Fake httpx streaming response.
         mock_response = AsyncMock()
         mock_response.status_code = 200
 
-        async def fake_aiter_lines():
-            for line in sse_lines:
-                yield line
+        async def fake_aiter_bytes():
+            for i in range(0, len(sse_body), 7):
+                yield sse_body[i:i + 7]
 
-        mock_response.aiter_lines = fake_aiter_lines
+        mock_response.aiter_bytes = fake_aiter_bytes
 
         # Fake httpx client with a stream context manager.
         mock_httpx = AsyncMock()
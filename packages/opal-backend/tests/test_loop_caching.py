@@ -10,15 +10,20 @@ Verifies that:
 - When it's None, the body inlines everything
 - When a cached request fails before producing content, the loop
   drops the cache and retries with a full uncached body
+- With ``context_cache`` set, the loop rolls the conversation prefix into
+  per-session cached content and only sends the entries after it
 """
 
 from __future__ import annotations
 
+import json
+
 from typing import Any, AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from opal_backend.context_cache import ContextCacheConfig
 from opal_backend.loop import AgentRunArgs, Loop, LoopController
 from opal_backend.function_definition import FunctionGroup
 
@@ -73,6 +78,8 @@ def _terminating_function_group(controller: LoopController) -> FunctionGroup:
     defn.precondition = None
     defn.icon = None
     defn.title = None
+    defn.concurrency_class = None
+    defn.timeout_s = None
 
     return FunctionGroup(
         instruction="System instruction.",
@@ -92,6 +99,7 @@ class FakeBackend:
         self._chunks = chunks or [[]]
         self._call_index = 0
         self.calls: list[dict] = []
+        self.deleted: list[str] = []
         self._fail_on_first = fail_on_first
 
     async def stream_generate_content(
@@ -123,6 +131,9 @@ class FakeBackend:
     async def update_cached_content(self, name: str, body: dict) -> dict:
         return {}
 
+    async def delete_cached_content(self, name: str) -> None:
+        self.deleted.append(name)
+
 
 # ---------------------------------------------------------------------------
 # Cached body shape
@@ -271,3 +282,226 @@ class TestContentsSlicing:
         body = backend.calls[0]
         assert len(body["contents"]) == 1
         assert body["contents"][0] == objective
+
+
+# ---------------------------------------------------------------------------
+# Rolling conversation cache
+# ---------------------------------------------------------------------------
+
+
+def _working_function_group(
+    controller: LoopController, *, turns: int, output_size: int,
+) -> FunctionGroup:
+    """A ``work`` function that returns a large result and terminates the
+    loop on its ``turns``-th call."""
+    calls = 0
+
+    async def handler(args: dict, status_cb: Any) -> dict:
+        nonlocal calls
+        calls += 1
+        if calls >= turns:
+            controller.terminate({"success": True, "outcomes": None})
+        return {"output": "x" * output_size}
+
+    defn = MagicMock()
+    defn.handler = handler
+    defn.precondition = None
+    defn.icon = None
+    defn.title = None
+    defn.concurrency_class = None
+    defn.timeout_s = None
+
+    return FunctionGroup(
+        instruction="System instruction.",
+        declarations=[{"name": "work", "parameters": {}}],
+        definitions=[("work", defn)],
+    )
+
+
+def _tokens(value: Any) -> int:
+    return len(json.dumps(value)) // 4
+
+
+class ConversationBackend(FakeBackend):
+    """Calls ``work`` every turn and keeps Gemini-like cache accounting.
+
+    ``expire_after_uses`` makes a cached content resource fail once it
+    has served that many requests. ``break_on_call`` makes that request's
+    stream fail after its first chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        fail_create: bool = False,
+        expire_after_uses: int | None = None,
+        break_on_call: int | None = None,
+    ):
+        super().__init__()
+        self._break_on_call = break_on_call
+        self.created: list[dict] = []
+        self._cached_tokens: dict[str, int] = {}
+        self._uses: dict[str, int] = {}
+        self._fail_create = fail_create
+        self._expire_after_uses = expire_after_uses
+
+    async def stream_generate_content(
+        self, model: str, body: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        self.calls.append(body)
+        cached = 0
+        name = body.get("cachedContent")
+        if name:
+            uses = self._uses.get(name, 0)
+            if (
+                self._expire_after_uses is not None
+                and uses >= self._expire_after_uses
+            ):
+                raise Exception(f"{name} not found")
+            self._uses[name] = uses + 1
+            cached = self._cached_tokens.get(name, 0)
+        chunk = _make_chunk(text="", function_call={"name": "work", "args": {}})
+        chunk["usageMetadata"] = {
+            "promptTokenCount": _tokens(body["contents"]) + cached,
+            "cachedContentTokenCount": cached,
+        }
+        yield chunk
+        if len(self.calls) == self._break_on_call:
+            raise Exception("connection reset")
+
+    async def create_cached_content(self, body: dict) -> dict:
+        if self._fail_create:
+            raise Exception("cachedContents quota exceeded")
+        self.created.append(body)
+        name = f"cachedContents/conv-{len(self.created)}"
+        self._cached_tokens[name] = _tokens(body["contents"])
+        return {"name": name}
+
+
+async def _run_conversation(
+    backend: ConversationBackend,
+    *,
+    turns: int = 12,
+    context_cache: ContextCacheConfig | None = ContextCacheConfig(
+        min_tokens=2_000,
+    ),
+) -> dict:
+    controller = LoopController()
+    loop = Loop(backend=backend, controller=controller)
+    args = AgentRunArgs(
+        objective={"parts": [{"text": "test"}], "role": "user"},
+        function_groups=[
+            _working_function_group(controller, turns=turns, output_size=3_000),
+        ],
+        context_cache=context_cache,
+    )
+    return await loop.run(args)
+
+
+class TestConversationCache:
+    @pytest.mark.asyncio
+    async def test_rolls_prefix_and_sends_only_the_tail(self):
+        backend = ConversationBackend()
+        result = await _run_conversation(backend)
+        assert result.get("success") is True
+
+        assert backend.created
+        first = backend.created[0]
+        assert first["contents"][-1]["role"] == "model"
+        assert first["systemInstruction"]["parts"][0]["text"]
+        assert first["tools"][0]["functionDeclarations"][0]["name"] == "work"
+
+        # The request after the roll references it and resends nothing
+        # the resource already holds.
+        rolled = next(
+            i for i, body in enumerate(backend.calls)
+            if body.get("cachedContent") == "cachedContents/conv-1"
+        )
+        before = backend.calls[rolled - 1]["contents"]
+        after = backend.calls[rolled]
+        assert "tools" not in after
+        assert "systemInstruction" not in after
+        # The resource holds the previous request plus the model's reply;
+        # only the function response to that reply is sent.
+        assert first["contents"][:-1] == before
+        assert len(after["contents"]) == 1
+        assert "functionResponse" in after["contents"][0]["parts"][0]
+
+        # Successive rolls extend the prefix, deleting the resource they
+        # replace; the last one is deleted when the run ends.
+        counts = [len(body["contents"]) for body in backend.created]
+        assert len(counts) >= 2
+        assert counts == sorted(counts)
+        assert len(set(counts)) == len(counts)
+        assert backend.deleted == [
+            f"cachedContents/conv-{i}" for i in range(1, len(counts) + 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_run_deletes_its_resource(self):
+        backend = ConversationBackend(break_on_call=8)
+        result = await _run_conversation(backend)
+        assert "$error" in result
+        assert "cachedContent" in backend.calls[-1]
+        assert backend.deleted[-1] == backend.calls[-1]["cachedContent"]
+
+    @pytest.mark.asyncio
+    async def test_request_bytes_per_turn_stay_bounded(self):
+        cached_backend = ConversationBackend()
+        await _run_conversation(cached_backend, turns=20)
+        plain_backend = ConversationBackend()
+        await _run_conversation(plain_backend, turns=20, context_cache=None)
+
+        cached = [len(json.dumps(b)) for b in cached_backend.calls]
+        plain = [len(json.dumps(b)) for b in plain_backend.calls]
+        assert not plain_backend.created
+        # Without the cache each turn resends everything so far.
+        assert plain == sorted(plain)
+        assert plain[-1] > 15 * plain[0]
+        # With it, no request carries much more than the roll threshold.
+        assert max(cached) < 4 * 2_000 * 4
+        assert sum(cached) < sum(plain) / 3
+
+    @pytest.mark.asyncio
+    async def test_expired_resource_falls_back_then_rolls_again(self):
+        backend = ConversationBackend(expire_after_uses=1)
+        result = await _run_conversation(backend)
+        assert result.get("success") is True
+
+        failed = next(
+            i for i, body in enumerate(backend.calls)
+            if body.get("cachedContent") == "cachedContents/conv-1"
+        ) + 1
+        assert backend.calls[failed]["cachedContent"] == "cachedContents/conv-1"
+        # Retried in full, without any cache.
+        retry = backend.calls[failed + 1]
+        assert "cachedContent" not in retry
+        assert retry["contents"][0]["parts"][0]["text"] == "test"
+        # A fresh resource covers the whole history again.
+        assert len(backend.created) >= 2
+        assert any(
+            body.get("cachedContent") == "cachedContents/conv-2"
+            for body in backend.calls
+        )
+
+    @pytest.mark.asyncio
+    async def test_rejected_on_first_use_stops_rolling(self):
+        backend = ConversationBackend(expire_after_uses=0)
+        result = await _run_conversation(backend)
+        assert result.get("success") is True
+        assert len(backend.created) == 1
+        assert "cachedContent" not in backend.calls[-1]
+
+    @pytest.mark.asyncio
+    async def test_create_failure_continues_uncached(self):
+        backend = ConversationBackend(fail_create=True)
+        result = await _run_conversation(backend)
+        assert result.get("success") is True
+        assert all("cachedContent" not in body for body in backend.calls)
+        assert len(backend.calls) == 12
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self):
+        backend = ConversationBackend()
+        await _run_conversation(backend, context_cache=None)
+        assert not backend.created
@@ -99,6 +99,21 @@ async def test_get_events_after(store):
     assert len(events) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_events_limit_and_iter(store):
+    await store.create("sess-1")
+    for i in range(5):
+        await store.append_event("sess-1", {"i": i})
+
+    events = await store.get_events("sess-1", after=1, limit=2)
+    assert [e["i"] for e in events] == [2, 3]
+
+    streamed = [
+        e["i"] async for e in store.iter_events("sess-1", after=0, batch_size=2)
+    ]
+    assert streamed == [1, 2, 3, 4]
+
+
 @pytest.mark.asyncio
 async def test_append_event_not_found(store):
     with pytest.raises(KeyError):
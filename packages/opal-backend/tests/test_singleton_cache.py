@@ -3,22 +3,28 @@
 
 """
 Tests for singleton_cache.py — cache hit/miss, TTL expiry,
-throttled TTL extension, and Gemini API failure handling.
+throttled TTL extension, single-flight creation, background refresh,
+and Gemini API failure handling.
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from opal_backend import singleton_cache
+from opal_backend.prefix_payload import build_prefix_payload
 from opal_backend.singleton_cache import (
     _cache,
     _cache_key,
     _CacheEntry,
     _maybe_extend_ttl,
+    get_singleton_cache_stats,
     get_singleton_prefix_cache,
+    SingletonCacheStats,
     CACHE_TTL_SECONDS,
     EXTEND_THRESHOLD_SECONDS,
 )
@@ -54,12 +60,25 @@ def _make_client(
     return client
 
 
+def _default_key(**flags: bool) -> str:
+    return _cache_key(build_prefix_payload(**flags))
+
+
+async def _settle_background() -> None:
+    """Let background refreshes and deletions run to completion."""
+    while singleton_cache._background:
+        await asyncio.gather(*list(singleton_cache._background))
+
+
 @pytest.fixture(autouse=True)
-def _clear_cache():
-    """Clear the in-memory cache before each test."""
+def _clear_cache(monkeypatch):
+    """Clear the in-memory cache and counters before each test."""
     _cache.clear()
+    singleton_cache._keys_by_flags.clear()
+    monkeypatch.setattr(singleton_cache, "_stats", SingletonCacheStats())
     yield
     _cache.clear()
+    singleton_cache._keys_by_flags.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -93,7 +112,7 @@ class TestCacheMiss:
 
         await get_singleton_prefix_cache(client=client)
 
-        key = _cache_key(False, False, False)
+        key = _cache_key({})
         assert key in _cache
         assert _cache[key].name == "cachedContents/stored"
 
@@ -154,7 +173,7 @@ class TestCacheHit:
     @pytest.mark.asyncio
     async def test_returns_cached_name_on_hit(self):
         """Cache hit returns the stored name without calling the API."""
-        key = _cache_key(False, False, False)
+        key = _default_key()
         _cache[key] = _CacheEntry(name="cachedContents/existing", created_at=time.time())
 
         client = _make_client()
@@ -166,7 +185,7 @@ class TestCacheHit:
     @pytest.mark.asyncio
     async def test_different_flag_combos_cache_separately(self):
         """Different flag combinations produce independent cache entries."""
-        key_mem = _cache_key(True, False, False)
+        key_mem = _default_key(use_memory=True)
         _cache[key_mem] = _CacheEntry(
             name="cachedContents/with-memory", created_at=time.time()
         )
@@ -202,10 +221,12 @@ class TestTTLExpiry:
     async def test_expired_entry_triggers_cache_miss(self, mock_build):
         """An entry older than CACHE_TTL_SECONDS is treated as a miss."""
         mock_build.return_value = {}
-        key = _cache_key(False, False, False)
+        key = _cache_key({})
+        stale = time.time() - CACHE_TTL_SECONDS - 1
         _cache[key] = _CacheEntry(
             name="cachedContents/old",
-            created_at=time.time() - CACHE_TTL_SECONDS - 1,
+            created_at=stale,
+            last_extended_at=stale,
         )
 
         client = _make_client(create_response={"name": "cachedContents/fresh"})
@@ -216,20 +237,41 @@ class TestTTLExpiry:
         assert result == {"cachedContent": {"name": "cachedContents/fresh"}}
 
     @pytest.mark.asyncio
-    async def test_almost_expired_entry_still_hits(self):
-        """An entry 1 second before TTL is still valid."""
-        key = _cache_key(False, False, False)
+    async def test_extended_entry_outlives_creation_ttl(self):
+        """Expiry follows the last extension, not the creation time."""
+        key = _default_key()
         _cache[key] = _CacheEntry(
-            name="cachedContents/almost-expired",
-            created_at=time.time() - CACHE_TTL_SECONDS + 1,
+            name="cachedContents/extended",
+            created_at=time.time() - CACHE_TTL_SECONDS - 100,
+            last_extended_at=time.time(),
         )
 
         client = _make_client()
         result = await get_singleton_prefix_cache(client=client)
 
-        assert result == {"cachedContent": {"name": "cachedContents/almost-expired"}}
+        assert result == {"cachedContent": {"name": "cachedContents/extended"}}
         client.create_cached_content.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_entry_about_to_expire_is_replaced(self):
+        """An entry inside the expiry margin is not handed out."""
+        key = _default_key()
+        almost = time.time() - CACHE_TTL_SECONDS + 1
+        _cache[key] = _CacheEntry(
+            name="cachedContents/almost-expired",
+            created_at=almost,
+            last_extended_at=almost,
+        )
+
+        client = _make_client(create_response={"name": "cachedContents/fresh"})
+        result = await get_singleton_prefix_cache(client=client)
+        await _settle_background()
+
+        assert result == {"cachedContent": {"name": "cachedContents/fresh"}}
+        client.delete_cached_content.assert_awaited_once_with(
+            "cachedContents/almost-expired"
+        )
+
 
 # ---------------------------------------------------------------------------
 # Throttled TTL extension (_maybe_extend_ttl)
@@ -334,15 +376,164 @@ class TestCacheKey:
     """Tests for _cache_key correctness."""
 
     def test_same_flags_produce_same_key(self):
-        assert _cache_key(True, False, True) == _cache_key(True, False, True)
+        assert _default_key(use_memory=True, use_google_drive=True) == (
+            _default_key(use_memory=True, use_google_drive=True)
+        )
 
-    def test_different_flags_produce_different_keys(self):
-        assert _cache_key(True, False, False) != _cache_key(False, True, False)
+    def test_key_ignores_dict_order(self):
+        assert _cache_key({"a": 1, "b": [1, 2]}) == _cache_key({"b": [1, 2], "a": 1})
 
     def test_all_combinations_are_distinct(self):
         keys = set()
         for m in (True, False):
             for n in (True, False):
                 for g in (True, False):
-                    keys.add(_cache_key(m, n, g))
+                    keys.add(_default_key(
+                        use_memory=m, use_notebooklm=n, use_google_drive=g,
+                    ))
         assert len(keys) == 8
+
+    @pytest.mark.asyncio
+    async def test_payload_change_retires_old_entry(self):
+        """When the payload for a flag combination changes, the old
+        resource is deleted and a new one created."""
+        client = _make_client(create_response={"name": "cachedContents/v1"})
+        with patch(
+            "opal_backend.singleton_cache.build_prefix_payload",
+            return_value={"v": 1},
+        ):
+            await get_singleton_prefix_cache(client=client)
+
+        client.create_cached_content.return_value = {"name": "cachedContents/v2"}
+        with patch(
+            "opal_backend.singleton_cache.build_prefix_payload",
+            return_value={"v": 2},
+        ):
+            result = await get_singleton_prefix_cache(client=client)
+        await _settle_background()
+
+        assert result == {"cachedContent": {"name": "cachedContents/v2"}}
+        assert _cache_key({"v": 1}) not in _cache
+        client.delete_cached_content.assert_awaited_once_with("cachedContents/v1")
+
+
+# ---------------------------------------------------------------------------
+# Single-flight creation
+# ---------------------------------------------------------------------------
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_create_once(self):
+        release = asyncio.Event()
+        client = _make_client()
+
+        async def create(payload):
+            await release.wait()
+            return {"name": "cachedContents/shared"}
+
+        client.create_cached_content.side_effect = create
+        tasks = [
+            asyncio.create_task(get_singleton_prefix_cache(client=client))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert client.create_cached_content.await_count == 1
+        assert all(
+            r == {"cachedContent": {"name": "cachedContents/shared"}}
+            for r in results
+        )
+        stats = get_singleton_cache_stats()
+        assert (stats.misses, stats.creates, stats.hits) == (10, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failure_reaches_every_waiter(self):
+        release = asyncio.Event()
+        client = _make_client()
+
+        async def create(payload):
+            await release.wait()
+            raise Exception("quota")
+
+        client.create_cached_content.side_effect = create
+        tasks = [
+            asyncio.create_task(get_singleton_prefix_cache(client=client))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert all(r == {"errorMessage": "quota"} for r in results)
+        assert get_singleton_cache_stats().create_failures == 1
+        assert len(_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_hits(self):
+        client = _make_client()
+        for _ in range(3):
+            await get_singleton_prefix_cache(client=client)
+        stats = get_singleton_cache_stats()
+        assert (stats.hits, stats.misses, stats.creates) == (2, 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Background refresh
+# ---------------------------------------------------------------------------
+
+
+class TestBackgroundRefresh:
+    def _stale_entry(self, name: str) -> tuple[str, _CacheEntry]:
+        key = _default_key()
+        stale = time.time() - EXTEND_THRESHOLD_SECONDS - 1
+        entry = _CacheEntry(name=name, created_at=stale, last_extended_at=stale)
+        _cache[key] = entry
+        return key, entry
+
+    @pytest.mark.asyncio
+    async def test_burst_of_hits_extends_once(self):
+        key, entry = self._stale_entry("cachedContents/stale")
+        client = _make_client()
+
+        for _ in range(5):
+            result = await get_singleton_prefix_cache(client=client)
+            assert result == {"cachedContent": {"name": "cachedContents/stale"}}
+        await _settle_background()
+
+        client.update_cached_content.assert_awaited_once()
+        assert entry.expires_at > time.time() + CACHE_TTL_SECONDS - 5
+        assert not entry.refreshing
+
+    @pytest.mark.asyncio
+    async def test_failed_extension_replaces_resource(self):
+        key, entry = self._stale_entry("cachedContents/gone")
+        client = _make_client(
+            create_response={"name": "cachedContents/replacement"},
+            update_error=Exception("404 not found"),
+        )
+
+        result = await get_singleton_prefix_cache(client=client)
+        # Served from the old entry while the replacement is created.
+        assert result == {"cachedContent": {"name": "cachedContents/gone"}}
+        await _settle_background()
+
+        assert _cache[key].name == "cachedContents/replacement"
+        client.delete_cached_content.assert_awaited_once_with("cachedContents/gone")
+        stats = get_singleton_cache_stats()
+        assert (stats.creates, stats.deletes) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_delete_is_non_fatal(self):
+        self._stale_entry("cachedContents/gone")
+        client = _make_client(update_error=Exception("404 not found"))
+        client.delete_cached_content.side_effect = Exception("already gone")
+
+        await get_singleton_prefix_cache(client=client)
+        await _settle_background()
+
+        assert get_singleton_cache_stats().deletes == 0
+        result = await get_singleton_prefix_cache(client=client)
+        assert result == {"cachedContent": {"name": "cachedContents/test-abc123"}}
@@ -0,0 +1,220 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for SqliteGraphSessionStore."""
+
+import pytest
+
+from opal_backend.graph_runner import GraphRunner
+from opal_backend.graph_session_store import (
+    GraphSessionStore, SuspendedNodeState,
+)
+from opal_backend.graph_types import (
+    Edge, GraphPlan, NodeDescriptor, PlanNodeInfo,
+)
+from opal_backend.local.event_bus_impl import InMemoryEventBus
+from opal_backend.local.sqlite_graph_session_store_impl import (
+    SqliteGraphSessionStore,
+)
+from opal_backend.local.task_scheduler_impl import LocalTaskScheduler
+
+
+def _linear_plan() -> GraphPlan:
+    """a → b → c (linear three-node plan)."""
+    a = NodeDescriptor(id="a", type="generate", configuration={"n": 1})
+    b = NodeDescriptor(id="b", type="generate")
+    c = NodeDescriptor(id="c", type="output")
+
+    e_ab = Edge(from_node="a", to_node="b", out_port="data", in_port="input")
+    e_bc = Edge(from_node="b", to_node="c", out_port="context", in_port="result")
+
+    return GraphPlan(stages=[
+        [PlanNodeInfo(node=a, downstream=[e_ab], upstream=[])],
+        [PlanNodeInfo(node=b, downstream=[e_bc], upstream=[e_ab])],
+        [PlanNodeInfo(node=c, downstream=[], upstream=[e_bc])],
+    ], assets={"logo": {"data": "x"}})
+
+
+def _diamond_plan() -> GraphPlan:
+    """start → (left, right) → merge."""
+    start = NodeDescriptor(id="start", type="generate")
+    left = NodeDescriptor(id="left", type="generate")
+    right = NodeDescriptor(id="right", type="generate")
+    merge = NodeDescriptor(id="merge", type="output")
+
+    e_sl = Edge(from_node="start", to_node="left", out_port="data", in_port="i1")
+    e_sr = Edge(from_node="start", to_node="right", out_port="data", in_port="i2")
+    e_lm = Edge(from_node="left", to_node="merge", out_port="r1", in_port="c1")
+    e_rm = Edge(from_node="right", to_node="merge", out_port="r2", in_port="c2")
+
+    return GraphPlan(stages=[
+        [PlanNodeInfo(node=start, downstream=[e_sl, e_sr], upstream=[])],
+        [PlanNodeInfo(node=left, downstream=[e_lm], upstream=[e_sl]),
+         PlanNodeInfo(node=right, downstream=[e_rm], upstream=[e_sr])],
+        [PlanNodeInfo(node=merge, downstream=[], upstream=[e_lm, e_rm])],
+    ])
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "graph.db"
+
+
+@pytest.fixture
+def store(db_path):
+    store = SqliteGraphSessionStore(db_path)
+    yield store
+    store.close()
+
+
+def _reopen(store: SqliteGraphSessionStore, db_path) -> SqliteGraphSessionStore:
+    store.close()
+    return SqliteGraphSessionStore(db_path)
+
+
+class TestProtocol:
+    def test_satisfies_protocol(self, store):
+        assert isinstance(store, GraphSessionStore)
+
+
+class TestNodeLifecycle:
+    async def test_plan_round_trips(self, store):
+        plan = _linear_plan()
+        await store.create("s1", plan)
+        assert await store.get_plan("s1") == plan
+        assert await store.get_plan("missing") is None
+        assert await store.get_node_config("s1", "a") == {"n": 1}
+        assert await store.get_node_config("s1", "b") == {}
+
+    async def test_diamond_both_deps_needed(self, store):
+        await store.create("s1", _diamond_plan())
+
+        newly = await store.complete_node("s1", "start", {"data": "x"})
+        assert newly == ["left", "right"]
+        assert await store.complete_node("s1", "left", {"r1": "a"}) == []
+        assert await store.complete_node("s1", "right", {"r2": "b"}) == ["merge"]
+
+        inputs = await store.get_node_inputs("s1", "merge")
+        assert inputs == {"c1": ["a"], "c2": ["b"]}
+
+    async def test_graph_complete_and_outputs(self, store):
+        await store.create("s1", _linear_plan())
+        assert not await store.is_graph_complete("s1")
+        assert not await store.is_graph_complete("missing")
+        for node_id in ("a", "b", "c"):
+            await store.complete_node("s1", node_id, {"out": node_id})
+        assert await store.is_graph_complete("s1")
+        assert await store.get_graph_outputs("s1") == {
+            "a": {"out": "a"}, "b": {"out": "b"}, "c": {"out": "c"},
+        }
+
+    async def test_mark_failed_skips_dependents(self, store):
+        await store.create("s1", _diamond_plan())
+        await store.complete_node("s1", "start", {"data": "x"})
+        await store.start_node("s1", "right")
+
+        # "right" is running, so it is not handed out again.
+        assert await store.mark_node_failed("s1", "left", "boom") == []
+        assert await store.list_interrupted_nodes() == [("s1", "right")]
+        await store.complete_node("s1", "right", {"r2": "y"})
+        assert await store.is_graph_complete("s1")
+        assert "merge" not in await store.get_graph_outputs("s1")
+
+    async def test_headless_inputs(self, store):
+        await store.create("s1", _linear_plan(), headless_inputs={"a": "hi"})
+        await store.create("s2", _linear_plan())
+        assert await store.is_headless_session("s1")
+        assert await store.get_headless_input("s1", "a") == "hi"
+        assert await store.get_headless_input("s1", "b") is None
+        assert not await store.is_headless_session("s2")
+
+
+class TestDurability:
+    async def test_state_survives_reopen(self, store, db_path):
+        await store.create("s1", _linear_plan())
+        await store.append_event("s1", {"type": "graphStart"})
+        await store.complete_node("s1", "a", {"data": "hello"})
+        await store.set_status("s1", "suspended")
+        await store.suspend_node(
+            "s1", "b", "int-1",
+            SuspendedNodeState(
+                node_id="b", interaction_id="int-1", context={"cursor": 42},
+            ),
+        )
+
+        store = _reopen(store, db_path)
+        try:
+            assert await store.get_plan("s1") == _linear_plan()
+            assert await store.get_status("s1") == "suspended"
+            assert await store.get_node_inputs("s1", "b") == {
+                "input": ["hello"],
+            }
+            loaded = await store.load_suspended_node("s1", "int-1")
+            assert loaded is not None
+            assert loaded[0] == "b"
+            assert loaded[1].context == {"cursor": 42}
+            assert await store.load_suspended_node("s1", "other") is None
+
+            idx = await store.append_event("s1", {"type": "nodeStart"})
+            assert idx == 1
+            events = await store.get_events("s1", after=0)
+            assert events == [{"type": "nodeStart", "index": 1}]
+        finally:
+            store.close()
+
+    async def test_interrupted_nodes(self, store, db_path):
+        await store.create("s1", _diamond_plan())
+        await store.complete_node("s1", "start", {"data": "x"})
+        await store.start_node("s1", "left")
+        await store.create("done", _linear_plan())
+        await store.set_status("done", "completed")
+
+        store = _reopen(store, db_path)
+        try:
+            assert await store.list_interrupted_nodes() == [
+                ("s1", "left"), ("s1", "right"),
+            ]
+        finally:
+            store.close()
+
+    async def test_recreate_replaces_session(self, store):
+        await store.create("s1", _linear_plan())
+        await store.append_event("s1", {"type": "graphStart"})
+        await store.complete_node("s1", "a", {"data": "x"})
+
+        await store.create("s1", _diamond_plan())
+        assert await store.get_events("s1") == []
+        assert await store.get_graph_outputs("s1") == {}
+        assert await store.get_status("s1") == "running"
+
+
+class TestRecovery:
+    async def test_runner_recovers_interrupted_graph(self, store, db_path):
+        await store.create("s1", _linear_plan())
+        await store.complete_node("s1", "a", {"context": ["first"]})
+        # The server went down while "b" was running.
+        await store.start_node("s1", "b")
+
+        store = _reopen(store, db_path)
+        try:
+            bus = InMemoryEventBus()
+            runner = GraphRunner(store=store, event_bus=bus, scheduler=None)
+            runner._scheduler = LocalTaskScheduler(run_fn=runner.run_node)
+            subscriber = bus.subscribe("s1")
+
+            assert await runner.recover() == 1
+            # Nothing runs until a request brings credentials.
+            assert await runner.authorize("s1", access_token="") == 0
+            assert await store.get_status("s1") == "running"
+            assert await runner.authorize("s1", access_token="token") == 1
+            assert await runner.authorize("s1", access_token="token") == 0
+            async for event in subscriber:
+                if event.get("type") == "graphComplete":
+                    break
+
+            assert await store.is_graph_complete("s1")
+            assert await store.get_status("s1") == "completed"
+            outputs = await store.get_graph_outputs("s1")
+            assert set(outputs) == {"a", "b", "c"}
+        finally:
+            store.close()
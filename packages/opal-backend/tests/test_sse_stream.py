@@ -0,0 +1,167 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for replay-then-live SSE streaming."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from opal_backend.local.event_bus_impl import InMemoryEventBus
+from opal_backend.local.sse_stream import sse_frame, stream_events
+
+
+class _Log:
+    """A session event log that appends, then publishes — like GraphRunner."""
+
+    def __init__(self, bus: InMemoryEventBus) -> None:
+        self.bus = bus
+        self.events: list[dict] = []
+        self.live = True
+
+    async def emit(self, event: dict) -> None:
+        index = len(self.events)
+        self.events.append({**event, "index": index})
+        await self.bus.publish("s1", self.events[-1], index=index)
+
+    async def replay(self, after: int):
+        for event in list(self.events[after + 1:]):
+            yield event["index"], json.dumps(event).encode()
+            # Let the producer run mid-replay.
+            await asyncio.sleep(0)
+
+    async def is_live(self) -> bool:
+        return self.live
+
+
+def _parse(frames: list[bytes]) -> list[tuple[str | None, str, dict]]:
+    parsed = []
+    for frame in frames:
+        fields = dict(
+            line.split(": ", 1)
+            for line in frame.decode().strip().split("\r\n")
+        )
+        parsed.append(
+            (fields.get("id"), fields.get("event"), json.loads(fields["data"]))
+        )
+    return parsed
+
+
+async def _collect(log: _Log, *, after: int = -1) -> list[bytes]:
+    return [
+        frame async for frame in stream_events(
+            session_id="s1",
+            event_bus=log.bus,
+            after=after,
+            replay=log.replay,
+            is_live=log.is_live,
+        )
+    ]
+
+
+class TestSseFrame:
+    def test_frame_fields(self):
+        assert sse_frame(b"{}", id=3) == (
+            b"id: 3\r\nevent: event\r\ndata: {}\r\n\r\n"
+        )
+        assert sse_frame(b"{}", event=None) == b"data: {}\r\n\r\n"
+
+
+class TestReplayThenLive:
+    async def test_no_gap_between_replay_and_live(self):
+        bus = InMemoryEventBus()
+        log = _Log(bus)
+        for i in range(5):
+            await log.emit({"n": i})
+
+        async def produce():
+            # Runs while the stream is replaying.
+            for i in range(5, 10):
+                await log.emit({"n": i})
+                await asyncio.sleep(0)
+            await bus.close("s1")
+
+        collect = asyncio.ensure_future(_collect(log))
+        await asyncio.sleep(0)
+        await produce()
+        parsed = _parse(await collect)
+
+        assert parsed[0][1] == "start"
+        assert parsed[-1][1] == "done"
+        events = parsed[1:-1]
+        assert [data["n"] for _, _, data in events] == list(range(10))
+        assert [int(id) for id, _, _ in events] == list(range(10))
+
+    async def test_after_skips_replayed_and_live(self):
+        bus = InMemoryEventBus()
+        log = _Log(bus)
+        for i in range(3):
+            await log.emit({"n": i})
+        log.live = False
+
+        parsed = _parse(await _collect(log, after=1))
+        assert [data for _, event, data in parsed if event == "event"] == [
+            {"n": 2, "index": 2},
+        ]
+
+    async def test_live_only_events_have_no_id(self):
+        bus = InMemoryEventBus()
+        log = _Log(bus)
+
+        collect = asyncio.ensure_future(_collect(log))
+        await asyncio.sleep(0)
+        await bus.publish("s1", {"type": "thoughtEvent"})
+        await log.emit({"n": 0})
+        await bus.close("s1")
+        parsed = _parse(await collect)
+
+        assert parsed[1] == (None, "event", {"type": "thoughtEvent"})
+        assert parsed[2] == ("0", "event", {"n": 0, "index": 0})
+
+    async def test_finished_session_replays_tail(self):
+        bus = InMemoryEventBus()
+        log = _Log(bus)
+        await log.emit({"n": 0})
+        log.live = False
+
+        parsed = _parse(await _collect(log))
+        assert [event for _, event, _ in parsed] == ["start", "event", "done"]
+        assert bus._subscriptions["s1"] == []
+
+    async def test_overflow_ends_without_done(self):
+        bus = InMemoryEventBus(max_pending=2)
+        log = _Log(bus)
+
+        stream = stream_events(
+            session_id="s1", event_bus=bus, after=-1,
+            replay=log.replay, is_live=log.is_live,
+        )
+        frames = [await stream.__anext__()]  # start
+        for i in range(4):
+            await log.emit({"n": i})
+        frames += [frame async for frame in stream]
+
+        # The stored events still replay; the overflowed live tail ends
+        # the stream without "done" so the client reconnects.
+        assert [event for _, event, _ in _parse(frames)] == [
+            "start", "event", "event", "event", "event",
+        ]
+
+
+    async def test_dropped_events_refilled_from_log(self):
+        bus = InMemoryEventBus(max_pending=2, overflow="drop_oldest")
+        log = _Log(bus)
+
+        collect = asyncio.ensure_future(_collect(log))
+        await asyncio.sleep(0)
+        # publish() never yields, so the stream falls six events behind.
+        for i in range(6):
+            await log.emit({"n": i})
+        await bus.close("s1")
+        parsed = _parse(await collect)
+
+        assert [int(id) for id, event, _ in parsed if event == "event"] == [
+            0, 1, 2, 3, 4, 5,
+        ]
+        assert parsed[-1][1] == "done"
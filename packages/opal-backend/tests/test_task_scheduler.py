@@ -0,0 +1,225 @@
+# Copyright 2026 Google LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for LocalTaskScheduler — limits, pools, fairness, priority."""
+
+import asyncio
+
+from opal_backend.graph_plan import create_plan
+from opal_backend.graph_types import Edge, GraphDescriptor, NodeDescriptor
+from opal_backend.local.graph_session_store_impl import InMemoryGraphSessionStore
+from opal_backend.local.task_scheduler_impl import (
+    LocalTaskScheduler,
+    SchedulerLimits,
+)
+from opal_backend.node_handlers import node_pool
+from opal_backend.task_scheduler import TaskScheduler
+
+
+class _Recorder:
+    """A run_fn whose tasks block until released, recording start order."""
+
+    def __init__(self) -> None:
+        self.started: list[tuple[str, str]] = []
+        self.running = 0
+        self.peak = 0
+        self._open = False
+        self._release: dict[tuple[str, str], asyncio.Event] = {}
+
+    async def run(self, session_id: str, node_id: str) -> None:
+        key = (session_id, node_id)
+        self.started.append(key)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            if not self._open:
+                await self._release.setdefault(key, asyncio.Event()).wait()
+        finally:
+            self.running -= 1
+
+    def release(self, session_id: str, node_id: str) -> None:
+        self._release.setdefault((session_id, node_id), asyncio.Event()).set()
+
+    async def release_all(self, scheduler: LocalTaskScheduler) -> None:
+        """Let every task, current and queued, run to completion."""
+        self._open = True
+        for event in self._release.values():
+            event.set()
+        while scheduler.metrics().queued or scheduler.metrics().running:
+            await asyncio.sleep(0)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _unlimited(**overrides) -> SchedulerLimits:
+    return SchedulerLimits(
+        **{"max_running": None, "max_running_per_session": None,
+           "pools": {}, **overrides},
+    )
+
+
+class TestProtocol:
+    def test_satisfies_protocol(self):
+        assert isinstance(LocalTaskScheduler(run_fn=_Recorder().run), TaskScheduler)
+
+
+class TestLimits:
+    async def test_global_cap(self):
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, limits=_unlimited(max_running=2),
+        )
+        for i in range(5):
+            await scheduler.schedule("s1", f"n{i}")
+        await _settle()
+        assert len(recorder.started) == 2
+        assert scheduler.metrics().queued == 3
+
+        recorder.release("s1", "n0")
+        await _settle()
+        assert len(recorder.started) == 3
+
+        await recorder.release_all(scheduler)
+        assert recorder.peak == 2
+        assert len(recorder.started) == 5
+        metrics = scheduler.metrics()
+        assert (metrics.queued, metrics.running, metrics.dispatched) == (0, 0, 5)
+        assert metrics.sessions == {}
+
+    async def test_per_session_cap_and_round_robin(self):
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run,
+            limits=_unlimited(max_running=2, max_running_per_session=2),
+        )
+        for i in range(3):
+            await scheduler.schedule("a", f"n{i}")
+        for i in range(3):
+            await scheduler.schedule("b", f"n{i}")
+        await _settle()
+        # "a" filled both slots before "b" arrived.
+        assert recorder.started == [("a", "n0"), ("a", "n1")]
+
+        # Freed slots alternate between sessions.
+        recorder.release("a", "n0")
+        await _settle()
+        recorder.release("a", "n1")
+        await _settle()
+        assert recorder.started[2:] == [("b", "n0"), ("a", "n2")]
+
+        metrics = scheduler.metrics()
+        assert metrics.sessions["b"].queued == 2
+        assert metrics.sessions["a"].running == 1
+        await recorder.release_all(scheduler)
+
+    async def test_duplicate_schedule_queues_once(self):
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, limits=_unlimited(max_running=1),
+        )
+        await scheduler.schedule("s1", "a")
+        await scheduler.schedule("s1", "b")
+        await scheduler.schedule("s1", "b")
+        assert scheduler.metrics().queued == 1
+        await recorder.release_all(scheduler)
+        assert recorder.started == [("s1", "a"), ("s1", "b")]
+
+    async def test_cancel_queued_and_running(self):
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, limits=_unlimited(max_running=1),
+        )
+        await scheduler.schedule("s1", "a")
+        await scheduler.schedule("s1", "b")
+        await scheduler.schedule("s2", "c")
+        await _settle()
+
+        await scheduler.cancel("s1")
+        await _settle()
+        assert recorder.started == [("s1", "a"), ("s2", "c")]
+        assert set(scheduler.metrics().sessions) == {"s2"}
+        await recorder.release_all(scheduler)
+
+
+def _graph_store_plan(nodes, edges):
+    return create_plan(GraphDescriptor(
+        nodes=[NodeDescriptor(id=i, type="generate", configuration=c)
+               for i, c in nodes],
+        edges=[Edge(from_node=a, to_node=b, out_port="context", in_port=b)
+               for a, b in edges],
+    ))
+
+
+class TestPlanAware:
+    async def test_pools_cap_media_nodes(self):
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _graph_store_plan(
+            [("v1", {"mode": "video"}), ("v2", {"mode": "video"}),
+             ("t1", {}), ("t2", {}), ("end", {})],
+            [("v1", "end"), ("v2", "end"), ("t1", "end"), ("t2", "end")],
+        ))
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, store=store,
+            limits=_unlimited(pools={"video": 1}),
+        )
+        for node_id in ("v1", "v2", "t1", "t2"):
+            await scheduler.schedule("s1", node_id)
+        await _settle()
+
+        assert sorted(n for _, n in recorder.started) == ["t1", "t2", "v1"]
+        pools = scheduler.metrics().pools
+        assert (pools["video"].queued, pools["video"].running) == (1, 1)
+        assert pools["text"].running == 2
+        await recorder.release_all(scheduler)
+
+    async def test_critical_path_first(self):
+        # "short" heads a two-node chain, "long" a three-node one.
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _graph_store_plan(
+            [("short", {}), ("long", {}), ("mid", {}), ("end", {})],
+            [("short", "end"), ("long", "mid"), ("mid", "end")],
+        ))
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, store=store,
+            limits=_unlimited(max_running=1),
+        )
+        await scheduler.schedule("s1", "blocker")  # Not in the plan.
+        await scheduler.schedule("s1", "short")
+        await scheduler.schedule("s1", "long")
+        await recorder.release_all(scheduler)
+
+        assert [n for _, n in recorder.started] == ["blocker", "long", "short"]
+
+    async def test_pool_weights_shape_priority(self):
+        store = InMemoryGraphSessionStore()
+        await store.create("s1", _graph_store_plan(
+            [("text", {}), ("mid", {}), ("video", {"mode": "video"}),
+             ("end", {})],
+            [("text", "mid"), ("mid", "end"), ("video", "end")],
+        ))
+        recorder = _Recorder()
+        scheduler = LocalTaskScheduler(
+            run_fn=recorder.run, store=store,
+            limits=_unlimited(max_running=1, pool_weights={"video": 10.0}),
+        )
+        await scheduler.schedule("s1", "blocker")
+        await scheduler.schedule("s1", "text")
+        await scheduler.schedule("s1", "video")
+        await recorder.release_all(scheduler)
+
+        assert [n for _, n in recorder.started] == ["blocker", "video", "text"]
+
+
+class TestNodePool:
+    def test_pools(self):
+        assert node_pool("generate", {}) == "text"
+        assert node_pool("generate", {"generation-mode": "video"}) == "video"
+        assert node_pool("generate", {"mode": "agent"}) == "agent"
+        assert node_pool("embed://a2/a2.bgl.json#module:render-outputs", {}) == (
+            "output"
+        )